@@ -3,6 +3,15 @@ backend/app/__init__.py
 
 Inicializa el paquete principal del backend AgoraX.
 Expone la instancia de FastAPI como `app` para Uvicorn.
+
+La instancia se carga de forma diferida: importar subpaquetes como
+`app.core` o `app.services` no construye la aplicación completa.
 """
 
-from .main import app  # noqa: F401
+
+def __getattr__(name: str):
+    if name == "app":
+        from .main import app
+
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,8 +4,10 @@ backend/app/api/v1/__init__.py
 Punto de entrada de la versión 1 de la API de AgoraX.
 
 Aquí se agrupan y exponen los routers de los módulos:
+- admin.py
 - auth.py
 - meetings.py
+- owners.py
 - quorum.py
 - rules.py
 - votes.py
@@ -18,14 +20,16 @@ y montar toda la versión v1 de una sola vez.
 from fastapi import APIRouter
 
 # Importa los submódulos que definen sus propios routers
-from . import auth, meetings, quorum, rules, votes
+from . import admin, auth, meetings, owners, quorum, rules, votes
 
 # Router principal de la versión v1
 api_router = APIRouter()
 
 # Se incluyen los subrouters, asumiendo que cada módulo define `router = APIRouter()`
+api_router.include_router(admin.router, prefix="/admin", tags=["admin"])
 api_router.include_router(auth.router, prefix="/auth", tags=["auth"])
 api_router.include_router(meetings.router, prefix="/meetings", tags=["meetings"])
+api_router.include_router(owners.router, prefix="/owners", tags=["owners"])
 api_router.include_router(quorum.router, prefix="/quorum", tags=["quorum"])
 api_router.include_router(rules.router, prefix="/rules", tags=["rules"])
 api_router.include_router(votes.router, prefix="/votes", tags=["votes"])
@@ -0,0 +1,92 @@
+"""
+backend/app/api/v1/admin.py
+
+Endpoints de diagnóstico para administradores (rol ADMIN).
+
+- Perfiles de peticiones tomados bajo demanda (core/profiling.py): listado
+  y descarga en formato "folded" para flamegraph.pl / speedscope.
+- Registro de sentencias SQL lentas con su plan (core/slow_queries.py).
+- Archivado en frío de una asamblea cerrada (services/archive_service.py).
+"""
+
+from typing import List
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import FileResponse
+from sqlalchemy.orm import Session
+
+from app.core.db import get_db
+from app.core.profiling import request_profiler
+from app.core.security import require_admin
+from app.core.slow_queries import slow_query_log
+from app.schemas.admin_schema import MeetingArchiveRead, ProfileRead, SlowQueryLogRead
+from app.services import archive_service
+
+router = APIRouter(
+    prefix="/api/v1/admin",
+    tags=["admin"],
+    dependencies=[Depends(require_admin)],
+)
+
+
+@router.get("/profiles", response_model=List[ProfileRead])
+def list_profiles():
+    """
+    Lista los perfiles guardados, del más reciente al más antiguo.
+
+    Se perfila una petición enviándola con la cabecera "X-Profile: 1"
+    (usuario ADMIN, PROFILING_ENABLED=True); su respuesta trae X-Profile-Id.
+    """
+    return request_profiler.list_profiles()
+
+
+@router.get("/profiles/{profile_id}")
+def download_profile(profile_id: str):
+    """
+    Descarga las pilas muestreadas de un perfil (formato folded).
+    """
+    path = request_profiler.profile_path(profile_id)
+    if path is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Perfil no encontrado.",
+        )
+    return FileResponse(path, media_type="text/plain; charset=utf-8", filename=path.name)
+
+
+@router.get("/slow-queries", response_model=SlowQueryLogRead)
+def list_slow_queries(limit: int = Query(50, ge=1, le=1000)):
+    """
+    Devuelve las sentencias lentas más recientes (de todos los shards del proceso).
+
+    Una misma sentencia repetida con un Seq Scan / SCAN en el plan suele
+    indicar un índice ausente.
+    """
+    return {"stats": slow_query_log.stats(), "queries": slow_query_log.entries(limit)}
+
+
+@router.delete("/slow-queries", status_code=status.HTTP_204_NO_CONTENT)
+def clear_slow_queries():
+    """
+    Vacía el registro (p. ej. antes de medir tras crear un índice).
+    """
+    slow_query_log.clear()
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+@router.post("/meetings/{meeting_id}/archive", response_model=MeetingArchiveRead)
+def archive_meeting(meeting_id: int, db: Session = Depends(get_db)):
+    """
+    Archiva una asamblea cerrada sin esperar al job (scripts/archive_meetings.py).
+
+    Sus rutas GET siguen respondiendo igual, ahora desde el archivo.
+    """
+    report = archive_service.archive_meeting(db, meeting_id)
+    return MeetingArchiveRead(
+        meeting_id=report.meeting_id,
+        path=report.path,
+        sha256=report.sha256,
+        size_bytes=report.size_bytes,
+        row_counts=report.row_counts,
+        vote_key_ids=report.vote_key_ids,
+    )
@@ -11,7 +11,8 @@ Incluye:
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
-from app.core.db import get_db
+from app.core.db import get_directory_db
+from app.core.rate_limit import RateLimit, client_ip
 from app.core.security import (
     verify_password,
     get_password_hash,
@@ -25,7 +26,7 @@ router = APIRouter(prefix="/auth", tags=["auth"])
 
 
 @router.post("/register", response_model=UserRead, status_code=status.HTTP_201_CREATED)
-def register_user(user_in: UserCreate, db: Session = Depends(get_db)):
+def register_user(user_in: UserCreate, db: Session = Depends(get_directory_db)):
     """
     Registra un nuevo usuario en el sistema.
     """
@@ -49,8 +50,12 @@ def register_user(user_in: UserCreate, db: Session = Depends(get_db)):
     return user
 
 
-@router.post("/login", response_model=Token)
-def login(user_in: UserCreate, db: Session = Depends(get_db)):
+@router.post(
+    "/login",
+    response_model=Token,
+    dependencies=[Depends(RateLimit("login:ip", "RATE_LIMIT_LOGIN_PER_IP", client_ip))],
+)
+def login(user_in: UserCreate, db: Session = Depends(get_directory_db)):
     """
     Autentica a un usuario existente y devuelve un token JWT.
     """
@@ -6,21 +6,34 @@ Endpoints para la gestión de:
 - Asambleas (Meeting)
 - Puntos de agenda (AgendaItem)
 - Presencias (Presence)
+- Poderes (Delegation) y derechos de voto
 
 Implementa varios aspectos del ciclo de vida de requerimientos y reglas de negocio:
 - Creación de asambleas.
-- Cambio de estado (CREATED / IN_PROGRESS / CLOSED).
+- Cambio de estado validado (CREATED / IN_PROGRESS / CLOSED) con compare-and-set.
 - Definición de agenda.
-- Registro de presencias, base para cálculo de quórum.
+- Registro de presencias, base para cálculo de quórum (individual y masivo).
+- Resultados materializados al cerrar cada punto de agenda.
+- Poderes validados contra el grafo de la asamblea (RD-02).
+- Panel de asambleas para administradores con agregados por página.
 """
 
-from typing import List
-
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session, joinedload
-
-from app.core.db import get_db
-from app.core.security import get_current_user
+from contextlib import nullcontext
+from typing import List, Literal, Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, status
+from sqlalchemy.orm import Session
+
+from app.core.checkin_tokens import InvalidCheckinToken, verify_checkin_token
+from app.core import events
+from app.core.db import get_db, get_directory_db
+from app.core.http_cache import etag_matches, is_not_modified
+from app.core.rate_limit import RateLimit, path_param, token_subject
+from app.core.security import get_current_user, require_admin
+from app.core.serialization import json_response
+from app.core.sharding import TenantMoving, shard_router
+from app.core.vote_crypto import VoteDecryptionError
+from app.core.vote_journal import vote_journal
 from app.models import (
     Meeting,
     AgendaItem,
@@ -32,11 +45,32 @@ from app.schemas.meeting_schema import (
     MeetingCreate,
     MeetingUpdateStatus,
     MeetingSummary,
+    MeetingDashboardPage,
     MeetingDetail,
     AgendaItemCreate,
     AgendaItemDetail,
     PresenceCreate,
     PresenceSummary,
+    PresenceBulkCreate,
+    PresenceBulkResult,
+    CheckinTokenRead,
+    CheckinScan,
+    PresenceScanResult,
+    DelegationCreate,
+    DelegationRead,
+    VotingRightRead,
+    VotingRightsRead,
+)
+from app.schemas.vote_schema import AgendaItemResultRead
+from app.services import (
+    archive_service,
+    dashboard_service,
+    delegation_service,
+    lifecycle_service,
+    outbox_service,
+    presence_service,
+    read_service,
+    results_service,
 )
 from app.services.audit_service import log_action
 
@@ -49,35 +83,59 @@ router = APIRouter(prefix="/api/v1/meetings", tags=["meetings"])
 @router.post("/", response_model=MeetingSummary, status_code=status.HTTP_201_CREATED)
 def create_meeting(
     meeting_in: MeetingCreate,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_directory_db),
     current_user: User = Depends(get_current_user),
 ):
     """
     Crea una nueva asamblea para un conjunto residencial.
 
+    La asamblea se crea en el shard del conjunto y se registra en
+    meeting_routes para que las rutas /{meeting_id} la encuentren.
+
     Regla de negocio relacionada:
         - RD-07: Cada asamblea debe tener un identificador único.
     """
-    meeting = Meeting(
-        condominium_id=meeting_in.condominium_id,
-        title=meeting_in.title,
-        total_propietarios=meeting_in.total_propietarios,
-        status="CREATED",
-    )
-    db.add(meeting)
-    db.commit()
-    db.refresh(meeting)
-
-    log_action(
-        db,
-        user_id=current_user.id,
-        action="CREATE_MEETING",
-        entity_type="Meeting",
-        entity_id=meeting.id,
-        description=f"Asamblea creada: {meeting.title}",
-    )
-
-    return meeting
+    try:
+        with shard_router.tenant_session(db, meeting_in.condominium_id) as tenant_db:
+            meeting = Meeting(
+                condominium_id=meeting_in.condominium_id,
+                title=meeting_in.title,
+                total_propietarios=meeting_in.total_propietarios,
+                status="CREATED",
+            )
+            tenant_db.add(meeting)
+            tenant_db.flush()
+            outbox_service.emit(
+                tenant_db,
+                events.MEETING_CREATED,
+                meeting_id=meeting.id,
+                entity_type="Meeting",
+                entity_id=meeting.id,
+                payload={"condominium_id": meeting.condominium_id, "title": meeting.title},
+            )
+
+            if shard_router.enabled:
+                shard_router.register_meeting(db, meeting.id, meeting.condominium_id)
+                if tenant_db is not db:
+                    db.commit()
+            tenant_db.commit()
+            tenant_db.refresh(meeting)
+
+            log_action(
+                tenant_db,
+                user_id=current_user.id,
+                action="CREATE_MEETING",
+                entity_type="Meeting",
+                entity_id=meeting.id,
+                description=f"Asamblea creada: {meeting.title}",
+            )
+
+            return MeetingSummary.model_validate(meeting, from_attributes=True)
+    except TenantMoving as exc:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(exc),
+        )
 
 
 @router.get("/", response_model=List[MeetingSummary])
@@ -89,64 +147,119 @@ def list_meetings(
     Devuelve el listado de asambleas registradas.
 
     Se utiliza para la vista general de reuniones.
+
+    Usa la ruta de lectura liviana: solo columnas y serialización directa.
+    Con sharding habilitado consulta cada shard y combina los resultados.
+    """
+    rows = []
+    for shard_db in shard_router.each_shard_session(db):
+        rows.extend(read_service.list_meeting_rows(shard_db))
+    if shard_router.enabled:
+        rows.sort(key=lambda row: row.date, reverse=True)
+    return json_response(read_service.MEETING_ROWS_ADAPTER, rows)
+
+
+@router.get("/dashboard", response_model=MeetingDashboardPage)
+def get_meetings_dashboard(
+    request: Request,
+    condominium_id: Optional[int] = Query(None, description="Solo las asambleas de este conjunto."),
+    meeting_status: Optional[Literal["CREATED", "IN_PROGRESS", "CLOSED"]] = Query(None, alias="status"),
+    limit: int = Query(20, ge=1, le=dashboard_service.MAX_LIMIT),
+    offset: int = Query(0, ge=0),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_admin),
+):
     """
-    meetings = db.query(Meeting).order_by(Meeting.date.desc()).all()
-    return meetings
+    Panel de asambleas: estado, quórum, presentes, punto abierto y votos emitidos.
+
+    Una página se resuelve con un número fijo de consultas agrupadas
+    (dashboard_service), sin consultas por asamblea. Los agregados se
+    guardan en caché por versión de cada asamblea y la página lleva un
+    ETag que las combina: si no cambió ninguna responde 304.
+    """
+    plan = dashboard_service.plan_page(
+        db,
+        condominium_id=condominium_id,
+        status=meeting_status,
+        limit=limit,
+        offset=offset,
+    )
+    validators = plan.validators
+    if validators is not None and is_not_modified(request.headers, validators):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=validators.headers())
+
+    page = dashboard_service.build_page(db, plan)
+    return json_response(
+        dashboard_service.DASHBOARD_ADAPTER,
+        page,
+        headers=validators.headers() if validators is not None else None,
+    )
 
 
 @router.get("/{meeting_id}", response_model=MeetingDetail)
 def get_meeting_detail(
     meeting_id: int,
+    request: Request,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """
     Devuelve el detalle de una asamblea específica, incluyendo sus puntos de agenda.
+
+    Respuesta condicional: ETag/Last-Modified según la versión de la
+    asamblea; si el cliente ya la tiene responde 304 sin leer el detalle.
+    Las asambleas archivadas se leen de su archivo (archive_service).
     """
-    meeting = (
-        db.query(Meeting)
-        .options(joinedload(Meeting.agenda_items))
-        .filter(Meeting.id == meeting_id)
-        .first()
-    )
+    validators = read_service.get_meeting_validators(db, meeting_id=meeting_id)
+    if validators is not None and is_not_modified(request.headers, validators):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=validators.headers())
 
-    if not meeting:
+    detail = read_service.get_meeting_detail_row(db, meeting_id=meeting_id)
+    if detail is None:
+        detail = archive_service.archived_meeting_detail(db, meeting_id)
+
+    if detail is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Asamblea no encontrada.",
         )
 
-    return meeting
+    response = json_response(read_service.MEETING_DETAIL_ADAPTER, detail)
+    if validators is not None:
+        response.headers.update(validators.headers())
+    return response
 
 
 @router.patch("/{meeting_id}/status", response_model=MeetingSummary)
 def update_meeting_status(
     meeting_id: int,
     data: MeetingUpdateStatus,
+    response: Response,
+    if_match: Optional[str] = Header(default=None),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """
     Actualiza el estado de una asamblea.
 
-    Ejemplos:
+    Transiciones válidas (lifecycle_service):
         - CREATED → IN_PROGRESS
-        - IN_PROGRESS → CLOSED
+        - IN_PROGRESS → CLOSED (sin puntos abiertos)
+
+    El cambio es un compare-and-set sobre la versión de la fila: si otra
+    petición lo cambió antes (o If-Match no coincide) responde 409. La
+    nueva versión se devuelve en el ETag.
 
     Reglas:
         - RD-05: Los resultados no se modifican tras el cierre. El cambio a CLOSED
-          debe considerarse definitivo en el flujo de negocio.
+          es definitivo.
     """
-    meeting = db.query(Meeting).filter(Meeting.id == meeting_id).first()
-
-    if not meeting:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Asamblea no encontrada.",
-        )
-
-    meeting.status = data.status
-    db.add(meeting)
+    meeting = lifecycle_service.transition_meeting(
+        db,
+        meeting_id=meeting_id,
+        target=data.status,
+        expected_version=lifecycle_service.parse_if_match(if_match),
+    )
     db.commit()
     db.refresh(meeting)
 
@@ -159,6 +272,7 @@ def update_meeting_status(
         description=f"Estado actualizado a {meeting.status}",
     )
 
+    response.headers["ETag"] = lifecycle_service.version_etag(meeting.version)
     return meeting
 
 
@@ -194,8 +308,19 @@ def add_agenda_item(
         meeting_id=meeting_id,
         title=item_in.title,
         status="PENDING",
+        approval_threshold=item_in.approval_threshold,
+        threshold_basis=item_in.threshold_basis,
     )
     db.add(agenda_item)
+    db.flush()
+    outbox_service.emit(
+        db,
+        events.AGENDA_ITEM_ADDED,
+        meeting_id=meeting_id,
+        entity_type="AgendaItem",
+        entity_id=agenda_item.id,
+        payload={"title": agenda_item.title},
+    )
     db.commit()
     db.refresh(agenda_item)
 
@@ -219,34 +344,42 @@ def update_agenda_item_status(
     meeting_id: int,
     agenda_item_id: int,
     data: MeetingUpdateStatus,
+    response: Response,
+    if_match: Optional[str] = Header(default=None),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """
-    Actualiza el estado de un punto de agenda.
+    Actualiza el estado de un punto de agenda (PENDING → OPEN → CLOSED).
 
-    Aquí se materializa parte de RB-02:
-        - Debe cerrarse un punto antes de abrir otro (validación adicional
-          podría implementarse en rule_engine si se requiere).
-    """
-    agenda_item = (
-        db.query(AgendaItem)
-        .filter(
-            AgendaItem.id == agenda_item_id,
-            AgendaItem.meeting_id == meeting_id,
-        )
-        .first()
-    )
+    lifecycle_service valida la transición con compare-and-set sobre la
+    versión del punto (409 si cambió entretanto o If-Match no coincide):
+        - RB-02: Debe cerrarse un punto antes de abrir otro.
+        - RB-07: No se abre votación sin quórum.
+        - RD-05: Un punto cerrado no se reabre.
 
-    if not agenda_item:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Punto de agenda no encontrado.",
-        )
-
-    agenda_item.status = data.status
-    db.add(agenda_item)
-    db.commit()
+    Al pasar a CLOSED se calcula y guarda el resultado del punto en la
+    misma transacción (results_service); ningún voto confirma después. En
+    modo diario se aplican antes los votos pendientes del punto.
+    """
+    # Modo diario: sellar el punto y aplicar sus votos pendientes antes del cierre
+    journal_guard = vote_journal.closing_item(agenda_item_id) if data.status == "CLOSED" else nullcontext()
+    with journal_guard:
+        try:
+            agenda_item = lifecycle_service.transition_agenda_item(
+                db,
+                meeting_id=meeting_id,
+                agenda_item_id=agenda_item_id,
+                target=data.status,
+                expected_version=lifecycle_service.parse_if_match(if_match),
+            )
+        except VoteDecryptionError:
+            db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="No se pudieron descifrar los votos del punto; no se cerró.",
+            )
+        db.commit()
     db.refresh(agenda_item)
 
     log_action(
@@ -258,9 +391,65 @@ def update_agenda_item_status(
         description=f"Estado del punto actualizado a {agenda_item.status}",
     )
 
+    response.headers["ETag"] = lifecycle_service.version_etag(agenda_item.version)
     return agenda_item
 
 
+@router.get(
+    "/{meeting_id}/agenda/{agenda_item_id}/results",
+    response_model=AgendaItemResultRead,
+)
+def get_agenda_item_results(
+    meeting_id: int,
+    agenda_item_id: int,
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Devuelve el resultado materializado de un punto de agenda cerrado.
+
+    Es una lectura de una fila con la respuesta ya serializada; como el
+    resultado es inmutable (RD-05) se sirve con ETag y admite 304.
+
+    Reglas de negocio relacionadas:
+        - RB-09: Resultados visibles solo al cierre de todas las votaciones.
+    """
+    stored = results_service.get_stored_result(
+        db,
+        meeting_id=meeting_id,
+        agenda_item_id=agenda_item_id,
+    )
+    if stored is None:
+        stored = archive_service.archived_result(
+            db,
+            meeting_id=meeting_id,
+            agenda_item_id=agenda_item_id,
+        )
+    if stored is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="El punto no existe o aún no se ha cerrado.",
+        )
+    if stored.pending_items:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="RB-09: Los resultados se publican cuando todos los puntos estén cerrados.",
+        )
+
+    headers = {
+        "ETag": f'"result-{agenda_item_id}-{int(stored.computed_at.timestamp())}"',
+        "Cache-Control": "private, max-age=3600",
+    }
+    if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(
+        content=stored.payload_json,
+        media_type="application/json",
+        headers=headers,
+    )
+
+
 # ================== PRESENCES ==================
 
 
@@ -278,18 +467,26 @@ def register_presence(
     """
     Registra la presencia de un propietario en una asamblea.
 
+    El coeficiente se toma del propietario (no del cliente) y el propietario
+    debe pertenecer al conjunto de la asamblea.
+
+    Si el usuario del propietario es apoderado en la asamblea, su
+    representado queda presente en la misma transacción.
+
     Reglas relacionadas:
         - RB-03: El usuario debe confirmar asistencia antes de votar.
         - RD-04: El coeficiente se usa para el cálculo de quórum.
     """
-    meeting = db.query(Meeting).filter(Meeting.id == meeting_id).first()
-    if not meeting:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Asamblea no encontrada.",
-        )
+    condominium_id = presence_service.ensure_meeting_accepts_presence(db, meeting_id)
 
-    owner = db.query(Owner).filter(Owner.id == presence_in.owner_id).first()
+    owner = (
+        db.query(Owner)
+        .filter(
+            Owner.id == presence_in.owner_id,
+            Owner.condominium_id == condominium_id,
+        )
+        .first()
+    )
     if not owner:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -298,10 +495,25 @@ def register_presence(
 
     presence = Presence(
         meeting_id=meeting_id,
-        owner_id=presence_in.owner_id,
-        coeficiente=presence_in.coeficiente,
+        owner_id=owner.id,
+        coeficiente=owner.coeficiente,
     )
     db.add(presence)
+    outbox_service.emit(
+        db,
+        events.PRESENCE_REGISTERED,
+        meeting_id=meeting_id,
+        entity_type="Owner",
+        entity_id=owner.id,
+        payload={"coeficiente": owner.coeficiente},
+    )
+    db.flush()
+    represented = [
+        owner_id
+        for owner_id, _ in delegation_service.register_represented_presences(
+            db, meeting_id=meeting_id, owner_ids=[owner.id]
+        )
+    ]
     db.commit()
     db.refresh(presence)
 
@@ -313,7 +525,7 @@ def register_presence(
         entity_id=presence.id,
         description=(
             f"Presencia registrada para owner_id={owner.id}, "
-            f"coeficiente={presence.coeficiente}"
+            f"coeficiente={presence.coeficiente}, representados={represented}"
         ),
     )
 
@@ -322,4 +534,224 @@ def register_presence(
         owner_name=owner.name,
         coeficiente=presence.coeficiente,
         created_at=presence.created_at,
+        represented=represented,
+    )
+
+
+@router.post(
+    "/{meeting_id}/presence/bulk",
+    response_model=PresenceBulkResult,
+)
+def register_presence_bulk(
+    meeting_id: int,
+    bulk_in: PresenceBulkCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Registra en bloque la presencia de varios propietarios (check-in en la puerta).
+
+    A diferencia de register_presence:
+        - El coeficiente se toma de cada propietario, no del cliente.
+        - Los propietarios que no pertenecen al conjunto se rechazan.
+        - Los ya presentes se informan sin error (reintentos seguros).
+        - Devuelve el quórum actualizado en la misma respuesta.
+
+    Reglas relacionadas:
+        - RB-03: El usuario debe confirmar asistencia antes de votar.
+        - RD-04: El coeficiente se usa para el cálculo de quórum.
+    """
+    condominium_id = presence_service.ensure_meeting_accepts_presence(db, meeting_id)
+
+    return presence_service.bulk_register_presence(
+        db,
+        meeting_id=meeting_id,
+        condominium_id=condominium_id,
+        owner_ids=bulk_in.owner_ids,
+        user_id=current_user.id,
+    )
+
+
+@router.post(
+    "/{meeting_id}/checkin-tokens",
+    response_model=List[CheckinTokenRead],
+)
+def issue_checkin_tokens(
+    meeting_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Emite en un solo lote los tokens de check-in firmados (QR) de todos los
+    propietarios del conjunto de la asamblea.
+    """
+    try:
+        tokens = presence_service.issue_checkin_tokens(db, meeting_id=meeting_id)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Asamblea no encontrada.",
+        )
+
+    log_action(
+        db,
+        user_id=current_user.id,
+        action="ISSUE_CHECKIN_TOKENS",
+        entity_type="Meeting",
+        entity_id=meeting_id,
+        description=f"Tokens de check-in emitidos: {len(tokens)}",
+    )
+    return tokens
+
+
+@router.post(
+    "/{meeting_id}/presence/scan",
+    response_model=PresenceScanResult,
+    dependencies=[
+        Depends(RateLimit("checkin:user", "RATE_LIMIT_CHECKIN_PER_USER", token_subject)),
+        Depends(RateLimit("checkin:meeting", "RATE_LIMIT_CHECKIN_PER_MEETING", path_param("meeting_id"))),
+    ],
+)
+def register_presence_by_token(
+    meeting_id: int,
+    scan_in: CheckinScan,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Registra la presencia a partir de un token de check-in firmado.
+
+    La firma se verifica criptográficamente: no se consulta Owner por cada
+    escaneo, solo el estado de la asamblea (404 si no existe, 400 si está
+    cerrada). Un escaneo repetido devuelve registered=False.
+
+    Reglas relacionadas:
+        - RB-03: El usuario debe confirmar asistencia antes de votar.
+        - RD-04: El coeficiente firmado se usa para el cálculo de quórum.
+    """
+    try:
+        claims = verify_checkin_token(scan_in.token, meeting_id=meeting_id)
+    except InvalidCheckinToken as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(exc),
+        )
+
+    return presence_service.register_presence_from_token(
+        db,
+        claims=claims,
+        user_id=current_user.id,
+    )
+
+
+# ================== PODERES ==================
+
+
+@router.post(
+    "/{meeting_id}/delegations",
+    response_model=DelegationRead,
+    status_code=status.HTTP_201_CREATED,
+)
+def register_delegation(
+    meeting_id: int,
+    delegation_in: DelegationCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Registra un poder: el apoderado vota y hace check-in por el poderdante.
+
+    Se valida el grafo de la asamblea (sin cadenas, un representado por
+    apoderado) y se recalculan los derechos de voto en la misma transacción.
+    Solo puede otorgarlo el usuario del poderdante o un ADMIN (403).
+
+    Reglas relacionadas:
+        - RD-02: Un apoderado representa máximo a un propietario.
+    """
+    delegation = delegation_service.register_delegation(
+        db,
+        meeting_id=meeting_id,
+        principal_owner_id=delegation_in.principal_owner_id,
+        proxy_user_id=delegation_in.proxy_user_id,
+        user_id=current_user.id,
+        is_admin=current_user.role == "ADMIN",
+    )
+    db.commit()
+
+    log_action(
+        db,
+        user_id=current_user.id,
+        action="REGISTER_DELEGATION",
+        entity_type="Meeting",
+        entity_id=meeting_id,
+        description=(
+            f"Poder id={delegation.id}: owner_id={delegation.principal_owner_id} "
+            f"representado por user_id={delegation.proxy_user_id}"
+        ),
+    )
+    return delegation
+
+
+@router.delete(
+    "/{meeting_id}/delegations/{delegation_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+)
+def revoke_delegation(
+    meeting_id: int,
+    delegation_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Revoca un poder. Los votos ya emitidos por el apoderado se conservan.
+
+    Solo puede revocarlo el usuario del poderdante o un ADMIN (403).
+    """
+    delegation = delegation_service.revoke_delegation(
+        db,
+        meeting_id=meeting_id,
+        delegation_id=delegation_id,
+        user_id=current_user.id,
+        is_admin=current_user.role == "ADMIN",
+    )
+    principal_owner_id, proxy_user_id = delegation.principal_owner_id, delegation.proxy_user_id
+    db.commit()
+
+    log_action(
+        db,
+        user_id=current_user.id,
+        action="REVOKE_DELEGATION",
+        entity_type="Meeting",
+        entity_id=meeting_id,
+        description=(
+            f"Poder id={delegation_id} revocado: owner_id={principal_owner_id}, "
+            f"user_id={proxy_user_id}"
+        ),
+    )
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+@router.get("/{meeting_id}/voting-rights/me", response_model=VotingRightsRead)
+def get_my_voting_rights(
+    meeting_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Devuelve los propietarios por los que vota el usuario actual y su peso total.
+    """
+    rights = delegation_service.voting_rights_for_user(
+        db, meeting_id=meeting_id, user_id=current_user.id
+    )
+    if not rights:
+        rights = archive_service.archived_voting_rights(
+            db, meeting_id=meeting_id, user_id=current_user.id
+        ) or rights
+    return VotingRightsRead(
+        meeting_id=meeting_id,
+        owners=[
+            VotingRightRead(owner_id=owner_id, coeficiente=coeficiente, delegated=delegated)
+            for owner_id, coeficiente, delegated in rights
+        ],
+        coeficiente_total=sum(coeficiente for _, coeficiente, _ in rights),
     )
@@ -0,0 +1,65 @@
+"""
+backend/app/api/v1/owners.py
+
+Endpoints de propietarios (Owner).
+
+- Búsqueda incremental para las mesas de check-in: nombre parcial, unidad
+  o correo, con el estado de presencia en la asamblea actual. Se resuelve
+  contra un índice en memoria por conjunto (services/owner_search_service.py),
+  sin recorrer la tabla owners en cada tecla.
+"""
+
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.orm import Session
+
+from app.core.db import get_db
+from app.core.security import get_current_user
+from app.core.serialization import json_response
+from app.models import User
+from app.schemas.owner_schema import OwnerSearchResult
+from app.services import owner_search_service
+
+router = APIRouter(prefix="/api/v1/owners", tags=["owners"])
+
+
+@router.get("/{condominium_id}/search", response_model=OwnerSearchResult)
+def search_owners(
+    condominium_id: int,
+    q: str = Query(..., min_length=1, max_length=100, description="Nombre parcial, unidad o correo."),
+    meeting_id: Optional[int] = Query(
+        None, description="Asamblea para el estado de presencia; por defecto la que está en curso."
+    ),
+    limit: int = Query(20, ge=1, le=owner_search_service.MAX_LIMIT),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Busca propietarios del conjunto mientras el personal escribe.
+
+    Cada término debe coincidir como prefijo de una palabra (o en mitad de
+    ella si tiene 3+ caracteres) del nombre, la unidad o el correo. Se
+    ordena por unidad exacta, coincidencia de prefijo y nombre.
+
+    Reglas de negocio relacionadas:
+        - RB-03: El check-in confirma la asistencia antes de votar.
+        - RD-08: Se indica si el propietario tiene deuda.
+    """
+    current_meeting = owner_search_service.current_meeting_id(
+        db, condominium_id=condominium_id, meeting_id=meeting_id
+    )
+    if meeting_id is not None and current_meeting is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Asamblea no encontrada en el conjunto.",
+        )
+
+    page = owner_search_service.search_owners(
+        db,
+        condominium_id=condominium_id,
+        query=q,
+        limit=limit,
+        meeting_id=current_meeting,
+    )
+    return json_response(owner_search_service.OWNER_SEARCH_ADAPTER, page)
@@ -11,13 +11,15 @@ Y los esquemas:
 - QuorumDetail
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.orm import Session
 
 from app.core.db import get_db
+from app.core.http_cache import is_not_modified
 from app.core.security import get_current_user
 from app.models import Meeting, User
 from app.schemas.quorum_schema import QuorumDetail
+from app.services import archive_service, read_service
 from app.services.quorum_service import calculate_quorum
 
 router = APIRouter(prefix="/api/v1/quorum", tags=["quorum"])
@@ -26,6 +28,8 @@ router = APIRouter(prefix="/api/v1/quorum", tags=["quorum"])
 @router.get("/{meeting_id}", response_model=QuorumDetail)
 def get_quorum(
     meeting_id: int,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
@@ -36,9 +40,21 @@ def get_quorum(
         - Porcentaje de quórum.
         - Si cumple el mínimo.
         - Lista de presentes y sus coeficientes.
+
+    Respuesta condicional por versión de la asamblea (ETag / 304).
+    Las asambleas archivadas se leen de su archivo (archive_service).
     """
+    validators = read_service.get_meeting_validators(db, meeting_id=meeting_id)
+    if validators is not None:
+        if is_not_modified(request.headers, validators):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=validators.headers())
+        response.headers.update(validators.headers())
+
     meeting = db.query(Meeting).filter(Meeting.id == meeting_id).first()
     if not meeting:
+        archived = archive_service.archived_quorum(db, meeting_id)
+        if archived is not None:
+            return archived
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Asamblea no encontrada.",
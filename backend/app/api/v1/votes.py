@@ -6,7 +6,7 @@ Endpoints relacionados con el registro y consulta de votos.
 Aquí se conectan:
 - Modelos: Meeting, AgendaItem, Owner, Vote.
 - Esquemas: VoteCreate, VoteResponse.
-- Servicios: rule_engine, audit_service.
+- Servicios: rule_engine, lifecycle_service, audit_service.
 - Seguridad: cifrado de votos (encrypt_vote_value).
 
 Reglas de negocio aplicadas:
@@ -19,25 +19,38 @@ Reglas de negocio aplicadas:
 - RB-06: Registrar IP, fecha y hora del voto.
 """
 
-from typing import List
+from datetime import datetime, timezone
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.responses import JSONResponse
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from app.core import events
 from app.core.db import get_db
+from app.core.http_cache import is_not_modified
+from app.core.rate_limit import RateLimit, client_ip, path_param, token_subject
+from app.core.serialization import json_response
+from app.core.sharding import DEFAULT_SHARD
+from app.core.vote_journal import (
+    AgendaItemClosing,
+    DuplicateJournalVote,
+    JournalUnavailable,
+    vote_journal,
+)
 from app.core.security import (
     get_current_user,
     encrypt_vote_value,
+    vote_aad,
 )
-from app.models import (
-    Meeting,
-    AgendaItem,
-    Owner,
-    Vote,
-    User,
-)
-from app.schemas.vote_schema import VoteCreate, VoteResponse
+from app.models import User
+from app.schemas.vote_schema import VoteAccepted, VoteCreate, VoteResponse
+from app.services import archive_service
 from app.services import audit_service
+from app.services import lifecycle_service
+from app.services import outbox_service
+from app.services import read_service
 from app.services import rule_engine
 
 router = APIRouter(prefix="/api/v1/votes", tags=["votes"])
@@ -47,6 +60,12 @@ router = APIRouter(prefix="/api/v1/votes", tags=["votes"])
     "/{meeting_id}/agenda/{agenda_item_id}",
     response_model=VoteResponse,
     status_code=status.HTTP_201_CREATED,
+    responses={status.HTTP_202_ACCEPTED: {"model": VoteAccepted}},
+    dependencies=[
+        Depends(RateLimit("vote:user", "RATE_LIMIT_VOTE_PER_USER", token_subject)),
+        Depends(RateLimit("vote:ip", "RATE_LIMIT_VOTE_PER_IP", client_ip)),
+        Depends(RateLimit("vote:meeting", "RATE_LIMIT_VOTE_PER_MEETING", path_param("meeting_id"))),
+    ],
 )
 def cast_vote(
     meeting_id: int,
@@ -59,61 +78,107 @@ def cast_vote(
     Registra un voto para un punto de la agenda.
 
     Flujo:
-        1. Obtiene Meeting, AgendaItem y Owner (a partir de current_user).
-        2. Valida elegibilidad de voto mediante rule_engine.validate_vote_eligibility.
-        3. Cifra el valor del voto (encrypt_vote_value).
-        4. Persiste el voto.
+        0. Limitación de ritmo por usuario, IP y asamblea (core/rate_limit.py),
+           antes de abrir sesión: un rechazo (429) no toca la base.
+        1. Obtiene en una sola consulta los hechos de Meeting, AgendaItem y
+           Owner que exige rule_engine.VOTE_PIPELINE. El propietario es el de
+           current_user o, con vote_in.owner_id, el que representa por poder
+           (voting_rights, RD-02).
+        2. Valida elegibilidad de voto evaluando el pipeline sobre esos hechos.
+        3. Cifra el valor del voto (encrypt_vote_value), ligado a su fila por AAD.
+        4. Persiste el voto solo si el punto sigue OPEN
+           (lifecycle_service.insert_vote_if_open). En modo diario
+           (VOTE_INTAKE_MODE=journal) lo añade al diario local y responde
+           202; el aplicador lo inserta por lotes.
         5. Registra auditoría (audit_service.log_action).
 
     Si alguna regla se viola, se lanza HTTPException con detalle.
     """
-    meeting = db.query(Meeting).filter(Meeting.id == meeting_id).first()
-    if not meeting:
+    facts = rule_engine.VOTE_PIPELINE.load_facts(
+        db,
+        meeting_id=meeting_id,
+        agenda_item_id=agenda_item_id,
+        user_id=current_user.id,
+        represented_owner_id=vote_in.owner_id,
+    )
+    if facts.meeting_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Asamblea no encontrada.",
         )
 
-    agenda_item = (
-        db.query(AgendaItem)
-        .filter(
-            AgendaItem.id == agenda_item_id,
-            AgendaItem.meeting_id == meeting_id,
-        )
-        .first()
-    )
-    if not agenda_item:
+    if facts.agenda_item_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Punto de agenda no encontrado.",
         )
 
-    owner = db.query(Owner).filter(Owner.user_id == current_user.id).first()
-    if not owner:
+    if facts.owner_id is None and vote_in.owner_id is not None:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=(
+                f"El usuario actual no vota por el propietario (id={vote_in.owner_id}) "
+                "en esta asamblea (RD-02)."
+            ),
+        )
+
+    if facts.owner_id is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="El usuario actual no está asociado a un propietario.",
         )
 
     # Validar todas las reglas de negocio antes de registrar el voto
-    rule_engine.validate_vote_eligibility(
-        db=db,
-        meeting=meeting,
-        agenda_item=agenda_item,
-        owner=owner,
+    rule_engine.VOTE_PIPELINE.evaluate(facts)
+
+    value_encrypted = encrypt_vote_value(
+        vote_in.value,
+        associated_data=vote_aad(agenda_item_id, facts.owner_id),
     )
 
-    value_encrypted = encrypt_vote_value(vote_in.value)
+    if vote_journal.running:
+        return _journal_vote(
+            db,
+            meeting_id=meeting_id,
+            agenda_item_id=agenda_item_id,
+            owner_id=facts.owner_id,
+            user_id=current_user.id,
+            value_encrypted=value_encrypted,
+            ip_address=vote_in.ip_address,
+        )
 
-    vote = Vote(
-        agenda_item_id=agenda_item_id,
-        owner_id=owner.id,
-        value_encrypted=value_encrypted,
-        ip_address=vote_in.ip_address,
+    # Inserción condicionada al estado OPEN: ningún voto confirma tras el cierre
+    try:
+        vote = lifecycle_service.insert_vote_if_open(
+            db,
+            agenda_item_id=agenda_item_id,
+            owner_id=facts.owner_id,
+            value_encrypted=value_encrypted,
+            ip_address=vote_in.ip_address,
+        )
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="El propietario ya registró un voto para este punto de agenda.",
+        )
+    if vote is None:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=(
+                f"El punto de agenda (id={agenda_item_id}) se cerró antes de registrar el voto."
+            ),
+        )
+    outbox_service.emit(
+        db,
+        events.VOTE_CAST,
+        meeting_id=meeting_id,
+        entity_type="Vote",
+        entity_id=vote.id,
+        payload={"agenda_item_id": agenda_item_id, "owner_id": facts.owner_id},
     )
-    db.add(vote)
     db.commit()
-    db.refresh(vote)
 
     audit_service.log_action(
         db,
@@ -122,18 +187,63 @@ def cast_vote(
         entity_type="Vote",
         entity_id=vote.id,
         description=(
-            f"Voto emitido para agenda_item_id={agenda_item_id}, owner_id={owner.id}"
+            f"Voto emitido para agenda_item_id={agenda_item_id}, owner_id={facts.owner_id}"
         ),
     )
 
     return VoteResponse(
         id=vote.id,
-        agenda_item_id=vote.agenda_item_id,
-        owner_id=vote.owner_id,
+        agenda_item_id=agenda_item_id,
+        owner_id=facts.owner_id,
         created_at=vote.created_at,
     )
 
 
+def _journal_vote(
+    db: Session,
+    *,
+    meeting_id: int,
+    agenda_item_id: int,
+    owner_id: int,
+    user_id: int,
+    value_encrypted: str,
+    ip_address: Optional[str],
+) -> JSONResponse:
+    """
+    Modo diario: añade el voto al diario local y responde 202 tras el fsync.
+
+    El aplicador lo inserta en votes y audit_logs por lotes
+    (vote_intake_service).
+    """
+    try:
+        record = vote_journal.append(
+            shard=db.info.get("shard", DEFAULT_SHARD),
+            meeting_id=meeting_id,
+            agenda_item_id=agenda_item_id,
+            owner_id=owner_id,
+            user_id=user_id,
+            value_encrypted=value_encrypted,
+            ip_address=ip_address,
+            created_at=datetime.now(timezone.utc),
+        )
+    except (DuplicateJournalVote, AgendaItemClosing) as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+    except JournalUnavailable as exc:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(exc),
+            headers={"Retry-After": "1"},
+        )
+
+    accepted = VoteAccepted(
+        agenda_item_id=record.agenda_item_id,
+        owner_id=record.owner_id,
+        journal_seq=record.seq,
+        accepted_at=record.created_at,
+    )
+    return JSONResponse(status_code=status.HTTP_202_ACCEPTED, content=accepted.model_dump(mode="json"))
+
+
 @router.get(
     "/{meeting_id}/agenda/{agenda_item_id}",
     response_model=List[VoteResponse],
@@ -141,6 +251,7 @@ def cast_vote(
 def list_votes_for_agenda_item(
     meeting_id: int,
     agenda_item_id: int,
+    request: Request,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
@@ -151,34 +262,29 @@ def list_votes_for_agenda_item(
         - No expone el valor del voto (value_encrypted).
         - Este endpoint sirve para auditoría básica o validación, no para
           mostrar resultados en claro (eso iría en otra capa agregada).
+        - Selecciona solo columnas y serializa directamente (read_service).
+        - Respuesta condicional por versión de la asamblea (ETag / 304).
+        - Las asambleas archivadas se leen de su archivo (archive_service).
     """
-    agenda_item = (
-        db.query(AgendaItem)
-        .filter(
-            AgendaItem.id == agenda_item_id,
-            AgendaItem.meeting_id == meeting_id,
+    validators = read_service.get_meeting_validators(db, meeting_id=meeting_id)
+    if validators is not None and is_not_modified(request.headers, validators):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=validators.headers())
+
+    if read_service.agenda_item_exists(
+        db, meeting_id=meeting_id, agenda_item_id=agenda_item_id
+    ):
+        rows = read_service.list_vote_rows(db, agenda_item_id=agenda_item_id)
+    else:
+        rows = archive_service.archived_vote_rows(
+            db, meeting_id=meeting_id, agenda_item_id=agenda_item_id
         )
-        .first()
-    )
-    if not agenda_item:
+    if rows is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Punto de agenda no encontrado.",
         )
 
-    votes = (
-        db.query(Vote)
-        .filter(Vote.agenda_item_id == agenda_item_id)
-        .order_by(Vote.created_at.asc())
-        .all()
-    )
-
-    return [
-        VoteResponse(
-            id=v.id,
-            agenda_item_id=v.agenda_item_id,
-            owner_id=v.owner_id,
-            created_at=v.created_at,
-        )
-        for v in votes
-    ]
+    response = json_response(read_service.VOTE_ROWS_ADAPTER, rows)
+    if validators is not None:
+        response.headers.update(validators.headers())
+    return response
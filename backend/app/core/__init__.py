@@ -12,6 +12,42 @@ Submódulos principales:
         variables de entorno y parámetros de negocio (quórum, JWT,
         credenciales de BD, etc).
 
+    - db.py:
+        Motor, sesiones y modo embebido (SQLite WAL).
+
+    - schema.py:
+        Migraciones (Alembic) al arrancar, solo si cambió la huella del esquema.
+
+    - sharding.py:
+        Enrutamiento multi-tenant: resuelve el shard de cada conjunto.
+
+    - replicas.py:
+        Lecturas desde réplica con tokens de consistencia read-your-writes.
+
+    - vote_crypto.py:
+        Cifrado autenticado de votos (AES-256-GCM) individual y por lotes.
+
+    - vote_journal.py:
+        Diario local de votos con group commit para absorber picos de votación.
+
+    - events.py:
+        Bus de eventos de dominio en proceso (alimentado por el outbox).
+
+    - rate_limit.py:
+        Limitación de ritmo por token bucket (en proceso o compartida en Redis).
+
+    - admission.py:
+        Control de admisión por prioridad de ruta y descarte de carga (503).
+
+    - profiling.py:
+        Perfilado bajo demanda de peticiones (pilas muestreadas + SQL).
+
+    - slow_queries.py:
+        Registro de sentencias SQL lentas con su plan (EXPLAIN).
+
+    - tracing.py:
+        Trazas de extremo a extremo exportadas en formato OpenTelemetry (OTLP/JSON).
+
     - security.py:
         Implementa funciones criptográficas, hashing de contraseñas
         (bcrypt), generación y validación de tokens JWT y utilidades
@@ -22,4 +58,4 @@ de soporte que no pertenecen a un dominio funcional específico, permitiendo
 una arquitectura más ordenada, testeable y mantenible.
 """
 
-__all__ = ["config", "security"]
+__all__ = ["config", "db", "schema", "security", "sharding", "replicas", "vote_crypto", "vote_journal", "events", "rate_limit", "admission", "profiling", "slow_queries", "tracing"]
@@ -0,0 +1,336 @@
+"""
+backend/app/core/admission.py
+
+Control de admisión por prioridad y descarte de carga.
+
+Cada petición HTTP se clasifica por método y ruta en una clase:
+    - critical: votar, registrar presencia, login y cambios de estado.
+    - interactive: el resto de la API.
+    - background: listados y lecturas de auditoría (lista de asambleas,
+      votos de un punto, catálogo de reglas, documentación).
+
+Cada clase tiene un máximo de peticiones en curso y una cola FIFO de
+espera acotada (ADMISSION_*_CONCURRENCY / ADMISSION_*_QUEUE). Con la cola
+llena, o tras ADMISSION_QUEUE_TIMEOUT_MS esperando, se responde 503 con
+Retry-After sin llegar a la aplicación (no ocupa hilo ni conexión).
+
+Además, si el sistema está saturado (pool de conexiones del motor
+principal agotado, todos los hilos del threadpool ocupados o retraso del
+event loop mayor que ADMISSION_LOOP_LAG_MS):
+    - background se descarta de inmediato;
+    - interactive se descarta si tendría que esperar en cola;
+    - critical sigue admitiéndose según su propio presupuesto.
+
+La espera en cola se mide por clase (admission_controller.stats()) y se
+devuelve en la cabecera Server-Timing ("queue;dur=<ms>") para ajustar los
+límites con el simulador de carga.
+"""
+
+import asyncio
+import json
+import logging
+import re
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Pattern, Tuple
+
+from anyio import to_thread
+
+from app.core.config import Settings, get_settings
+from app.core.db import engine
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+CRITICAL = "critical"
+INTERACTIVE = "interactive"
+BACKGROUND = "background"
+ROUTE_CLASSES = (CRITICAL, INTERACTIVE, BACKGROUND)
+
+# (métodos, patrón de ruta, clase); gana la primera coincidencia.
+# Los patrones anclan solo el final: los routers se montan con prefijos repetidos.
+ROUTE_RULES: List[Tuple[frozenset, Pattern[str], Optional[str]]] = [
+    (frozenset({"GET", "HEAD"}), re.compile(r"^/health$"), None),
+    (frozenset({"POST"}), re.compile(r"/votes/\d+/agenda/\d+$"), CRITICAL),
+    (frozenset({"POST"}), re.compile(r"/meetings/\d+/presence(/bulk|/scan)?$"), CRITICAL),
+    (frozenset({"POST"}), re.compile(r"/auth/login$"), CRITICAL),
+    (frozenset({"PATCH"}), re.compile(r"/meetings/\d+(/agenda/\d+)?/status$"), CRITICAL),
+    (frozenset({"GET", "HEAD"}), re.compile(r"/meetings/?$"), BACKGROUND),
+    (frozenset({"GET", "HEAD"}), re.compile(r"/votes/\d+/agenda/\d+$"), BACKGROUND),
+    (frozenset({"GET", "HEAD"}), re.compile(r"/rules/?$"), BACKGROUND),
+    (frozenset({"GET", "HEAD"}), re.compile(r"^/(docs|redoc|openapi\.json)"), BACKGROUND),
+]
+
+# Esperas recientes por clase para los percentiles
+_WAIT_SAMPLES = 1024
+
+
+def classify(method: str, path: str) -> Optional[str]:
+    """
+    Clase de admisión de una petición; None = exenta (healthcheck).
+    """
+    for methods, pattern, route_class in ROUTE_RULES:
+        if method in methods and pattern.search(path):
+            return route_class
+    return INTERACTIVE
+
+
+class Shed(Exception):
+    """
+    La petición no se admite (cola llena, espera agotada o saturación).
+    """
+
+    def __init__(self, reason: str) -> None:
+        super().__init__(reason)
+        self.reason = reason
+
+
+class ClassGate:
+    """
+    Límite de concurrencia y cola FIFO de una clase (solo desde el event loop).
+    """
+
+    def __init__(self, name: str, concurrency: int, max_queue: int) -> None:
+        self.name = name
+        self.concurrency = concurrency
+        self.max_queue = max_queue
+        self.active = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self.admitted = 0
+        self.shed: Dict[str, int] = {}
+        self.total_wait_s = 0.0
+        self.max_wait_s = 0.0
+        self._waits: Deque[float] = deque(maxlen=_WAIT_SAMPLES)
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    async def acquire(self, timeout: float, *, queue_allowed: bool = True) -> float:
+        """
+        Toma un turno. Retorna los segundos esperados o lanza Shed.
+        """
+        if self.active < self.concurrency and not self._waiters:
+            self.active += 1
+            self._record_wait(0.0)
+            return 0.0
+        if not queue_allowed:
+            raise self.reject("saturated")
+        if len(self._waiters) >= self.max_queue:
+            raise self.reject("queue_full")
+
+        start = time.perf_counter()
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as exc:
+            if waiter.done() and not waiter.cancelled():
+                # El turno llegó a la vez que el fin de la espera: se cede
+                self.release()
+            else:
+                waiter.cancel()
+                try:
+                    self._waiters.remove(waiter)
+                except ValueError:
+                    pass
+            if isinstance(exc, asyncio.CancelledError):
+                raise
+            raise self.reject("timeout")
+        waited = time.perf_counter() - start
+        self._record_wait(waited)
+        return waited
+
+    def release(self) -> None:
+        """
+        Libera un turno y lo entrega al primer turno en espera, si hay.
+        """
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.active -= 1
+
+    def _record_wait(self, waited: float) -> None:
+        self.admitted += 1
+        self.total_wait_s += waited
+        self.max_wait_s = max(self.max_wait_s, waited)
+        self._waits.append(waited)
+
+    def reject(self, reason: str) -> Shed:
+        """
+        Cuenta un descarte y devuelve la excepción correspondiente.
+        """
+        self.shed[reason] = self.shed.get(reason, 0) + 1
+        return Shed(reason)
+
+    def stats(self) -> dict:
+        waits = sorted(self._waits)
+
+        def percentile(p: float) -> float:
+            if not waits:
+                return 0.0
+            return waits[min(len(waits) - 1, int(p * len(waits)))] * 1000.0
+
+        return {
+            "concurrency": self.concurrency,
+            "max_queue": self.max_queue,
+            "active": self.active,
+            "queued": self.queued,
+            "admitted": self.admitted,
+            "shed": dict(self.shed),
+            "avg_wait_ms": (self.total_wait_s / self.admitted) * 1000.0 if self.admitted else 0.0,
+            "p50_wait_ms": percentile(0.50),
+            "p95_wait_ms": percentile(0.95),
+            "max_wait_ms": self.max_wait_s * 1000.0,
+        }
+
+
+class AdmissionController:
+    """
+    Compuertas por clase y señales de saturación del proceso.
+    """
+
+    def __init__(self, cfg: Settings) -> None:
+        self._cfg = cfg
+        self.gates: Dict[str, ClassGate] = {
+            CRITICAL: ClassGate(
+                CRITICAL, cfg.ADMISSION_CRITICAL_CONCURRENCY, cfg.ADMISSION_CRITICAL_QUEUE
+            ),
+            INTERACTIVE: ClassGate(
+                INTERACTIVE, cfg.ADMISSION_INTERACTIVE_CONCURRENCY, cfg.ADMISSION_INTERACTIVE_QUEUE
+            ),
+            BACKGROUND: ClassGate(
+                BACKGROUND, cfg.ADMISSION_BACKGROUND_CONCURRENCY, cfg.ADMISSION_BACKGROUND_QUEUE
+            ),
+        }
+        self.loop_lag_ms = 0.0
+        self._monitor: Optional[asyncio.Task] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self._cfg.ADMISSION_ENABLED
+
+    @property
+    def queue_timeout_s(self) -> float:
+        return self._cfg.ADMISSION_QUEUE_TIMEOUT_MS / 1000.0
+
+    # ---------- Señales de saturación ----------
+
+    def ensure_monitor(self) -> None:
+        """
+        Arranca (una vez por event loop) la medición del retraso del loop.
+        """
+        if self._monitor is None or self._monitor.done():
+            self._monitor = asyncio.get_running_loop().create_task(self._measure_loop_lag())
+
+    async def _measure_loop_lag(self) -> None:
+        interval = 0.1
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(interval)
+            lag_ms = max(0.0, (time.perf_counter() - start - interval) * 1000.0)
+            # Media móvil: un pico aislado no dispara el descarte
+            self.loop_lag_ms = 0.7 * self.loop_lag_ms + 0.3 * lag_ms
+
+    def saturation(self) -> Optional[str]:
+        """
+        Motivo de saturación actual, o None.
+        """
+        if self.loop_lag_ms > self._cfg.ADMISSION_LOOP_LAG_MS:
+            return "event_loop"
+
+        try:
+            limiter = to_thread.current_default_thread_limiter()
+        except RuntimeError:
+            limiter = None
+        if limiter is not None and limiter.borrowed_tokens >= limiter.total_tokens:
+            return "threadpool"
+
+        pool = engine.pool
+        if hasattr(pool, "checkedout") and hasattr(pool, "size"):
+            # QueuePool no expone el máximo de desbordamiento de forma pública
+            capacity = pool.size() + max(0, getattr(pool, "_max_overflow", 0))
+            if capacity > 0 and pool.checkedout() >= capacity:
+                return "db_pool"
+        return None
+
+    def stats(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "saturation": self.saturation(),
+            "loop_lag_ms": self.loop_lag_ms,
+            "classes": {name: gate.stats() for name, gate in self.gates.items()},
+        }
+
+
+admission_controller = AdmissionController(settings)
+
+
+class AdmissionControlMiddleware:
+    """
+    Middleware ASGI que aplica el control de admisión antes de enrutar.
+    """
+
+    def __init__(self, app, controller: AdmissionController = admission_controller) -> None:
+        self.app = app
+        self.controller = controller
+
+    async def __call__(self, scope, receive, send):
+        controller = self.controller
+        if scope["type"] != "http" or not controller.enabled:
+            await self.app(scope, receive, send)
+            return
+        route_class = classify(scope["method"], scope["path"])
+        if route_class is None:
+            await self.app(scope, receive, send)
+            return
+
+        controller.ensure_monitor()
+        gate = controller.gates[route_class]
+        queue_allowed = True
+        if route_class != CRITICAL:
+            saturated = controller.saturation()
+            if saturated is not None:
+                if route_class == BACKGROUND:
+                    await self._reject(send, gate.reject("saturated"), route_class, saturated)
+                    return
+                queue_allowed = False
+        try:
+            waited = await gate.acquire(controller.queue_timeout_s, queue_allowed=queue_allowed)
+        except Shed as exc:
+            await self._reject(send, exc, route_class, exc.reason)
+            return
+
+        timing = f"queue;dur={waited * 1000.0:.1f};desc={route_class}".encode("latin-1")
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", timing))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            gate.release()
+
+    async def _reject(self, send, exc: Shed, route_class: str, reason: str) -> None:
+        logger.debug("Admisión: petición %s descartada (%s).", route_class, reason)
+        body = json.dumps(
+            {"detail": "Servicio saturado; intente de nuevo en unos segundos."}
+        ).encode("utf-8")
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 503,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode("latin-1")),
+                    (b"retry-after", b"1"),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
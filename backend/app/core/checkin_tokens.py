@@ -0,0 +1,143 @@
+"""
+backend/app/core/checkin_tokens.py
+
+Tokens de check-in firmados para AgoraX.
+
+Cada propietario recibe, por asamblea, un token compacto (apto para QR) que
+incluye owner_id, meeting_id, coeficiente y expiración, firmado con
+HMAC-SHA256. La puerta puede verificarlo sin consultar Owner ni Meeting:
+la firma garantiza que los datos los emitió el backend.
+
+El secreto (CHECKIN_TOKEN_SECRET) no depende de JWT_SECRET: sin él el
+arranque falla salvo con APP_ENV=development, donde se usa un secreto de
+desarrollo fijo (DEV_CHECKIN_TOKEN_SECRET) y se avisa en el log.
+
+Formato:
+    ck1:<meeting_id>:<owner_id>:<coeficiente>:<exp_unix>:<firma_base64url>
+"""
+
+import base64
+import hashlib
+import hmac
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import lru_cache
+
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+TOKEN_PREFIX = "ck1"
+
+# Solo para APP_ENV=development: cualquiera puede firmar tokens con él
+DEV_CHECKIN_TOKEN_SECRET = "agorax-dev-checkin-secret-not-for-production"
+
+
+@dataclass(frozen=True, slots=True)
+class CheckinClaims:
+    """
+    Datos verificados de un token de check-in.
+    """
+
+    meeting_id: int
+    owner_id: int
+    coeficiente: float
+    expires_at: int
+
+
+class InvalidCheckinToken(ValueError):
+    """
+    El token está mal formado, tiene firma inválida, expiró o es de otra asamblea.
+    """
+
+
+@lru_cache()
+def checkin_token_secret() -> str:
+    """
+    Secreto de firma de los tokens de check-in.
+
+    Excepciones:
+        - RuntimeError si falta CHECKIN_TOKEN_SECRET fuera de APP_ENV=development.
+    """
+    if settings.CHECKIN_TOKEN_SECRET:
+        return settings.CHECKIN_TOKEN_SECRET
+    if settings.APP_ENV != "development":
+        raise RuntimeError(
+            f"CHECKIN_TOKEN_SECRET es obligatoria con APP_ENV={settings.APP_ENV}."
+        )
+    logger.warning("CHECKIN_TOKEN_SECRET no configurada: se usa el secreto de desarrollo.")
+    return DEV_CHECKIN_TOKEN_SECRET
+
+
+@lru_cache()
+def _signing_key() -> bytes:
+    """
+    Deriva la clave HMAC una sola vez.
+    """
+    secret = checkin_token_secret()
+    return hashlib.sha256(b"agorax-checkin:" + secret.encode("utf-8")).digest()
+
+
+def _sign(message: str) -> str:
+    digest = hmac.new(_signing_key(), message.encode("ascii"), hashlib.sha256).digest()
+    return base64.urlsafe_b64encode(digest).rstrip(b"=").decode("ascii")
+
+
+def issue_checkin_token(
+    *,
+    meeting_id: int,
+    owner_id: int,
+    coeficiente: float,
+    expires_at: int,
+) -> str:
+    """
+    Emite un token de check-in firmado.
+
+    Parámetros:
+        meeting_id: Asamblea para la que vale el token.
+        owner_id: Propietario titular.
+        coeficiente: Coeficiente de copropiedad que aportará al quórum.
+        expires_at: Expiración como timestamp UNIX (segundos).
+    """
+    message = f"{TOKEN_PREFIX}:{meeting_id}:{owner_id}:{float(coeficiente)!r}:{int(expires_at)}"
+    return f"{message}:{_sign(message)}"
+
+
+def verify_checkin_token(token: str, *, meeting_id: int) -> CheckinClaims:
+    """
+    Verifica firma, expiración y asamblea de un token de check-in.
+
+    No consulta la base de datos.
+
+    Excepciones:
+        - InvalidCheckinToken si el token no es válido para esta asamblea.
+    """
+    # El token llega del cliente: fuera de ASCII no puede ser nuestro (y _sign lo exige)
+    token = token.strip()
+    if not token.isascii():
+        raise InvalidCheckinToken("Token de check-in mal formado.")
+    message, _, signature = token.rpartition(":")
+    parts = message.split(":")
+    if len(parts) != 5 or parts[0] != TOKEN_PREFIX:
+        raise InvalidCheckinToken("Token de check-in mal formado.")
+
+    if not hmac.compare_digest(_sign(message).encode("ascii"), signature.encode("ascii")):
+        raise InvalidCheckinToken("Firma del token de check-in inválida.")
+
+    try:
+        claims = CheckinClaims(
+            meeting_id=int(parts[1]),
+            owner_id=int(parts[2]),
+            coeficiente=float(parts[3]),
+            expires_at=int(parts[4]),
+        )
+    except ValueError as exc:
+        raise InvalidCheckinToken("Token de check-in mal formado.") from exc
+
+    if claims.meeting_id != meeting_id:
+        raise InvalidCheckinToken("El token de check-in pertenece a otra asamblea.")
+    if claims.expires_at < datetime.now(timezone.utc).timestamp():
+        raise InvalidCheckinToken("El token de check-in expiró.")
+    return claims
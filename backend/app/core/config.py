@@ -18,14 +18,24 @@ class Settings(BaseSettings):
     Atributos principales:
         APP_NAME: Nombre visible de la API.
         APP_VERSION: Versión del backend.
+        APP_ENV: Entorno ("development" admite claves de desarrollo).
+        DB_BACKEND: Motor de base de datos ("postgresql" o "sqlite").
         POSTGRES_*: Parámetros de conexión a PostgreSQL.
+        SQLITE_*: Parámetros del modo embebido (SQLite en modo WAL).
+        SHARD_*: Sharding multi-tenant por conjunto (vacío = deshabilitado).
+        READ_REPLICA_URL / REPLICA_*: Réplica de lectura y token read-your-writes.
         JWT_*: Configuración de tokens JWT.
         QUORUM_MIN: Umbral mínimo de quórum.
-        VOTE_ENCRYPTION_KEY: Clave opcional para cifrar votos.
+        VOTE_ENCRYPTION_KEY: Clave de cifrado de votos (obligatoria fuera de desarrollo).
+        CHECKIN_TOKEN_*: Firma de los tokens de check-in (secreto obligatorio fuera de desarrollo).
+        VOTE_INTAKE_MODE / VOTE_JOURNAL_*: Recepción de votos directa o por diario local.
+        OUTBOX_*: Relay del outbox transaccional hacia el bus de eventos.
     """
 
     APP_NAME: str = "AgoraX Backend API"
     APP_VERSION: str = "1.0.0"
+    # Fuera de "development" el arranque exige VOTE_ENCRYPTION_KEY y CHECKIN_TOKEN_SECRET
+    APP_ENV: str = "development"
 
     POSTGRES_USER: str = "agx_user"
     POSTGRES_PASSWORD: str = "agx_pass"
@@ -33,13 +43,111 @@ class Settings(BaseSettings):
     POSTGRES_HOST: str = "db"
     POSTGRES_PORT: int = 5432
 
+    # Modo embebido para conjuntos pequeños y pruebas: DB_BACKEND=sqlite
+    DB_BACKEND: str = "postgresql"
+    SQLITE_PATH: str = "agorax.db"
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    SQLITE_CACHE_SIZE_KB: int = 16384
+    SQLITE_MMAP_SIZE: int = 134217728
+
+    # Sharding por conjunto: {"nombre": "url"}; el motor principal es el shard "default"
+    SHARD_DATABASE_URLS: dict[str, str] = {}
+    SHARD_ROUTE_CACHE_SECONDS: float = 30.0
+
+    # Réplica de lectura para GET/HEAD (None = todo al primario)
+    READ_REPLICA_URL: str | None = None
+    REPLICA_MAX_WAIT_MS: int = 200
+    REPLICA_CONSISTENCY_WINDOW_SECONDS: float = 5.0
+
+    # Arranque: migraciones (alembic upgrade head) solo si la huella del esquema cambió
+    SCHEMA_AUTO_CREATE: bool = True
+
     JWT_SECRET: str = "secret123"
     JWT_ALGORITHM: str = "HS256"
     JWT_EXPIRE_MINUTES: int = 60
 
     QUORUM_MIN: float = 51.0
 
+    # Independiente de JWT_SECRET: rotar el JWT no debe dejar votos sin descifrar
     VOTE_ENCRYPTION_KEY: str | None = None
+    # Claves anteriores aceptadas solo para descifrar durante una rotación
+    VOTE_ENCRYPTION_OLD_KEYS: list[str] = []
+
+    # Tokens de check-in (QR) firmados con HMAC-SHA256; independiente de JWT_SECRET
+    CHECKIN_TOKEN_SECRET: str | None = None
+    CHECKIN_TOKEN_TTL_HOURS: int = 24
+
+    # Recepción de votos: "direct" (INSERT por voto) o "journal" (diario local + aplicador por lotes)
+    VOTE_INTAKE_MODE: str = "direct"
+    VOTE_JOURNAL_DIR: str = "vote_journal"
+    VOTE_JOURNAL_GROUP_COMMIT_MS: float = 2.0
+    VOTE_JOURNAL_APPLY_BATCH: int = 500
+    VOTE_JOURNAL_APPLY_INTERVAL_MS: float = 50.0
+    VOTE_JOURNAL_SEGMENT_BYTES: int = 16777216
+
+    # Outbox de eventos de dominio: relay en proceso y, opcionalmente, LISTEN/NOTIFY
+    OUTBOX_RELAY_INTERVAL_MS: float = 200.0
+    OUTBOX_BATCH_SIZE: int = 200
+    OUTBOX_GAP_TIMEOUT_MS: float = 2000.0
+    OUTBOX_NOTIFY_CHANNEL: str | None = None
+
+    # Limitación de ritmo (token bucket): "N/periodo" con periodo s, min, h; vacío desactiva la regla
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_BACKEND: str = "memory"
+    RATE_LIMIT_REDIS_URL: str | None = None
+    RATE_LIMIT_VOTE_PER_USER: str = "10/min"
+    RATE_LIMIT_VOTE_PER_IP: str = "600/min"
+    RATE_LIMIT_VOTE_PER_MEETING: str = "200/s"
+    RATE_LIMIT_LOGIN_PER_IP: str = "60/min"
+    RATE_LIMIT_CHECKIN_PER_USER: str = "120/min"
+    RATE_LIMIT_CHECKIN_PER_MEETING: str = "50/s"
+
+    # Control de admisión por clase de ruta (critical / interactive / background)
+    ADMISSION_ENABLED: bool = True
+    ADMISSION_CRITICAL_CONCURRENCY: int = 64
+    ADMISSION_CRITICAL_QUEUE: int = 512
+    ADMISSION_INTERACTIVE_CONCURRENCY: int = 32
+    ADMISSION_INTERACTIVE_QUEUE: int = 128
+    ADMISSION_BACKGROUND_CONCURRENCY: int = 8
+    ADMISSION_BACKGROUND_QUEUE: int = 16
+    ADMISSION_QUEUE_TIMEOUT_MS: float = 2000.0
+    ADMISSION_LOOP_LAG_MS: float = 100.0
+
+    # Búsqueda de propietarios en el check-in: índice en memoria por conjunto
+    OWNER_SEARCH_TTL_SECONDS: float = 300.0
+    OWNER_SEARCH_MAX_CONDOMINIUMS: int = 256
+
+    # Perfilado bajo demanda: cabecera X-Profile (solo ADMIN) o muestreo aleatorio de peticiones
+    PROFILING_ENABLED: bool = False
+    PROFILING_SAMPLE_RATE: float = 0.0
+    PROFILING_INTERVAL_MS: float = 5.0
+    PROFILING_MAX_SECONDS: float = 30.0
+    PROFILING_DIR: str = "profiles"
+    PROFILING_MAX_PROFILES: int = 50
+
+    # Registro de sentencias lentas; plan: "off", "plan" (EXPLAIN) o "analyze" (EXPLAIN ANALYZE, solo SELECT)
+    SLOW_QUERY_LOG_ENABLED: bool = True
+    SLOW_QUERY_THRESHOLD_MS: float = 100.0
+    SLOW_QUERY_BUFFER_SIZE: int = 200
+    SLOW_QUERY_EXPLAIN: str = "plan"
+    SLOW_QUERY_EXPLAIN_INTERVAL_S: float = 60.0
+
+    # Trazas OpenTelemetry (OTLP/JSON); exportador: "file" (JSON por línea) u "otlp" (POST a un colector)
+    TRACING_ENABLED: bool = False
+    TRACING_SAMPLE_RATE: float = 1.0
+    TRACING_EXPORTER: str = "file"
+    TRACING_FILE: str = "traces.jsonl"
+    TRACING_OTLP_ENDPOINT: str = "http://localhost:4318/v1/traces"
+    TRACING_SERVICE_NAME: str = "agorax-backend"
+    TRACING_SQL_SPANS: bool = True
+
+    # Archivado en frío de asambleas cerradas (archivos .json.gz verificados por SHA-256)
+    ARCHIVE_DIR: str = "archives"
+    ARCHIVE_AFTER_DAYS: int = 30
+    ARCHIVE_CACHE_SIZE: int = 32
+
+    # Panel de asambleas (administración): agregados por asamblea en caché según su versión
+    DASHBOARD_CACHE_SIZE: int = 4096
 
     class Config:
         """
@@ -5,18 +5,41 @@ Módulo de conexión a base de datos para AgoraX.
 
 Define:
 - Base: clase base de modelos SQLAlchemy.
-- engine: motor de conexión a PostgreSQL.
+- engine: motor de conexión (PostgreSQL o SQLite embebido según DB_BACKEND).
 - SessionLocal: fábrica de sesiones.
-- get_db: dependencia reutilizable para FastAPI.
+- get_db: dependencia reutilizable para FastAPI (sesión del shard del conjunto).
+- get_directory_db: sesión del motor principal (usuarios y enrutamiento).
+
+Las lecturas GET/HEAD pueden servirse desde una réplica (ver app.core.replicas).
+
+Todos los motores miden sus sentencias y envían las que superan
+SLOW_QUERY_THRESHOLD_MS al registro de sentencias lentas
+(ver app.core.slow_queries).
+
+Modo embebido (DB_BACKEND=sqlite):
+    Pensado para conjuntos pequeños y para pruebas sin contenedor de Postgres.
+    La base se abre en modo WAL con pragmas ajustados, de modo que las
+    lecturas son concurrentes y las escrituras se serializan en una cola
+    FIFO de un solo escritor (SQLiteWriterQueue) en lugar de competir por el
+    bloqueo de SQLite y fallar con "database is locked".
 """
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, DeclarativeBase
+import threading
+import time
 
-from app.core.config import get_settings
+from fastapi import Depends, HTTPException, Request, status
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, sessionmaker, DeclarativeBase
+
+from app.core.config import Settings, get_settings
+from app.core.slow_queries import slow_query_log
 
 settings = get_settings()
 
+# Sentencias que obligan a tomar el turno de escritura en SQLite
+_SQLITE_WRITE_PREFIXES = ("INSERT", "UPDATE", "DELETE", "REPLACE")
+
 
 class Base(DeclarativeBase):
     """
@@ -28,14 +51,195 @@ class Base(DeclarativeBase):
     pass
 
 
-DATABASE_URL = (
-    f"postgresql+psycopg2://{settings.POSTGRES_USER}:"
-    f"{settings.POSTGRES_PASSWORD}@{settings.POSTGRES_HOST}:"
-    f"{settings.POSTGRES_PORT}/{settings.POSTGRES_DB}"
-)
+@event.listens_for(Base.metadata, "before_create")
+def _sqlite_autoincrement(metadata, connection, tables=None, **kw):
+    """
+    En SQLite crea las PK enteras con AUTOINCREMENT.
+
+    Así cada base lleva su contador en sqlite_sequence, que permite asignar
+    rangos de IDs disjuntos por shard (ver shard_service.provision_shard).
+    """
+    if connection.dialect.name != "sqlite":
+        return
+    for table in tables if tables is not None else metadata.tables.values():
+        table.dialect_options["sqlite"]["autoincrement"] = True
+
+
+class SQLiteWriterQueue:
+    """
+    Cola FIFO de un solo escritor para el modo embebido.
+
+    SQLite admite un único escritor a la vez. En lugar de dejar que los
+    hilos compitan por el bloqueo (y reintenten con busy_timeout), cada
+    transacción de escritura toma un turno al emitir su primera sentencia
+    DML y lo libera al hacer commit o rollback. Los turnos se atienden en
+    orden de llegada.
+
+    También lleva estadísticas de espera, útiles para el simulador de carga.
+    """
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition()
+        self._next_ticket = 0
+        self._serving = 0
+        self.acquired = 0
+        self.total_wait_s = 0.0
+        self.max_wait_s = 0.0
+
+    def acquire(self) -> None:
+        """
+        Espera el turno de escritura (bloqueante, orden FIFO).
+        """
+        start = time.perf_counter()
+        with self._cond:
+            ticket = self._next_ticket
+            self._next_ticket += 1
+            while self._serving != ticket:
+                self._cond.wait()
+            waited = time.perf_counter() - start
+            self.acquired += 1
+            self.total_wait_s += waited
+            self.max_wait_s = max(self.max_wait_s, waited)
+
+    def release(self) -> None:
+        """
+        Cede el turno al siguiente escritor en la cola.
+        """
+        with self._cond:
+            self._serving += 1
+            self._cond.notify_all()
+
+    @property
+    def depth(self) -> int:
+        """
+        Número de escritores activos o en espera.
+        """
+        with self._cond:
+            return self._next_ticket - self._serving
+
+    def stats(self) -> dict:
+        """
+        Devuelve un resumen de la contención de escritura.
+        """
+        with self._cond:
+            return {
+                "acquired": self.acquired,
+                "depth": self._next_ticket - self._serving,
+                "avg_wait_ms": (
+                    (self.total_wait_s / self.acquired) * 1000.0 if self.acquired else 0.0
+                ),
+                "max_wait_ms": self.max_wait_s * 1000.0,
+            }
+
+
+def build_database_url(cfg: Settings) -> str:
+    """
+    Construye la URL de conexión según el motor configurado (DB_BACKEND).
+    """
+    if cfg.DB_BACKEND == "sqlite":
+        return f"sqlite+pysqlite:///{cfg.SQLITE_PATH}"
+    if cfg.DB_BACKEND != "postgresql":
+        raise ValueError(f"DB_BACKEND no soportado: {cfg.DB_BACKEND}")
+    return (
+        f"postgresql+psycopg2://{cfg.POSTGRES_USER}:"
+        f"{cfg.POSTGRES_PASSWORD}@{cfg.POSTGRES_HOST}:"
+        f"{cfg.POSTGRES_PORT}/{cfg.POSTGRES_DB}"
+    )
+
+
+def _install_sqlite_hooks(sqlite_engine: Engine, cfg: Settings, queue: SQLiteWriterQueue) -> None:
+    """
+    Registra los pragmas de conexión y la cola de escritura en un motor SQLite.
+    """
+
+    @event.listens_for(sqlite_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.execute(f"PRAGMA busy_timeout={int(cfg.SQLITE_BUSY_TIMEOUT_MS)}")
+        cursor.execute(f"PRAGMA cache_size=-{int(cfg.SQLITE_CACHE_SIZE_KB)}")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute(f"PRAGMA mmap_size={int(cfg.SQLITE_MMAP_SIZE)}")
+        cursor.close()
+
+    @event.listens_for(sqlite_engine, "before_cursor_execute")
+    def _take_writer_turn(conn, cursor, statement, parameters, context, executemany):
+        if conn.info.get("sqlite_writer"):
+            return
+        if statement.lstrip()[:7].upper().startswith(_SQLITE_WRITE_PREFIXES):
+            queue.acquire()
+            conn.info["sqlite_writer"] = True
+
+    def _release_writer_turn(conn, *args):
+        if conn.info.pop("sqlite_writer", False):
+            queue.release()
+
+    event.listen(sqlite_engine, "commit", _release_writer_turn)
+    event.listen(sqlite_engine, "rollback", _release_writer_turn)
+
+    @event.listens_for(sqlite_engine, "checkin")
+    def _release_on_checkin(dbapi_connection, connection_record):
+        # Red de seguridad: una conexión devuelta al pool nunca retiene el turno
+        if connection_record.info.pop("sqlite_writer", False):
+            queue.release()
+
+
+def _install_slow_query_hooks(app_engine: Engine) -> None:
+    """
+    Mide cada sentencia del motor y registra las lentas.
+
+    El costo por sentencia sin superar el umbral son dos perf_counter.
+    """
+    if not slow_query_log.enabled:
+        return
+
+    @event.listens_for(app_engine, "before_cursor_execute")
+    def _start_query_timer(conn, cursor, statement, parameters, context, executemany):
+        context._agorax_query_start = time.perf_counter()
+
+    @event.listens_for(app_engine, "after_cursor_execute")
+    def _check_query_time(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - context._agorax_query_start
+        if elapsed >= slow_query_log.threshold_s:
+            slow_query_log.record(conn.engine, statement, parameters, executemany, elapsed)
+
+
+def create_app_engine(cfg: Settings, url: str | None = None) -> Engine:
+    """
+    Crea un motor SQLAlchemy para la configuración dada.
+
+    En modo SQLite aplica los pragmas de WAL y la cola de un solo escritor;
+    en PostgreSQL conserva el comportamiento habitual. En ambos registra
+    los hooks de sentencias lentas.
+    """
+    url = url or build_database_url(cfg)
+    if not url.startswith("sqlite"):
+        pg_engine = create_engine(url, echo=False, future=True)
+        _install_slow_query_hooks(pg_engine)
+        return pg_engine
+
+    sqlite_engine = create_engine(
+        url,
+        echo=False,
+        future=True,
+        connect_args={"check_same_thread": False},
+    )
+    queue = SQLiteWriterQueue()
+    sqlite_engine.sqlite_writer_queue = queue
+    _install_sqlite_hooks(sqlite_engine, cfg, queue)
+    _install_slow_query_hooks(sqlite_engine)
+    return sqlite_engine
+
+
+DATABASE_URL = build_database_url(settings)
 
 # Motor de conexión
-engine = create_engine(DATABASE_URL, echo=False, future=True)
+engine = create_app_engine(settings, DATABASE_URL)
+
+# Cola de escritura del modo embebido (None en PostgreSQL)
+writer_queue: SQLiteWriterQueue | None = getattr(engine, "sqlite_writer_queue", None)
 
 # Fábrica de sesiones
 SessionLocal = sessionmaker(
@@ -45,15 +249,82 @@ SessionLocal = sessionmaker(
 )
 
 
-def get_db():
+def dialect_insert(db, table):
+    """
+    Devuelve un INSERT del dialecto activo que admite ON CONFLICT.
+
+    PostgreSQL y SQLite exponen on_conflict_do_nothing / do_update con la
+    misma API; esta función elige la construcción correcta según el
+    dialecto de la sesión, conexión o motor recibido.
+    """
+    bind = db.get_bind() if hasattr(db, "get_bind") else db
+    if bind.dialect.name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        from sqlalchemy.dialects.postgresql import insert
+    return insert(table)
+
+
+def get_directory_db():
+    """
+    Dependencia FastAPI con una sesión del motor principal (directorio).
+
+    Se usa para usuarios, autenticación y tablas de enrutamiento.
+    """
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def get_db(request: Request, directory_db: Session = Depends(get_directory_db)):
     """
     Dependencia FastAPI que proporciona una sesión de base de datos.
 
+    Con sharding habilitado, la sesión apunta al shard del conjunto que
+    resuelven los parámetros de ruta (meeting_id / condominium_id). Si el
+    shard es el principal, se reutiliza la sesión del directorio, salvo en
+    lecturas GET/HEAD con réplica configurada y al día con el token de
+    consistencia del cliente.
+
     Ejemplo de uso:
         def endpoint(db: Session = Depends(get_db)):
             ...
     """
-    db = SessionLocal()
+    from app.core.replicas import CONSISTENCY_HEADER, READ_METHODS, replica_router
+    from app.core.sharding import DEFAULT_SHARD, TenantMoving, shard_router
+
+    shard = DEFAULT_SHARD
+    if shard_router.enabled:
+        try:
+            shard = shard_router.shard_for_path_params(directory_db, request.path_params)
+        except TenantMoving as exc:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail=str(exc),
+                headers={"Retry-After": str(int(settings.SHARD_ROUTE_CACHE_SECONDS) or 1)},
+            )
+
+    if shard == DEFAULT_SHARD:
+        if (
+            replica_router.enabled
+            and request.method in READ_METHODS
+            and replica_router.replica_ready(request.headers.get(CONSISTENCY_HEADER))
+        ):
+            replica_router.replica_reads += 1
+            db = replica_router.session()
+            try:
+                yield db
+            finally:
+                db.close()
+            return
+        if replica_router.enabled and request.method in READ_METHODS:
+            replica_router.primary_reads += 1
+        yield directory_db
+        return
+
+    db = shard_router.session(shard)
     try:
         yield db
     finally:
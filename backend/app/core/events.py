@@ -0,0 +1,121 @@
+"""
+backend/app/core/events.py
+
+Bus de eventos de dominio en proceso.
+
+Los eventos nacen en el outbox transaccional (tabla outbox_events) y el
+relay de app.services.outbox_service los entrega aquí, en orden y por
+lotes, a los suscriptores registrados (cachés, canales push,
+proyecciones). La entrega es al-menos-una-vez: un manejador que lanza
+excepción recibe de nuevo el mismo lote en la siguiente ronda, por lo que
+los manejadores deben ser idempotentes.
+
+Tipos de suscripción:
+    - Efímera (durable=False): recibe los eventos confirmados desde que el
+      relay la atiende por primera vez; su avance vive en memoria (útil
+      para invalidar cachés locales de cada worker).
+    - Durable (durable=True): su avance se guarda en
+      outbox_consumer_offsets de cada shard y, tras un reinicio, continúa
+      donde quedó (proyecciones, integraciones).
+
+Uso:
+    event_bus.subscribe("cache-quorum", handler, event_types={"PRESENCE_REGISTERED"})
+"""
+
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Dict, FrozenSet, List, Optional, Sequence
+
+# Tipos de evento emitidos por el backend
+MEETING_CREATED = "MEETING_CREATED"
+MEETING_STARTED = "MEETING_STARTED"
+MEETING_CLOSED = "MEETING_CLOSED"
+AGENDA_ITEM_ADDED = "AGENDA_ITEM_ADDED"
+AGENDA_ITEM_OPENED = "AGENDA_ITEM_OPENED"
+AGENDA_ITEM_CLOSED = "AGENDA_ITEM_CLOSED"
+PRESENCE_REGISTERED = "PRESENCE_REGISTERED"
+VOTE_CAST = "VOTE_CAST"
+DELEGATION_REGISTERED = "DELEGATION_REGISTERED"
+DELEGATION_REVOKED = "DELEGATION_REVOKED"
+MEETING_ARCHIVED = "MEETING_ARCHIVED"
+
+
+@dataclass(frozen=True, slots=True)
+class DomainEvent:
+    """
+    Evento publicado por el relay.
+    """
+
+    id: int
+    shard: str
+    event_type: str
+    meeting_id: Optional[int]
+    entity_type: str
+    entity_id: Optional[int]
+    payload: dict
+    created_at: datetime
+
+
+EventHandler = Callable[[Sequence[DomainEvent]], None]
+
+
+@dataclass(slots=True)
+class Subscription:
+    """
+    Suscriptor del bus y su avance por shard (solo efímeros; los durables
+    lo leen de la base).
+    """
+
+    name: str
+    handler: EventHandler
+    event_types: Optional[FrozenSet[str]] = None
+    durable: bool = False
+    offsets: Dict[str, int] = field(default_factory=dict)
+
+    def accepts(self, event: DomainEvent) -> bool:
+        return self.event_types is None or event.event_type in self.event_types
+
+
+class EventBus:
+    """
+    Registro de suscriptores; el relay del outbox es quien publica.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._subscriptions: Dict[str, Subscription] = {}
+
+    def subscribe(
+        self,
+        name: str,
+        handler: EventHandler,
+        *,
+        event_types: Optional[Sequence[str]] = None,
+        durable: bool = False,
+    ) -> Subscription:
+        """
+        Registra un suscriptor. El nombre identifica su avance (debe ser único).
+        """
+        subscription = Subscription(
+            name=name,
+            handler=handler,
+            event_types=frozenset(event_types) if event_types is not None else None,
+            durable=durable,
+        )
+        with self._lock:
+            if name in self._subscriptions:
+                raise ValueError(f"Ya existe un suscriptor llamado {name}.")
+            self._subscriptions[name] = subscription
+        return subscription
+
+    def unsubscribe(self, name: str) -> None:
+        with self._lock:
+            self._subscriptions.pop(name, None)
+
+    def subscriptions(self) -> List[Subscription]:
+        with self._lock:
+            return list(self._subscriptions.values())
+
+
+event_bus = EventBus()
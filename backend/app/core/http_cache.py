@@ -0,0 +1,85 @@
+"""
+backend/app/core/http_cache.py
+
+Utilidades de caché HTTP (ETag / If-None-Match) para AgoraX.
+
+Permiten responder 304 Not Modified sin reconstruir la respuesta cuando
+el cliente ya tiene la representación vigente.
+
+Las rutas de una asamblea usan como validador su versión (el último
+evento del outbox de la asamblea, ver read_service.get_meeting_validators):
+ETag W/"m<id>-v<versión>" y Last-Modified con la hora de ese evento.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Dict, Mapping, Optional
+
+
+@dataclass(frozen=True, slots=True)
+class Validators:
+    """
+    ETag y Last-Modified de una representación.
+    """
+
+    etag: str
+    last_modified: Optional[datetime] = None
+
+    def headers(self) -> Dict[str, str]:
+        headers = {"ETag": self.etag, "Cache-Control": "private, no-cache"}
+        if self.last_modified is not None:
+            headers["Last-Modified"] = http_date(self.last_modified)
+        return headers
+
+
+def http_date(value: datetime) -> str:
+    """
+    Formatea una fecha como HTTP-date (RFC 9110), siempre en GMT.
+    """
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Indica si la cabecera If-None-Match del cliente coincide con el ETag actual.
+
+    Admite listas separadas por comas, el comodín "*" y validadores débiles
+    (W/"..."), que se comparan de forma débil según RFC 9110.
+    """
+    if not if_none_match:
+        return False
+    current = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == current:
+            return True
+    return False
+
+
+def is_not_modified(request_headers: Mapping[str, str], validators: Validators) -> bool:
+    """
+    Evalúa If-None-Match (o, en su ausencia, If-Modified-Since) contra los validadores.
+    """
+    if_none_match = request_headers.get("if-none-match")
+    if if_none_match is not None:
+        return etag_matches(if_none_match, validators.etag)
+
+    if_modified_since = request_headers.get("if-modified-since")
+    if not if_modified_since or validators.last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    last_modified = validators.last_modified
+    if last_modified.tzinfo is None:
+        last_modified = last_modified.replace(tzinfo=timezone.utc)
+    # HTTP-date tiene resolución de segundos
+    return last_modified.replace(microsecond=0) <= since
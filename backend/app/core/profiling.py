@@ -0,0 +1,391 @@
+"""
+backend/app/core/profiling.py
+
+Perfilado bajo demanda de peticiones HTTP.
+
+Cuando un endpoint va lento en producción se puede perfilar una petición
+concreta sin redesplegar (PROFILING_ENABLED=True):
+
+    - Cabecera "X-Profile: 1" en una petición de un usuario ADMIN.
+    - PROFILING_SAMPLE_RATE: fracción de peticiones perfiladas al azar.
+
+Mientras dura la petición, un hilo muestreador toma la pila cada
+PROFILING_INTERVAL_MS (sys._current_frames) del hilo del event loop y de
+los hilos del threadpool de anyio que están ejecutando código de la
+aplicación (los hilos propios, como el relay del outbox, no se incluyen).
+Las pilas se guardan en formato "folded" (una línea "marco;marco;... N"
+por pila), que abren directamente flamegraph.pl, speedscope o inferno.
+Junto al perfil se guarda un JSON con la ruta, el estado, la duración,
+el número y el tiempo de las sentencias SQL, y las peticiones que había
+en curso (con concurrencia, las pilas del threadpool pueden mezclar
+otras peticiones).
+
+Sin perfil activo el costo es una lectura de ContextVar por sentencia
+SQL. Los perfiles se listan y descargan en /admin/profiles.
+"""
+
+import json
+import logging
+import os
+import random
+import re
+import secrets
+import sys
+import threading
+import time
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from anyio import to_thread
+from sqlalchemy import event, select
+from sqlalchemy.engine import Engine
+
+from app.core.config import Settings, get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+PROFILE_HEADER = "x-profile"
+PROFILE_ID_HEADER = "X-Profile-Id"
+
+PROFILE_ID_PATTERN = re.compile(r"^[0-9]{8}T[0-9]{6}-[0-9a-f]{8}$")
+
+# Profundidad máxima de pila por muestra
+_MAX_DEPTH = 128
+# Rol ADMIN cacheado por usuario del token (segundos)
+_ADMIN_CACHE_SECONDS = 60.0
+
+# Nombre de los hilos del threadpool de anyio (endpoints y dependencias síncronas)
+_THREADPOOL_NAME = "AnyIO worker thread"
+
+_APP_DIR = str(Path(__file__).resolve().parent.parent)
+_SITE_MARKERS = ("site-packages" + os.sep, "dist-packages" + os.sep)
+
+_active: ContextVar[Optional["ProfileSession"]] = ContextVar("agorax_profile", default=None)
+
+
+@dataclass
+class ProfileMeta:
+    """
+    Metadatos de un perfil guardado (<id>.json junto a <id>.folded).
+    """
+
+    id: str
+    created_at: str
+    method: str
+    path: str
+    route: Optional[str] = None
+    status_code: Optional[int] = None
+    trigger: str = "header"
+    user: Optional[str] = None
+    duration_ms: float = 0.0
+    sql_count: int = 0
+    sql_ms: float = 0.0
+    samples: int = 0
+    interval_ms: float = 0.0
+    in_flight: int = 0
+    truncated: bool = False
+
+
+@dataclass
+class ProfileSession:
+    """
+    Perfil en curso de una petición.
+    """
+
+    meta: ProfileMeta
+    loop_thread: int
+    stacks: Counter = field(default_factory=Counter)
+    started: float = field(default_factory=time.perf_counter)
+    _lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def record_sql(self, elapsed_s: float) -> None:
+        with self._lock:
+            self.meta.sql_count += 1
+            self.meta.sql_ms += elapsed_s * 1000.0
+
+
+# =========================================================
+# Muestreo de pilas
+# =========================================================
+
+_labels: Dict[object, str] = {}
+
+
+def _frame_label(code) -> str:
+    label = _labels.get(code)
+    if label is None:
+        filename = code.co_filename
+        if filename.startswith(_APP_DIR):
+            filename = "app" + filename[len(_APP_DIR):]
+        else:
+            for marker in _SITE_MARKERS:
+                cut = filename.rfind(marker)
+                if cut >= 0:
+                    filename = filename[cut + len(marker):]
+                    break
+            else:
+                filename = os.path.basename(filename)
+        # ";" separa marcos en el formato folded
+        label = f"{code.co_name} ({filename}:{code.co_firstlineno})".replace(";", ":")
+        _labels[code] = label
+    return label
+
+
+def _folded_stack(frame) -> Tuple[Optional[str], bool]:
+    """
+    (pila "raíz;...;hoja", True si pasa por código de la aplicación).
+    """
+    labels: List[str] = []
+    in_app = False
+    while frame is not None and len(labels) < _MAX_DEPTH:
+        code = frame.f_code
+        if not in_app and code.co_filename.startswith(_APP_DIR):
+            in_app = True
+        labels.append(_frame_label(code))
+        frame = frame.f_back
+    if not labels:
+        return None, False
+    labels.reverse()
+    return ";".join(labels), in_app
+
+
+class _Sampler(threading.Thread):
+    def __init__(self, session: ProfileSession, interval_s: float, max_seconds: float) -> None:
+        super().__init__(name="agorax-profiler", daemon=True)
+        self.session = session
+        self.interval_s = interval_s
+        self.deadline = time.perf_counter() + max_seconds
+        self.stopped = threading.Event()
+
+    def run(self) -> None:
+        session = self.session
+        while not self.stopped.wait(self.interval_s):
+            if time.perf_counter() > self.deadline:
+                session.meta.truncated = True
+                return
+            workers = {
+                thread.ident for thread in threading.enumerate() if thread.name == _THREADPOOL_NAME
+            }
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id != session.loop_thread and thread_id not in workers:
+                    continue
+                stack, in_app = _folded_stack(frame)
+                if stack is None:
+                    continue
+                if thread_id == session.loop_thread:
+                    session.stacks["event_loop;" + stack] += 1
+                elif in_app:
+                    session.stacks["threadpool;" + stack] += 1
+            session.meta.samples += 1
+
+
+# =========================================================
+# Perfilador
+# =========================================================
+
+class RequestProfiler:
+    """
+    Decide qué peticiones se perfilan y gestiona los perfiles guardados.
+    """
+
+    def __init__(self, cfg: Settings) -> None:
+        self._cfg = cfg
+        self._admins: Dict[str, Tuple[bool, float]] = {}
+        self._write_lock = threading.Lock()
+        self.in_flight = 0
+        self.profiled = 0
+        self.denied = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._cfg.PROFILING_ENABLED
+
+    @property
+    def directory(self) -> Path:
+        return Path(self._cfg.PROFILING_DIR)
+
+    def _is_admin(self, subject: str) -> bool:
+        now = time.monotonic()
+        cached = self._admins.get(subject)
+        if cached is not None and now - cached[1] < _ADMIN_CACHE_SECONDS:
+            return cached[0]
+        from app.core.db import SessionLocal
+        from app.models import User
+
+        with SessionLocal() as db:
+            role = db.execute(select(User.role).where(User.email == subject)).scalar_one_or_none()
+        is_admin = role == "ADMIN"
+        self._admins[subject] = (is_admin, now)
+        return is_admin
+
+    async def trigger_for(self, headers: Dict[str, str]) -> Optional[Tuple[str, Optional[str]]]:
+        """
+        (motivo, usuario) si la petición debe perfilarse; None si no.
+        """
+        if headers.get(PROFILE_HEADER, "").lower() in ("1", "true", "yes"):
+            from app.core.rate_limit import _token_subject
+
+            scheme, _, token = headers.get("authorization", "").partition(" ")
+            subject = _token_subject(token) if scheme.lower() == "bearer" and token else None
+            if subject is not None and await to_thread.run_sync(self._is_admin, subject):
+                return "header", subject
+            self.denied += 1
+            return None
+        rate = self._cfg.PROFILING_SAMPLE_RATE
+        if rate > 0 and random.random() < rate:
+            return "sample", None
+        return None
+
+    def begin(self, method: str, path: str, trigger: str, user: Optional[str]) -> Tuple[ProfileSession, _Sampler]:
+        now = datetime.now(timezone.utc)
+        meta = ProfileMeta(
+            id=f"{now:%Y%m%dT%H%M%S}-{secrets.token_hex(4)}",
+            created_at=now.isoformat(),
+            method=method,
+            path=path,
+            trigger=trigger,
+            user=user,
+            interval_ms=self._cfg.PROFILING_INTERVAL_MS,
+            in_flight=self.in_flight,
+        )
+        session = ProfileSession(meta=meta, loop_thread=threading.get_ident())
+        sampler = _Sampler(
+            session,
+            self._cfg.PROFILING_INTERVAL_MS / 1000.0,
+            self._cfg.PROFILING_MAX_SECONDS,
+        )
+        sampler.start()
+        self.profiled += 1
+        return session, sampler
+
+    def save(self, session: ProfileSession) -> None:
+        """
+        Escribe <id>.folded y <id>.json y conserva los PROFILING_MAX_PROFILES más recientes.
+        """
+        directory = self.directory
+        meta = session.meta
+        with self._write_lock:
+            directory.mkdir(parents=True, exist_ok=True)
+            folded = "".join(f"{stack} {count}\n" for stack, count in session.stacks.most_common())
+            (directory / f"{meta.id}.folded").write_text(folded, encoding="utf-8")
+            (directory / f"{meta.id}.json").write_text(json.dumps(asdict(meta)), encoding="utf-8")
+            saved = sorted(directory.glob("*.json"), key=lambda path: path.stat().st_mtime)
+            for old in saved[: -self._cfg.PROFILING_MAX_PROFILES or None]:
+                old.unlink(missing_ok=True)
+                old.with_suffix(".folded").unlink(missing_ok=True)
+
+    def list_profiles(self) -> List[dict]:
+        """
+        Metadatos de los perfiles guardados, del más reciente al más antiguo.
+        """
+        profiles = []
+        for path in self.directory.glob("*.json"):
+            try:
+                profiles.append(json.loads(path.read_text(encoding="utf-8")))
+            except (OSError, ValueError):
+                continue
+        profiles.sort(key=lambda meta: meta["created_at"], reverse=True)
+        return profiles
+
+    def profile_path(self, profile_id: str) -> Optional[Path]:
+        if not PROFILE_ID_PATTERN.match(profile_id):
+            return None
+        path = self.directory / f"{profile_id}.folded"
+        return path if path.is_file() else None
+
+    def stats(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "sample_rate": self._cfg.PROFILING_SAMPLE_RATE,
+            "profiled": self.profiled,
+            "denied": self.denied,
+            "in_flight": self.in_flight,
+        }
+
+
+request_profiler = RequestProfiler(settings)
+
+
+# =========================================================
+# Conteo de SQL por petición perfilada
+# =========================================================
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _sql_started(conn, cursor, statement, parameters, context, executemany):
+    if _active.get() is not None and context is not None:
+        context._agorax_profile_start = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _sql_finished(conn, cursor, statement, parameters, context, executemany):
+    session = _active.get()
+    if session is not None and context is not None:
+        started = getattr(context, "_agorax_profile_start", None)
+        if started is not None:
+            session.record_sql(time.perf_counter() - started)
+
+
+# =========================================================
+# Middleware
+# =========================================================
+
+class ProfilingMiddleware:
+    """
+    Middleware ASGI que perfila las peticiones marcadas y guarda el resultado.
+
+    La respuesta de una petición perfilada lleva la cabecera X-Profile-Id.
+    """
+
+    def __init__(self, app, profiler: RequestProfiler = request_profiler) -> None:
+        self.app = app
+        self.profiler = profiler
+
+    async def __call__(self, scope, receive, send):
+        profiler = self.profiler
+        if scope["type"] != "http" or not profiler.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        profiler.in_flight += 1
+        try:
+            headers = {k.decode("latin-1"): v.decode("latin-1") for k, v in scope["headers"]}
+            trigger = await profiler.trigger_for(headers)
+            if trigger is None:
+                await self.app(scope, receive, send)
+                return
+            await self._profile(scope, receive, send, *trigger)
+        finally:
+            profiler.in_flight -= 1
+
+    async def _profile(self, scope, receive, send, trigger: str, user: Optional[str]) -> None:
+        profiler = self.profiler
+        session, sampler = profiler.begin(scope["method"], scope["path"], trigger, user)
+        profile_id = session.meta.id.encode("latin-1")
+
+        async def send_with_id(message):
+            if message["type"] == "http.response.start":
+                session.meta.status_code = message["status"]
+                headers = list(message.get("headers", []))
+                headers.append((PROFILE_ID_HEADER.lower().encode("latin-1"), profile_id))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        token = _active.set(session)
+        try:
+            await self.app(scope, receive, send_with_id)
+        finally:
+            _active.reset(token)
+            sampler.stopped.set()
+            session.meta.duration_ms = (time.perf_counter() - session.started) * 1000.0
+            route = scope.get("route")
+            session.meta.route = getattr(route, "path", None)
+            await to_thread.run_sync(sampler.join)
+            try:
+                await to_thread.run_sync(profiler.save, session)
+            except OSError:
+                logger.warning("No se pudo guardar el perfil %s.", session.meta.id, exc_info=True)
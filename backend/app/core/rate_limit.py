@@ -0,0 +1,303 @@
+"""
+backend/app/core/rate_limit.py
+
+Limitación de ritmo por token bucket para las rutas calientes (votar,
+login, check-in).
+
+Cada regla ("10/min", "200/s", "1000/h") es un bucket de capacidad N que
+se rellena a N fichas por periodo. Una petición consume una ficha de cada
+bucket que le aplica (por usuario, por IP, por asamblea); si alguno está
+vacío se responde 429 con Retry-After.
+
+Las dependencias se declaran en el decorador de la ruta
+(dependencies=[...]) para que se resuelvan antes que get_db y
+get_current_user: una petición rechazada no abre sesión ni consulta la
+base. El usuario se identifica por el "sub" del JWT (firma verificada,
+sin consultar la tabla users).
+
+Backends (RATE_LIMIT_BACKEND):
+    - "memory": buckets en el proceso; cada worker limita por separado.
+    - "redis": buckets compartidos entre workers (script Lua atómico con la
+      hora del servidor Redis). Requiere el paquete redis. Si Redis no
+      responde se recurre a los buckets locales (fail-open) para no
+      bloquear la asamblea.
+
+Detrás de un proxy, la IP del cliente es la que entrega uvicorn
+(--proxy-headers / --forwarded-allow-ips).
+"""
+
+import logging
+import math
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Dict, Optional, Tuple
+
+from fastapi import HTTPException, Request, status
+
+from app.core.config import Settings, get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+_PERIODS = {"s": 1.0, "sec": 1.0, "m": 60.0, "min": 60.0, "h": 3600.0, "hour": 3600.0}
+
+# Buckets locales como máximo; se descartan los menos usados (vuelven llenos)
+_MAX_LOCAL_BUCKETS = 100_000
+
+_REDIS_TOKEN_BUCKET = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local bucket = redis.call('HMGET', KEYS[1], 't', 's')
+local tokens = tonumber(bucket[1])
+local stamp = tonumber(bucket[2])
+if tokens == nil then
+    tokens = capacity
+    stamp = now
+end
+tokens = math.min(capacity, tokens + math.max(0, now - stamp) * rate)
+local retry = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    retry = (1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 't', tostring(tokens), 's', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity / rate * 1000) + 1000)
+return tostring(retry)
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class Rate:
+    """
+    Capacidad del bucket y fichas repuestas por segundo.
+    """
+
+    capacity: int
+    per_second: float
+
+    @classmethod
+    def parse(cls, spec: str) -> Optional["Rate"]:
+        """
+        Interpreta "N/periodo" (periodo: s, min, h o un número de segundos).
+
+        Cadena vacía o "0" desactiva la regla (retorna None).
+        """
+        spec = spec.strip()
+        if not spec or spec == "0":
+            return None
+        amount, _, period = spec.partition("/")
+        capacity = int(amount)
+        period = period.strip() or "s"
+        seconds = _PERIODS.get(period)
+        if seconds is None:
+            seconds = float(period)
+        if capacity <= 0 or seconds <= 0:
+            raise ValueError(f"Límite de ritmo inválido: {spec!r}")
+        return cls(capacity=capacity, per_second=capacity / seconds)
+
+
+class LocalBuckets:
+    """
+    Buckets en memoria del proceso.
+    """
+
+    def __init__(self, max_buckets: int = _MAX_LOCAL_BUCKETS) -> None:
+        self._lock = threading.Lock()
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+        self._max_buckets = max_buckets
+
+    def take(self, key: str, rate: Rate) -> float:
+        """
+        Consume una ficha. Retorna 0 si se concedió o los segundos a esperar.
+        """
+        now = time.monotonic()
+        with self._lock:
+            tokens, stamp = self._buckets.pop(key, (float(rate.capacity), now))
+            tokens = min(float(rate.capacity), tokens + (now - stamp) * rate.per_second)
+            retry_after = 0.0
+            if tokens >= 1.0:
+                tokens -= 1.0
+            else:
+                retry_after = (1.0 - tokens) / rate.per_second
+            self._buckets[key] = (tokens, now)
+            if len(self._buckets) > self._max_buckets:
+                self._buckets.popitem(last=False)
+        return retry_after
+
+    def clear(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+
+
+class RedisBuckets:
+    """
+    Buckets compartidos en Redis (un hash por clave, con expiración).
+    """
+
+    def __init__(self, url: str, prefix: str) -> None:
+        try:
+            import redis.asyncio as redis_asyncio
+        except ImportError as exc:  # pragma: no cover - depende del despliegue
+            raise RuntimeError(
+                "RATE_LIMIT_BACKEND=redis requiere el paquete redis (extra 'redis')."
+            ) from exc
+        self._client = redis_asyncio.from_url(url, socket_timeout=0.05, socket_connect_timeout=0.2)
+        self._script = self._client.register_script(_REDIS_TOKEN_BUCKET)
+        self._prefix = prefix
+
+    async def take(self, key: str, rate: Rate) -> float:
+        result = await self._script(keys=[self._prefix + key], args=[rate.capacity, rate.per_second])
+        return float(result)
+
+
+class RateLimiter:
+    """
+    Punto único de decisión: backend configurado, respaldo local y contadores.
+    """
+
+    def __init__(self, cfg: Settings) -> None:
+        self._cfg = cfg
+        self._local = LocalBuckets()
+        self._remote: Optional[RedisBuckets] = None
+        self._started = False
+        self._last_remote_error = 0.0
+        self.allowed = 0
+        self.rejected: Dict[str, int] = {}
+        self.remote_errors = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._cfg.RATE_LIMIT_ENABLED
+
+    def start(self) -> None:
+        """
+        Crea el backend compartido; falla al arrancar si está mal configurado.
+        """
+        if self._started:
+            return
+        backend = self._cfg.RATE_LIMIT_BACKEND
+        if backend == "redis":
+            if not self._cfg.RATE_LIMIT_REDIS_URL:
+                raise RuntimeError("RATE_LIMIT_BACKEND=redis requiere RATE_LIMIT_REDIS_URL.")
+            self._remote = RedisBuckets(self._cfg.RATE_LIMIT_REDIS_URL, prefix="agorax:rl:")
+        elif backend != "memory":
+            raise RuntimeError(f"RATE_LIMIT_BACKEND desconocido: {backend!r}")
+        self._started = True
+
+    async def take(self, key: str, rate: Rate) -> float:
+        if not self._started:
+            self.start()
+        if self._remote is not None:
+            try:
+                return await self._remote.take(key, rate)
+            except Exception:
+                self.remote_errors += 1
+                now = time.monotonic()
+                if now - self._last_remote_error > 10.0:
+                    self._last_remote_error = now
+                    logger.warning("Rate limit: Redis no disponible; se usan los buckets locales.", exc_info=True)
+        return self._local.take(key, rate)
+
+    def record(self, scope: str, allowed: bool) -> None:
+        if allowed:
+            self.allowed += 1
+        else:
+            self.rejected[scope] = self.rejected.get(scope, 0) + 1
+
+    def reset(self) -> None:
+        """
+        Vacía los buckets locales (p. ej. entre pruebas de carga).
+        """
+        self._local.clear()
+
+    def stats(self) -> dict:
+        return {
+            "backend": self._cfg.RATE_LIMIT_BACKEND,
+            "allowed": self.allowed,
+            "rejected": dict(self.rejected),
+            "remote_errors": self.remote_errors,
+        }
+
+
+rate_limiter = RateLimiter(settings)
+
+
+# =========================================================
+# Claves
+# =========================================================
+
+KeyFunc = Callable[[Request], Optional[str]]
+
+
+def client_ip(request: Request) -> Optional[str]:
+    return request.client.host if request.client else None
+
+
+@lru_cache(maxsize=4096)
+def _token_subject(token: str) -> Optional[str]:
+    from jose import JWTError, jwt
+
+    try:
+        payload = jwt.decode(token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM])
+    except JWTError:
+        return None
+    return payload.get("sub")
+
+
+def token_subject(request: Request) -> Optional[str]:
+    """
+    Usuario del JWT Bearer. Sin token válido no se limita por usuario:
+    la ruta responderá 401 en get_current_user.
+    """
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    return _token_subject(token)
+
+
+def path_param(name: str) -> KeyFunc:
+    def key(request: Request) -> Optional[str]:
+        return request.path_params.get(name)
+
+    return key
+
+
+# =========================================================
+# Dependencia FastAPI
+# =========================================================
+
+class RateLimit:
+    """
+    Dependencia que consume una ficha del bucket "<scope>:<clave>".
+
+    Uso:
+        @router.post("/...", dependencies=[Depends(RateLimit("vote:user", "RATE_LIMIT_VOTE_PER_USER", token_subject))])
+
+    El límite se lee de la configuración por nombre; una regla vacía no limita.
+    """
+
+    def __init__(self, scope: str, setting: str, key: KeyFunc) -> None:
+        self.scope = scope
+        self.rate = Rate.parse(getattr(settings, setting))
+        self.key = key
+
+    async def __call__(self, request: Request) -> None:
+        if self.rate is None or not rate_limiter.enabled:
+            return
+        key = self.key(request)
+        if key is None:
+            return
+        retry_after = await rate_limiter.take(f"{self.scope}:{key}", self.rate)
+        rate_limiter.record(self.scope, retry_after <= 0)
+        if retry_after > 0:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Demasiadas solicitudes; intente de nuevo en unos segundos.",
+                headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+            )
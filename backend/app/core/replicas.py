@@ -0,0 +1,168 @@
+"""
+backend/app/core/replicas.py
+
+Enrutamiento de lecturas a réplicas con garantía read-your-writes.
+
+Las peticiones GET/HEAD (quórum, listados de asambleas y de votos) se
+sirven desde READ_REPLICA_URL; el resto usa el primario. Para que un
+cliente vea sus propias escrituras, cada escritura exitosa devuelve un
+token de consistencia en la cabecera X-AgoraX-Consistency, que el cliente
+reenvía en sus siguientes lecturas:
+
+    - PostgreSQL: el token es la posición WAL del primario ("lsn:0/16B3748").
+      La lectura espera hasta REPLICA_MAX_WAIT_MS a que la réplica haya
+      reproducido esa posición; si no llega, se sirve desde el primario.
+    - Otros motores (p. ej. dos SQLite locales): el token es la marca de
+      tiempo de la escritura ("ts:<ms>") y las lecturas quedan fijadas al
+      primario durante REPLICA_CONSISTENCY_WINDOW_SECONDS.
+
+Sin READ_REPLICA_URL todo se sirve desde el primario y no se emiten tokens.
+"""
+
+import re
+import threading
+import time
+from typing import Optional
+
+import anyio
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.config import Settings, get_settings
+from app.core.db import create_app_engine, engine
+
+settings = get_settings()
+
+CONSISTENCY_HEADER = "X-AgoraX-Consistency"
+READ_METHODS = frozenset({"GET", "HEAD"})
+
+# Intervalo de sondeo mientras se espera a la réplica
+_POLL_INTERVAL_S = 0.01
+# Posición WAL de PostgreSQL: dos enteros hexadecimales de 32 bits ("0/16B3748")
+_LSN_PATTERN = re.compile(r"[0-9A-Fa-f]{1,8}/[0-9A-Fa-f]{1,8}")
+
+
+class ReplicaRouter:
+    """
+    Decide si una lectura puede ir a la réplica y emite tokens de consistencia.
+    """
+
+    def __init__(self, cfg: Settings, primary_engine: Engine) -> None:
+        self._cfg = cfg
+        self._primary = primary_engine
+        self._engine: Optional[Engine] = None
+        self._sessionmaker: Optional[sessionmaker] = None
+        self._lock = threading.Lock()
+        self.replica_reads = 0
+        self.primary_reads = 0
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._cfg.READ_REPLICA_URL)
+
+    @property
+    def engine(self) -> Engine:
+        if self._engine is None:
+            with self._lock:
+                if self._engine is None:
+                    self._engine = create_app_engine(self._cfg, self._cfg.READ_REPLICA_URL)
+        return self._engine
+
+    def session(self) -> Session:
+        """
+        Abre una sesión sobre la réplica.
+        """
+        if self._sessionmaker is None:
+            self._sessionmaker = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
+        return self._sessionmaker()
+
+    # ---------- Tokens ----------
+
+    def current_token(self) -> str:
+        """
+        Devuelve el token que representa el estado actual del primario.
+        """
+        if self._primary.dialect.name == "postgresql":
+            with self._primary.connect() as conn:
+                lsn = conn.execute(text("SELECT pg_current_wal_lsn()")).scalar_one()
+            return f"lsn:{lsn}"
+        return f"ts:{int(time.time() * 1000)}"
+
+    def replica_ready(self, token: Optional[str]) -> bool:
+        """
+        Indica si la réplica ya refleja el token (esperando como máximo REPLICA_MAX_WAIT_MS).
+
+        Un token ausente permite leer de la réplica; uno ilegible fuerza el primario.
+        """
+        if not token:
+            return True
+        kind, _, value = token.partition(":")
+        if kind == "ts":
+            try:
+                written_at = int(value) / 1000.0
+            except ValueError:
+                return False
+            return time.time() - written_at >= self._cfg.REPLICA_CONSISTENCY_WINDOW_SECONDS
+        if kind == "lsn" and self.engine.dialect.name == "postgresql":
+            # El token lo envía el cliente: se valida antes de llegar a CAST
+            if not _LSN_PATTERN.fullmatch(value):
+                return False
+            deadline = time.monotonic() + self._cfg.REPLICA_MAX_WAIT_MS / 1000.0
+            try:
+                with self.engine.connect() as conn:
+                    while True:
+                        caught_up = conn.execute(
+                            text(
+                                "SELECT COALESCE(pg_last_wal_replay_lsn() >= CAST(:lsn AS pg_lsn), TRUE)"
+                            ),
+                            {"lsn": value},
+                        ).scalar_one()
+                        if caught_up:
+                            return True
+                        if time.monotonic() >= deadline:
+                            return False
+                        time.sleep(_POLL_INTERVAL_S)
+            except DBAPIError:
+                return False
+        return False
+
+    def stats(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "replica_reads": self.replica_reads,
+            "primary_reads": self.primary_reads,
+        }
+
+
+# Router global de réplicas
+replica_router = ReplicaRouter(settings, engine)
+
+
+class ConsistencyTokenMiddleware:
+    """
+    Middleware ASGI que añade el token de consistencia a las escrituras exitosas.
+    """
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if (
+            scope["type"] != "http"
+            or scope["method"] in READ_METHODS
+            or not replica_router.enabled
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_token(message):
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                token = await anyio.to_thread.run_sync(replica_router.current_token)
+                headers = list(message.get("headers", []))
+                headers.append((CONSISTENCY_HEADER.lower().encode("latin-1"), token.encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        await self.app(scope, receive, send_with_token)
@@ -0,0 +1,152 @@
+"""
+backend/app/core/schema.py
+
+Verificación y migración del esquema de base de datos al arrancar AgoraX.
+
+El esquema lo gestionan las migraciones de Alembic (backend/migrations).
+Para no pagar su costo en cada worker, se calcula una huella (fingerprint)
+determinista de los modelos y se compara con la huella guardada en la
+tabla `agorax_schema_state`:
+
+- Si coinciden, el arranque cuesta una sola consulta de una fila.
+- Si no coinciden (o la tabla no existe), se ejecuta `alembic upgrade head`
+  una vez y se guarda la nueva huella.
+
+Bases creadas antes de las migraciones (por create_all, sin tabla
+alembic_version): se crean las tablas que falten, se marcan como la
+revisión base (BASELINE_REVISION) y después se aplican las siguientes.
+"""
+
+import hashlib
+import logging
+from datetime import datetime, timezone
+from pathlib import Path
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, delete, insert, inspect, select, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import OperationalError, ProgrammingError
+
+from app.core.config import get_settings
+from app.core.db import Base
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Metadatos propios: la tabla de estado no forma parte de la huella de los modelos
+_state_metadata = MetaData()
+
+schema_state = Table(
+    "agorax_schema_state",
+    _state_metadata,
+    Column("id", Integer, primary_key=True),
+    Column("fingerprint", String(64), nullable=False),
+    Column("applied_at", DateTime(timezone=True), nullable=False),
+)
+
+# Clave arbitraria para serializar el arranque concurrente de workers en PostgreSQL
+_SCHEMA_LOCK_KEY = 0x41474F5258
+
+# backend/alembic.ini y la revisión que equivale al esquema creado por create_all
+ALEMBIC_INI = Path(__file__).resolve().parents[2] / "alembic.ini"
+BASELINE_REVISION = "0001"
+
+
+def compute_schema_fingerprint(metadata: MetaData | None = None) -> str:
+    """
+    Calcula una huella SHA-256 del esquema declarado por los modelos.
+
+    Considera tablas, columnas (tipo, nulabilidad, PK), índices y
+    restricciones con nombre. No consulta la base de datos.
+    """
+    # Garantiza que todos los modelos estén registrados en Base.metadata
+    import app.models  # noqa: F401
+
+    metadata = metadata or Base.metadata
+    parts: list[str] = []
+    for table in sorted(metadata.tables.values(), key=lambda t: t.name):
+        parts.append(f"T:{table.name}")
+        for column in table.columns:
+            parts.append(
+                f"C:{column.name}:{column.type!r}:{column.nullable}:{column.primary_key}"
+            )
+        for index in sorted(table.indexes, key=lambda i: i.name or ""):
+            cols = ",".join(c.name for c in index.columns)
+            parts.append(f"I:{index.name}:{cols}:{index.unique}")
+        for constraint in sorted(table.constraints, key=lambda c: c.name or ""):
+            if constraint.name:
+                parts.append(f"K:{constraint.name}")
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+
+def _stored_fingerprint(bind: Engine) -> str | None:
+    try:
+        with bind.connect() as conn:
+            return conn.execute(
+                select(schema_state.c.fingerprint).where(schema_state.c.id == 1)
+            ).scalar_one_or_none()
+    except (OperationalError, ProgrammingError):
+        # La tabla de estado aún no existe (base nueva)
+        return None
+
+
+def alembic_config():
+    """
+    Configuración de Alembic (importado de forma diferida: solo se usa al migrar).
+    """
+    from alembic.config import Config
+
+    return Config(str(ALEMBIC_INI))
+
+
+def upgrade_schema(conn: Connection) -> None:
+    """
+    Aplica las migraciones pendientes (alembic upgrade head) en la conexión dada.
+
+    Adopta las bases sin versión creadas por create_all antes de existir
+    las migraciones.
+    """
+    from alembic import command
+    from alembic.runtime.migration import MigrationContext
+
+    cfg = alembic_config()
+    cfg.attributes["connection"] = conn
+    if MigrationContext.configure(conn).get_current_revision() is None and inspect(conn).has_table("users"):
+        logger.info("Base sin versión de migraciones: se adopta como revisión %s.", BASELINE_REVISION)
+        Base.metadata.create_all(bind=conn)
+        command.stamp(cfg, BASELINE_REVISION)
+    command.upgrade(cfg, "head")
+
+
+def ensure_schema(bind: Engine) -> bool:
+    """
+    Asegura que el esquema de la base coincida con los modelos.
+
+    Retorna:
+        True si se tuvo que migrar, False si la huella ya coincidía.
+    """
+    fingerprint = compute_schema_fingerprint()
+    if _stored_fingerprint(bind) == fingerprint:
+        return False
+
+    if not settings.SCHEMA_AUTO_CREATE:
+        logger.warning(
+            "La huella del esquema no coincide con los modelos y SCHEMA_AUTO_CREATE=False; "
+            "se omiten las migraciones (ejecutar `alembic upgrade head`)."
+        )
+        return False
+
+    with bind.begin() as conn:
+        if conn.dialect.name == "postgresql":
+            conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": _SCHEMA_LOCK_KEY})
+        upgrade_schema(conn)
+        _state_metadata.create_all(bind=conn)
+        conn.execute(delete(schema_state))
+        conn.execute(
+            insert(schema_state).values(
+                id=1,
+                fingerprint=fingerprint,
+                applied_at=datetime.now(timezone.utc),
+            )
+        )
+    logger.info("Esquema migrado (huella %s).", fingerprint[:12])
+    return True
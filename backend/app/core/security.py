@@ -6,28 +6,34 @@ Funciones y utilidades de seguridad para AgoraX:
 - Hash y verificación de contraseñas.
 - Creación y validación de tokens JWT.
 - Dependencia get_current_user para obtener el usuario autenticado.
+- Dependencia require_admin para las rutas de administración.
+- Cifrado de votos (reexportado desde app.core.vote_crypto).
 
 Se integra con:
-    - app.core.config.Settings (SECRET_KEY, ALGORITHM, ACCESS_TOKEN_EXPIRE_MINUTES)
-    - app.core.db.get_db
+    - app.core.config.Settings (JWT_SECRET, JWT_ALGORITHM, JWT_EXPIRE_MINUTES)
+    - app.core.db.get_directory_db
     - app.schemas.TokenData
+
+Las dependencias criptográficas pesadas (passlib/bcrypt y python-jose) se
+importan de forma diferida en el primer uso, para que importar este módulo
+(y arrancar cada worker) no pague su costo de carga.
 """
 
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional, Any
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
-from passlib.context import CryptContext
 from sqlalchemy.orm import Session
 
-from app.core.config import settings
-from app.core.db import get_db
+from app.core.config import get_settings
+from app.core.db import get_directory_db
+from app.core.tracing import traced
+from app.core.vote_crypto import decrypt_vote_value, encrypt_vote_value, vote_aad  # noqa: F401
 from app.schemas import TokenData
 
-# Contexto de hashing de contraseñas
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+settings = get_settings()
 
 # Esquema OAuth2 para extraer el token de la cabecera Authorization
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
@@ -37,18 +43,31 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 # Gestión de contraseñas
 # =========================================================
 
+@lru_cache()
+def get_pwd_context():
+    """
+    Devuelve el contexto de hashing de contraseñas (bcrypt).
+
+    passlib y bcrypt se importan aquí, en el primer login o registro,
+    y no al importar el módulo.
+    """
+    from passlib.context import CryptContext
+
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     Verifica que la contraseña en texto plano coincida con el hash almacenado.
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    return get_pwd_context().verify(plain_password, hashed_password)
 
 
 def get_password_hash(password: str) -> str:
     """
     Genera un hash seguro de la contraseña.
     """
-    return pwd_context.hash(password)
+    return get_pwd_context().hash(password)
 
 
 # =========================================================
@@ -65,20 +84,22 @@ def create_access_token(
     Parámetros:
         subject: Identificador del sujeto (normalmente email del usuario).
         expires_delta: Tiempo de expiración; si no se envía, se usa
-                       ACCESS_TOKEN_EXPIRE_MINUTES de la configuración.
+                       JWT_EXPIRE_MINUTES de la configuración.
 
     Devuelve:
         Token JWT como cadena.
     """
+    from jose import jwt
+
     if expires_delta is None:
-        expires_delta = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+        expires_delta = timedelta(minutes=settings.JWT_EXPIRE_MINUTES)
 
     expire = datetime.utcnow() + expires_delta
     to_encode = {"sub": subject, "exp": expire}
     encoded_jwt = jwt.encode(
         to_encode,
-        settings.SECRET_KEY,
-        algorithm=settings.ALGORITHM,
+        settings.JWT_SECRET,
+        algorithm=settings.JWT_ALGORITHM,
     )
     return encoded_jwt
 
@@ -87,15 +108,16 @@ def create_access_token(
 # Usuario actual a partir del token
 # =========================================================
 
+@traced("auth.get_current_user")
 def get_current_user(
     token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_directory_db),
 ) -> Any:
     """
     Obtiene el usuario actual autenticado a partir del token JWT.
 
     Pasos:
-        1. Decodifica el token usando SECRET_KEY y ALGORITHM.
+        1. Decodifica el token usando JWT_SECRET y JWT_ALGORITHM.
         2. Extrae el campo "sub" (email del usuario).
         3. Consulta en la base de datos el usuario con ese email.
         4. Si algo falla, lanza HTTP 401.
@@ -103,7 +125,9 @@ def get_current_user(
     Devuelve:
         Instancia de User correspondiente al token.
     """
-    # Importación diferida para evitar ciclos de importación
+    # Importaciones diferidas: evita ciclos y la carga de jose al arrancar
+    from jose import JWTError, jwt
+
     from app.models.user import User
 
     credentials_exception = HTTPException(
@@ -115,19 +139,33 @@ def get_current_user(
     try:
         payload = jwt.decode(
             token,
-            settings.SECRET_KEY,
-            algorithms=[settings.ALGORITHM],
+            settings.JWT_SECRET,
+            algorithms=[settings.JWT_ALGORITHM],
         )
         sub: Optional[str] = payload.get("sub")
         if sub is None:
             raise credentials_exception
 
-        token_data = TokenData(username=sub)
+        token_data = TokenData(email=sub)
     except JWTError:
         raise credentials_exception
 
-    user = db.query(User).filter(User.email == token_data.username).first()
+    user = db.query(User).filter(User.email == token_data.email).first()
     if user is None:
         raise credentials_exception
 
     return user
+
+
+def require_admin(current_user: Any = Depends(get_current_user)) -> Any:
+    """
+    Dependencia para rutas de administración: el usuario debe tener rol ADMIN.
+
+    Lanza HTTP 403 si el usuario autenticado no es administrador.
+    """
+    if current_user.role != "ADMIN":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Solo un administrador puede acceder a este recurso.",
+        )
+    return current_user
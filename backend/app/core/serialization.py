@@ -0,0 +1,41 @@
+"""
+backend/app/core/serialization.py
+
+Serialización JSON rápida para las rutas de lectura de AgoraX.
+
+Las rutas de lectura construyen DTOs livianos (dataclasses con slots) a
+partir de columnas seleccionadas y los serializan directamente con un
+TypeAdapter de Pydantic precompilado (serializador en Rust). Al devolver
+un Response ya serializado, FastAPI no vuelve a validar el response_model
+ni pasa por jsonable_encoder + json.dumps; el response_model se conserva
+solo para la documentación OpenAPI.
+"""
+
+from typing import Any, Mapping, Optional
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+
+def json_response(
+    adapter: TypeAdapter,
+    payload: Any,
+    *,
+    status_code: int = 200,
+    headers: Optional[Mapping[str, str]] = None,
+) -> Response:
+    """
+    Serializa `payload` con un TypeAdapter precompilado y lo envuelve en un Response.
+
+    Parámetros:
+        adapter: TypeAdapter creado una sola vez a nivel de módulo.
+        payload: Objeto compatible con el tipo del adapter (no se valida).
+        status_code: Código HTTP de la respuesta.
+        headers: Cabeceras adicionales.
+    """
+    return Response(
+        content=adapter.dump_json(payload),
+        status_code=status_code,
+        media_type="application/json",
+        headers=dict(headers) if headers else None,
+    )
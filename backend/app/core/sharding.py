@@ -0,0 +1,322 @@
+"""
+backend/app/core/sharding.py
+
+Enrutamiento multi-tenant por conjunto (Condominium) para AgoraX.
+
+Cada conjunto vive completo (propietarios, asambleas, agenda, presencias,
+votos y auditoría) en un único shard. El motor principal actúa como shard
+"default" y como directorio: guarda las tablas de enrutamiento
+(tenant_shards, meeting_routes) y los usuarios.
+
+Resolución del shard en una petición:
+    - Si la ruta trae condominium_id, se usa directamente.
+    - Si trae meeting_id, se resuelve el conjunto con meeting_routes.
+    - Si no hay ruta registrada, se usa "default" (datos previos al sharding).
+
+Las rutas se cachean en memoria por SHARD_ROUTE_CACHE_SECONDS; durante un
+rebalanceo el conjunto se marca MOVING y sus peticiones reciben 503 hasta
+que termina la copia (ver app.services.shard_service).
+
+Los usuarios viven en el directorio; cuando una sesión de shard inserta
+filas que referencian users.id (propietarios, auditoría), el usuario se
+replica al shard en la misma transacción (ver _replicate_users).
+
+Con SHARD_DATABASE_URLS vacío el sharding queda deshabilitado y todo usa
+el motor principal, sin consultas adicionales.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, Set, Tuple
+
+from sqlalchemy import event, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.config import Settings, get_settings
+from app.core.db import create_app_engine, dialect_insert, engine
+
+settings = get_settings()
+
+DEFAULT_SHARD = "default"
+STATUS_ACTIVE = "ACTIVE"
+STATUS_MOVING = "MOVING"
+
+
+class TenantMoving(RuntimeError):
+    """
+    El conjunto se está moviendo de shard y no puede atenderse ahora.
+    """
+
+
+class ShardRouter:
+    """
+    Resuelve el shard de cada conjunto y entrega sesiones sobre él.
+
+    Los motores de los shards se crean de forma perezosa en el primer uso.
+    """
+
+    def __init__(self, cfg: Settings, directory_engine: Engine) -> None:
+        self._cfg = cfg
+        self._urls: Dict[str, str] = dict(cfg.SHARD_DATABASE_URLS)
+        self._engines: Dict[str, Engine] = {DEFAULT_SHARD: directory_engine}
+        self._sessionmakers: Dict[str, sessionmaker] = {}
+        self._lock = threading.Lock()
+        # condominium_id -> (shard, status, expira_en)
+        self._tenant_routes: Dict[int, Tuple[str, str, float]] = {}
+        # meeting_id -> condominium_id (una asamblea nunca cambia de conjunto)
+        self._meeting_routes: Dict[int, int] = {}
+        # shard -> IDs de usuario ya replicados
+        self._replicated_users: Dict[str, set] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._urls)
+
+    def shard_names(self) -> list[str]:
+        """
+        Devuelve todos los shards conocidos, empezando por 'default'.
+        """
+        return [DEFAULT_SHARD, *sorted(name for name in self._urls if name != DEFAULT_SHARD)]
+
+    # ---------- Motores y sesiones ----------
+
+    def engine(self, shard: str) -> Engine:
+        """
+        Devuelve (y crea si hace falta) el motor de un shard.
+
+        Excepciones:
+            - ValueError si el shard no está configurado.
+        """
+        found = self._engines.get(shard)
+        if found is not None:
+            return found
+        if shard not in self._urls:
+            raise ValueError(f"Shard no configurado: {shard}")
+        with self._lock:
+            if shard not in self._engines:
+                self._engines[shard] = create_app_engine(self._cfg, self._urls[shard])
+            return self._engines[shard]
+
+    def session(self, shard: str) -> Session:
+        """
+        Abre una sesión nueva sobre el shard indicado.
+        """
+        factory = self._sessionmakers.get(shard)
+        if factory is None:
+            factory = sessionmaker(autocommit=False, autoflush=False, bind=self.engine(shard))
+            if shard != DEFAULT_SHARD:
+                event.listen(factory, "before_flush", self._replicate_users)
+                factory.kw["info"] = {"shard": shard}
+            self._sessionmakers[shard] = factory
+        return factory()
+
+    def _replicate_users(self, session: Session, flush_context, instances) -> None:
+        """
+        Copia al shard los usuarios referenciados por filas nuevas (before_flush).
+        """
+        self.replicate_users(
+            session,
+            {
+                obj.user_id
+                for obj in session.new
+                if getattr(obj, "user_id", None) is not None
+            },
+        )
+
+    def replicate_users(self, session: Session, user_ids: Set[int]) -> None:
+        """
+        Copia al shard de la sesión los usuarios indicados que aún no estén.
+
+        Lo usan el listener before_flush y las inserciones masivas (Core)
+        que no pasan por el flush del ORM. En el shard "default" no hace nada.
+        """
+        shard = session.info.get("shard", DEFAULT_SHARD)
+        if not user_ids or shard == DEFAULT_SHARD:
+            return
+        known = self._replicated_users.setdefault(shard, set())
+        missing = set(user_ids) - known
+        if not missing:
+            return
+
+        from app.models import User
+
+        users = User.__table__
+        with self._engines[DEFAULT_SHARD].connect() as directory:
+            rows = [
+                dict(row)
+                for row in directory.execute(select(users).where(users.c.id.in_(missing))).mappings()
+            ]
+        if rows:
+            session.execute(
+                dialect_insert(session, users).on_conflict_do_nothing(index_elements=["id"]),
+                rows,
+            )
+        known.update(missing)
+
+    # ---------- Resolución de rutas ----------
+
+    def tenant_route(self, directory_db: Session, condominium_id: int) -> Tuple[str, str]:
+        """
+        Devuelve (shard, status) del conjunto, usando la caché con TTL.
+        """
+        from app.models import TenantShard
+
+        now = time.monotonic()
+        cached = self._tenant_routes.get(condominium_id)
+        if cached is not None and cached[2] > now:
+            return cached[0], cached[1]
+
+        row = directory_db.execute(
+            select(TenantShard.shard, TenantShard.status).where(
+                TenantShard.condominium_id == condominium_id
+            )
+        ).first()
+        shard, status = (row.shard, row.status) if row is not None else (DEFAULT_SHARD, STATUS_ACTIVE)
+        self._tenant_routes[condominium_id] = (shard, status, now + self._cfg.SHARD_ROUTE_CACHE_SECONDS)
+        return shard, status
+
+    def shard_for_condominium(self, directory_db: Session, condominium_id: int) -> str:
+        """
+        Devuelve el shard activo del conjunto.
+
+        Excepciones:
+            - TenantMoving si el conjunto se está rebalanceando.
+        """
+        shard, status = self.tenant_route(directory_db, condominium_id)
+        if status == STATUS_MOVING:
+            raise TenantMoving(f"El conjunto {condominium_id} se está moviendo de shard.")
+        return shard
+
+    def condominium_for_meeting(self, directory_db: Session, meeting_id: int) -> Optional[int]:
+        """
+        Devuelve el conjunto de una asamblea según meeting_routes (None si no está registrada).
+        """
+        from app.models import MeetingRoute
+
+        cached = self._meeting_routes.get(meeting_id)
+        if cached is not None:
+            return cached
+        condominium_id = directory_db.execute(
+            select(MeetingRoute.condominium_id).where(MeetingRoute.meeting_id == meeting_id)
+        ).scalar_one_or_none()
+        if condominium_id is not None:
+            self._meeting_routes[meeting_id] = condominium_id
+        return condominium_id
+
+    def shard_for_path_params(self, directory_db: Session, path_params: dict) -> str:
+        """
+        Resuelve el shard a partir de los parámetros de ruta de una petición.
+        """
+        try:
+            if "condominium_id" in path_params:
+                return self.shard_for_condominium(directory_db, int(path_params["condominium_id"]))
+            if "meeting_id" in path_params:
+                condominium_id = self.condominium_for_meeting(
+                    directory_db, int(path_params["meeting_id"])
+                )
+                if condominium_id is not None:
+                    return self.shard_for_condominium(directory_db, condominium_id)
+        except ValueError:
+            # Parámetro no numérico: la validación del endpoint responderá 422
+            pass
+        return DEFAULT_SHARD
+
+    @contextmanager
+    def tenant_session(self, directory_db: Session, condominium_id: int) -> Iterator[Session]:
+        """
+        Sesión sobre el shard del conjunto.
+
+        Si el conjunto vive en 'default' se reutiliza la sesión del
+        directorio (misma transacción, sin conexión adicional).
+        """
+        shard = self.shard_for_condominium(directory_db, condominium_id) if self.enabled else DEFAULT_SHARD
+        if shard == DEFAULT_SHARD:
+            yield directory_db
+            return
+        db = self.session(shard)
+        try:
+            yield db
+        finally:
+            db.close()
+
+    def each_shard_session(self, directory_db: Session) -> Iterator[Session]:
+        """
+        Recorre una sesión por shard (para consultas que abarcan todos los conjuntos).
+
+        El shard 'default' usa la sesión del directorio; las demás sesiones
+        se cierran al avanzar el iterador.
+        """
+        yield directory_db
+        if not self.enabled:
+            return
+        for shard in self.shard_names()[1:]:
+            db = self.session(shard)
+            try:
+                yield db
+            finally:
+                db.close()
+
+    # ---------- Escritura en el directorio ----------
+
+    def register_meeting(self, directory_db: Session, meeting_id: int, condominium_id: int) -> None:
+        """
+        Registra la asamblea en meeting_routes (idempotente). No hace commit.
+        """
+        from app.models import MeetingRoute
+
+        stmt = (
+            dialect_insert(directory_db, MeetingRoute.__table__)
+            .values(meeting_id=meeting_id, condominium_id=condominium_id)
+            .on_conflict_do_nothing(index_elements=["meeting_id"])
+        )
+        directory_db.execute(stmt)
+        self._meeting_routes[meeting_id] = condominium_id
+
+    def assign_tenant(
+        self,
+        directory_db: Session,
+        condominium_id: int,
+        shard: str,
+        *,
+        status: str = STATUS_ACTIVE,
+    ) -> None:
+        """
+        Asigna (o reasigna) un conjunto a un shard. No hace commit.
+        """
+        from datetime import datetime, timezone
+
+        from app.models import TenantShard
+
+        if shard != DEFAULT_SHARD:
+            self.engine(shard)  # valida que el shard exista
+        stmt = dialect_insert(directory_db, TenantShard.__table__).values(
+            condominium_id=condominium_id,
+            shard=shard,
+            status=status,
+            updated_at=datetime.now(timezone.utc),
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["condominium_id"],
+            set_={
+                "shard": stmt.excluded.shard,
+                "status": stmt.excluded.status,
+                "updated_at": stmt.excluded.updated_at,
+            },
+        )
+        directory_db.execute(stmt)
+        self.invalidate(condominium_id)
+
+    def invalidate(self, condominium_id: Optional[int] = None) -> None:
+        """
+        Descarta rutas cacheadas (de un conjunto o todas).
+        """
+        if condominium_id is None:
+            self._tenant_routes.clear()
+        else:
+            self._tenant_routes.pop(condominium_id, None)
+
+
+# Router global de la aplicación
+shard_router = ShardRouter(settings, engine)
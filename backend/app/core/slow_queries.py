@@ -0,0 +1,274 @@
+"""
+backend/app/core/slow_queries.py
+
+Registro de sentencias SQL lentas con su plan de ejecución.
+
+Los hooks before_cursor_execute / after_cursor_execute de cada motor
+(core/db.py) miden cada sentencia; las que superan
+SLOW_QUERY_THRESHOLD_MS se guardan en un buffer circular de
+SLOW_QUERY_BUFFER_SIZE entradas con:
+
+    - la sentencia (truncada) y la forma de sus parámetros: nombres y
+      tipos, nunca valores (RD-06: un parámetro puede ser un voto);
+    - la duración, la base (shard) y la ruta HTTP que la ejecutó.
+
+Plan (SLOW_QUERY_EXPLAIN):
+    - "off": no se captura.
+    - "plan": EXPLAIN (PostgreSQL) / EXPLAIN QUERY PLAN (SQLite).
+    - "analyze": EXPLAIN (ANALYZE, BUFFERS) en PostgreSQL; vuelve a
+      ejecutar la consulta, así que solo se aplica a SELECT.
+    Se captura en un hilo aparte, con una cola acotada y como mucho una
+    vez por sentencia cada SLOW_QUERY_EXPLAIN_INTERVAL_S, de modo que la
+    petición lenta no espera a su propio EXPLAIN.
+
+El buffer se consulta en /admin/slow-queries: un índice ausente (p. ej.
+sobre votes.agenda_item_id) aparece como la misma sentencia repetida con
+un Seq Scan / SCAN en el plan.
+"""
+
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, List, Optional
+
+from sqlalchemy.engine import Engine
+
+from app.core.config import Settings, get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+EXPLAIN_MODES = ("off", "plan", "analyze")
+
+# Longitud máxima de la sentencia guardada
+_MAX_STATEMENT_CHARS = 4000
+# EXPLAIN pendientes como máximo (los demás se descartan)
+_EXPLAIN_QUEUE_SIZE = 16
+_EXPLAIN_TIMEOUT_MS = 5000
+
+# Sentencias con plan (primeros 6 caracteres); ANALYZE solo en lecturas
+_READ_HEADS = ("SELECT", "WITH")
+_WRITE_HEADS = ("INSERT", "UPDATE", "DELETE")
+
+# Ruta de la petición en curso (la fija QueryRouteMiddleware)
+_request_scope: ContextVar[Optional[dict]] = ContextVar("agorax_query_route", default=None)
+
+
+@dataclass
+class SlowQuery:
+    """
+    Sentencia lenta registrada.
+    """
+
+    id: int
+    recorded_at: str
+    duration_ms: float
+    statement: str
+    params_shape: Any
+    executemany: bool
+    database: Optional[str]
+    route: Optional[str]
+    method: Optional[str]
+    plan: Optional[str] = None
+    plan_error: Optional[str] = None
+
+
+def params_shape(parameters: Any, executemany: bool) -> Any:
+    """
+    Forma de los parámetros sin sus valores: {"nombre": "tipo"} o ["tipo", ...].
+    """
+    if executemany and isinstance(parameters, (list, tuple)):
+        first = params_shape(parameters[0], False) if parameters else None
+        return {"rows": len(parameters), "each": first}
+    if isinstance(parameters, dict):
+        return {key: type(value).__name__ for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [type(value).__name__ for value in parameters]
+    return type(parameters).__name__ if parameters is not None else None
+
+
+def _current_route() -> tuple[Optional[str], Optional[str]]:
+    scope = _request_scope.get()
+    if scope is None:
+        return None, None
+    route = scope.get("route")
+    return getattr(route, "path", None) or scope.get("path"), scope.get("method")
+
+
+class SlowQueryLog:
+    """
+    Buffer circular de sentencias lentas y captura asíncrona de planes.
+    """
+
+    def __init__(self, cfg: Settings) -> None:
+        self._cfg = cfg
+        if cfg.SLOW_QUERY_EXPLAIN not in EXPLAIN_MODES:
+            raise ValueError(f"SLOW_QUERY_EXPLAIN desconocido: {cfg.SLOW_QUERY_EXPLAIN!r}")
+        self.threshold_s = cfg.SLOW_QUERY_THRESHOLD_MS / 1000.0
+        self._lock = threading.Lock()
+        self._entries: Deque[SlowQuery] = deque(maxlen=cfg.SLOW_QUERY_BUFFER_SIZE)
+        self._next_id = 1
+        self._explained_at: Dict[str, float] = {}
+        self._explain_queue: "queue.Queue[tuple]" = queue.Queue(maxsize=_EXPLAIN_QUEUE_SIZE)
+        self._explainer: Optional[threading.Thread] = None
+        self.recorded = 0
+        self.explained = 0
+        self.explain_dropped = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._cfg.SLOW_QUERY_LOG_ENABLED
+
+    def record(
+        self,
+        engine: Engine,
+        statement: str,
+        parameters: Any,
+        executemany: bool,
+        elapsed_s: float,
+    ) -> None:
+        """
+        Registra una sentencia que superó el umbral (llamado desde after_cursor_execute).
+        """
+        if statement.startswith("EXPLAIN"):
+            # Los planes que captura el propio registro no se registran
+            return
+        route, method = _current_route()
+        with self._lock:
+            entry = SlowQuery(
+                id=self._next_id,
+                recorded_at=datetime.now(timezone.utc).isoformat(),
+                duration_ms=elapsed_s * 1000.0,
+                statement=statement[:_MAX_STATEMENT_CHARS],
+                params_shape=params_shape(parameters, executemany),
+                executemany=executemany,
+                database=engine.url.database,
+                route=route,
+                method=method,
+            )
+            self._next_id += 1
+            self._entries.append(entry)
+            self.recorded += 1
+        logger.info(
+            "Sentencia lenta (%.1f ms, %s %s): %s",
+            entry.duration_ms,
+            method or "-",
+            route or "-",
+            entry.statement[:200],
+        )
+        if not executemany:
+            self._schedule_explain(engine, entry, statement, parameters)
+
+    # ---------- Planes ----------
+
+    def _schedule_explain(self, engine: Engine, entry: SlowQuery, statement: str, parameters: Any) -> None:
+        mode = self._cfg.SLOW_QUERY_EXPLAIN
+        if mode == "off":
+            return
+        head = statement.lstrip()[:6].upper()
+        if not head.startswith(_READ_HEADS if mode == "analyze" else _READ_HEADS + _WRITE_HEADS):
+            return
+        now = time.monotonic()
+        with self._lock:
+            last = self._explained_at.get(statement)
+            if last is not None and now - last < self._cfg.SLOW_QUERY_EXPLAIN_INTERVAL_S:
+                return
+            self._explained_at[statement] = now
+            if len(self._explained_at) > 4 * self._entries.maxlen:
+                self._explained_at.clear()
+            if self._explainer is None or not self._explainer.is_alive():
+                self._explainer = threading.Thread(
+                    target=self._explain_loop, name="agorax-explain", daemon=True
+                )
+                self._explainer.start()
+        try:
+            # Los valores se usan solo para el EXPLAIN y no se guardan
+            self._explain_queue.put_nowait((engine, entry, statement, parameters, mode))
+        except queue.Full:
+            self.explain_dropped += 1
+
+    def _explain_loop(self) -> None:
+        while True:
+            engine, entry, statement, parameters, mode = self._explain_queue.get()
+            try:
+                entry.plan = self._explain(engine, statement, parameters, mode)
+                self.explained += 1
+            except Exception as exc:  # el plan es diagnóstico: nunca debe romper nada
+                entry.plan_error = f"{type(exc).__name__}: {exc}"[:500]
+
+    def _explain(self, engine: Engine, statement: str, parameters: Any, mode: str) -> str:
+        dialect = engine.dialect.name
+        if dialect == "postgresql":
+            prefix = "EXPLAIN (ANALYZE, BUFFERS) " if mode == "analyze" else "EXPLAIN "
+        elif dialect == "sqlite":
+            prefix = "EXPLAIN QUERY PLAN "
+        else:
+            return f"EXPLAIN no soportado en {dialect}"
+
+        with engine.connect() as conn:
+            if dialect == "postgresql":
+                conn.exec_driver_sql(f"SET LOCAL statement_timeout = {_EXPLAIN_TIMEOUT_MS}")
+            result = conn.exec_driver_sql(prefix + statement, parameters)
+            rows = result.fetchall()
+            # Nunca se confirma: ANALYZE ejecuta la consulta dentro de esta transacción
+            conn.rollback()
+        if dialect == "sqlite":
+            # (id, parent, notused, detail)
+            return "\n".join(str(row[-1]) for row in rows)
+        return "\n".join(str(row[0]) for row in rows)
+
+    # ---------- Consulta ----------
+
+    def entries(self, limit: Optional[int] = None) -> List[dict]:
+        """
+        Sentencias registradas, de la más reciente a la más antigua.
+        """
+        with self._lock:
+            items = list(self._entries)
+        items.reverse()
+        return [asdict(entry) for entry in items[:limit]]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._explained_at.clear()
+
+    def stats(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "threshold_ms": self._cfg.SLOW_QUERY_THRESHOLD_MS,
+            "explain": self._cfg.SLOW_QUERY_EXPLAIN,
+            "buffered": len(self._entries),
+            "recorded": self.recorded,
+            "explained": self.explained,
+            "explain_dropped": self.explain_dropped,
+        }
+
+
+slow_query_log = SlowQueryLog(settings)
+
+
+class QueryRouteMiddleware:
+    """
+    Middleware ASGI que expone la ruta en curso a los hooks de SQL.
+    """
+
+    def __init__(self, app, log: SlowQueryLog = slow_query_log) -> None:
+        self.app = app
+        self.log = log
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self.log.enabled:
+            await self.app(scope, receive, send)
+            return
+        # Se guarda el scope: la plantilla de ruta se conoce después de enrutar
+        token = _request_scope.set(scope)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _request_scope.reset(token)
@@ -0,0 +1,496 @@
+"""
+backend/app/core/tracing.py
+
+Trazas livianas de extremo a extremo, exportadas en formato OpenTelemetry
+(OTLP/JSON) sin depender del SDK.
+
+Cada petición HTTP muestreada abre un span raíz (TracingMiddleware) y,
+dentro de él, se registran spans hijos para:
+
+    - la autenticación (get_current_user);
+    - la carga de hechos y cada regla del pipeline de votación, y las
+      verificaciones ensure_* del motor de reglas;
+    - el cálculo de quórum, el cifrado de votos y la auditoría;
+    - cada sentencia SQL y cada commit de sesión (TRACING_SQL_SPANS).
+
+El span activo viaja en una ContextVar, así que los endpoints síncronos
+del threadpool heredan la traza. Fuera de una traza, span() devuelve un
+contexto vacío compartido: el costo es una lectura de ContextVar.
+
+Propagación (W3C Trace Context):
+    - Se respeta "traceparent" de entrada (mismo trace id y decisión de muestreo).
+    - La respuesta lleva "traceresponse" y "X-Trace-Id".
+
+Exportación (TRACING_EXPORTER), por lotes desde un hilo:
+    - "file": una ExportTraceServiceRequest JSON por línea en TRACING_FILE
+      (formato del receptor otlpjsonfile del OpenTelemetry Collector).
+    - "otlp": POST a TRACING_OTLP_ENDPOINT (OTLP/HTTP con JSON, /v1/traces).
+Si la cola se llena, los spans se descartan (y se cuentan).
+"""
+
+import functools
+import json
+import logging
+import queue
+import random
+import re
+import threading
+import time
+import urllib.request
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.core.config import Settings, get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Tipos de span OTLP
+KIND_INTERNAL = 1
+KIND_SERVER = 2
+KIND_CLIENT = 3
+
+_STATUS_ERROR = 2
+_MAX_STATEMENT_CHARS = 1000
+_QUEUE_SIZE = 10_000
+_BATCH_SIZE = 512
+_FLUSH_INTERVAL_S = 1.0
+
+_TRACEPARENT = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+
+_current: ContextVar[Optional["Span"]] = ContextVar("agorax_span", default=None)
+
+
+def _new_id(bits: int) -> str:
+    return f"{random.getrandbits(bits):0{bits // 4}x}"
+
+
+@dataclass(slots=True)
+class Span:
+    """
+    Span terminado o en curso (tiempos en nanosegundos de reloj de pared).
+    """
+
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str]
+    name: str
+    kind: int = KIND_INTERNAL
+    start_ns: int = 0
+    end_ns: int = 0
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    def to_otlp(self) -> dict:
+        span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": [_otlp_attribute(key, value) for key, value in self.attributes.items()],
+        }
+        if self.parent_id:
+            span["parentSpanId"] = self.parent_id
+        if self.error is not None:
+            span["status"] = {"code": _STATUS_ERROR, "message": self.error}
+        return span
+
+
+def _otlp_attribute(key: str, value: Any) -> dict:
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+    return {"key": key, "value": {"stringValue": str(value)}}
+
+
+# =========================================================
+# Exportación
+# =========================================================
+
+class SpanExporter:
+    """
+    Cola acotada de spans terminados y un hilo que los exporta por lotes.
+    """
+
+    def __init__(self, cfg: Settings) -> None:
+        self._cfg = cfg
+        self._queue: "queue.Queue[Span]" = queue.Queue(maxsize=_QUEUE_SIZE)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self.exported = 0
+        self.dropped = 0
+        self.errors = 0
+
+    def start(self) -> None:
+        if self._cfg.TRACING_EXPORTER not in ("file", "otlp"):
+            raise RuntimeError(f"TRACING_EXPORTER desconocido: {self._cfg.TRACING_EXPORTER!r}")
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._stop.clear()
+                self._thread = threading.Thread(target=self._loop, name="agorax-tracing", daemon=True)
+                self._thread.start()
+
+    def stop(self) -> None:
+        thread = self._thread
+        if thread is None:
+            return
+        self._stop.set()
+        thread.join(timeout=5.0)
+        self._thread = None
+
+    def submit(self, span: Span) -> None:
+        try:
+            self._queue.put_nowait(span)
+        except queue.Full:
+            self.dropped += 1
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            self._stop.wait(_FLUSH_INTERVAL_S)
+            self.flush()
+        self.flush()
+
+    def flush(self) -> None:
+        """
+        Exporta todo lo encolado en lotes de hasta _BATCH_SIZE spans.
+        """
+        while True:
+            batch: List[Span] = []
+            while len(batch) < _BATCH_SIZE:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            if not batch:
+                return
+            try:
+                self._export(batch)
+                self.exported += len(batch)
+            except Exception:
+                self.errors += 1
+                logger.warning("No se pudieron exportar %s spans.", len(batch), exc_info=True)
+
+    def _export(self, batch: List[Span]) -> None:
+        body = json.dumps(
+            {
+                "resourceSpans": [
+                    {
+                        "resource": {
+                            "attributes": [_otlp_attribute("service.name", self._cfg.TRACING_SERVICE_NAME)]
+                        },
+                        "scopeSpans": [
+                            {
+                                "scope": {"name": "agorax"},
+                                "spans": [span.to_otlp() for span in batch],
+                            }
+                        ],
+                    }
+                ]
+            },
+            separators=(",", ":"),
+        )
+        if self._cfg.TRACING_EXPORTER == "file":
+            with open(self._cfg.TRACING_FILE, "a", encoding="utf-8") as fh:
+                fh.write(body + "\n")
+            return
+        request = urllib.request.Request(
+            self._cfg.TRACING_OTLP_ENDPOINT,
+            data=body.encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        with urllib.request.urlopen(request, timeout=2.0) as response:
+            response.read()
+
+
+# =========================================================
+# Tracer
+# =========================================================
+
+class Tracer:
+    """
+    Decisión de muestreo, spans raíz y envío al exportador.
+    """
+
+    def __init__(self, cfg: Settings) -> None:
+        self._cfg = cfg
+        self.exporter = SpanExporter(cfg)
+        self.traces = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._cfg.TRACING_ENABLED
+
+    @property
+    def sql_spans(self) -> bool:
+        return self._cfg.TRACING_SQL_SPANS
+
+    def start(self) -> None:
+        if self.enabled:
+            self.exporter.start()
+
+    def stop(self) -> None:
+        self.exporter.stop()
+
+    def start_trace(self, name: str, traceparent: Optional[str]) -> Tuple[Span, bool]:
+        """
+        Span raíz de una petición y si está muestreada.
+
+        Con un traceparent válido se continúa esa traza y su decisión de muestreo.
+        """
+        match = _TRACEPARENT.match(traceparent or "")
+        if match is not None:
+            trace_id, parent_id, flags = match.groups()
+            sampled = bool(int(flags, 16) & 1)
+        else:
+            trace_id, parent_id = _new_id(128), None
+            sampled = random.random() < self._cfg.TRACING_SAMPLE_RATE
+        root = Span(
+            trace_id=trace_id,
+            span_id=_new_id(64),
+            parent_id=parent_id,
+            name=name,
+            kind=KIND_SERVER,
+            start_ns=time.time_ns(),
+        )
+        if sampled:
+            self.traces += 1
+        return root, sampled
+
+    def finish(self, finished: Span) -> None:
+        self.exporter.submit(finished)
+
+    def stats(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "exporter": self._cfg.TRACING_EXPORTER,
+            "traces": self.traces,
+            "exported_spans": self.exporter.exported,
+            "dropped_spans": self.exporter.dropped,
+            "export_errors": self.exporter.errors,
+        }
+
+
+tracer = Tracer(settings)
+
+
+# =========================================================
+# API de instrumentación
+# =========================================================
+
+class _NoopScope:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc) -> bool:
+        return False
+
+
+_NOOP = _NoopScope()
+
+
+class _SpanScope:
+    __slots__ = ("_span", "_token")
+
+    def __init__(self, child: Span) -> None:
+        self._span = child
+        self._token = None
+
+    def __enter__(self) -> Span:
+        self._span.start_ns = time.time_ns()
+        self._token = _current.set(self._span)
+        return self._span
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        child = self._span
+        child.end_ns = time.time_ns()
+        if exc is not None:
+            child.error = f"{exc_type.__name__}: {getattr(exc, 'detail', exc)}"[:500]
+        _current.reset(self._token)
+        tracer.finish(child)
+        return False
+
+
+def span(name: str, **attributes: Any):
+    """
+    Contexto que registra un span hijo del activo; vacío fuera de una traza.
+
+    Uso:
+        with span("quorum.calculate", meeting_id=meeting_id):
+            ...
+    """
+    parent = _current.get()
+    if parent is None:
+        return _NOOP
+    return _SpanScope(
+        Span(
+            trace_id=parent.trace_id,
+            span_id=_new_id(64),
+            parent_id=parent.span_id,
+            name=name,
+            attributes=attributes,
+        )
+    )
+
+
+def traced(name: str) -> Callable:
+    """
+    Decorador: ejecuta la función dentro de span(name).
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _current.get() is None:
+                return func(*args, **kwargs)
+            with span(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def record_span(name: str, start_ns: int, end_ns: int, kind: int = KIND_INTERNAL, **attributes: Any) -> None:
+    """
+    Registra un span ya terminado como hijo del activo (hooks de SQLAlchemy).
+    """
+    parent = _current.get()
+    if parent is None:
+        return
+    tracer.finish(
+        Span(
+            trace_id=parent.trace_id,
+            span_id=_new_id(64),
+            parent_id=parent.span_id,
+            name=name,
+            kind=kind,
+            start_ns=start_ns,
+            end_ns=end_ns,
+            attributes=attributes,
+        )
+    )
+
+
+def current_trace_id() -> Optional[str]:
+    active = _current.get()
+    return active.trace_id if active is not None else None
+
+
+# =========================================================
+# SQL y commits
+# =========================================================
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _sql_span_start(conn, cursor, statement, parameters, context, executemany):
+    if context is not None and _current.get() is not None and tracer.sql_spans:
+        context._agorax_trace_start = time.time_ns()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _sql_span_end(conn, cursor, statement, parameters, context, executemany):
+    started = getattr(context, "_agorax_trace_start", None)
+    if started is None:
+        return
+    record_span(
+        "db.query",
+        started,
+        time.time_ns(),
+        kind=KIND_CLIENT,
+        **{
+            "db.system": conn.dialect.name,
+            "db.name": conn.engine.url.database or "",
+            "db.statement": statement[:_MAX_STATEMENT_CHARS],
+            "db.executemany": executemany,
+        },
+    )
+
+
+@event.listens_for(Session, "before_commit")
+def _commit_span_start(session: Session) -> None:
+    if _current.get() is not None and tracer.sql_spans:
+        session.info["trace_commit_start"] = time.time_ns()
+
+
+@event.listens_for(Session, "after_commit")
+def _commit_span_end(session: Session) -> None:
+    started = session.info.pop("trace_commit_start", None)
+    if started is not None:
+        record_span("db.commit", started, time.time_ns(), kind=KIND_CLIENT)
+
+
+@event.listens_for(Session, "after_rollback")
+def _commit_span_discard(session: Session) -> None:
+    session.info.pop("trace_commit_start", None)
+
+
+# =========================================================
+# Middleware
+# =========================================================
+
+class TracingMiddleware:
+    """
+    Middleware ASGI: span raíz por petición y cabeceras de propagación.
+    """
+
+    def __init__(self, app, tracer_: Tracer = tracer) -> None:
+        self.app = app
+        self.tracer = tracer_
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self.tracer.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        traceparent = None
+        for key, value in scope["headers"]:
+            if key == b"traceparent":
+                traceparent = value.decode("latin-1").strip().lower()
+                break
+        root, sampled = self.tracer.start_trace(f"{scope['method']} {scope['path']}", traceparent)
+        response_headers = [
+            (b"traceresponse", f"00-{root.trace_id}-{root.span_id}-{'01' if sampled else '00'}".encode("latin-1")),
+            (b"x-trace-id", root.trace_id.encode("latin-1")),
+        ]
+
+        async def send_with_trace(message):
+            if message["type"] == "http.response.start":
+                root.attributes["http.response.status_code"] = message["status"]
+                message = {**message, "headers": [*message.get("headers", []), *response_headers]}
+            await send(message)
+
+        if not sampled:
+            await self.app(scope, receive, send_with_trace)
+            return
+
+        root.attributes["http.request.method"] = scope["method"]
+        root.attributes["url.path"] = scope["path"]
+        token = _current.set(root)
+        try:
+            await self.app(scope, receive, send_with_trace)
+        except Exception as exc:
+            root.error = f"{type(exc).__name__}: {exc}"[:500]
+            raise
+        finally:
+            _current.reset(token)
+            root.end_ns = time.time_ns()
+            route = getattr(scope.get("route"), "path", None)
+            if route is not None:
+                root.attributes["http.route"] = route
+                root.name = f"{scope['method']} {route}"
+            if root.error is None and root.attributes.get("http.response.status_code", 200) >= 500:
+                root.error = f"HTTP {root.attributes['http.response.status_code']}"
+            self.tracer.finish(root)
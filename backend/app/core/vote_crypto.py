@@ -0,0 +1,278 @@
+"""
+backend/app/core/vote_crypto.py
+
+Cifrado autenticado de votos (RD-06) con AES-256-GCM.
+
+La clave se deriva una sola vez de Settings.VOTE_ENCRYPTION_KEY con
+HKDF-SHA256 y el objeto AESGCM resultante se reutiliza en todas las
+llamadas. La clave no depende de JWT_SECRET: sin VOTE_ENCRYPTION_KEY el
+arranque falla salvo con APP_ENV=development, donde se usa una clave de
+desarrollo fija (DEV_VOTE_ENCRYPTION_KEY) y se avisa en el log. Cada voto cifrado es un texto base64url (sin relleno) de:
+
+    versión (1 byte) | key_id (4 bytes) | nonce (12 bytes) | cifrado + tag (16 bytes)
+
+key_id identifica la clave con la que se cifró, de modo que el descifrado
+elige la clave correcta del llavero: la actual más VOTE_ENCRYPTION_OLD_KEYS
+durante una rotación (ver app.services.vote_rekey_service). Los datos asociados (AAD) ligan el
+cifrado a su fila (agenda_item_id, owner_id): un valor copiado a otro voto
+no descifra.
+
+Las funciones por lote (encrypt_vote_values / decrypt_vote_values) toman
+todos los nonces de una sola llamada a os.urandom y resuelven clave y
+cifrador una vez por lote, para los caminos de escrutinio y exportación.
+
+La librería cryptography se importa en el primer uso, no al arrancar.
+"""
+
+import base64
+import hashlib
+import logging
+import os
+import struct
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence
+
+from app.core.config import get_settings
+from app.core.tracing import traced
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Solo para APP_ENV=development: los votos cifrados con ella no son confidenciales
+DEV_VOTE_ENCRYPTION_KEY = "agorax-dev-vote-key-not-for-production"
+
+FORMAT_VERSION = 1
+_KEY_ID_SIZE = 4
+_NONCE_SIZE = 12
+_TAG_SIZE = 16
+_HEADER = struct.Struct(f">B{_KEY_ID_SIZE}s")
+_PREFIX_SIZE = _HEADER.size + _NONCE_SIZE
+_AAD = struct.Struct(">qq")
+
+_HKDF_SALT = b"agorax-vote-encryption"
+_HKDF_INFO = b"agorax-vote-aes256gcm-v1"
+
+
+class VoteDecryptionError(ValueError):
+    """
+    El voto cifrado está mal formado, usa una clave desconocida o no se autentica.
+    """
+
+
+@dataclass(frozen=True, slots=True)
+class VoteKey:
+    """
+    Clave derivada y su cifrador AES-GCM cacheado.
+    """
+
+    key_id: bytes
+    aead: Any
+
+
+def derive_vote_key(secret: str) -> VoteKey:
+    """
+    Deriva una clave AES-256 (HKDF-SHA256) a partir del secreto configurado.
+    """
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+    from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+
+    key = HKDF(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=_HKDF_SALT,
+        info=_HKDF_INFO,
+    ).derive(secret.encode("utf-8"))
+    key_id = hashlib.sha256(b"agorax-vote-key-id:" + key).digest()[:_KEY_ID_SIZE]
+    return VoteKey(key_id=key_id, aead=AESGCM(key))
+
+
+@lru_cache()
+def vote_key_secret() -> str:
+    """
+    Secreto de la clave actual.
+
+    Excepciones:
+        - RuntimeError si falta VOTE_ENCRYPTION_KEY fuera de APP_ENV=development.
+    """
+    if settings.VOTE_ENCRYPTION_KEY:
+        return settings.VOTE_ENCRYPTION_KEY
+    if settings.APP_ENV != "development":
+        raise RuntimeError(
+            f"VOTE_ENCRYPTION_KEY es obligatoria con APP_ENV={settings.APP_ENV} (RD-06)."
+        )
+    logger.warning("VOTE_ENCRYPTION_KEY no configurada: se usa la clave de desarrollo.")
+    return DEV_VOTE_ENCRYPTION_KEY
+
+
+@lru_cache()
+def get_vote_key() -> VoteKey:
+    """
+    Clave de cifrado actual (derivada una sola vez por proceso).
+    """
+    return derive_vote_key(vote_key_secret())
+
+
+@lru_cache()
+def get_keyring() -> Dict[bytes, VoteKey]:
+    """
+    Claves aceptadas para descifrar, indexadas por key_id.
+    """
+    keyring = {}
+    for secret in settings.VOTE_ENCRYPTION_OLD_KEYS:
+        old = derive_vote_key(secret)
+        keyring[old.key_id] = old
+    current = get_vote_key()
+    keyring[current.key_id] = current
+    return keyring
+
+
+def ciphertext_key_id(token: str) -> bytes:
+    """
+    Devuelve el key_id de un voto cifrado sin descifrarlo.
+
+    Excepciones:
+        - VoteDecryptionError si el texto no tiene el formato esperado.
+    """
+    # 8 caracteres base64 = 6 bytes: versión + key_id + 1 byte del nonce
+    head = _decode(token[:8])
+    if len(head) < _HEADER.size or head[0] != FORMAT_VERSION:
+        raise VoteDecryptionError("Voto cifrado mal formado.")
+    return head[1:_HEADER.size]
+
+
+def vote_aad(agenda_item_id: int, owner_id: int) -> bytes:
+    """
+    Datos asociados que ligan un voto cifrado a su fila.
+    """
+    return _AAD.pack(agenda_item_id, owner_id)
+
+
+def _encode(blob) -> str:
+    return base64.urlsafe_b64encode(blob).rstrip(b"=").decode("ascii")
+
+
+def _decode(token: str) -> bytes:
+    try:
+        return base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+    except (ValueError, TypeError) as exc:
+        raise VoteDecryptionError("Voto cifrado mal formado.") from exc
+
+
+def _split(blob: bytes, keyring: Dict[bytes, VoteKey]) -> tuple[VoteKey, bytes, bytes]:
+    if len(blob) < _PREFIX_SIZE + _TAG_SIZE:
+        raise VoteDecryptionError("Voto cifrado demasiado corto.")
+    if blob[0] != FORMAT_VERSION:
+        raise VoteDecryptionError(f"Versión de cifrado no soportada: {blob[0]}")
+    key = keyring.get(blob[1:_HEADER.size])
+    if key is None:
+        raise VoteDecryptionError(f"Clave de cifrado desconocida: {blob[1:_HEADER.size].hex()}")
+    return key, blob[_HEADER.size:_PREFIX_SIZE], blob[_PREFIX_SIZE:]
+
+
+# ================== UN VOTO ==================
+
+
+@traced("crypto.encrypt_vote")
+def encrypt_vote_value(value: str, *, associated_data: Optional[bytes] = None) -> str:
+    """
+    Cifra el valor de un voto con la clave actual.
+
+    Parámetros:
+        value: Opción de voto en texto claro.
+        associated_data: AAD opcional (ver vote_aad).
+    """
+    key = get_vote_key()
+    nonce = os.urandom(_NONCE_SIZE)
+    sealed = key.aead.encrypt(nonce, value.encode("utf-8"), associated_data)
+    return _encode(_HEADER.pack(FORMAT_VERSION, key.key_id) + nonce + sealed)
+
+
+@traced("crypto.decrypt_vote")
+def decrypt_vote_value(token: str, *, associated_data: Optional[bytes] = None) -> str:
+    """
+    Descifra el valor de un voto.
+
+    Excepciones:
+        - VoteDecryptionError si el formato, la clave o la autenticación fallan.
+    """
+    from cryptography.exceptions import InvalidTag
+
+    key, nonce, sealed = _split(_decode(token), get_keyring())
+    try:
+        return key.aead.decrypt(nonce, sealed, associated_data).decode("utf-8")
+    except InvalidTag as exc:
+        raise VoteDecryptionError("El voto cifrado no se pudo autenticar.") from exc
+
+
+# ================== LOTES ==================
+
+
+@traced("crypto.encrypt_votes")
+def encrypt_vote_values(
+    values: Sequence[str],
+    *,
+    associated_data: Optional[Sequence[Optional[bytes]]] = None,
+) -> List[str]:
+    """
+    Cifra varios votos con la clave actual.
+
+    Todos los nonces salen de una sola lectura de os.urandom y la cabecera,
+    el cifrador y el codificador se resuelven una vez para todo el lote.
+    """
+    count = len(values)
+    if associated_data is None:
+        associated_data = (None,) * count
+    elif len(associated_data) != count:
+        raise ValueError("associated_data debe tener un elemento por voto.")
+
+    key = get_vote_key()
+    header = _HEADER.pack(FORMAT_VERSION, key.key_id)
+    encrypt = key.aead.encrypt
+    b64encode = base64.urlsafe_b64encode
+    nonces = os.urandom(_NONCE_SIZE * count)
+
+    result: List[str] = []
+    append = result.append
+    offset = 0
+    for value, aad in zip(values, associated_data):
+        nonce = nonces[offset:offset + _NONCE_SIZE]
+        offset += _NONCE_SIZE
+        sealed = encrypt(nonce, value.encode("utf-8"), aad)
+        append(b64encode(header + nonce + sealed).rstrip(b"=").decode("ascii"))
+    return result
+
+
+@traced("crypto.decrypt_votes")
+def decrypt_vote_values(
+    tokens: Sequence[str],
+    *,
+    associated_data: Optional[Sequence[Optional[bytes]]] = None,
+) -> List[str]:
+    """
+    Descifra varios votos (escrutinio, exportación, rotación de claves).
+
+    Excepciones:
+        - VoteDecryptionError en el primer voto que no se pueda descifrar.
+    """
+    from cryptography.exceptions import InvalidTag
+
+    count = len(tokens)
+    if associated_data is None:
+        associated_data = (None,) * count
+    elif len(associated_data) != count:
+        raise ValueError("associated_data debe tener un elemento por voto.")
+
+    keyring = get_keyring()
+    result: List[str] = []
+    append = result.append
+    for index, (token, aad) in enumerate(zip(tokens, associated_data)):
+        key, nonce, sealed = _split(_decode(token), keyring)
+        try:
+            append(key.aead.decrypt(nonce, sealed, aad).decode("utf-8"))
+        except InvalidTag as exc:
+            raise VoteDecryptionError(
+                f"El voto cifrado #{index} no se pudo autenticar."
+            ) from exc
+    return result
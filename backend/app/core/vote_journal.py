@@ -0,0 +1,583 @@
+"""
+backend/app/core/vote_journal.py
+
+Diario local de votos para absorber picos de votación (VOTE_INTAKE_MODE=journal).
+
+Cuando se abre un punto, los votos llegan en ráfaga y confirmarlos uno a
+uno en la base no da abasto. En modo diario, cast_vote valida la
+elegibilidad (una lectura) y, en lugar de insertar, añade el voto ya
+cifrado a un archivo local de solo-anexado; responde 202 en cuanto el
+registro es durable. Un hilo aplicador lo inserta después por lotes en
+votes y audit_logs (ver app.services.vote_intake_service).
+
+Durabilidad (group commit):
+    Un hilo de escritura agrupa los votos que llegan durante
+    VOTE_JOURNAL_GROUP_COMMIT_MS y los escribe con un único fsync; cada
+    petición espera al fsync de su grupo antes de responder.
+
+Formato:
+    Segmentos votes-<primera_seq>.journal con registros
+    longitud (4 bytes) | crc32 (4 bytes) | JSON. Al arrancar se leen todos
+    los segmentos, se descarta una cola incompleta (escritura cortada por
+    un fallo) y los registros se vuelven a aplicar; el checkpoint por
+    journal_id en cada base hace que la reproducción sea idempotente.
+    Los segmentos ya aplicados se borran.
+
+Cierre de puntos:
+    closing_item sella el punto (no admite más votos del diario) y aplica
+    todo lo pendiente antes de que el cierre calcule el resultado.
+
+Un solo proceso:
+    El cierre solo puede sellar y aplicar el diario del proceso que lo
+    atiende; con varios procesos, los votos ya respondidos con 202 en otro
+    diario llegarían tarde y se descartarían como REJECT_VOTE. Por eso el
+    modo diario exige que todo el despliegue sea un único proceso
+    (uvicorn --workers 1): claim_intake toma al arrancar un bloqueo
+    exclusivo sobre la base (pg_try_advisory_lock en PostgreSQL, flock
+    junto al archivo en SQLite) y un segundo proceso en modo diario no
+    arranca. Un proceso en modo directo tampoco arranca mientras otro
+    tenga el diario. VOTE_JOURNAL_DIR se bloquea además con flock.
+"""
+
+import json
+import logging
+import os
+import struct
+import threading
+import time
+import uuid
+import zlib
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from itertools import islice, takewhile
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+
+from app.core.config import Settings, get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+_FRAME = struct.Struct(">II")
+_SEGMENT_PREFIX = "votes-"
+_SEGMENT_SUFFIX = ".journal"
+_ID_FILE = "journal.id"
+_LOCK_FILE = "journal.lock"
+# Bloqueo consultivo (PostgreSQL) del proceso dueño del diario: "AGXJ"
+_INTAKE_LOCK_KEY = 0x4147584A
+
+# Espera máxima de drain() a que lo aceptado sea durable
+_DRAIN_TIMEOUT_S = 5.0
+
+
+class JournalUnavailable(RuntimeError):
+    """
+    El diario no está activo o no se pudo escribir el registro.
+    """
+
+
+class AgendaItemClosing(ValueError):
+    """
+    El punto se está cerrando: el diario ya no admite votos para él.
+    """
+
+
+class DuplicateJournalVote(ValueError):
+    """
+    Ya hay un voto pendiente del mismo propietario para el punto (RD-01).
+    """
+
+
+@dataclass(frozen=True, slots=True)
+class JournalRecord:
+    """
+    Voto aceptado por el diario (el valor ya va cifrado).
+    """
+
+    seq: int
+    shard: str
+    meeting_id: int
+    agenda_item_id: int
+    owner_id: int
+    user_id: int
+    value_encrypted: str
+    ip_address: Optional[str]
+    created_at: datetime
+
+    def encode(self) -> bytes:
+        payload = asdict(self)
+        payload["created_at"] = self.created_at.isoformat()
+        body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        return _FRAME.pack(len(body), zlib.crc32(body)) + body
+
+    @classmethod
+    def decode(cls, body: bytes) -> "JournalRecord":
+        payload = json.loads(body)
+        payload["created_at"] = datetime.fromisoformat(payload["created_at"])
+        return cls(**payload)
+
+
+class _Batch:
+    """
+    Grupo de registros que se escribe con un solo fsync.
+    """
+
+    __slots__ = ("records", "done", "error")
+
+    def __init__(self) -> None:
+        self.records: List[JournalRecord] = []
+        self.done = threading.Event()
+        self.error: Optional[BaseException] = None
+
+
+# apply(journal_id, registros): inserta un lote; lanza excepción si falla
+ApplyFn = Callable[[str, Sequence[JournalRecord]], None]
+
+
+class VoteJournal:
+    """
+    Diario de votos del proceso: escritura con group commit y aplicación por lotes.
+    """
+
+    def __init__(self, cfg: Settings) -> None:
+        self._cfg = cfg
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._file_lock = threading.Lock()
+        self._apply_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._batch = _Batch()
+        self._pending: Dict[int, JournalRecord] = {}
+        self._pending_keys: Set[Tuple[int, int]] = set()
+        self._sealed: Set[int] = set()
+        self._segments: List[Tuple[str, int]] = []
+        self._next_seq = 1
+        self._durable_seq = 0
+        self._file = None
+        self._active_path = ""
+        self._active_last_seq = 0
+        self._lock_fd: Optional[int] = None
+        self._intake_conn = None
+        self._intake_fd: Optional[int] = None
+        self._apply: Optional[ApplyFn] = None
+        self._threads: List[threading.Thread] = []
+        self._running = False
+        self.journal_id = ""
+        self.applied = 0
+        self.apply_errors = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._cfg.VOTE_INTAKE_MODE == "journal"
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    # ---------- Ciclo de vida ----------
+
+    def claim_intake(self, engine) -> None:
+        """
+        Garantiza que el modo diario sea el único proceso sobre la base.
+
+        En modo diario toma un bloqueo exclusivo que se mantiene hasta
+        stop(); en modo directo solo comprueba que nadie lo tenga.
+
+        Excepciones:
+            - RuntimeError si otro proceso ya recibe votos por diario, o si
+              en modo diario hay otro proceso con el bloqueo.
+        """
+        message = (
+            "VOTE_INTAKE_MODE=journal exige un único proceso para toda la base "
+            "(uvicorn --workers 1): otro proceso ya recibe votos por diario."
+        )
+        exclusive = self.enabled
+        if engine.dialect.name == "postgresql":
+            from sqlalchemy import text
+
+            conn = engine.connect()
+            function = "pg_try_advisory_lock" if exclusive else "pg_try_advisory_lock_shared"
+            acquired = conn.execute(text(f"SELECT {function}(:key)"), {"key": _INTAKE_LOCK_KEY}).scalar_one()
+            conn.commit()
+            if acquired and exclusive:
+                self._intake_conn = conn
+                return
+            if acquired:
+                conn.execute(text("SELECT pg_advisory_unlock_shared(:key)"), {"key": _INTAKE_LOCK_KEY})
+                conn.commit()
+            conn.close()
+            if not acquired:
+                raise RuntimeError(message)
+            return
+
+        database = engine.url.database
+        if not database or database == ":memory:":
+            return
+        import fcntl
+
+        fd = os.open(f"{database}.journal-owner.lock", os.O_CREAT | os.O_RDWR, 0o600)
+        try:
+            fcntl.flock(fd, (fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH) | fcntl.LOCK_NB)
+        except OSError as exc:
+            os.close(fd)
+            raise RuntimeError(message) from exc
+        if exclusive:
+            self._intake_fd = fd
+        else:
+            os.close(fd)
+
+    def _release_intake(self) -> None:
+        if self._intake_conn is not None:
+            from sqlalchemy import text
+
+            try:
+                self._intake_conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": _INTAKE_LOCK_KEY})
+                self._intake_conn.commit()
+            finally:
+                self._intake_conn.close()
+                self._intake_conn = None
+        if self._intake_fd is not None:
+            os.close(self._intake_fd)
+            self._intake_fd = None
+
+    def start(self, apply: ApplyFn) -> None:
+        """
+        Abre el diario, recupera los registros pendientes y lanza los hilos.
+
+        Los registros recuperados quedan pendientes; apply_pending() (o el
+        hilo aplicador) los reproduce.
+        """
+        import fcntl
+
+        directory = self._cfg.VOTE_JOURNAL_DIR
+        os.makedirs(directory, exist_ok=True)
+        self._lock_fd = os.open(os.path.join(directory, _LOCK_FILE), os.O_CREAT | os.O_RDWR, 0o600)
+        try:
+            fcntl.flock(self._lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError as exc:
+            os.close(self._lock_fd)
+            self._lock_fd = None
+            raise RuntimeError(
+                f"El diario {directory} ya está en uso por otro proceso "
+                "(el modo diario admite un único proceso)."
+            ) from exc
+
+        self.journal_id = self._load_journal_id(directory)
+        self._apply = apply
+        self._pending.clear()
+        self._pending_keys.clear()
+        self._sealed.clear()
+        self._segments = []
+        recovered, first_free = self._recover(directory)
+        for record in recovered:
+            self._pending[record.seq] = record
+            self._pending_keys.add((record.agenda_item_id, record.owner_id))
+        last_seq = recovered[-1].seq if recovered else 0
+        self._durable_seq = self._active_last_seq = last_seq
+        self._next_seq = max(last_seq + 1, first_free)
+        self._open_segment(self._next_seq)
+        self._segments = [entry for entry in self._segments if entry[0] != self._active_path]
+        if recovered:
+            logger.info("Diario de votos: %s registros pendientes recuperados.", len(recovered))
+
+        self._stop.clear()
+        self._running = True
+        self._threads = [
+            threading.Thread(target=self._flush_loop, name="vote-journal-fsync", daemon=True),
+            threading.Thread(target=self._apply_loop, name="vote-journal-apply", daemon=True),
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self) -> None:
+        """
+        Deja de aceptar votos, escribe el último grupo y aplica lo pendiente.
+
+        Lo que no se pueda aplicar queda en el diario para el próximo arranque.
+        """
+        with self._lock:
+            if not self._running:
+                return
+            self._running = False
+            self._changed.notify_all()
+        self._stop.set()
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+        try:
+            self.apply_pending()
+        except Exception:
+            logger.exception("Diario de votos: quedan votos pendientes; se aplicarán al reiniciar.")
+        with self._file_lock:
+            self._file.close()
+            self._file = None
+        os.close(self._lock_fd)
+        self._lock_fd = None
+        self._release_intake()
+
+    # ---------- Escritura ----------
+
+    def append(
+        self,
+        *,
+        shard: str,
+        meeting_id: int,
+        agenda_item_id: int,
+        owner_id: int,
+        user_id: int,
+        value_encrypted: str,
+        ip_address: Optional[str],
+        created_at: datetime,
+    ) -> JournalRecord:
+        """
+        Añade un voto y espera a que su grupo sea durable (fsync).
+
+        Excepciones:
+            - DuplicateJournalVote si ya hay un voto pendiente del propietario.
+            - AgendaItemClosing si el punto se está cerrando.
+            - JournalUnavailable si el diario no está activo o falla la escritura.
+        """
+        key = (agenda_item_id, owner_id)
+        with self._lock:
+            if not self._running:
+                raise JournalUnavailable("El diario de votos no está activo.")
+            if agenda_item_id in self._sealed:
+                raise AgendaItemClosing(f"El punto de agenda (id={agenda_item_id}) se está cerrando.")
+            if key in self._pending_keys:
+                raise DuplicateJournalVote("El propietario ya registró un voto para este punto de agenda.")
+            record = JournalRecord(
+                seq=self._next_seq,
+                shard=shard,
+                meeting_id=meeting_id,
+                agenda_item_id=agenda_item_id,
+                owner_id=owner_id,
+                user_id=user_id,
+                value_encrypted=value_encrypted,
+                ip_address=ip_address,
+                created_at=created_at,
+            )
+            self._next_seq += 1
+            self._pending[record.seq] = record
+            self._pending_keys.add(key)
+            batch = self._batch
+            batch.records.append(record)
+            self._changed.notify_all()
+
+        batch.done.wait()
+        if batch.error is not None:
+            raise JournalUnavailable("No se pudo escribir el diario de votos.") from batch.error
+        return record
+
+    def _flush_loop(self) -> None:
+        window = self._cfg.VOTE_JOURNAL_GROUP_COMMIT_MS / 1000.0
+        while True:
+            with self._lock:
+                while self._running and not self._batch.records:
+                    self._changed.wait()
+                if not self._batch.records:
+                    return
+            if window > 0:
+                # Ventana de agrupación: los votos que lleguen comparten el fsync
+                time.sleep(window)
+            with self._lock:
+                batch, self._batch = self._batch, _Batch()
+            self._write(batch)
+
+    def _write(self, batch: _Batch) -> None:
+        data = b"".join(record.encode() for record in batch.records)
+        with self._file_lock:
+            offset = self._file.tell()
+            try:
+                self._file.write(data)
+                self._file.flush()
+                os.fsync(self._file.fileno())
+            except OSError as exc:
+                logger.exception("Diario de votos: fallo al escribir %s registros.", len(batch.records))
+                try:
+                    self._file.truncate(offset)
+                except OSError:
+                    pass
+                batch.error = exc
+            else:
+                self._active_last_seq = batch.records[-1].seq
+
+        with self._lock:
+            if batch.error is None:
+                self._durable_seq = batch.records[-1].seq
+            else:
+                for record in batch.records:
+                    self._pending.pop(record.seq, None)
+                    self._pending_keys.discard((record.agenda_item_id, record.owner_id))
+            self._changed.notify_all()
+        batch.done.set()
+
+    # ---------- Aplicación ----------
+
+    def _apply_loop(self) -> None:
+        interval = self._cfg.VOTE_JOURNAL_APPLY_INTERVAL_MS / 1000.0
+        while not self._stop.wait(interval):
+            try:
+                self.apply_pending()
+            except Exception:
+                self.apply_errors += 1
+                logger.exception("Diario de votos: fallo al aplicar un lote; se reintentará.")
+
+    def apply_pending(self) -> int:
+        """
+        Aplica por lotes todos los registros durables pendientes.
+
+        Retorna el número de registros aplicados. Si un lote falla la
+        excepción se propaga y el lote sigue pendiente.
+        """
+        applied = 0
+        with self._apply_lock:
+            while True:
+                with self._lock:
+                    durable = self._durable_seq
+                    batch = list(
+                        islice(
+                            takewhile(lambda record: record.seq <= durable, self._pending.values()),
+                            self._cfg.VOTE_JOURNAL_APPLY_BATCH,
+                        )
+                    )
+                if not batch:
+                    break
+                self._apply(self.journal_id, batch)
+                with self._lock:
+                    for record in batch:
+                        del self._pending[record.seq]
+                        self._pending_keys.discard((record.agenda_item_id, record.owner_id))
+                applied += len(batch)
+                self.applied += len(batch)
+            self._trim_segments()
+        return applied
+
+    def drain(self) -> None:
+        """
+        Espera a que lo aceptado hasta ahora sea durable y lo aplica.
+        """
+        with self._lock:
+            target = self._next_seq - 1
+            self._changed.wait_for(
+                lambda: self._durable_seq >= target
+                or next(iter(self._pending), target + 1) > target,
+                timeout=_DRAIN_TIMEOUT_S,
+            )
+        self.apply_pending()
+
+    @contextmanager
+    def closing_item(self, agenda_item_id: int) -> Iterator[None]:
+        """
+        Sella un punto y aplica sus votos pendientes antes de cerrarlo.
+
+        Si el cierre falla (excepción dentro del bloque) el punto se
+        vuelve a abrir al diario. Sin diario activo no hace nada.
+        """
+        if not self._running:
+            yield
+            return
+        with self._lock:
+            self._sealed.add(agenda_item_id)
+        try:
+            self.drain()
+            yield
+        except BaseException:
+            with self._lock:
+                self._sealed.discard(agenda_item_id)
+            raise
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "journal_id": self.journal_id,
+                "pending": len(self._pending),
+                "durable_seq": self._durable_seq,
+                "applied": self.applied,
+                "apply_errors": self.apply_errors,
+            }
+
+    # ---------- Segmentos ----------
+
+    @staticmethod
+    def _load_journal_id(directory: str) -> str:
+        path = os.path.join(directory, _ID_FILE)
+        if os.path.exists(path):
+            with open(path, encoding="ascii") as fh:
+                return fh.read().strip()
+        journal_id = str(uuid.uuid4())
+        with open(path, "w", encoding="ascii") as fh:
+            fh.write(journal_id)
+            fh.flush()
+            os.fsync(fh.fileno())
+        return journal_id
+
+    def _segment_paths(self, directory: str) -> List[Tuple[int, str]]:
+        found = []
+        for name in os.listdir(directory):
+            if name.startswith(_SEGMENT_PREFIX) and name.endswith(_SEGMENT_SUFFIX):
+                first = int(name[len(_SEGMENT_PREFIX):-len(_SEGMENT_SUFFIX)])
+                found.append((first, os.path.join(directory, name)))
+        return sorted(found)
+
+    def _recover(self, directory: str) -> Tuple[List[JournalRecord], int]:
+        """
+        Lee los segmentos existentes. Retorna (registros, primera seq libre).
+        """
+        records: List[JournalRecord] = []
+        first_free = 1
+        for first, path in self._segment_paths(directory):
+            first_free = max(first_free, first)
+            last = 0
+            with open(path, "r+b") as fh:
+                data = fh.read()
+                offset = 0
+                while offset + _FRAME.size <= len(data):
+                    length, crc = _FRAME.unpack_from(data, offset)
+                    body = data[offset + _FRAME.size:offset + _FRAME.size + length]
+                    if len(body) < length or zlib.crc32(body) != crc:
+                        break
+                    record = JournalRecord.decode(body)
+                    records.append(record)
+                    last = record.seq
+                    offset += _FRAME.size + length
+                if offset < len(data):
+                    logger.warning(
+                        "Diario de votos: %s bytes incompletos descartados al final de %s.",
+                        len(data) - offset,
+                        path,
+                    )
+                    fh.truncate(offset)
+            self._segments.append((path, last))
+        return records, first_free
+
+    def _open_segment(self, first_seq: int) -> None:
+        directory = self._cfg.VOTE_JOURNAL_DIR
+        self._active_path = os.path.join(directory, f"{_SEGMENT_PREFIX}{first_seq:020d}{_SEGMENT_SUFFIX}")
+        self._file = open(self._active_path, "ab")
+        dir_fd = os.open(directory, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+    def _trim_segments(self) -> None:
+        """
+        Rota el segmento activo si creció y borra los ya aplicados.
+        """
+        with self._file_lock:
+            if self._file is not None and self._file.tell() >= self._cfg.VOTE_JOURNAL_SEGMENT_BYTES:
+                self._file.close()
+                self._segments.append((self._active_path, self._active_last_seq))
+                self._open_segment(self._active_last_seq + 1)
+        with self._lock:
+            oldest_pending = next(iter(self._pending), None)
+        keep = []
+        for path, last in self._segments:
+            if path == self._active_path or (oldest_pending is not None and last >= oldest_pending):
+                keep.append((path, last))
+            else:
+                os.remove(path)
+        self._segments = keep
+
+
+vote_journal = VoteJournal(settings)
@@ -2,22 +2,90 @@
 backend/app/main.py
 
 Punto de entrada de la aplicación FastAPI para AgoraX.
+
+Importar este módulo no toca la base de datos: la verificación del esquema
+se hace en el hook de ciclo de vida (lifespan), una vez por worker.
 """
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
 from app.api import root_api_router
-from app.core.db import Base, engine
+from app.core.admission import AdmissionControlMiddleware
+from app.core.checkin_tokens import checkin_token_secret
+from app.core.db import engine
+from app.core.profiling import ProfilingMiddleware
+from app.core.rate_limit import rate_limiter
+from app.core.replicas import ConsistencyTokenMiddleware
+from app.core.schema import ensure_schema
+from app.core.slow_queries import QueryRouteMiddleware
+from app.core.sharding import shard_router
+from app.core.tracing import TracingMiddleware, tracer
+from app.core.vote_crypto import vote_key_secret
+from app.core.vote_journal import vote_journal
+from app.services import vote_intake_service
+from app.services.outbox_service import outbox_relay
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Arranque y parada de la aplicación.
+
+    Al iniciar compara la huella del esquema con la guardada en la base y
+    solo aplica las migraciones pendientes si cambió.
+    Con sharding habilitado verifica también cada shard.
+
+    En modo diario (VOTE_INTAKE_MODE=journal) abre el diario de votos y
+    reproduce lo pendiente antes de atender peticiones; al parar aplica
+    lo que quede. El relay del outbox publica los eventos de dominio al
+    bus en proceso mientras la aplicación está activa. El limitador de
+    ritmo crea su backend al inicio (falla si está mal configurado).
+    El exportador de trazas vacía su cola al parar. Sin VOTE_ENCRYPTION_KEY
+    o sin CHECKIN_TOKEN_SECRET fuera de desarrollo el arranque falla antes
+    de aceptar votos o check-ins.
+    """
+    vote_key_secret()
+    checkin_token_secret()
+    rate_limiter.start()
+    tracer.start()
+    ensure_schema(engine)
+    for shard in shard_router.shard_names()[1:]:
+        ensure_schema(shard_router.engine(shard))
+    vote_journal.claim_intake(engine)
+    if vote_journal.enabled:
+        vote_journal.start(vote_intake_service.apply_journal_records)
+        vote_journal.apply_pending()
+    outbox_relay.start()
+    yield
+    vote_journal.stop()
+    outbox_relay.stop()
+    tracer.stop()
 
-# Crear tablas (solo para entorno demo/dev; en prod usar migraciones)
-Base.metadata.create_all(bind=engine)
 
 app = FastAPI(
     title="AgoraX",
     version="1.0.0",
     description="Sistema de votación y quórum para copropiedades.",
+    lifespan=lifespan,
 )
 
+# Token read-your-writes para las lecturas servidas desde réplica
+app.add_middleware(ConsistencyTokenMiddleware)
+
+# Ruta en curso para el registro de sentencias lentas
+app.add_middleware(QueryRouteMiddleware)
+
+# Perfilado bajo demanda (X-Profile de un ADMIN o muestreo); no mide la espera de admisión
+app.add_middleware(ProfilingMiddleware)
+
+# Span raíz por petición y cabeceras traceresponse / X-Trace-Id
+app.add_middleware(TracingMiddleware)
+
+# Admisión por prioridad: el más externo, decide antes de enrutar
+app.add_middleware(AdmissionControlMiddleware)
+
 # Montar la API versionada
 app.include_router(root_api_router)
 
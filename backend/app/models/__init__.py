@@ -10,20 +10,37 @@ disponibilidad sin depender de `import *`, que es frágil y silencioso.
 # Importación explícita de todos los modelos
 from .user import User
 from .meeting import Meeting
+from .meeting_archive import MeetingArchive
 from .agenda_item import AgendaItem
+from .agenda_item_result import AgendaItemResult
 from .condominium import Condominium
 from .owner import Owner
 from .presence import Presence
 from .vote import Vote
 from .audit import AuditLog
+from .tenant_shard import TenantShard, MeetingRoute
+from .vote_rekey import VoteRekeyCheckpoint
+from .vote_journal import VoteJournalCheckpoint
+from .outbox import OutboxEvent, OutboxConsumerOffset
+from .delegation import Delegation, VotingRight
 
 __all__ = [
     "User",
     "Meeting",
+    "MeetingArchive",
     "AgendaItem",
+    "AgendaItemResult",
     "Condominium",
     "Owner",
     "Presence",
     "Vote",
     "AuditLog",
+    "TenantShard",
+    "MeetingRoute",
+    "VoteRekeyCheckpoint",
+    "VoteJournalCheckpoint",
+    "OutboxEvent",
+    "OutboxConsumerOffset",
+    "Delegation",
+    "VotingRight",
 ]
@@ -11,7 +11,7 @@ Reglas:
 from typing import List
 
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import Integer, String, ForeignKey
+from sqlalchemy import Integer, Float, String, ForeignKey
 
 from app.core.db import Base
 
@@ -25,6 +25,10 @@ class AgendaItem(Base):
         meeting_id: Asamblea a la que pertenece.
         title: Título del punto.
         status: PENDING / OPEN / CLOSED.
+        approval_threshold: % de coeficiente exigido para aprobar (50 = mayoría simple,
+            70 = mayoría calificada de la Ley 675/2001).
+        threshold_basis: PRESENT (coeficiente presente) o TOTAL (coeficiente del conjunto).
+        version: Contador de cambios de estado (compare-and-set, ver lifecycle_service).
 
     Relaciones:
         meeting: Asamblea asociada.
@@ -34,10 +38,13 @@ class AgendaItem(Base):
     __tablename__ = "agenda_items"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
-    meeting_id: Mapped[int] = mapped_column(ForeignKey("meetings.id"), nullable=False)
+    meeting_id: Mapped[int] = mapped_column(ForeignKey("meetings.id"), nullable=False, index=True)
 
     title: Mapped[str] = mapped_column(String(255), nullable=False)
     status: Mapped[str] = mapped_column(String(50), nullable=False, default="PENDING")
+    approval_threshold: Mapped[float] = mapped_column(Float, nullable=False, default=50.0)
+    threshold_basis: Mapped[str] = mapped_column(String(20), nullable=False, default="PRESENT")
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
 
     meeting: Mapped["Meeting"] = relationship(
         "Meeting",
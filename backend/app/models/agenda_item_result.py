@@ -0,0 +1,67 @@
+"""
+backend/app/models/agenda_item_result.py
+
+Resultado materializado de un punto de agenda (AgendaItemResult).
+
+Se calcula una sola vez, cuando el punto pasa a CLOSED, y no vuelve a
+modificarse (RD-05: los resultados no pueden modificarse tras el cierre).
+Leer un resultado es una consulta de una fila: no se descifran votos.
+"""
+
+from datetime import datetime, timezone
+
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import Integer, Float, String, Boolean, DateTime, ForeignKey, Text, event
+
+from app.core.db import Base
+
+
+class AgendaItemResult(Base):
+    """
+    Escrutinio inmutable de un punto de agenda.
+
+    Atributos:
+        agenda_item_id: Punto de agenda (uno a uno).
+        meeting_id: Asamblea.
+        total_votes: Votos emitidos.
+        total_weight: Suma de coeficientes de los votantes.
+        basis_weight: Coeficiente sobre el que se mide la mayoría
+            (presentes o total del conjunto, según threshold_basis).
+        approval_threshold: Umbral exigido (%), 50 = mayoría simple.
+        threshold_basis: PRESENT / TOTAL.
+        approval_pct: % de coeficiente a favor sobre basis_weight.
+        approved: Si el punto quedó aprobado.
+        rules_version: Versión del registro de reglas al calcular.
+        payload_json: Respuesta JSON completa, pre-serializada.
+        computed_at: Momento del cálculo.
+    """
+
+    __tablename__ = "agenda_item_results"
+
+    agenda_item_id: Mapped[int] = mapped_column(
+        ForeignKey("agenda_items.id"),
+        primary_key=True,
+        autoincrement=False,
+    )
+    meeting_id: Mapped[int] = mapped_column(ForeignKey("meetings.id"), nullable=False, index=True)
+
+    total_votes: Mapped[int] = mapped_column(Integer, nullable=False)
+    total_weight: Mapped[float] = mapped_column(Float, nullable=False)
+    basis_weight: Mapped[float] = mapped_column(Float, nullable=False)
+    approval_threshold: Mapped[float] = mapped_column(Float, nullable=False)
+    threshold_basis: Mapped[str] = mapped_column(String(20), nullable=False)
+    approval_pct: Mapped[float] = mapped_column(Float, nullable=False)
+    approved: Mapped[bool] = mapped_column(Boolean, nullable=False)
+    rules_version: Mapped[str] = mapped_column(String(32), nullable=False)
+    payload_json: Mapped[str] = mapped_column(Text, nullable=False)
+    computed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+    )
+
+
+@event.listens_for(AgendaItemResult, "before_update")
+def _reject_result_update(mapper, connection, target):
+    # RD-05: un resultado materializado nunca se reescribe
+    raise ValueError("Los resultados de un punto cerrado no pueden modificarse (RD-05).")
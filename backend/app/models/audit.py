@@ -11,7 +11,7 @@ from datetime import datetime, timezone
 from typing import Optional
 
 from sqlalchemy.orm import Mapped, mapped_column
-from sqlalchemy import Integer, String, DateTime, ForeignKey, Text
+from sqlalchemy import Integer, String, DateTime, ForeignKey, Index, Text
 
 from app.core.db import Base
 
@@ -46,3 +46,6 @@ class AuditLog(Base):
         nullable=False,
         default=lambda: datetime.now(timezone.utc),
     )
+
+    # Historial de una entidad (get_audit_for_entity)
+    __table_args__ = (Index("ix_audit_logs_entity", "entity_type", "entity_id"),)
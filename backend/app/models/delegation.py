@@ -0,0 +1,83 @@
+"""
+backend/app/models/delegation.py
+
+Poderes (apoderados) por asamblea y derechos de voto materializados.
+
+Reglas relacionadas:
+- RD-02: Un apoderado representa máximo a un propietario.
+- RD-04: El coeficiente del representado cuenta para el quórum.
+"""
+
+from datetime import datetime, timezone
+
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import Integer, Float, Boolean, DateTime, ForeignKey, Index, UniqueConstraint
+
+from app.core.db import Base
+
+
+class Delegation(Base):
+    """
+    Poder otorgado por un propietario a un usuario para una asamblea.
+
+    Atributos:
+        id: Identificador.
+        meeting_id: Asamblea.
+        principal_owner_id: Propietario que delega (poderdante).
+        proxy_user_id: Usuario que lo representa (apoderado).
+        created_by_user_id: Usuario que registró el poder.
+        created_at: Momento del registro.
+
+    Restricciones:
+        - Un propietario delega una sola vez por asamblea.
+        - Un apoderado representa a un solo propietario por asamblea (RD-02).
+    """
+
+    __tablename__ = "delegations"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    meeting_id: Mapped[int] = mapped_column(ForeignKey("meetings.id"), nullable=False)
+    principal_owner_id: Mapped[int] = mapped_column(ForeignKey("owners.id"), nullable=False)
+    proxy_user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
+    created_by_user_id: Mapped[int | None] = mapped_column(ForeignKey("users.id"), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+    )
+
+    __table_args__ = (
+        UniqueConstraint("meeting_id", "principal_owner_id", name="uq_delegation_meeting_principal"),
+        UniqueConstraint("meeting_id", "proxy_user_id", name="uq_delegation_meeting_proxy"),
+    )
+
+
+class VotingRight(Base):
+    """
+    Quién vota por cada propietario en una asamblea (grafo de poderes resuelto).
+
+    Se recalcula para la asamblea completa al iniciarla y cada vez que
+    cambian sus poderes (delegation_service.refresh_voting_rights), de modo
+    que cast_vote y el check-in resuelven la representación con una
+    búsqueda por índice.
+
+    Atributos:
+        meeting_id, owner_id: Clave (un único votante por propietario).
+        user_id: Usuario que ejerce el voto (el propio o su apoderado).
+        coeficiente: Coeficiente del propietario al recalcular.
+        delegated: True si el voto lo ejerce un apoderado.
+    """
+
+    __tablename__ = "voting_rights"
+
+    meeting_id: Mapped[int] = mapped_column(
+        ForeignKey("meetings.id"), primary_key=True, autoincrement=False
+    )
+    owner_id: Mapped[int] = mapped_column(
+        ForeignKey("owners.id"), primary_key=True, autoincrement=False
+    )
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
+    coeficiente: Mapped[float] = mapped_column(Float, nullable=False)
+    delegated: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+
+    __table_args__ = (Index("ix_voting_rights_meeting_user", "meeting_id", "user_id"),)
@@ -28,6 +28,7 @@ class Meeting(Base):
         date: Fecha y hora.
         status: CREATED / IN_PROGRESS / CLOSED.
         total_propietarios: Número total de propietarios de referencia.
+        version: Contador de cambios de estado (compare-and-set, ver lifecycle_service).
 
     Relaciones:
         condominium: Conjunto asociado.
@@ -38,7 +39,7 @@ class Meeting(Base):
     __tablename__ = "meetings"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
-    condominium_id: Mapped[int] = mapped_column(ForeignKey("condominiums.id"), nullable=False)
+    condominium_id: Mapped[int] = mapped_column(ForeignKey("condominiums.id"), nullable=False, index=True)
 
     title: Mapped[str] = mapped_column(String(255), nullable=False)
     date: Mapped[datetime] = mapped_column(
@@ -48,6 +49,7 @@ class Meeting(Base):
     )
     status: Mapped[str] = mapped_column(String(50), nullable=False, default="CREATED")
     total_propietarios: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
 
     condominium: Mapped["Condominium"] = relationship(
         "Condominium",
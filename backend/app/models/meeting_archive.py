@@ -0,0 +1,62 @@
+"""
+backend/app/models/meeting_archive.py
+
+Índice de asambleas archivadas (MeetingArchive).
+
+Una asamblea cerrada (RD-05) puede compactarse en un archivo comprimido
+y verificado por checksum (services/archive_service.py); sus filas salen
+de las tablas calientes y aquí queda una fila con el resumen de la
+asamblea y la ubicación del archivo.
+"""
+
+from datetime import datetime, timezone
+from typing import Optional
+
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import Integer, String, DateTime
+
+from app.core.db import Base
+
+
+class MeetingArchive(Base):
+    """
+    Asamblea archivada.
+
+    Atributos:
+        meeting_id: ID original de la asamblea (uno a uno).
+        condominium_id: Conjunto de la asamblea.
+        title / date / status / total_propietarios: Resumen para los listados
+            (se sirven sin abrir el archivo).
+        path: Ruta del archivo, relativa a ARCHIVE_DIR.
+        sha256: Checksum del archivo comprimido.
+        size_bytes: Tamaño del archivo.
+        row_count: Filas archivadas (todas las tablas).
+        format_version: Versión del formato del archivo.
+        vote_key_ids: key_id (hex, separados por comas) de las claves con
+            que están cifrados sus votos; el archivo no se recifra al rotar
+            la clave. NULL en archivos anteriores a la columna (se rellena
+            al consultarla, ver archive_service.archived_vote_key_usage).
+        archived_at: Momento del archivado.
+    """
+
+    __tablename__ = "meeting_archives"
+
+    meeting_id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    condominium_id: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
+
+    title: Mapped[str] = mapped_column(String(255), nullable=False)
+    date: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    status: Mapped[str] = mapped_column(String(50), nullable=False)
+    total_propietarios: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    path: Mapped[str] = mapped_column(String(500), nullable=False)
+    sha256: Mapped[str] = mapped_column(String(64), nullable=False)
+    size_bytes: Mapped[int] = mapped_column(Integer, nullable=False)
+    row_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    format_version: Mapped[int] = mapped_column(Integer, nullable=False)
+    vote_key_ids: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    archived_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+    )
@@ -0,0 +1,73 @@
+"""
+backend/app/models/outbox.py
+
+Outbox transaccional de eventos de dominio.
+
+Cada cambio relevante (presencia registrada, punto abierto/cerrado, voto
+emitido, asamblea iniciada/cerrada...) escribe una fila en outbox_events
+en la misma transacción que el cambio. El relay (outbox_service) las
+publica en orden de id a los suscriptores del bus de eventos y guarda el
+avance de cada consumidor durable en outbox_consumer_offsets.
+"""
+
+from datetime import datetime, timezone
+from typing import Optional
+
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import Index, Integer, String, DateTime, Text
+
+from app.core.db import Base
+
+
+class OutboxEvent(Base):
+    """
+    Evento de dominio pendiente de publicar.
+
+    Atributos:
+        id: Orden de publicación dentro de la base/shard.
+        event_type: Tipo de evento (VOTE_CAST, AGENDA_ITEM_CLOSED, ...).
+        meeting_id: Asamblea a la que pertenece el evento.
+        entity_type: Tipo de entidad afectada.
+        entity_id: ID de la entidad afectada.
+        payload_json: Datos del evento (JSON; nunca el valor de un voto).
+        created_at: Fecha y hora del cambio.
+    """
+
+    __tablename__ = "outbox_events"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    event_type: Mapped[str] = mapped_column(String(50), nullable=False)
+    meeting_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    entity_type: Mapped[str] = mapped_column(String(50), nullable=False)
+    entity_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    payload_json: Mapped[str] = mapped_column(Text, nullable=False, default="{}")
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+    )
+
+    __table_args__ = (
+        Index("ix_outbox_events_meeting_id_id", "meeting_id", "id"),
+    )
+
+
+class OutboxConsumerOffset(Base):
+    """
+    Último evento entregado a un consumidor durable (uno por base/shard).
+
+    Atributos:
+        consumer: Nombre del consumidor.
+        last_event_id: Último OutboxEvent.id entregado con éxito.
+        updated_at: Última entrega.
+    """
+
+    __tablename__ = "outbox_consumer_offsets"
+
+    consumer: Mapped[str] = mapped_column(String(100), primary_key=True)
+    last_event_id: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+    )
@@ -25,6 +25,7 @@ class Owner(Base):
         user_id: FK a User.
         condominium_id: FK a Condominium.
         name: Nombre del propietario.
+        unit: Unidad privada (apartamento, casa, local); se usa en la búsqueda del check-in.
         coeficiente: Coeficiente de copropiedad.
         is_in_debt: Indica si tiene deuda (afecta RD-08).
 
@@ -38,10 +39,11 @@ class Owner(Base):
     __tablename__ = "owners"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
-    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
-    condominium_id: Mapped[int] = mapped_column(ForeignKey("condominiums.id"), nullable=False)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False, index=True)
+    condominium_id: Mapped[int] = mapped_column(ForeignKey("condominiums.id"), nullable=False, index=True)
 
     name: Mapped[str] = mapped_column(String(255), nullable=False)
+    unit: Mapped[str | None] = mapped_column(String(50), nullable=True)
     coeficiente: Mapped[float] = mapped_column(Float, nullable=False, default=1.0)
     is_in_debt: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
 
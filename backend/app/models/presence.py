@@ -35,7 +35,7 @@ class Presence(Base):
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     meeting_id: Mapped[int] = mapped_column(ForeignKey("meetings.id"), nullable=False)
-    owner_id: Mapped[int] = mapped_column(ForeignKey("owners.id"), nullable=False)
+    owner_id: Mapped[int] = mapped_column(ForeignKey("owners.id"), nullable=False, index=True)
 
     coeficiente: Mapped[float] = mapped_column(Float, nullable=False, default=1.0)
     created_at: Mapped[datetime] = mapped_column(
@@ -55,6 +55,7 @@ class Presence(Base):
         lazy="selectin",
     )
 
+    # La restricción única también sirve de índice para las búsquedas por meeting_id
     __table_args__ = (
         UniqueConstraint(
             "meeting_id",
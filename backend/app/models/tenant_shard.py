@@ -0,0 +1,58 @@
+"""
+backend/app/models/tenant_shard.py
+
+Tablas de enrutamiento multi-tenant (sharding por conjunto).
+
+Viven en la base "directorio" (el motor principal):
+- TenantShard: a qué shard pertenece cada conjunto (Condominium).
+- MeetingRoute: a qué conjunto pertenece cada asamblea, para resolver el
+  shard a partir del meeting_id de la URL sin consultar todos los shards.
+
+No tienen claves foráneas: los conjuntos y asambleas pueden estar en otra
+base de datos distinta del directorio.
+"""
+
+from datetime import datetime, timezone
+
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import Integer, String, DateTime
+
+from app.core.db import Base
+
+
+class TenantShard(Base):
+    """
+    Asignación de un conjunto a un shard.
+
+    Atributos:
+        condominium_id: Conjunto (tenant).
+        shard: Nombre del shard (clave de SHARD_DATABASE_URLS o 'default').
+        status: ACTIVE / MOVING (durante un rebalanceo no se atienden peticiones).
+        updated_at: Último cambio de asignación.
+    """
+
+    __tablename__ = "tenant_shards"
+
+    condominium_id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    shard: Mapped[str] = mapped_column(String(64), nullable=False, default="default")
+    status: Mapped[str] = mapped_column(String(20), nullable=False, default="ACTIVE")
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+    )
+
+
+class MeetingRoute(Base):
+    """
+    Índice global asamblea → conjunto.
+
+    Atributos:
+        meeting_id: Asamblea (IDs únicos globalmente por rangos de shard).
+        condominium_id: Conjunto al que pertenece.
+    """
+
+    __tablename__ = "meeting_routes"
+
+    meeting_id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    condominium_id: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
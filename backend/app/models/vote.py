@@ -37,7 +37,7 @@ class Vote(Base):
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     agenda_item_id: Mapped[int] = mapped_column(ForeignKey("agenda_items.id"), nullable=False)
-    owner_id: Mapped[int] = mapped_column(ForeignKey("owners.id"), nullable=False)
+    owner_id: Mapped[int] = mapped_column(ForeignKey("owners.id"), nullable=False, index=True)
 
     value_encrypted: Mapped[str] = mapped_column(String(512), nullable=False)
     created_at: Mapped[datetime] = mapped_column(
@@ -58,6 +58,7 @@ class Vote(Base):
         lazy="selectin",
     )
 
+    # La restricción única también sirve de índice para las búsquedas por agenda_item_id
     __table_args__ = (
         UniqueConstraint(
             "agenda_item_id",
@@ -0,0 +1,38 @@
+"""
+backend/app/models/vote_journal.py
+
+Checkpoint del aplicador del diario local de votos (VOTE_INTAKE_MODE=journal).
+
+Hay una fila por diario (journal_id) en cada base/shard: applied_seq es la
+última secuencia aplicada y se escribe en la misma transacción que los
+votos y su auditoría, de modo que al reproducir el diario tras un fallo
+los registros ya aplicados se omiten (ni se pierden ni se duplican).
+"""
+
+from datetime import datetime, timezone
+
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import BigInteger, String, DateTime
+
+from app.core.db import Base
+
+
+class VoteJournalCheckpoint(Base):
+    """
+    Avance de un diario de votos sobre esta base.
+
+    Atributos:
+        journal_id: Identificador estable del directorio del diario.
+        applied_seq: Última secuencia del diario aplicada.
+        updated_at: Último lote aplicado.
+    """
+
+    __tablename__ = "vote_journal_checkpoints"
+
+    journal_id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    applied_seq: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+    )
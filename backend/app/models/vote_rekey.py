@@ -0,0 +1,43 @@
+"""
+backend/app/models/vote_rekey.py
+
+Checkpoint del trabajo de recifrado de votos (rotación de VOTE_ENCRYPTION_KEY).
+
+Hay una fila por clave destino: si el trabajo se interrumpe, al relanzarlo
+continúa desde last_vote_id en lugar de recorrer la tabla desde el inicio.
+"""
+
+from datetime import datetime, timezone
+from typing import Optional
+
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import Integer, String, DateTime
+
+from app.core.db import Base
+
+
+class VoteRekeyCheckpoint(Base):
+    """
+    Avance del recifrado hacia una clave.
+
+    Atributos:
+        target_key_id: key_id (hex) de la clave destino.
+        last_vote_id: Último Vote.id procesado (recorrido por keyset).
+        reencrypted: Votos recifrados hasta ahora.
+        failed: Votos que no se pudieron descifrar (se dejan intactos).
+        updated_at: Último checkpoint.
+        finished_at: Fin del recorrido (None si sigue pendiente).
+    """
+
+    __tablename__ = "vote_rekey_checkpoints"
+
+    target_key_id: Mapped[str] = mapped_column(String(16), primary_key=True)
+    last_vote_id: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    reencrypted: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    failed: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+    )
+    finished_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
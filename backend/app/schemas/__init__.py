@@ -12,14 +12,34 @@ from .meeting_schema import (
     MeetingCreate,
     MeetingUpdateStatus,
     MeetingSummary,
+    MeetingDashboardRow,
+    MeetingDashboardPage,
     MeetingDetail,
     AgendaItemCreate,
     AgendaItemDetail,
     PresenceCreate,
     PresenceSummary,
+    PresenceBulkCreate,
+    PresenceBulkResult,
+    CheckinTokenRead,
+    CheckinScan,
+    PresenceScanResult,
+    DelegationCreate,
+    DelegationRead,
+    VotingRightRead,
+    VotingRightsRead,
+)
+from .vote_schema import (
+    VoteCreate,
+    VoteResponse,
+    VoteAccepted,
+    VoteAggregate,
+    OptionResult,
+    AgendaItemResultRead,
 )
-from .vote_schema import VoteCreate, VoteResponse, VoteAggregate
 from .audit_schema import AuditLogRead
+from .owner_schema import OwnerSearchHit, OwnerSearchResult
+from .admin_schema import MeetingArchiveRead, ProfileRead, SlowQueryRead, SlowQueryLogRead
 from .quorum_schema import QuorumStatus, QuorumDetail
 
 __all__ = [
@@ -33,17 +53,39 @@ __all__ = [
     "MeetingCreate",
     "MeetingUpdateStatus",
     "MeetingSummary",
+    "MeetingDashboardRow",
+    "MeetingDashboardPage",
     "MeetingDetail",
     "AgendaItemCreate",
     "AgendaItemDetail",
     "PresenceCreate",
     "PresenceSummary",
+    "PresenceBulkCreate",
+    "PresenceBulkResult",
+    "CheckinTokenRead",
+    "CheckinScan",
+    "PresenceScanResult",
+    "DelegationCreate",
+    "DelegationRead",
+    "VotingRightRead",
+    "VotingRightsRead",
     # Votos
     "VoteCreate",
     "VoteResponse",
+    "VoteAccepted",
     "VoteAggregate",
+    "OptionResult",
+    "AgendaItemResultRead",
     # Auditoría
     "AuditLogRead",
+    # Propietarios
+    "OwnerSearchHit",
+    "OwnerSearchResult",
+    # Administración
+    "ProfileRead",
+    "SlowQueryRead",
+    "SlowQueryLogRead",
+    "MeetingArchiveRead",
     # Quórum
     "QuorumStatus",
     "QuorumDetail",
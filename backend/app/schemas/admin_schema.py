@@ -0,0 +1,96 @@
+"""
+backend/app/schemas/admin_schema.py
+
+Esquemas Pydantic de las herramientas de administración y diagnóstico.
+
+Estos esquemas soportan los endpoints expuestos en:
+- api/v1/admin.py
+"""
+
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class ProfileRead(BaseModel):
+    """
+    Perfil de una petición guardado por el perfilador bajo demanda.
+
+    Campos:
+        id: Identificador (descarga en /admin/profiles/{id}).
+        route: Plantilla de la ruta atendida.
+        trigger: "header" (X-Profile de un ADMIN) o "sample" (muestreo aleatorio).
+        sql_count / sql_ms: Sentencias SQL ejecutadas y su tiempo total.
+        samples: Muestras de pila tomadas cada interval_ms.
+        in_flight: Peticiones en curso al empezar (incluida esta).
+        truncated: El muestreo se detuvo al alcanzar PROFILING_MAX_SECONDS.
+    """
+
+    id: str
+    created_at: str
+    method: str
+    path: str
+    route: Optional[str] = None
+    status_code: Optional[int] = None
+    trigger: str
+    user: Optional[str] = None
+    duration_ms: float
+    sql_count: int
+    sql_ms: float
+    samples: int
+    interval_ms: float
+    in_flight: int = Field(..., description="Con concurrencia, las pilas del threadpool pueden mezclar peticiones.")
+    truncated: bool
+
+
+class SlowQueryRead(BaseModel):
+    """
+    Sentencia SQL que superó SLOW_QUERY_THRESHOLD_MS.
+
+    Campos:
+        params_shape: Nombres y tipos de los parámetros (nunca sus valores).
+        database: Base (shard) donde se ejecutó.
+        route / method: Petición HTTP que la ejecutó (None fuera de una petición).
+        plan: Plan capturado en segundo plano (None mientras no esté listo).
+    """
+
+    id: int
+    recorded_at: str
+    duration_ms: float
+    statement: str
+    params_shape: Any = None
+    executemany: bool
+    database: Optional[str] = None
+    route: Optional[str] = None
+    method: Optional[str] = None
+    plan: Optional[str] = None
+    plan_error: Optional[str] = None
+
+
+class SlowQueryLogRead(BaseModel):
+    """
+    Estado del registro de sentencias lentas y sus entradas más recientes.
+    """
+
+    stats: dict
+    queries: List[SlowQueryRead]
+
+
+class MeetingArchiveRead(BaseModel):
+    """
+    Resultado del archivado en frío de una asamblea cerrada.
+
+    Campos:
+        path: Ruta del archivo relativa a ARCHIVE_DIR.
+        sha256: Checksum del archivo comprimido (se verifica en cada lectura).
+        row_counts: Filas archivadas y borradas de cada tabla.
+        vote_key_ids: Claves (key_id hex) con que están cifrados sus votos;
+            deben seguir en VOTE_ENCRYPTION_OLD_KEYS tras una rotación.
+    """
+
+    meeting_id: int
+    path: str
+    sha256: str
+    size_bytes: int
+    row_counts: Dict[str, int]
+    vote_key_ids: List[str]
@@ -6,16 +6,19 @@ Esquemas Pydantic relacionados con:
 - Asambleas (Meeting)
 - Puntos de agenda (AgendaItem)
 - Presencias (Presence)
+- Poderes (Delegation) y derechos de voto
 
 Estos esquemas representan la estructura de datos que se envía y recibe
 en los endpoints de gestión de asambleas y cálculo de quórum.
 """
 
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Literal, Optional
 
 from pydantic import BaseModel, Field
 
+from .quorum_schema import QuorumStatus
+
 
 # ================== AGENDA ITEMS ==================
 
@@ -37,7 +40,16 @@ class AgendaItemCreate(AgendaItemBase):
     Se utiliza al momento de definir la agenda de la asamblea.
     """
 
-    pass
+    approval_threshold: float = Field(
+        50.0,
+        ge=50.0,
+        le=100.0,
+        description="% de coeficiente exigido para aprobar (50 = mayoría simple, 70 = calificada).",
+    )
+    threshold_basis: Literal["PRESENT", "TOTAL"] = Field(
+        "PRESENT",
+        description="Base de la mayoría: coeficiente presente o total del conjunto.",
+    )
 
 
 class AgendaItemDetail(AgendaItemBase):
@@ -69,9 +81,12 @@ class PresenceCreate(BaseModel):
 
     owner_id: int
     meeting_id: int
-    coeficiente: float = Field(
-        ...,
-        description="Coeficiente de copropiedad asociado a este propietario en esta asamblea.",
+    coeficiente: Optional[float] = Field(
+        None,
+        description=(
+            "Obsoleto: se ignora. El coeficiente se toma del propietario registrado "
+            "en el conjunto, no del cliente."
+        ),
     )
 
 
@@ -80,17 +95,133 @@ class PresenceSummary(BaseModel):
     Resumen de una presencia registrada.
 
     Incluye los campos necesarios para calcular y mostrar el quórum.
+    represented lista a los propietarios que el usuario del propietario
+    representa como apoderado y que quedaron presentes con él.
     """
 
     owner_id: int
     owner_name: str
     coeficiente: float
     created_at: datetime
+    represented: List[int] = Field(default_factory=list)
 
     class Config:
         from_attributes = True
 
 
+class PresenceBulkCreate(BaseModel):
+    """
+    Esquema de entrada para el check-in masivo en la puerta.
+
+    El coeficiente no se recibe del cliente: se toma de cada propietario.
+    """
+
+    owner_ids: List[int] = Field(
+        ...,
+        min_length=1,
+        max_length=1000,
+        description="IDs de propietarios a registrar como presentes.",
+    )
+
+
+class PresenceBulkResult(BaseModel):
+    """
+    Resultado del check-in masivo.
+
+    Incluye:
+    - registered: propietarios registrados en esta operación.
+    - already_present: propietarios que ya tenían presencia.
+    - rejected: IDs inexistentes o de otro conjunto.
+    - represented: representados por poder registrados junto a sus apoderados.
+    - quorum: estado de quórum tras el registro.
+    """
+
+    registered: List[int]
+    already_present: List[int]
+    rejected: List[int]
+    represented: List[int] = Field(default_factory=list)
+    quorum: QuorumStatus
+
+
+class CheckinTokenRead(BaseModel):
+    """
+    Token de check-in firmado emitido para un propietario (contenido del QR).
+    """
+
+    owner_id: int
+    owner_name: str
+    token: str
+    expires_at: datetime
+
+
+class CheckinScan(BaseModel):
+    """
+    Esquema de entrada al escanear un token de check-in en la puerta.
+    """
+
+    token: str = Field(..., description="Token de check-in firmado (leído del QR).")
+
+
+class PresenceScanResult(BaseModel):
+    """
+    Resultado del registro de presencia a partir de un token firmado.
+
+    registered es False si el propietario ya estaba presente (escaneo repetido).
+    """
+
+    owner_id: int
+    coeficiente: float
+    registered: bool
+    represented: List[int] = Field(default_factory=list)
+
+
+# ================== PODERES ==================
+
+
+class DelegationCreate(BaseModel):
+    """
+    Poder otorgado por un propietario a un usuario (apoderado) para la asamblea.
+    """
+
+    principal_owner_id: int = Field(..., description="Propietario que delega su voto.")
+    proxy_user_id: int = Field(..., description="Usuario que lo representa (RD-02: uno por apoderado).")
+
+
+class DelegationRead(BaseModel):
+    """
+    Poder registrado.
+    """
+
+    id: int
+    meeting_id: int
+    principal_owner_id: int
+    proxy_user_id: int
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class VotingRightRead(BaseModel):
+    """
+    Propietario por el que vota un usuario en una asamblea.
+    """
+
+    owner_id: int
+    coeficiente: float
+    delegated: bool
+
+
+class VotingRightsRead(BaseModel):
+    """
+    Derechos de voto del usuario actual en una asamblea y su peso total.
+    """
+
+    meeting_id: int
+    owners: List[VotingRightRead]
+    coeficiente_total: float
+
+
 # ================== MEETINGS ==================
 
 
@@ -153,6 +284,44 @@ class MeetingSummary(BaseModel):
         from_attributes = True
 
 
+class MeetingDashboardRow(MeetingSummary):
+    """
+    Asamblea del panel de administración, con sus agregados.
+
+    Campos:
+        porcentaje_quorum / cumple_quorum: Quórum actual (RD-04).
+        presentes / presentes_coeficiente: Presencias registradas y su peso.
+        agenda_items / closed_items: Puntos de agenda totales y cerrados.
+        open_item_*: Punto abierto (RB-02: a lo sumo uno) y sus votos.
+        votes_cast: Votos emitidos en todos los puntos.
+        version: Versión de la asamblea (None si no tiene eventos).
+    """
+
+    condominium_id: int
+    porcentaje_quorum: float
+    cumple_quorum: bool
+    presentes: int
+    presentes_coeficiente: float
+    agenda_items: int
+    closed_items: int
+    open_item_id: Optional[int] = None
+    open_item_title: Optional[str] = None
+    open_item_votes: int
+    votes_cast: int
+    version: Optional[str] = None
+
+
+class MeetingDashboardPage(BaseModel):
+    """
+    Página del panel de asambleas (más recientes primero).
+    """
+
+    total: int = Field(..., description="Asambleas que cumplen el filtro (en todas las páginas).")
+    limit: int
+    offset: int
+    meetings: List[MeetingDashboardRow]
+
+
 class MeetingDetail(MeetingSummary):
     """
     Detalle completo de una asamblea.
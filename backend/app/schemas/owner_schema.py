@@ -0,0 +1,54 @@
+"""
+backend/app/schemas/owner_schema.py
+
+Esquemas Pydantic de propietarios.
+
+Estos esquemas soportan los endpoints expuestos en:
+- api/v1/owners.py
+y la lógica implementada en:
+- services/owner_search_service.py
+"""
+
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class OwnerSearchHit(BaseModel):
+    """
+    Propietario encontrado y su presencia en la asamblea consultada.
+
+    Campos:
+        owner_id: ID del propietario.
+        name: Nombre.
+        unit: Unidad privada.
+        email: Correo del usuario asociado.
+        coeficiente: Coeficiente de copropiedad.
+        is_in_debt: Tiene deuda (RD-08: no puede votar).
+        present: Ya registró su presencia en la asamblea.
+        checked_in_at: Momento del registro de presencia.
+    """
+
+    owner_id: int
+    name: str
+    unit: Optional[str] = None
+    email: Optional[str] = None
+    coeficiente: float
+    is_in_debt: bool
+    present: bool = False
+    checked_in_at: Optional[datetime] = None
+
+
+class OwnerSearchResult(BaseModel):
+    """
+    Resultado de la búsqueda de propietarios de un conjunto.
+    """
+
+    condominium_id: int
+    meeting_id: Optional[int] = Field(
+        None, description="Asamblea cuya presencia se informa (None si no hay ninguna abierta)."
+    )
+    query: str
+    total: int = Field(..., description="Coincidencias totales (se devuelven hasta `limit`).")
+    owners: List[OwnerSearchHit]
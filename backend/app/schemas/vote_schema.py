@@ -7,10 +7,11 @@ Incluye:
 - Entrada de voto (VoteCreate).
 - Respuesta al registrar un voto (VoteResponse).
 - Agregaciones de resultados para visualización (VoteAggregate).
+- Resultado materializado de un punto cerrado (AgendaItemResultRead).
 """
 
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -23,10 +24,16 @@ class VoteCreate(BaseModel):
     - RD-01: un propietario solo puede votar una vez por punto.
     - RD-03: el usuario debe estar autenticado (se verifica en seguridad).
     - RB-03: se asume que ya confirmó asistencia.
+    - RD-02: owner_id elige el propietario representado cuando el usuario
+      vota como apoderado; si se omite, vota por su propia unidad.
     """
 
     agenda_item_id: int
     value: str = Field(..., description="Opción de voto en texto claro (antes de cifrado).")
+    owner_id: Optional[int] = Field(
+        None,
+        description="Propietario por el que se vota (propio o representado por poder).",
+    )
     ip_address: Optional[str] = Field(
         None,
         description="Dirección IP desde la que se registra el voto (para auditoría).",
@@ -49,6 +56,20 @@ class VoteResponse(BaseModel):
         from_attributes = True
 
 
+class VoteAccepted(BaseModel):
+    """
+    Respuesta 202 de cast_vote en modo diario (VOTE_INTAKE_MODE=journal).
+
+    El voto es durable en el diario local y se insertará en votes por lotes;
+    journal_seq identifica el registro en el diario.
+    """
+
+    agenda_item_id: int
+    owner_id: int
+    journal_seq: int
+    accepted_at: datetime
+
+
 class VoteAggregate(BaseModel):
     """
     Esquema para representar resultados agregados de votación.
@@ -60,3 +81,37 @@ class VoteAggregate(BaseModel):
     option: str
     total_votos: int
     porcentaje: float
+
+
+class OptionResult(BaseModel):
+    """
+    Escrutinio de una opción de voto, por número de votos y por coeficiente.
+    """
+
+    option: str
+    total_votos: int
+    coeficiente: float
+    porcentaje_votos: float
+    porcentaje_coeficiente: float
+
+
+class AgendaItemResultRead(BaseModel):
+    """
+    Resultado inmutable de un punto de agenda cerrado (RD-05, RB-09).
+
+    porcentaje_aprobacion es el coeficiente a favor sobre la base indicada
+    por threshold_basis (coeficiente presente o total del conjunto).
+    """
+
+    agenda_item_id: int
+    meeting_id: int
+    total_votos: int
+    coeficiente_votante: float
+    coeficiente_base: float
+    threshold_basis: str
+    approval_threshold: float
+    porcentaje_aprobacion: float
+    aprobado: bool
+    opciones: List[OptionResult]
+    rules_version: str
+    computed_at: datetime
@@ -14,4 +14,17 @@ __all__ = [
     "audit_service",
     "quorum_service",
     "rule_engine",
+    "rule_registry",
+    "read_service",
+    "presence_service",
+    "shard_service",
+    "vote_rekey_service",
+    "results_service",
+    "lifecycle_service",
+    "vote_intake_service",
+    "outbox_service",
+    "delegation_service",
+    "owner_search_service",
+    "archive_service",
+    "dashboard_service",
 ]
@@ -0,0 +1,571 @@
+"""
+backend/app/services/archive_service.py
+
+Archivado en frío de asambleas cerradas.
+
+Una asamblea cerrada es de solo lectura (RD-05). archive_meeting la
+compacta junto con sus puntos de agenda, resultados, presencias, poderes,
+derechos de voto, votos y su rastro de auditoría en un único archivo:
+
+    ARCHIVE_DIR/<condominium_id>/meeting-<meeting_id>.json.gz
+
+    - JSON comprimido con gzip: por tabla, la lista de columnas y las filas.
+    - Los votos se guardan tal como están en la base: cifrados (RD-06).
+      El archivo es inmutable y no se recifra al rotar la clave de votos:
+      meeting_archives.vote_key_ids registra las claves que usa, y
+      archived_vote_key_usage indica cuáles deben seguir en
+      VOTE_ENCRYPTION_OLD_KEYS.
+    - El SHA-256 del archivo se guarda en meeting_archives y se verifica
+      en cada lectura desde disco.
+
+Orden del archivado (una transacción por asamblea):
+    1. Se leen las filas con la asamblea bloqueada (FOR UPDATE en PostgreSQL).
+    2. Se escribe el archivo de forma atómica (temporal + fsync + rename)
+       y se relee para comprobar checksum y conteos.
+    3. Se inserta la fila de meeting_archives, se borran las filas de las
+       tablas calientes y se emite MEETING_ARCHIVED; después, commit.
+    Si algo falla antes del commit, el archivo nuevo se elimina y la
+    asamblea queda intacta.
+
+Lectura: las rutas GET de asambleas, quórum, votos, resultados y derechos
+de voto consultan primero las tablas calientes y, si la asamblea no está,
+recurren a este módulo. Los listados usan solo meeting_archives; el
+detalle abre el archivo, que queda en una caché LRU de ARCHIVE_CACHE_SIZE
+asambleas por worker (un archivo no cambia nunca).
+
+La ruta a la asamblea en meeting_routes se conserva: con sharding, las
+lecturas siguen llegando al shard que guarda su fila de meeting_archives.
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import DateTime, Table, delete, or_, select
+from sqlalchemy.orm import Session
+
+from app.core import events
+from app.core.config import Settings, get_settings
+from app.core.vote_crypto import VoteDecryptionError, ciphertext_key_id
+from app.models import (
+    AgendaItem,
+    AgendaItemResult,
+    AuditLog,
+    Condominium,
+    Delegation,
+    Meeting,
+    MeetingArchive,
+    Owner,
+    Presence,
+    Vote,
+    VotingRight,
+)
+from app.schemas.quorum_schema import QuorumDetail
+from app.services import outbox_service
+from app.services.quorum_service import build_quorum_status
+from app.services.read_service import AgendaItemRow, MeetingDetailRow, VoteRow
+from app.services.results_service import StoredResult
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+ARCHIVE_FORMAT = 1
+
+# Tablas archivadas, en orden de claves foráneas (se borran en orden inverso)
+_ARCHIVED_TABLES: Tuple[Table, ...] = (
+    Meeting.__table__,
+    AgendaItem.__table__,
+    Presence.__table__,
+    Delegation.__table__,
+    VotingRight.__table__,
+    Vote.__table__,
+    AgendaItemResult.__table__,
+    AuditLog.__table__,
+)
+
+
+def _http_error(detail: str, status_code: int = status.HTTP_400_BAD_REQUEST) -> HTTPException:
+    return HTTPException(status_code=status_code, detail=detail)
+
+
+def _meeting_row_filters(meeting_id: int) -> Dict[str, Any]:
+    """
+    Filtro de cada tabla archivada para una asamblea.
+    """
+    agenda_ids = select(AgendaItem.id).where(AgendaItem.meeting_id == meeting_id)
+    presence_ids = select(Presence.id).where(Presence.meeting_id == meeting_id)
+    delegation_ids = select(Delegation.id).where(Delegation.meeting_id == meeting_id)
+    vote_ids = select(Vote.id).where(Vote.agenda_item_id.in_(agenda_ids))
+    return {
+        "meetings": Meeting.id == meeting_id,
+        "agenda_items": AgendaItem.meeting_id == meeting_id,
+        "presences": Presence.meeting_id == meeting_id,
+        "delegations": Delegation.meeting_id == meeting_id,
+        "voting_rights": VotingRight.meeting_id == meeting_id,
+        "votes": Vote.agenda_item_id.in_(agenda_ids),
+        "agenda_item_results": AgendaItemResult.meeting_id == meeting_id,
+        "audit_logs": or_(
+            (AuditLog.entity_type == "Meeting") & (AuditLog.entity_id == meeting_id),
+            (AuditLog.entity_type == "AgendaItem") & AuditLog.entity_id.in_(agenda_ids),
+            (AuditLog.entity_type == "Presence") & AuditLog.entity_id.in_(presence_ids),
+            (AuditLog.entity_type == "Delegation") & AuditLog.entity_id.in_(delegation_ids),
+            (AuditLog.entity_type == "Vote") & AuditLog.entity_id.in_(vote_ids),
+        ),
+    }
+
+
+def _encode_value(value: Any) -> Any:
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def _datetime_columns(table: Table) -> frozenset:
+    return frozenset(column.name for column in table.columns if isinstance(column.type, DateTime))
+
+
+def _decode_rows(table: Table, columns: List[str], rows: List[list]) -> List[dict]:
+    datetimes = _datetime_columns(table)
+    decoded = []
+    for row in rows:
+        record = dict(zip(columns, row))
+        for name in datetimes.intersection(record):
+            if record[name] is not None:
+                record[name] = datetime.fromisoformat(record[name])
+        decoded.append(record)
+    return decoded
+
+
+# =========================================================
+# Archivo leído
+# =========================================================
+
+@dataclass
+class ArchivedMeeting:
+    """
+    Contenido de un archivo, ya verificado y decodificado.
+    """
+
+    meeting: dict
+    coeficiente_total: float
+    owner_names: Dict[int, str]
+    tables: Dict[str, List[dict]]
+    _votes_by_item: Optional[Dict[int, List[VoteRow]]] = field(default=None, repr=False)
+
+    def rows(self, table: str) -> List[dict]:
+        return self.tables.get(table, [])
+
+    def votes_for_item(self, agenda_item_id: int) -> List[VoteRow]:
+        if self._votes_by_item is None:
+            grouped: Dict[int, List[VoteRow]] = defaultdict(list)
+            for vote in sorted(self.rows("votes"), key=lambda v: v["created_at"]):
+                grouped[vote["agenda_item_id"]].append(
+                    VoteRow(vote["id"], vote["agenda_item_id"], vote["owner_id"], vote["created_at"])
+                )
+            self._votes_by_item = dict(grouped)
+        return self._votes_by_item.get(agenda_item_id, [])
+
+
+class ArchiveCache:
+    """
+    Caché LRU de archivos leídos, por (meeting_id, sha256).
+    """
+
+    def __init__(self, cfg: Settings) -> None:
+        self._cfg = cfg
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[int, str], ArchivedMeeting]" = OrderedDict()
+        self.hits = 0
+        self.loads = 0
+
+    def get(self, key: Tuple[int, str]) -> Optional[ArchivedMeeting]:
+        with self._lock:
+            archived = self._entries.get(key)
+            if archived is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            return archived
+
+    def put(self, key: Tuple[int, str], archived: ArchivedMeeting) -> None:
+        with self._lock:
+            self.loads += 1
+            self._entries[key] = archived
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._cfg.ARCHIVE_CACHE_SIZE:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        return {"cached": len(self._entries), "hits": self.hits, "loads": self.loads}
+
+
+archive_cache = ArchiveCache(settings)
+
+
+def _archive_root() -> Path:
+    return Path(settings.ARCHIVE_DIR)
+
+
+def _read_archive_file(relative_path: str, expected_sha256: str) -> dict:
+    blob = (_archive_root() / relative_path).read_bytes()
+    digest = hashlib.sha256(blob).hexdigest()
+    if digest != expected_sha256:
+        raise ValueError(f"checksum de {relative_path} no coincide ({digest[:12]} != {expected_sha256[:12]})")
+    return json.loads(gzip.decompress(blob))
+
+
+def _decode_document(document: dict) -> ArchivedMeeting:
+    tables_by_name = {table.name: table for table in _ARCHIVED_TABLES}
+    tables = {
+        name: _decode_rows(tables_by_name[name], content["columns"], content["rows"])
+        for name, content in document["tables"].items()
+    }
+    return ArchivedMeeting(
+        meeting=tables["meetings"][0],
+        coeficiente_total=document["coeficiente_total"],
+        owner_names={int(owner_id): name for owner_id, name in document["owner_names"].items()},
+        tables=tables,
+    )
+
+
+def get_archive_entry(db: Session, meeting_id: int) -> Optional[MeetingArchive]:
+    return db.get(MeetingArchive, meeting_id)
+
+
+def load_archived_meeting(db: Session, meeting_id: int) -> Optional[ArchivedMeeting]:
+    """
+    Contenido archivado de una asamblea, o None si no está archivada.
+
+    Lanza HTTPException 500 si el archivo falta o su checksum no coincide.
+    """
+    entry = get_archive_entry(db, meeting_id)
+    if entry is None:
+        return None
+    key = (meeting_id, entry.sha256)
+    archived = archive_cache.get(key)
+    if archived is not None:
+        return archived
+    try:
+        archived = _decode_document(_read_archive_file(entry.path, entry.sha256))
+    except (OSError, ValueError) as exc:
+        logger.error("Archivo de la asamblea %s ilegible: %s", meeting_id, exc)
+        raise _http_error(
+            "El archivo de la asamblea está dañado o no está disponible.",
+            status.HTTP_500_INTERNAL_SERVER_ERROR,
+        )
+    archive_cache.put(key, archived)
+    return archived
+
+
+# =========================================================
+# Archivado
+# =========================================================
+
+@dataclass(slots=True)
+class ArchiveReport:
+    """
+    Resultado del archivado de una asamblea.
+    """
+
+    meeting_id: int
+    path: str
+    sha256: str
+    size_bytes: int
+    row_counts: Dict[str, int]
+    vote_key_ids: List[str] = field(default_factory=list)
+
+
+def _vote_key_ids(ciphertexts) -> List[str]:
+    """
+    key_id (hex) distintos de una serie de votos cifrados, ordenados.
+    """
+    key_ids = set()
+    for token in ciphertexts:
+        try:
+            key_ids.add(ciphertext_key_id(token).hex())
+        except VoteDecryptionError:
+            # Ilegible con cualquier clave: no obliga a conservar ninguna
+            continue
+    return sorted(key_ids)
+
+
+def _write_atomic(path: Path, blob: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as fh:
+        fh.write(blob)
+        fh.flush()
+        os.fsync(fh.fileno())
+    os.replace(tmp, path)
+
+
+def archive_meeting(db: Session, meeting_id: int) -> ArchiveReport:
+    """
+    Archiva una asamblea cerrada y borra sus filas de las tablas calientes.
+
+    Confirma la transacción de la sesión. Errores (HTTPException):
+        - 404 si la asamblea no existe.
+        - 409 si ya está archivada o no está cerrada (RD-05: solo lo cerrado es inmutable).
+    """
+    meeting_query = select(Meeting).where(Meeting.id == meeting_id)
+    if db.get_bind().dialect.name == "postgresql":
+        meeting_query = meeting_query.with_for_update()
+    meeting = db.execute(meeting_query).scalar_one_or_none()
+    if meeting is None:
+        if get_archive_entry(db, meeting_id) is not None:
+            raise _http_error("La asamblea ya está archivada.", status.HTTP_409_CONFLICT)
+        raise _http_error("Asamblea no encontrada.", status.HTTP_404_NOT_FOUND)
+    if meeting.status != "CLOSED":
+        raise _http_error(
+            "RD-05: Solo se pueden archivar asambleas cerradas.",
+            status.HTTP_409_CONFLICT,
+        )
+
+    filters = _meeting_row_filters(meeting_id)
+    document_tables: Dict[str, dict] = {}
+    row_counts: Dict[str, int] = {}
+    vote_key_ids: List[str] = []
+    for table in _ARCHIVED_TABLES:
+        columns = [column.name for column in table.columns]
+        rows = db.execute(select(table).where(filters[table.name])).all()
+        if table is Vote.__table__:
+            vote_key_ids = _vote_key_ids(row.value_encrypted for row in rows)
+        document_tables[table.name] = {
+            "columns": columns,
+            "rows": [[_encode_value(value) for value in row] for row in rows],
+        }
+        row_counts[table.name] = len(rows)
+
+    presence_owner_ids = select(Presence.owner_id).where(Presence.meeting_id == meeting_id)
+    owner_names = {
+        str(owner_id): name
+        for owner_id, name in db.execute(
+            select(Owner.id, Owner.name).where(Owner.id.in_(presence_owner_ids))
+        )
+    }
+    coeficiente_total = db.execute(
+        select(Condominium.coeficiente_total).where(Condominium.id == meeting.condominium_id)
+    ).scalar_one()
+
+    document = {
+        "format": ARCHIVE_FORMAT,
+        "meeting_id": meeting_id,
+        "condominium_id": meeting.condominium_id,
+        "archived_at": datetime.now(timezone.utc).isoformat(),
+        "coeficiente_total": coeficiente_total,
+        "owner_names": owner_names,
+        "tables": document_tables,
+    }
+    blob = gzip.compress(
+        json.dumps(document, separators=(",", ":"), ensure_ascii=False).encode("utf-8"),
+        compresslevel=9,
+        mtime=0,
+    )
+    digest = hashlib.sha256(blob).hexdigest()
+    relative_path = f"{meeting.condominium_id}/meeting-{meeting_id}.json.gz"
+    path = _archive_root() / relative_path
+
+    _write_atomic(path, blob)
+    try:
+        # Antes de borrar nada: el archivo en disco debe leerse completo y coincidir
+        written = _read_archive_file(relative_path, digest)
+        for name, count in row_counts.items():
+            if len(written["tables"][name]["rows"]) != count:
+                raise ValueError(f"conteo de {name} no coincide en el archivo")
+
+        db.add(
+            MeetingArchive(
+                meeting_id=meeting_id,
+                condominium_id=meeting.condominium_id,
+                title=meeting.title,
+                date=meeting.date,
+                status=meeting.status,
+                total_propietarios=meeting.total_propietarios,
+                path=relative_path,
+                sha256=digest,
+                size_bytes=len(blob),
+                row_count=sum(row_counts.values()),
+                format_version=ARCHIVE_FORMAT,
+                vote_key_ids=",".join(vote_key_ids),
+            )
+        )
+        for table in reversed(_ARCHIVED_TABLES):
+            db.execute(delete(table).where(filters[table.name]))
+        outbox_service.emit(
+            db,
+            events.MEETING_ARCHIVED,
+            meeting_id=meeting_id,
+            entity_type="Meeting",
+            entity_id=meeting_id,
+            payload={"sha256": digest, "rows": sum(row_counts.values())},
+        )
+        db.commit()
+    except Exception:
+        db.rollback()
+        path.unlink(missing_ok=True)
+        raise
+    db.expunge_all()
+
+    logger.info(
+        "Asamblea %s archivada en %s (%s bytes, %s filas).",
+        meeting_id,
+        relative_path,
+        len(blob),
+        sum(row_counts.values()),
+    )
+    return ArchiveReport(meeting_id, relative_path, digest, len(blob), row_counts, vote_key_ids)
+
+
+def archived_vote_key_usage(db: Session) -> Dict[str, List[int]]:
+    """
+    Asambleas archivadas por key_id (hex) de los votos que contienen.
+
+    Una clave que aparece aquí no puede retirarse de VOTE_ENCRYPTION_OLD_KEYS.
+    Los archivos sin vote_key_ids (anteriores a la columna) se leen una vez,
+    verificando su checksum, y la columna queda rellena.
+    """
+    usage: Dict[str, List[int]] = defaultdict(list)
+    pending = db.execute(
+        select(MeetingArchive).where(MeetingArchive.vote_key_ids.is_(None))
+    ).scalars().all()
+    for entry in pending:
+        content = _read_archive_file(entry.path, entry.sha256)["tables"][Vote.__tablename__]
+        column = content["columns"].index("value_encrypted")
+        entry.vote_key_ids = ",".join(_vote_key_ids(row[column] for row in content["rows"]))
+    if pending:
+        db.commit()
+
+    for meeting_id, key_ids in db.execute(
+        select(MeetingArchive.meeting_id, MeetingArchive.vote_key_ids)
+        .where(MeetingArchive.vote_key_ids != "")
+        .order_by(MeetingArchive.meeting_id)
+    ):
+        for key_id in key_ids.split(","):
+            usage[key_id].append(meeting_id)
+    return dict(usage)
+
+
+def archivable_meeting_ids(db: Session, *, older_than_days: Optional[int] = None, limit: int = 100) -> List[int]:
+    """
+    Asambleas cerradas con fecha anterior a older_than_days (ARCHIVE_AFTER_DAYS por defecto).
+    """
+    days = settings.ARCHIVE_AFTER_DAYS if older_than_days is None else older_than_days
+    cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+    return list(
+        db.execute(
+            select(Meeting.id)
+            .where(Meeting.status == "CLOSED", Meeting.date < cutoff)
+            .order_by(Meeting.date)
+            .limit(limit)
+        ).scalars()
+    )
+
+
+# =========================================================
+# Lecturas para las rutas GET
+# =========================================================
+
+def archived_meeting_detail(db: Session, meeting_id: int) -> Optional[MeetingDetailRow]:
+    archived = load_archived_meeting(db, meeting_id)
+    if archived is None:
+        return None
+    meeting = archived.meeting
+    return MeetingDetailRow(
+        id=meeting["id"],
+        title=meeting["title"],
+        date=meeting["date"],
+        status=meeting["status"],
+        condominium_id=meeting["condominium_id"],
+        total_propietarios=meeting["total_propietarios"],
+        agenda_items=[
+            AgendaItemRow(item["title"], item["id"], item["status"])
+            for item in sorted(archived.rows("agenda_items"), key=lambda item: item["id"])
+        ],
+    )
+
+
+def archived_vote_rows(db: Session, *, meeting_id: int, agenda_item_id: int) -> Optional[List[VoteRow]]:
+    """
+    Votos archivados de un punto; None si el punto no está en el archivo.
+    """
+    archived = load_archived_meeting(db, meeting_id)
+    if archived is None or not any(item["id"] == agenda_item_id for item in archived.rows("agenda_items")):
+        return None
+    return archived.votes_for_item(agenda_item_id)
+
+
+def archived_result(db: Session, *, meeting_id: int, agenda_item_id: int) -> Optional[StoredResult]:
+    archived = load_archived_meeting(db, meeting_id)
+    if archived is None:
+        return None
+    for result in archived.rows("agenda_item_results"):
+        if result["agenda_item_id"] == agenda_item_id:
+            # Una asamblea archivada está cerrada: no hay puntos pendientes
+            return StoredResult(result["payload_json"], result["computed_at"], False)
+    return None
+
+
+def archived_quorum(db: Session, meeting_id: int) -> Optional[QuorumDetail]:
+    archived = load_archived_meeting(db, meeting_id)
+    if archived is None:
+        return None
+    presences = archived.rows("presences")
+    status_ = build_quorum_status(
+        meeting_id,
+        sum(presence["coeficiente"] for presence in presences),
+        archived.coeficiente_total,
+    )
+    return QuorumDetail(
+        status=status_,
+        presentes=[
+            {
+                "owner_id": presence["owner_id"],
+                "owner_name": archived.owner_names.get(presence["owner_id"], "Desconocido"),
+                "coeficiente": presence["coeficiente"],
+                "created_at": presence["created_at"],
+            }
+            for presence in presences
+        ],
+    )
+
+
+def archived_voting_rights(
+    db: Session, *, meeting_id: int, user_id: int
+) -> Optional[List[Tuple[int, float, bool]]]:
+    """
+    Misma forma que delegation_service.voting_rights_for_user, desde el archivo.
+    """
+    archived = load_archived_meeting(db, meeting_id)
+    if archived is None:
+        return None
+    rights = archived.rows("voting_rights")
+    if rights:
+        return sorted(
+            (
+                (right["owner_id"], right["coeficiente"], right["delegated"])
+                for right in rights
+                if right["user_id"] == user_id
+            ),
+            key=lambda right: (right[2], right[0]),
+        )
+    return [
+        (owner_id, coeficiente, False)
+        for owner_id, coeficiente in db.execute(
+            select(Owner.id, Owner.coeficiente)
+            .where(
+                Owner.condominium_id == archived.meeting["condominium_id"],
+                Owner.user_id == user_id,
+            )
+            .order_by(Owner.id)
+        )
+    ]
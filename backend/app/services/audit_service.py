@@ -15,9 +15,11 @@ from typing import Optional, List
 
 from sqlalchemy.orm import Session
 
+from app.core.tracing import traced
 from app.models import AuditLog
 
 
+@traced("audit.log_action")
 def log_action(
     db: Session,
     *,
@@ -26,6 +28,7 @@ def log_action(
     entity_type: str,
     entity_id: Optional[int] = None,
     description: Optional[str] = None,
+    commit: bool = True,
 ) -> AuditLog:
     """
     Registra una acción en la tabla de auditoría.
@@ -37,9 +40,11 @@ def log_action(
         entity_type: Tipo de entidad afectada (ej. 'Meeting', 'Vote').
         entity_id: Identificador de la entidad afectada (si aplica).
         description: Descripción opcional con más contexto.
+        commit: Si es False, el registro solo se agrega a la sesión para que
+            se confirme en la misma transacción que el cambio auditado.
 
     Retorna:
-        El objeto AuditLog persistido.
+        El objeto AuditLog persistido (o pendiente, si commit=False).
 
     Ejemplos típicos de uso:
         - Al registrar un voto.
@@ -54,8 +59,9 @@ def log_action(
         description=description,
     )
     db.add(audit)
-    db.commit()
-    db.refresh(audit)
+    if commit:
+        db.commit()
+        db.refresh(audit)
     return audit
 
 
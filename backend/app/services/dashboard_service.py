@@ -0,0 +1,388 @@
+"""
+backend/app/services/dashboard_service.py
+
+Panel de asambleas para administradores.
+
+Por asamblea: estado, porcentaje de quórum, presentes, punto abierto y
+votos emitidos. Antes eso costaba un calculate_quorum y un listado de
+votos por asamblea; aquí una página se resuelve con un número fijo de
+consultas agrupadas por shard, sin importar cuántas asambleas tenga:
+
+    1. Página de asambleas (con el coeficiente total de su conjunto).
+    2. Total de asambleas que cumplen el filtro.
+    3. Versión de cada asamblea: último id y cantidad de eventos del
+       outbox, agrupados por meeting_id (misma versión que el ETag de
+       read_service.get_meeting_validators).
+    4. Presencias por asamblea: cantidad y suma de coeficientes.
+    5. Puntos de agenda con sus votos (LEFT JOIN agrupado por punto).
+
+Caché por versión:
+    - Todo cambio de presencias, puntos, estados o votos emite un evento
+      del outbox, así que los agregados de una asamblea (consultas 4 y 5)
+      se guardan por (meeting_id, versión) en una caché LRU por worker y
+      solo se recalculan las asambleas que cambiaron. Una asamblea cerrada
+      no vuelve a consultarse.
+    - El ETag de la página combina filtros, total y versión de cada
+      asamblea: si el cliente ya la tiene se responde 304 tras las
+      consultas 1-3, sin calcular agregados.
+    - Las asambleas sin eventos (datos anteriores al outbox) no tienen
+      versión: se recalculan siempre y la página se sirve sin validadores.
+
+Las asambleas archivadas (archive_service) no aparecen: ya no están en
+las tablas calientes y se consultan con el listado de asambleas.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from pydantic import TypeAdapter
+from sqlalchemy import Select, func, select
+from sqlalchemy.orm import Session
+
+from app.core.config import Settings, get_settings
+from app.core.http_cache import Validators
+from app.core.sharding import shard_router
+from app.models import AgendaItem, Condominium, Meeting, OutboxEvent, Presence, Vote
+from app.services.quorum_service import build_quorum_status
+
+settings = get_settings()
+
+MAX_LIMIT = 100
+
+
+@dataclass(slots=True)
+class DashboardRow:
+    """Asamblea del panel (misma forma que MeetingDashboardRow)."""
+
+    id: int
+    title: str
+    date: datetime
+    status: str
+    condominium_id: int
+    porcentaje_quorum: float = 0.0
+    cumple_quorum: bool = False
+    presentes: int = 0
+    presentes_coeficiente: float = 0.0
+    agenda_items: int = 0
+    closed_items: int = 0
+    open_item_id: Optional[int] = None
+    open_item_title: Optional[str] = None
+    open_item_votes: int = 0
+    votes_cast: int = 0
+    version: Optional[str] = None
+
+
+@dataclass(slots=True)
+class DashboardPage:
+    """Página del panel (misma forma que MeetingDashboardPage)."""
+
+    total: int
+    limit: int
+    offset: int
+    meetings: List[DashboardRow] = field(default_factory=list)
+
+
+DASHBOARD_ADAPTER = TypeAdapter(DashboardPage)
+
+
+@dataclass(slots=True)
+class _Aggregates:
+    presentes: int = 0
+    presentes_coeficiente: float = 0.0
+    agenda_items: int = 0
+    closed_items: int = 0
+    open_item_id: Optional[int] = None
+    open_item_title: Optional[str] = None
+    open_item_votes: int = 0
+    votes_cast: int = 0
+
+
+@dataclass(slots=True)
+class _Candidate:
+    row: DashboardRow
+    coeficiente_total: float
+    shard: int
+    last_at: Optional[datetime] = None
+
+
+@dataclass
+class DashboardPlan:
+    """
+    Página elegida y sus versiones, antes de calcular los agregados.
+    """
+
+    total: int
+    limit: int
+    offset: int
+    candidates: List[_Candidate]
+    validators: Optional[Validators]
+
+
+# ================== CACHÉ ==================
+
+
+class DashboardCache:
+    """
+    Agregados por (meeting_id, versión). Una versión nunca cambia de contenido.
+    """
+
+    def __init__(self, cfg: Settings) -> None:
+        self._cfg = cfg
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[int, str], _Aggregates]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Tuple[int, str]) -> Optional[_Aggregates]:
+        with self._lock:
+            aggregates = self._entries.get(key)
+            if aggregates is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return aggregates
+
+    def put(self, key: Tuple[int, str], aggregates: _Aggregates) -> None:
+        with self._lock:
+            self._entries[key] = aggregates
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._cfg.DASHBOARD_CACHE_SIZE:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        return {"cached": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+dashboard_cache = DashboardCache(settings)
+
+
+# ================== CONSULTAS ==================
+
+
+def _filters(condominium_id: Optional[int], status: Optional[str]) -> list:
+    filters = []
+    if condominium_id is not None:
+        filters.append(Meeting.condominium_id == condominium_id)
+    if status is not None:
+        filters.append(Meeting.status == status)
+    return filters
+
+
+def _versions_statement(meeting_ids: List[int]) -> Select:
+    return (
+        select(
+            OutboxEvent.meeting_id,
+            func.max(OutboxEvent.id),
+            func.count(),
+            func.max(OutboxEvent.created_at),
+        )
+        .where(OutboxEvent.meeting_id.in_(meeting_ids))
+        .group_by(OutboxEvent.meeting_id)
+    )
+
+
+def _presences_statement(meeting_ids: List[int]) -> Select:
+    return (
+        select(Presence.meeting_id, func.count(), func.coalesce(func.sum(Presence.coeficiente), 0.0))
+        .where(Presence.meeting_id.in_(meeting_ids))
+        .group_by(Presence.meeting_id)
+    )
+
+
+def _agenda_votes_statement(meeting_ids: List[int]) -> Select:
+    return (
+        select(
+            AgendaItem.meeting_id,
+            AgendaItem.id,
+            AgendaItem.title,
+            AgendaItem.status,
+            func.count(Vote.id),
+        )
+        .outerjoin(Vote, Vote.agenda_item_id == AgendaItem.id)
+        .where(AgendaItem.meeting_id.in_(meeting_ids))
+        .group_by(AgendaItem.meeting_id, AgendaItem.id, AgendaItem.title, AgendaItem.status)
+        .order_by(AgendaItem.id)
+    )
+
+
+def _meeting_versions(db: Session, meeting_ids: List[int]) -> Dict[int, Tuple[str, datetime]]:
+    if not meeting_ids:
+        return {}
+    rows = db.execute(_versions_statement(meeting_ids))
+    return {meeting_id: (f"v{last_id}.{total}", last_at) for meeting_id, last_id, total, last_at in rows}
+
+
+def _load_aggregates(db: Session, meeting_ids: List[int]) -> Dict[int, _Aggregates]:
+    aggregates = {meeting_id: _Aggregates() for meeting_id in meeting_ids}
+
+    presences = db.execute(_presences_statement(meeting_ids))
+    for meeting_id, count, coeficiente in presences:
+        aggregates[meeting_id].presentes = count
+        aggregates[meeting_id].presentes_coeficiente = float(coeficiente)
+
+    items = db.execute(_agenda_votes_statement(meeting_ids))
+    for meeting_id, item_id, title, item_status, votes in items:
+        entry = aggregates[meeting_id]
+        entry.agenda_items += 1
+        entry.votes_cast += votes
+        if item_status == "CLOSED":
+            entry.closed_items += 1
+        elif item_status == "OPEN":
+            # RB-02: a lo sumo un punto abierto por asamblea
+            entry.open_item_id, entry.open_item_title, entry.open_item_votes = item_id, title, votes
+    return aggregates
+
+
+def _shard_candidates(
+    db: Session,
+    shard: int,
+    *,
+    condominium_id: Optional[int],
+    status: Optional[str],
+    limit: int,
+    offset: int,
+) -> Tuple[int, List[_Candidate]]:
+    filters = _filters(condominium_id, status)
+    total = db.execute(select(func.count()).select_from(Meeting).where(*filters)).scalar_one()
+    rows = db.execute(
+        select(
+            Meeting.id,
+            Meeting.title,
+            Meeting.date,
+            Meeting.status,
+            Meeting.condominium_id,
+            Condominium.coeficiente_total,
+        )
+        .join(Condominium, Condominium.id == Meeting.condominium_id)
+        .where(*filters)
+        .order_by(Meeting.date.desc(), Meeting.id.desc())
+        .limit(limit)
+        .offset(offset)
+    ).all()
+    versions = _meeting_versions(db, [row.id for row in rows])
+    candidates = []
+    for meeting_id, title, date, meeting_status, condo_id, coeficiente_total in rows:
+        version, last_at = versions.get(meeting_id, (None, None))
+        candidates.append(
+            _Candidate(
+                row=DashboardRow(meeting_id, title, date, meeting_status, condo_id, version=version),
+                coeficiente_total=coeficiente_total or 0.0,
+                shard=shard,
+                last_at=last_at,
+            )
+        )
+    return total, candidates
+
+
+def _page_validators(
+    candidates: Iterable[_Candidate],
+    *,
+    total: int,
+    limit: int,
+    offset: int,
+    condominium_id: Optional[int],
+    status: Optional[str],
+) -> Optional[Validators]:
+    candidates = list(candidates)
+    if any(candidate.row.version is None for candidate in candidates):
+        return None
+    digest = hashlib.sha1(
+        "|".join(
+            [f"{condominium_id}:{status}:{limit}:{offset}:{total}"]
+            + [f"{candidate.row.id}:{candidate.row.version}" for candidate in candidates]
+        ).encode()
+    ).hexdigest()[:20]
+    last_at = [candidate.last_at for candidate in candidates if candidate.last_at is not None]
+    return Validators(etag=f'W/"dash-{digest}"', last_modified=max(last_at) if last_at else None)
+
+
+def plan_page(
+    db: Session,
+    *,
+    condominium_id: Optional[int] = None,
+    status: Optional[str] = None,
+    limit: int = 20,
+    offset: int = 0,
+) -> DashboardPlan:
+    """
+    Elige las asambleas de la página (más recientes primero) y sus versiones.
+
+    Con sharding habilitado cada shard aporta sus primeras offset + limit
+    asambleas y la página se corta tras combinarlas.
+    """
+    total = 0
+    candidates: List[_Candidate] = []
+    sharded = shard_router.enabled
+    for shard, shard_db in enumerate(shard_router.each_shard_session(db)):
+        shard_total, shard_candidates = _shard_candidates(
+            shard_db,
+            shard,
+            condominium_id=condominium_id,
+            status=status,
+            limit=offset + limit if sharded else limit,
+            offset=0 if sharded else offset,
+        )
+        total += shard_total
+        candidates.extend(shard_candidates)
+    if sharded:
+        candidates.sort(key=lambda candidate: (candidate.row.date, candidate.row.id), reverse=True)
+        candidates = candidates[offset:offset + limit]
+
+    validators = _page_validators(
+        candidates,
+        total=total,
+        limit=limit,
+        offset=offset,
+        condominium_id=condominium_id,
+        status=status,
+    )
+    return DashboardPlan(total, limit, offset, candidates, validators)
+
+
+def build_page(db: Session, plan: DashboardPlan) -> DashboardPage:
+    """
+    Completa la página con los agregados (caché por versión o dos consultas por shard).
+    """
+    missing: Dict[int, List[int]] = defaultdict(list)
+    aggregates: Dict[int, _Aggregates] = {}
+    for candidate in plan.candidates:
+        row = candidate.row
+        cached = dashboard_cache.get((row.id, row.version)) if row.version is not None else None
+        if cached is None:
+            missing[candidate.shard].append(row.id)
+        else:
+            aggregates[row.id] = cached
+
+    if missing:
+        for shard, shard_db in enumerate(shard_router.each_shard_session(db)):
+            if shard in missing:
+                aggregates.update(_load_aggregates(shard_db, missing[shard]))
+
+    meetings = []
+    for candidate in plan.candidates:
+        row = candidate.row
+        entry = aggregates[row.id]
+        if row.version is not None:
+            dashboard_cache.put((row.id, row.version), entry)
+        quorum = build_quorum_status(row.id, entry.presentes_coeficiente, candidate.coeficiente_total)
+        row.porcentaje_quorum = quorum.porcentaje_quorum
+        row.cumple_quorum = quorum.cumple_quorum
+        row.presentes = entry.presentes
+        row.presentes_coeficiente = entry.presentes_coeficiente
+        row.agenda_items = entry.agenda_items
+        row.closed_items = entry.closed_items
+        row.open_item_id = entry.open_item_id
+        row.open_item_title = entry.open_item_title
+        row.open_item_votes = entry.open_item_votes
+        row.votes_cast = entry.votes_cast
+        meetings.append(row)
+    return DashboardPage(total=plan.total, limit=plan.limit, offset=plan.offset, meetings=meetings)
@@ -0,0 +1,316 @@
+"""
+backend/app/services/delegation_service.py
+
+Poderes (apoderados) y derechos de voto por asamblea.
+
+Registro de un poder (register_delegation), validado contra el grafo de
+la asamblea:
+    - Solo lo otorga (o revoca) el usuario del poderdante o un ADMIN.
+    - El poderdante pertenece al conjunto y no delegó ya su voto.
+    - El apoderado no es el propio usuario del poderdante.
+    - RD-02: el apoderado no representa ya a otro propietario.
+    - Sin cadenas: quien delegó no puede ser apoderado, y un apoderado no
+      puede delegar el voto de sus propias unidades.
+
+Derechos de voto (voting_rights):
+    Tras cada cambio de poderes, y al iniciar la asamblea, se recalcula
+    para la asamblea completa quién vota por cada propietario y con qué
+    coeficiente. cast_vote resuelve al propietario representado con una
+    búsqueda por índice (meeting_id, user_id) dentro de la misma consulta
+    de hechos, y el check-in de un apoderado registra también la presencia
+    de su representado, de modo que el quórum sigue siendo una sola suma.
+
+Reglas de negocio relacionadas:
+- RD-02: Un apoderado representa máximo a un propietario.
+- RD-04: El coeficiente del representado cuenta para el quórum.
+- RB-03: El representado queda presente cuando su apoderado hace check-in.
+"""
+
+from datetime import datetime, timezone
+from typing import Iterable, List, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import and_, delete, exists, func, insert, literal, select, true
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.core import events
+from app.core.db import dialect_insert
+from app.core.sharding import shard_router
+from app.models import Delegation, Meeting, Owner, Presence, User, VotingRight
+from app.services import outbox_service
+
+
+def _http_error(detail: str, status_code: int = status.HTTP_400_BAD_REQUEST) -> HTTPException:
+    return HTTPException(status_code=status_code, detail=detail)
+
+
+def _ensure_can_manage(principal_user_id: int | None, user_id: int | None, is_admin: bool) -> None:
+    """
+    Solo el usuario del poderdante o un administrador gestionan su poder (403).
+    """
+    if not is_admin and (user_id is None or user_id != principal_user_id):
+        raise _http_error(
+            "Solo el propietario poderdante o un administrador puede gestionar este poder.",
+            status.HTTP_403_FORBIDDEN,
+        )
+
+
+def refresh_voting_rights(db: Session, meeting_id: int) -> None:
+    """
+    Recalcula los derechos de voto de toda la asamblea. No hace commit.
+
+    Cada propietario del conjunto vota por sí mismo o, si delegó, por
+    medio de su apoderado.
+    """
+    meetings = Meeting.__table__
+    owners = Owner.__table__
+    delegations = Delegation.__table__
+
+    db.execute(delete(VotingRight).where(VotingRight.meeting_id == meeting_id))
+    db.execute(
+        insert(VotingRight).from_select(
+            ["meeting_id", "owner_id", "user_id", "coeficiente", "delegated"],
+            select(
+                meetings.c.id,
+                owners.c.id,
+                func.coalesce(delegations.c.proxy_user_id, owners.c.user_id),
+                owners.c.coeficiente,
+                delegations.c.id.is_not(None),
+            )
+            .select_from(
+                meetings.join(owners, owners.c.condominium_id == meetings.c.condominium_id).outerjoin(
+                    delegations,
+                    and_(
+                        delegations.c.meeting_id == meetings.c.id,
+                        delegations.c.principal_owner_id == owners.c.id,
+                    ),
+                )
+            )
+            .where(meetings.c.id == meeting_id),
+        )
+    )
+
+
+def register_delegation(
+    db: Session,
+    *,
+    meeting_id: int,
+    principal_owner_id: int,
+    proxy_user_id: int,
+    user_id: int | None,
+    is_admin: bool = False,
+) -> Delegation:
+    """
+    Registra un poder tras validar el grafo de la asamblea. No hace commit.
+
+    Errores (HTTPException):
+        - 403 si quien lo registra no es el usuario del poderdante ni ADMIN.
+        - 400 si viola el grafo, también cuando una petición concurrente
+          gana la carrera contra uq_delegation_meeting_principal /
+          uq_delegation_meeting_proxy (se hace rollback).
+    """
+    meeting = db.execute(
+        select(Meeting.condominium_id, Meeting.status).where(Meeting.id == meeting_id)
+    ).first()
+    if meeting is None:
+        raise _http_error("Asamblea no encontrada.", status.HTTP_404_NOT_FOUND)
+    if meeting.status == "CLOSED":
+        raise _http_error("No se pueden registrar poderes en una asamblea cerrada.")
+
+    principal_user_id = db.execute(
+        select(Owner.user_id).where(
+            Owner.id == principal_owner_id,
+            Owner.condominium_id == meeting.condominium_id,
+        )
+    ).scalar_one_or_none()
+    if principal_user_id is None:
+        raise _http_error("Propietario no encontrado.", status.HTTP_404_NOT_FOUND)
+    _ensure_can_manage(principal_user_id, user_id, is_admin)
+
+    shard_router.replicate_users(db, {proxy_user_id})
+    if db.get(User, proxy_user_id) is None:
+        raise _http_error("Apoderado no encontrado.", status.HTTP_404_NOT_FOUND)
+    if proxy_user_id == principal_user_id:
+        raise _http_error("Un propietario no puede otorgarse poder a sí mismo.")
+
+    in_meeting = Delegation.meeting_id == meeting_id
+    conflict = db.execute(
+        select(
+            exists().where(in_meeting, Delegation.principal_owner_id == principal_owner_id).label("delegated"),
+            exists().where(in_meeting, Delegation.proxy_user_id == proxy_user_id).label("represents"),
+            # Cadena hacia atrás: el usuario del poderdante ya es apoderado
+            exists().where(in_meeting, Delegation.proxy_user_id == principal_user_id).label("principal_is_proxy"),
+            # Cadena hacia adelante: el apoderado ya delegó el voto de una unidad suya
+            exists()
+            .where(
+                in_meeting,
+                Delegation.principal_owner_id == Owner.id,
+                Owner.user_id == proxy_user_id,
+            )
+            .label("proxy_delegated"),
+        )
+    ).one()
+    if conflict.delegated:
+        raise _http_error(f"El propietario (id={principal_owner_id}) ya otorgó un poder en esta asamblea.")
+    if conflict.represents:
+        raise _http_error("RD-02: el apoderado ya representa a otro propietario en esta asamblea.")
+    if conflict.principal_is_proxy or conflict.proxy_delegated:
+        raise _http_error("No se admiten cadenas de poderes: un apoderado no puede delegar ni ser representado.")
+
+    delegation = Delegation(
+        meeting_id=meeting_id,
+        principal_owner_id=principal_owner_id,
+        proxy_user_id=proxy_user_id,
+        created_by_user_id=user_id,
+        created_at=datetime.now(timezone.utc),
+    )
+    db.add(delegation)
+    try:
+        db.flush()
+    except IntegrityError:
+        db.rollback()
+        raise _http_error("El poder entra en conflicto con otro registrado en esta asamblea.")
+    refresh_voting_rights(db, meeting_id)
+    outbox_service.emit(
+        db,
+        events.DELEGATION_REGISTERED,
+        meeting_id=meeting_id,
+        entity_type="Delegation",
+        entity_id=delegation.id,
+        payload={"principal_owner_id": principal_owner_id, "proxy_user_id": proxy_user_id},
+    )
+    return delegation
+
+
+def revoke_delegation(
+    db: Session,
+    *,
+    meeting_id: int,
+    delegation_id: int,
+    user_id: int | None,
+    is_admin: bool = False,
+) -> Delegation:
+    """
+    Revoca un poder y recalcula los derechos de voto. No hace commit.
+
+    Solo el usuario del poderdante o un ADMIN pueden revocarlo (403).
+
+    Los votos ya emitidos por el apoderado se conservan (RD-05).
+    """
+    delegation = db.execute(
+        select(Delegation).where(Delegation.id == delegation_id, Delegation.meeting_id == meeting_id)
+    ).scalar_one_or_none()
+    if delegation is None:
+        raise _http_error("Poder no encontrado.", status.HTTP_404_NOT_FOUND)
+    principal_user_id = db.execute(
+        select(Owner.user_id).where(Owner.id == delegation.principal_owner_id)
+    ).scalar_one_or_none()
+    _ensure_can_manage(principal_user_id, user_id, is_admin)
+    meeting_status = db.execute(select(Meeting.status).where(Meeting.id == meeting_id)).scalar_one()
+    if meeting_status == "CLOSED":
+        raise _http_error("No se pueden revocar poderes de una asamblea cerrada.")
+
+    db.delete(delegation)
+    db.flush()
+    refresh_voting_rights(db, meeting_id)
+    outbox_service.emit(
+        db,
+        events.DELEGATION_REVOKED,
+        meeting_id=meeting_id,
+        entity_type="Delegation",
+        entity_id=delegation_id,
+        payload={
+            "principal_owner_id": delegation.principal_owner_id,
+            "proxy_user_id": delegation.proxy_user_id,
+        },
+    )
+    return delegation
+
+
+def has_voting_rights(db: Session, meeting_id: int) -> bool:
+    return db.execute(
+        select(exists().where(VotingRight.meeting_id == meeting_id))
+    ).scalar_one()
+
+
+def voting_rights_for_user(
+    db: Session, *, meeting_id: int, user_id: int
+) -> List[Tuple[int, float, bool]]:
+    """
+    Propietarios por los que vota un usuario: (owner_id, coeficiente, delegated).
+
+    Si la asamblea aún no tiene derechos calculados se usan sus propias unidades.
+    """
+    if has_voting_rights(db, meeting_id):
+        return [
+            tuple(row)
+            for row in db.execute(
+                select(VotingRight.owner_id, VotingRight.coeficiente, VotingRight.delegated)
+                .where(VotingRight.meeting_id == meeting_id, VotingRight.user_id == user_id)
+                .order_by(VotingRight.delegated, VotingRight.owner_id)
+            )
+        ]
+    return [
+        (owner_id, coeficiente, False)
+        for owner_id, coeficiente in db.execute(
+            select(Owner.id, Owner.coeficiente)
+            .join(Meeting, Meeting.condominium_id == Owner.condominium_id)
+            .where(Meeting.id == meeting_id, Owner.user_id == user_id)
+            .order_by(Owner.id)
+        )
+    ]
+
+
+def register_represented_presences(
+    db: Session,
+    *,
+    meeting_id: int,
+    owner_ids: Iterable[int],
+) -> List[Tuple[int, float]]:
+    """
+    Registra la presencia de los representados por los usuarios de owner_ids.
+
+    Un solo INSERT ... SELECT sobre voting_rights (ON CONFLICT DO NOTHING);
+    emite PRESENCE_REGISTERED por cada representado nuevo. No hace commit.
+
+    Retorna:
+        (owner_id, coeficiente) de las presencias añadidas.
+    """
+    owner_ids = list(owner_ids)
+    if not owner_ids:
+        return []
+    rights = VotingRight.__table__
+    presences = Presence.__table__
+    now = datetime.now(timezone.utc)
+
+    stmt = dialect_insert(db, presences).from_select(
+        ["meeting_id", "owner_id", "coeficiente", "created_at"],
+        select(rights.c.meeting_id, rights.c.owner_id, rights.c.coeficiente, literal(now, presences.c.created_at.type))
+        .where(
+            rights.c.meeting_id == meeting_id,
+            rights.c.delegated == true(),
+            rights.c.user_id.in_(select(Owner.user_id).where(Owner.id.in_(owner_ids))),
+        ),
+    )
+    if db.get_bind().dialect.name == "postgresql":
+        stmt = stmt.on_conflict_do_nothing(constraint="uq_presence_meeting_owner")
+    else:
+        stmt = stmt.on_conflict_do_nothing(index_elements=["meeting_id", "owner_id"])
+    represented = [tuple(row) for row in db.execute(stmt.returning(presences.c.owner_id, presences.c.coeficiente))]
+
+    if represented:
+        outbox_service.emit_many(
+            db,
+            (
+                {
+                    "event_type": events.PRESENCE_REGISTERED,
+                    "meeting_id": meeting_id,
+                    "entity_type": "Owner",
+                    "entity_id": owner_id,
+                    "payload": {"coeficiente": coeficiente, "represented": True},
+                }
+                for owner_id, coeficiente in represented
+            ),
+        )
+    return represented
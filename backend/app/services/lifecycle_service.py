@@ -0,0 +1,306 @@
+"""
+backend/app/services/lifecycle_service.py
+
+Máquina de estados de asambleas y puntos de agenda.
+
+Transiciones válidas:
+    Meeting:    CREATED → IN_PROGRESS → CLOSED
+    AgendaItem: PENDING → OPEN → CLOSED
+
+Cada cambio es un compare-and-set sobre (status, version):
+
+    UPDATE ... SET status = :nuevo, version = version + 1
+    WHERE id = :id AND status = :actual [AND version = :esperada]
+
+Cada transición emite su evento de dominio (outbox) en la misma transacción.
+
+Si otra petición cambió la fila entre la lectura y la escritura, el UPDATE
+no afecta filas y se responde 409. El cliente puede fijar la versión
+esperada con If-Match (los PATCH devuelven la versión en el ETag).
+
+Las aperturas y cierres toman además un candado consultivo por asamblea
+(pg_advisory_xact_lock) para serializar entre sí las transiciones de una
+misma asamblea (RB-02 se comprueba sin carreras). Los votos no toman ese
+candado: en PostgreSQL bloquean el punto con FOR SHARE, que no se bloquea
+entre votantes pero sí contra el UPDATE del cierre, de modo que ningún
+voto confirma después de cerrado su punto. En SQLite la cola de un solo
+escritor da la misma garantía.
+
+Reglas de negocio relacionadas:
+- RB-01: Solo el administrador puede abrir o cerrar votaciones (autenticación).
+- RB-02: Debe cerrarse un punto antes de abrir otro.
+- RB-07: No se puede abrir votación sin quórum mínimo.
+- RD-05: Los resultados no pueden modificarse tras el cierre.
+"""
+
+from datetime import datetime, timezone
+from typing import Dict, FrozenSet, Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy import exists, insert, literal, select, text, update
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+
+from app.core import events
+from app.models import AgendaItem, Meeting, Vote
+from app.services import delegation_service, outbox_service, results_service
+from app.services.quorum_service import calculate_quorum_status
+
+MEETING_TRANSITIONS: Dict[str, FrozenSet[str]] = {
+    "CREATED": frozenset({"IN_PROGRESS"}),
+    "IN_PROGRESS": frozenset({"CLOSED"}),
+    "CLOSED": frozenset(),
+}
+
+AGENDA_ITEM_TRANSITIONS: Dict[str, FrozenSet[str]] = {
+    "PENDING": frozenset({"OPEN"}),
+    "OPEN": frozenset({"CLOSED"}),
+    "CLOSED": frozenset(),
+}
+
+# Evento de outbox emitido al llegar a cada estado
+_MEETING_EVENTS = {"IN_PROGRESS": events.MEETING_STARTED, "CLOSED": events.MEETING_CLOSED}
+_AGENDA_ITEM_EVENTS = {"OPEN": events.AGENDA_ITEM_OPENED, "CLOSED": events.AGENDA_ITEM_CLOSED}
+
+# Espacio de nombres de los candados consultivos de asamblea
+_MEETING_LOCK_NAMESPACE = 0x4147
+
+
+def _http_error(detail: str, status_code: int = status.HTTP_400_BAD_REQUEST) -> HTTPException:
+    return HTTPException(status_code=status_code, detail=detail)
+
+
+def parse_if_match(if_match: Optional[str]) -> Optional[int]:
+    """
+    Extrae la versión esperada de una cabecera If-Match (W/"v3" o "3").
+    """
+    if not if_match or if_match.strip() == "*":
+        return None
+    value = if_match.strip()
+    if value.startswith("W/"):
+        value = value[2:]
+    value = value.strip('"').lstrip("v")
+    try:
+        return int(value)
+    except ValueError:
+        raise _http_error("Cabecera If-Match inválida.")
+
+
+def version_etag(version: int) -> str:
+    return f'W/"v{version}"'
+
+
+def lock_meeting_transitions(db: Session, meeting_id: int) -> None:
+    """
+    Serializa las aperturas/cierres de una asamblea hasta el fin de la transacción.
+
+    En SQLite no hace nada: la cola de un solo escritor ya serializa.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        db.execute(
+            text("SELECT pg_advisory_xact_lock(:namespace, :meeting_id)"),
+            {"namespace": _MEETING_LOCK_NAMESPACE, "meeting_id": meeting_id},
+        )
+
+
+def _check_transition(transitions: Dict[str, FrozenSet[str]], current: str, target: str, entity: str) -> None:
+    if target not in transitions:
+        raise _http_error(f"Estado de {entity} no válido: {target}.")
+    if target not in transitions.get(current, frozenset()):
+        raise _http_error(f"Transición de {entity} no permitida: {current} → {target}.")
+
+
+def _conflict() -> HTTPException:
+    return _http_error(
+        "El estado cambió mientras se procesaba la solicitud; vuelva a consultarlo.",
+        status.HTTP_409_CONFLICT,
+    )
+
+
+def transition_meeting(
+    db: Session,
+    *,
+    meeting_id: int,
+    target: str,
+    expected_version: Optional[int] = None,
+) -> Meeting:
+    """
+    Cambia el estado de una asamblea con compare-and-set. No hace commit.
+
+    Al cerrar exige que ningún punto siga abierto.
+    """
+    lock_meeting_transitions(db, meeting_id)
+
+    current = db.execute(
+        select(Meeting.status, Meeting.version).where(Meeting.id == meeting_id)
+    ).first()
+    if current is None:
+        raise _http_error("Asamblea no encontrada.", status.HTTP_404_NOT_FOUND)
+    if expected_version is not None and current.version != expected_version:
+        raise _conflict()
+    _check_transition(MEETING_TRANSITIONS, current.status, target, "asamblea")
+
+    if target == "CLOSED":
+        open_item = db.execute(
+            select(AgendaItem.id).where(
+                AgendaItem.meeting_id == meeting_id,
+                AgendaItem.status == "OPEN",
+            ).limit(1)
+        ).scalar_one_or_none()
+        if open_item is not None:
+            raise _http_error(f"Debe cerrarse el punto {open_item} antes de cerrar la asamblea.")
+
+    result = db.execute(
+        update(Meeting)
+        .where(
+            Meeting.id == meeting_id,
+            Meeting.status == current.status,
+            Meeting.version == current.version,
+        )
+        .values(status=target, version=Meeting.version + 1)
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount != 1:
+        raise _conflict()
+    if target == "IN_PROGRESS" and delegation_service.has_voting_rights(db, meeting_id):
+        # Incluye a los propietarios dados de alta después de registrar los poderes
+        delegation_service.refresh_voting_rights(db, meeting_id)
+    outbox_service.emit(
+        db,
+        _MEETING_EVENTS[target],
+        meeting_id=meeting_id,
+        entity_type="Meeting",
+        entity_id=meeting_id,
+        payload={"from": current.status, "to": target, "version": current.version + 1},
+    )
+    return db.get(Meeting, meeting_id, populate_existing=True)
+
+
+def transition_agenda_item(
+    db: Session,
+    *,
+    meeting_id: int,
+    agenda_item_id: int,
+    target: str,
+    expected_version: Optional[int] = None,
+) -> AgendaItem:
+    """
+    Cambia el estado de un punto de agenda con compare-and-set. No hace commit.
+
+    - Abrir exige asamblea IN_PROGRESS, ningún otro punto abierto (RB-02)
+      y quórum cumplido (RB-07).
+    - Cerrar materializa el resultado en la misma transacción (RD-05).
+    """
+    lock_meeting_transitions(db, meeting_id)
+
+    current = db.execute(
+        select(
+            AgendaItem.status,
+            AgendaItem.version,
+            Meeting.status.label("meeting_status"),
+        )
+        .join(Meeting, Meeting.id == AgendaItem.meeting_id)
+        .where(AgendaItem.id == agenda_item_id, AgendaItem.meeting_id == meeting_id)
+    ).first()
+    if current is None:
+        raise _http_error("Punto de agenda no encontrado.", status.HTTP_404_NOT_FOUND)
+    if expected_version is not None and current.version != expected_version:
+        raise _conflict()
+    if current.status == "CLOSED":
+        raise _http_error("RD-05: Un punto cerrado no puede reabrirse; sus resultados son definitivos.")
+    _check_transition(AGENDA_ITEM_TRANSITIONS, current.status, target, "punto de agenda")
+
+    if target == "OPEN":
+        if current.meeting_status != "IN_PROGRESS":
+            raise _http_error("La asamblea debe estar en curso (IN_PROGRESS) para abrir un punto.")
+        other_open = db.execute(
+            select(AgendaItem.id).where(
+                AgendaItem.meeting_id == meeting_id,
+                AgendaItem.status == "OPEN",
+                AgendaItem.id != agenda_item_id,
+            ).limit(1)
+        ).scalar_one_or_none()
+        if other_open is not None:
+            raise _http_error(f"RB-02: Debe cerrarse el punto {other_open} antes de abrir otro.")
+        if not calculate_quorum_status(db, meeting_id).cumple_quorum:
+            raise _http_error("No se puede abrir votación: el quórum mínimo aún no está cumplido.")
+
+    # En PostgreSQL este UPDATE espera a los votos en curso (FOR SHARE) del punto
+    result = db.execute(
+        update(AgendaItem)
+        .where(
+            AgendaItem.id == agenda_item_id,
+            AgendaItem.status == current.status,
+            AgendaItem.version == current.version,
+        )
+        .values(status=target, version=AgendaItem.version + 1)
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount != 1:
+        raise _conflict()
+
+    agenda_item = db.get(AgendaItem, agenda_item_id, populate_existing=True)
+    payload = {"from": current.status, "to": target, "version": current.version + 1}
+    if target == "CLOSED":
+        result = results_service.compute_agenda_item_result(db, agenda_item)
+        payload.update(total_votos=result.total_votos, aprobado=result.aprobado)
+    outbox_service.emit(
+        db,
+        _AGENDA_ITEM_EVENTS[target],
+        meeting_id=meeting_id,
+        entity_type="AgendaItem",
+        entity_id=agenda_item_id,
+        payload=payload,
+    )
+    return agenda_item
+
+
+def insert_vote_if_open(
+    db: Session,
+    *,
+    agenda_item_id: int,
+    owner_id: int,
+    value_encrypted: str,
+    ip_address: Optional[str],
+) -> Optional[Row]:
+    """
+    Inserta un voto solo si su punto sigue OPEN. No hace commit.
+
+    En PostgreSQL toma antes FOR SHARE sobre el punto: los votantes no se
+    bloquean entre sí, pero el cierre espera a que confirmen (y un voto que
+    llega tras el cierre ve el estado CLOSED). El INSERT ... SELECT ... WHERE
+    EXISTS cubre SQLite, donde el turno de escritura se toma en el propio INSERT.
+
+    Retorna (id, created_at) del voto, o None si el punto ya no está abierto.
+    Un voto duplicado (RD-01) lanza IntegrityError por uq_vote_agenda_owner.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        still_open = db.execute(
+            select(AgendaItem.id)
+            .where(AgendaItem.id == agenda_item_id, AgendaItem.status == "OPEN")
+            .with_for_update(read=True)
+        ).scalar_one_or_none()
+        if still_open is None:
+            return None
+
+    votes = Vote.__table__
+    created_at = datetime.now(timezone.utc)
+    item_open = exists().where(
+        AgendaItem.id == agenda_item_id,
+        AgendaItem.status == "OPEN",
+    )
+    stmt = (
+        insert(votes)
+        .from_select(
+            ["agenda_item_id", "owner_id", "value_encrypted", "created_at", "ip_address"],
+            select(
+                literal(agenda_item_id, votes.c.agenda_item_id.type),
+                literal(owner_id, votes.c.owner_id.type),
+                literal(value_encrypted, votes.c.value_encrypted.type),
+                literal(created_at, votes.c.created_at.type),
+                literal(ip_address, votes.c.ip_address.type),
+            ).where(item_open),
+        )
+        .returning(votes.c.id, votes.c.created_at)
+    )
+    return db.execute(stmt).first()
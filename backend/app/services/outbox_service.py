@@ -0,0 +1,347 @@
+"""
+backend/app/services/outbox_service.py
+
+Outbox transaccional y relay hacia el bus de eventos.
+
+Escritura:
+    emit / emit_many añaden filas a outbox_events en la sesión del cambio;
+    se confirman (o descartan) con él. Tras el commit se despierta al
+    relay para que la latencia no dependa del intervalo de sondeo.
+
+Publicación (OutboxRelay, un hilo por proceso):
+    Por cada shard y suscriptor lee los eventos con id mayor que su avance
+    (OUTBOX_BATCH_SIZE por ronda), los entrega en orden y por lotes al
+    manejador y después avanza el offset (en memoria o en
+    outbox_consumer_offsets si es durable). Si el manejador falla, el
+    offset no avanza y el lote se reintenta: entrega al-menos-una-vez.
+
+Huecos:
+    En PostgreSQL un id menor puede confirmarse después que uno mayor.
+    El relay solo entrega el prefijo contiguo de ids; un hueco se espera
+    hasta OUTBOX_GAP_TIMEOUT_MS (después se asume una transacción
+    abortada) para no saltarse eventos confirmados tarde.
+
+Con OUTBOX_NOTIFY_CHANNEL y PostgreSQL, un consumidor durable reenvía
+además cada evento con pg_notify para procesos externos (LISTEN).
+
+Los eventos no incluyen nunca el valor de un voto (RD-06).
+"""
+
+import json
+import logging
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import event, func, insert, select, text
+from sqlalchemy.orm import Session
+
+from app.core.config import Settings, get_settings
+from app.core.db import dialect_insert
+from app.core.events import DomainEvent, EventBus, Subscription, event_bus
+from app.core.sharding import shard_router
+from app.models import OutboxConsumerOffset, OutboxEvent
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Marca en Session.info: la transacción escribió eventos
+_PENDING_FLAG = "outbox_pending"
+
+
+def _payload_json(payload: Optional[dict]) -> str:
+    return json.dumps(payload or {}, separators=(",", ":"), default=str)
+
+
+def emit(
+    db: Session,
+    event_type: str,
+    *,
+    meeting_id: Optional[int],
+    entity_type: str,
+    entity_id: Optional[int] = None,
+    payload: Optional[dict] = None,
+) -> None:
+    """
+    Registra un evento en la transacción en curso. No hace commit.
+    """
+    db.add(
+        OutboxEvent(
+            event_type=event_type,
+            meeting_id=meeting_id,
+            entity_type=entity_type,
+            entity_id=entity_id,
+            payload_json=_payload_json(payload),
+            created_at=datetime.now(timezone.utc),
+        )
+    )
+    db.info[_PENDING_FLAG] = True
+
+
+def emit_many(db: Session, events: Iterable[dict]) -> None:
+    """
+    Registra varios eventos con un solo INSERT. No hace commit.
+
+    Cada elemento admite las mismas claves que emit (event_type,
+    meeting_id, entity_type, entity_id, payload).
+    """
+    now = datetime.now(timezone.utc)
+    rows = [
+        {
+            "event_type": item["event_type"],
+            "meeting_id": item.get("meeting_id"),
+            "entity_type": item["entity_type"],
+            "entity_id": item.get("entity_id"),
+            "payload_json": _payload_json(item.get("payload")),
+            "created_at": item.get("created_at", now),
+        }
+        for item in events
+    ]
+    if rows:
+        db.execute(insert(OutboxEvent), rows)
+        db.info[_PENDING_FLAG] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _wake_relay(session: Session) -> None:
+    if session.info.pop(_PENDING_FLAG, False):
+        outbox_relay.wake()
+
+
+@event.listens_for(Session, "after_rollback")
+def _clear_pending(session: Session) -> None:
+    session.info.pop(_PENDING_FLAG, None)
+
+
+class OutboxRelay:
+    """
+    Publica los eventos del outbox de todos los shards en el bus.
+    """
+
+    def __init__(self, cfg: Settings, bus: EventBus) -> None:
+        self._cfg = cfg
+        self._bus = bus
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._relay_lock = threading.Lock()
+        # (shard, primer id ausente) -> instante en que se detectó el hueco
+        self._gaps: Dict[Tuple[str, int], float] = {}
+        self.delivered = 0
+        self.errors = 0
+
+    # ---------- Ciclo de vida ----------
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        channel = self._cfg.OUTBOX_NOTIFY_CHANNEL
+        if channel and any(
+            shard_router.engine(shard).dialect.name == "postgresql"
+            for shard in shard_router.shard_names()
+        ):
+            name = f"pg_notify:{channel}"
+            if name not in {sub.name for sub in self._bus.subscriptions()}:
+                self._bus.subscribe(name, _pg_notify_handler(channel), durable=True)
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="outbox-relay", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Detiene el hilo tras una última ronda de publicación.
+        """
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._wake.set()
+        self._thread.join()
+        self._thread = None
+        try:
+            self.relay_once()
+        except Exception:
+            logger.exception("Outbox: fallo en la última ronda; se publicará al reiniciar.")
+
+    def wake(self) -> None:
+        self._wake.set()
+
+    def _loop(self) -> None:
+        interval = self._cfg.OUTBOX_RELAY_INTERVAL_MS / 1000.0
+        while not self._stop.is_set():
+            self._wake.wait(interval)
+            self._wake.clear()
+            if self._stop.is_set():
+                break
+            try:
+                self.relay_once()
+            except Exception:
+                self.errors += 1
+                logger.exception("Outbox: fallo en la ronda de publicación.")
+
+    # ---------- Publicación ----------
+
+    def relay_once(self) -> int:
+        """
+        Ejecuta una ronda sobre todos los shards. Retorna los eventos entregados.
+        """
+        subscriptions = self._bus.subscriptions()
+        if not subscriptions:
+            return 0
+        delivered = 0
+        with self._relay_lock:
+            for shard in shard_router.shard_names():
+                delivered += self._relay_shard(shard, subscriptions)
+        self.delivered += delivered
+        return delivered
+
+    def _relay_shard(self, shard: str, subscriptions: Sequence[Subscription]) -> int:
+        bind = shard_router.engine(shard)
+        events = OutboxEvent.__table__
+        offsets_table = OutboxConsumerOffset.__table__
+        batch_size = self._cfg.OUTBOX_BATCH_SIZE
+
+        with bind.connect() as conn:
+            durable_offsets = dict(
+                conn.execute(
+                    select(offsets_table.c.consumer, offsets_table.c.last_event_id).where(
+                        offsets_table.c.consumer.in_([sub.name for sub in subscriptions if sub.durable])
+                    )
+                ).all()
+            )
+            offsets: Dict[str, int] = {}
+            for sub in subscriptions:
+                if sub.durable:
+                    offsets[sub.name] = durable_offsets.get(sub.name, 0)
+                else:
+                    if shard not in sub.offsets:
+                        # Suscripción efímera nueva: empieza en el último evento actual
+                        sub.offsets[shard] = conn.execute(
+                            select(func.coalesce(func.max(events.c.id), 0))
+                        ).scalar_one()
+                    offsets[sub.name] = sub.offsets[shard]
+
+            # Una lectura por avance distinto (los suscriptores al día la comparten)
+            windows: Dict[int, Tuple[List[DomainEvent], int]] = {}
+            for after in set(offsets.values()):
+                rows = conn.execute(
+                    select(events).where(events.c.id > after).order_by(events.c.id).limit(batch_size)
+                ).all()
+                high = self._contiguous_high(shard, after, [row.id for row in rows])
+                windows[after] = (
+                    [
+                        DomainEvent(
+                            id=row.id,
+                            shard=shard,
+                            event_type=row.event_type,
+                            meeting_id=row.meeting_id,
+                            entity_type=row.entity_type,
+                            entity_id=row.entity_id,
+                            payload=json.loads(row.payload_json),
+                            created_at=row.created_at,
+                        )
+                        for row in rows
+                        if row.id <= high
+                    ],
+                    high,
+                )
+
+        delivered = 0
+        for sub in subscriptions:
+            after = offsets[sub.name]
+            window, high = windows[after]
+            if high <= after:
+                continue
+            batch = [item for item in window if sub.accepts(item)]
+            try:
+                if batch:
+                    sub.handler(batch)
+            except Exception:
+                self.errors += 1
+                logger.exception("Outbox: el suscriptor %s falló; se reintentará el lote.", sub.name)
+                continue
+            if sub.durable:
+                self._save_offset(shard, sub.name, high)
+            else:
+                sub.offsets[shard] = high
+            delivered += len(batch)
+        return delivered
+
+    def _contiguous_high(self, shard: str, after: int, ids: Sequence[int]) -> int:
+        """
+        Último id del prefijo contiguo a partir de after (huecos con espera).
+        """
+        now = time.monotonic()
+        timeout = self._cfg.OUTBOX_GAP_TIMEOUT_MS / 1000.0
+        high = after
+        for event_id in ids:
+            if event_id != high + 1:
+                first_seen = self._gaps.setdefault((shard, high + 1), now)
+                if now - first_seen < timeout:
+                    break
+            high = event_id
+        for key in [key for key in self._gaps if key[0] == shard and key[1] <= high]:
+            del self._gaps[key]
+        return high
+
+    def _save_offset(self, shard: str, consumer: str, last_event_id: int) -> None:
+        now = datetime.now(timezone.utc)
+        with shard_router.engine(shard).begin() as conn:
+            conn.execute(
+                dialect_insert(conn, OutboxConsumerOffset.__table__)
+                .values(consumer=consumer, last_event_id=last_event_id, updated_at=now)
+                .on_conflict_do_update(
+                    index_elements=["consumer"],
+                    set_={"last_event_id": last_event_id, "updated_at": now},
+                )
+            )
+
+    def stats(self) -> dict:
+        return {
+            "subscribers": [sub.name for sub in self._bus.subscriptions()],
+            "delivered": self.delivered,
+            "errors": self.errors,
+            "pending_gaps": len(self._gaps),
+        }
+
+
+def _pg_notify_handler(channel: str):
+    """
+    Manejador que reenvía los eventos por NOTIFY en su propio shard.
+    """
+
+    def handler(events: Sequence[DomainEvent]) -> None:
+        by_shard: Dict[str, List[DomainEvent]] = defaultdict(list)
+        for item in events:
+            by_shard[item.shard].append(item)
+        for shard, shard_events in by_shard.items():
+            bind = shard_router.engine(shard)
+            if bind.dialect.name != "postgresql":
+                continue
+            with bind.begin() as conn:
+                for item in shard_events:
+                    conn.execute(
+                        text("SELECT pg_notify(:channel, :payload)"),
+                        {
+                            "channel": channel,
+                            "payload": json.dumps(
+                                {
+                                    "id": item.id,
+                                    "shard": item.shard,
+                                    "event_type": item.event_type,
+                                    "meeting_id": item.meeting_id,
+                                    "entity_type": item.entity_type,
+                                    "entity_id": item.entity_id,
+                                    "payload": item.payload,
+                                },
+                                separators=(",", ":"),
+                                default=str,
+                            ),
+                        },
+                    )
+
+    return handler
+
+
+outbox_relay = OutboxRelay(settings, event_bus)
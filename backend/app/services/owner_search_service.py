@@ -0,0 +1,429 @@
+"""
+backend/app/services/owner_search_service.py
+
+Búsqueda de propietarios para las mesas de check-in.
+
+El personal de la puerta busca mientras escribe por nombre parcial,
+número de unidad o correo. Un ILIKE '%x%' sobre owners recorre la tabla
+en cada tecla, así que cada proceso mantiene un índice en memoria por
+conjunto, construido con una sola consulta (owners + users) la primera
+vez que se busca en él:
+
+    - Tokens normalizados (minúsculas, sin tildes) del nombre, la unidad
+      (también compactada: "T2-301" -> "t2301") y la parte local del
+      correo, en una lista ordenada: un prefijo se resuelve con bisect.
+    - Índice invertido de trigramas sobre las palabras distintas para
+      coincidencias en mitad de palabra (términos de 3+ caracteres).
+
+Cada término de la consulta debe coincidir (AND). Se ordena por unidad
+exacta, palabras completas, coincidencia de prefijo en todos los
+términos y por último por nombre. El estado de presencia en la asamblea
+actual se resuelve con una consulta por índice (meeting_id, owner_id)
+limitada a los propietarios devueltos.
+
+Invalidación:
+    - Los cambios ORM en Owner (o en el correo de un User) marcan el
+      conjunto al hacer flush y lo invalidan tras el commit.
+    - Las escrituras fuera del ORM y las de otros workers se recogen al
+      vencer OWNER_SEARCH_TTL_SECONDS.
+"""
+
+import heapq
+import logging
+import re
+import threading
+import time
+import unicodedata
+from bisect import bisect_left
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence, Set
+
+from pydantic import TypeAdapter
+from sqlalchemy import case, event, inspect, select
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.models import Meeting, Owner, Presence, User
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Marca en Session.info: conjuntos cuyo índice cambia al confirmar
+_DIRTY_KEY = "owner_search_dirty"
+# Invalida todos los índices (p. ej. cambió el correo de un usuario)
+_ALL = -1
+
+_NON_ALNUM = re.compile(r"[^0-9a-z]+")
+
+MAX_LIMIT = 50
+
+
+def normalize(text: Optional[str]) -> str:
+    """
+    Minúsculas sin tildes; todo lo que no es letra o dígito pasa a espacio.
+    """
+    if not text:
+        return ""
+    if not text.isascii():
+        # "Muñoz" -> "Munoz": se descompone y se descartan las marcas
+        text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii")
+    return _NON_ALNUM.sub(" ", text.lower()).strip()
+
+
+def _email_local_part(email: Optional[str]) -> str:
+    # El dominio se repite en todo el conjunto y no distingue a nadie
+    return normalize(email.partition("@")[0]) if email else ""
+
+
+def _trigrams(text: str) -> Set[str]:
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+# ================== DTOs ==================
+
+
+@dataclass(slots=True)
+class OwnerSearchRow:
+    """Coincidencia (misma forma que OwnerSearchHit)."""
+
+    owner_id: int
+    name: str
+    unit: Optional[str]
+    email: Optional[str]
+    coeficiente: float
+    is_in_debt: bool
+    present: bool = False
+    checked_in_at: Optional[datetime] = None
+
+
+@dataclass(slots=True)
+class OwnerSearchPage:
+    """Resultado de búsqueda (misma forma que OwnerSearchResult)."""
+
+    condominium_id: int
+    meeting_id: Optional[int]
+    query: str
+    total: int
+    owners: List[OwnerSearchRow] = field(default_factory=list)
+
+
+OWNER_SEARCH_ADAPTER = TypeAdapter(OwnerSearchPage)
+
+
+# ================== ÍNDICE ==================
+
+
+class CondominiumOwnerIndex:
+    """
+    Índice inmutable de los propietarios de un conjunto.
+
+    Las posiciones siguen el orden por nombre, de modo que ordenar por
+    posición es ordenar por nombre.
+    """
+
+    def __init__(self, condominium_id: int, rows: Sequence[tuple]) -> None:
+        self.condominium_id = condominium_id
+        self.built_at = time.monotonic()
+        entries = sorted(
+            ((normalize(row[1]), row) for row in rows),
+            key=lambda item: (item[0], item[1][0]),
+        )
+        self.entries: List[OwnerSearchRow] = []
+        self._units: Dict[str, List[int]] = defaultdict(list)
+        postings: Dict[str, List[int]] = defaultdict(list)
+        for pos, (name_key, (owner_id, name, unit, email, coeficiente, is_in_debt)) in enumerate(entries):
+            self.entries.append(
+                OwnerSearchRow(
+                    owner_id=owner_id,
+                    name=name,
+                    unit=unit,
+                    email=email,
+                    coeficiente=coeficiente,
+                    is_in_debt=is_in_debt,
+                )
+            )
+            unit_key = normalize(unit)
+            compact_unit = unit_key.replace(" ", "")
+            if compact_unit:
+                self._units[compact_unit].append(pos)
+            words = f"{name_key} {unit_key} {compact_unit} {_email_local_part(email)}".split()
+            for token in set(words):
+                postings[token].append(pos)
+
+        # Palabras distintas (los nombres se repiten mucho): prefijos por
+        # bisect y trigramas por palabra, no por propietario
+        self._tokens = sorted(postings)
+        self._postings = [postings[token] for token in self._tokens]
+        trigrams: Dict[str, List[int]] = defaultdict(list)
+        for token_id, token in enumerate(self._tokens):
+            for gram in _trigrams(token):
+                trigrams[gram].append(token_id)
+        self._trigrams = {gram: frozenset(token_ids) for gram, token_ids in trigrams.items()}
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def _prefix_matches(self, term: str) -> tuple[Set[int], Set[int]]:
+        """
+        (posiciones con una palabra igual al término, con una palabra que empieza por él).
+        """
+        exact: Set[int] = set()
+        prefix: Set[int] = set()
+        tokens = self._tokens
+        i = bisect_left(tokens, term)
+        if i < len(tokens) and tokens[i] == term:
+            exact.update(self._postings[i])
+        while i < len(tokens) and tokens[i].startswith(term):
+            prefix.update(self._postings[i])
+            i += 1
+        return exact, prefix
+
+    def _infix_matches(self, term: str) -> Set[int]:
+        candidates = sorted(
+            (self._trigrams.get(gram, frozenset()) for gram in _trigrams(term)),
+            key=len,
+        )
+        if not candidates or not candidates[0]:
+            return set()
+        matches: Set[int] = set()
+        for token_id in candidates[0].intersection(*candidates[1:]):
+            if term in self._tokens[token_id]:
+                matches.update(self._postings[token_id])
+        return matches
+
+    def search(self, query: str, limit: int) -> tuple[List[OwnerSearchRow], int]:
+        """
+        Retorna (coincidencias ordenadas hasta `limit`, total de coincidencias).
+        """
+        if "@" in query:
+            # Un correo completo se busca por su parte local (el dominio no se indexa)
+            query = query.partition("@")[0]
+        normalized = normalize(query)
+        terms = sorted(set(normalized.split()), key=len, reverse=True)
+        if not terms:
+            return [], 0
+
+        matched: Optional[Set[int]] = None
+        all_exact: Optional[Set[int]] = None
+        all_prefix: Optional[Set[int]] = None
+        for term in terms:
+            exact, prefix = self._prefix_matches(term)
+            hits = prefix | self._infix_matches(term) if len(term) >= 3 else prefix
+            if matched is None:
+                matched, all_exact, all_prefix = hits, exact, prefix
+            else:
+                matched &= hits
+                all_exact &= exact
+                all_prefix &= prefix
+            if not matched:
+                return [], 0
+
+        exact_unit = set(self._units.get(normalized.replace(" ", ""), ()))
+
+        def rank(pos: int) -> tuple:
+            return (pos not in exact_unit, pos not in all_exact, pos not in all_prefix, pos)
+
+        best = heapq.nsmallest(limit, matched, key=rank)
+        return [self.entries[pos] for pos in best], len(matched)
+
+
+class OwnerSearchIndex:
+    """
+    Índices por conjunto del proceso, con LRU, TTL e invalidación explícita.
+    """
+
+    def __init__(self, ttl_seconds: float, max_condominiums: int) -> None:
+        self._ttl = ttl_seconds
+        self._max = max_condominiums
+        self._lock = threading.Lock()
+        self._build_locks: Dict[int, threading.Lock] = defaultdict(threading.Lock)
+        self._indexes: "OrderedDict[int, CondominiumOwnerIndex]" = OrderedDict()
+        self._generation: Dict[int, int] = defaultdict(int)
+        self.hits = 0
+        self.builds = 0
+        self.invalidations = 0
+        self.last_build_ms = 0.0
+
+    def _cached(self, condominium_id: int) -> Optional[CondominiumOwnerIndex]:
+        with self._lock:
+            index = self._indexes.get(condominium_id)
+            if index is None:
+                return None
+            if self._ttl > 0 and time.monotonic() - index.built_at > self._ttl:
+                del self._indexes[condominium_id]
+                return None
+            self._indexes.move_to_end(condominium_id)
+            return index
+
+    def get(self, db: Session, condominium_id: int) -> CondominiumOwnerIndex:
+        """
+        Índice del conjunto; lo construye (una consulta) si falta o venció.
+        """
+        index = self._cached(condominium_id)
+        if index is not None:
+            self.hits += 1
+            return index
+
+        # Una sola construcción por conjunto aunque lleguen varias búsquedas
+        with self._build_locks[condominium_id]:
+            index = self._cached(condominium_id)
+            if index is not None:
+                self.hits += 1
+                return index
+            with self._lock:
+                generation = self._generation[condominium_id]
+            start = time.perf_counter()
+            rows = db.execute(
+                select(Owner.id, Owner.name, Owner.unit, User.email, Owner.coeficiente, Owner.is_in_debt)
+                .outerjoin(User, User.id == Owner.user_id)
+                .where(Owner.condominium_id == condominium_id)
+            ).all()
+            index = CondominiumOwnerIndex(condominium_id, rows)
+            self.builds += 1
+            self.last_build_ms = (time.perf_counter() - start) * 1000.0
+            logger.debug(
+                "Índice de propietarios del conjunto %s: %s entradas en %.1f ms.",
+                condominium_id,
+                len(index),
+                self.last_build_ms,
+            )
+            with self._lock:
+                # Si se invalidó durante la construcción, se usa pero no se guarda
+                if self._generation[condominium_id] == generation:
+                    self._indexes[condominium_id] = index
+                    while len(self._indexes) > self._max:
+                        self._indexes.popitem(last=False)
+            return index
+
+    def invalidate(self, condominium_id: Optional[int] = None) -> None:
+        with self._lock:
+            self.invalidations += 1
+            if condominium_id is None:
+                for key in list(self._generation) + list(self._indexes):
+                    self._generation[key] += 1
+                self._indexes.clear()
+            else:
+                self._generation[condominium_id] += 1
+                self._indexes.pop(condominium_id, None)
+
+    def stats(self) -> dict:
+        with self._lock:
+            sizes = {cid: len(index) for cid, index in self._indexes.items()}
+        return {
+            "condominiums": len(sizes),
+            "owners": sum(sizes.values()),
+            "hits": self.hits,
+            "builds": self.builds,
+            "invalidations": self.invalidations,
+            "last_build_ms": self.last_build_ms,
+        }
+
+
+owner_search_index = OwnerSearchIndex(
+    settings.OWNER_SEARCH_TTL_SECONDS,
+    settings.OWNER_SEARCH_MAX_CONDOMINIUMS,
+)
+
+
+@event.listens_for(Session, "before_flush")
+def _collect_owner_changes(session: Session, flush_context, instances) -> None:
+    dirty: Set[int] = set()
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, Owner):
+            if obj.condominium_id is not None:
+                dirty.add(obj.condominium_id)
+            dirty.update(inspect(obj).attrs.condominium_id.history.deleted or ())
+        elif isinstance(obj, User) and obj not in session.new:
+            if obj in session.deleted or inspect(obj).attrs.email.history.has_changes():
+                dirty.add(_ALL)
+    if dirty:
+        session.info.setdefault(_DIRTY_KEY, set()).update(dirty)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session: Session) -> None:
+    dirty = session.info.pop(_DIRTY_KEY, None)
+    if not dirty:
+        return
+    if _ALL in dirty:
+        owner_search_index.invalidate()
+        return
+    for condominium_id in dirty:
+        owner_search_index.invalidate(condominium_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_owner_changes(session: Session) -> None:
+    session.info.pop(_DIRTY_KEY, None)
+
+
+# ================== CONSULTA ==================
+
+
+def current_meeting_id(
+    db: Session, *, condominium_id: int, meeting_id: Optional[int] = None
+) -> Optional[int]:
+    """
+    Asamblea cuyo estado de presencia se muestra.
+
+    Con meeting_id se valida que pertenezca al conjunto; sin él se elige la
+    asamblea en curso o, si no hay, la próxima sin cerrar.
+    """
+    stmt = select(Meeting.id).where(Meeting.condominium_id == condominium_id)
+    if meeting_id is not None:
+        return db.execute(stmt.where(Meeting.id == meeting_id)).scalar_one_or_none()
+    return db.execute(
+        stmt.where(Meeting.status != "CLOSED")
+        .order_by(case((Meeting.status == "IN_PROGRESS", 0), else_=1), Meeting.date)
+        .limit(1)
+    ).scalar_one_or_none()
+
+
+def search_owners(
+    db: Session,
+    *,
+    condominium_id: int,
+    query: str,
+    limit: int = 20,
+    meeting_id: Optional[int] = None,
+) -> OwnerSearchPage:
+    """
+    Busca propietarios del conjunto y adjunta su presencia en la asamblea.
+    """
+    index = owner_search_index.get(db, condominium_id)
+    entries, total = index.search(query, max(1, min(limit, MAX_LIMIT)))
+
+    owners = [
+        OwnerSearchRow(
+            owner_id=entry.owner_id,
+            name=entry.name,
+            unit=entry.unit,
+            email=entry.email,
+            coeficiente=entry.coeficiente,
+            is_in_debt=entry.is_in_debt,
+        )
+        for entry in entries
+    ]
+    if meeting_id is not None and owners:
+        checked_in = dict(
+            db.execute(
+                select(Presence.owner_id, Presence.created_at).where(
+                    Presence.meeting_id == meeting_id,
+                    Presence.owner_id.in_([row.owner_id for row in owners]),
+                )
+            ).all()
+        )
+        for row in owners:
+            if row.owner_id in checked_in:
+                row.present = True
+                row.checked_in_at = checked_in[row.owner_id]
+
+    return OwnerSearchPage(
+        condominium_id=condominium_id,
+        meeting_id=meeting_id,
+        query=query,
+        total=total,
+        owners=owners,
+    )
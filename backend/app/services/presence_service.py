@@ -0,0 +1,282 @@
+"""
+backend/app/services/presence_service.py
+
+Servicio de registro de presencias (check-in) en AgoraX.
+
+Implementa el check-in masivo usado en la puerta de la asamblea:
+- Valida todos los propietarios contra el conjunto de la asamblea en una
+  sola consulta.
+- Inserta las presencias en bloque con ON CONFLICT DO NOTHING sobre
+  uq_presence_meeting_owner (reintentos y escaneos repetidos son inocuos).
+- Escribe un único registro de auditoría y los eventos PRESENCE_REGISTERED
+  (outbox) en la misma transacción.
+- Registra también a los representados por poder de los apoderados que
+  hacen check-in (delegation_service.register_represented_presences).
+- Recalcula el quórum una sola vez.
+
+También emite los tokens de check-in firmados de una asamblea (en un solo
+lote) y registra presencias a partir de ellos sin consultar Owner (solo el
+estado de la asamblea: una asamblea cerrada no admite presencias, RD-05).
+
+Reglas de negocio relacionadas:
+- RB-03: El usuario debe confirmar asistencia antes de votar.
+- RD-04: El coeficiente de cada propietario se usa para el quórum.
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, List
+
+from fastapi import HTTPException, status
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core import events
+from app.core.checkin_tokens import CheckinClaims, issue_checkin_token
+from app.core.config import get_settings
+from app.core.db import dialect_insert
+from app.models import Meeting, Owner, Presence
+from app.schemas.meeting_schema import CheckinTokenRead, PresenceBulkResult, PresenceScanResult
+from app.services import delegation_service, outbox_service
+from app.services.audit_service import log_action
+from app.services.quorum_service import calculate_quorum_status
+
+settings = get_settings()
+
+
+def _http_error(detail: str, status_code: int = status.HTTP_400_BAD_REQUEST) -> HTTPException:
+    return HTTPException(status_code=status_code, detail=detail)
+
+
+def ensure_meeting_accepts_presence(db: Session, meeting_id: int) -> int:
+    """
+    Comprueba que la asamblea existe y no está cerrada; devuelve su conjunto.
+
+    Errores (HTTPException):
+        - 404 si la asamblea no existe (o ya está archivada).
+        - 400 si está cerrada (RD-05).
+    """
+    meeting = db.execute(
+        select(Meeting.condominium_id, Meeting.status).where(Meeting.id == meeting_id)
+    ).first()
+    if meeting is None:
+        raise _http_error("Asamblea no encontrada.", status.HTTP_404_NOT_FOUND)
+    if meeting.status == "CLOSED":
+        raise _http_error("No se pueden registrar presencias en una asamblea cerrada.")
+    return meeting.condominium_id
+
+
+def _insert_presences_ignoring_duplicates(db: Session, rows: List[dict]):
+    """
+    Construye el INSERT de presencias con ON CONFLICT DO NOTHING y RETURNING owner_id.
+    """
+    stmt = dialect_insert(db, Presence.__table__).values(rows)
+    if db.get_bind().dialect.name == "postgresql":
+        stmt = stmt.on_conflict_do_nothing(constraint="uq_presence_meeting_owner")
+    else:
+        stmt = stmt.on_conflict_do_nothing(index_elements=["meeting_id", "owner_id"])
+    return stmt.returning(Presence.owner_id)
+
+
+def bulk_register_presence(
+    db: Session,
+    *,
+    meeting_id: int,
+    condominium_id: int,
+    owner_ids: Iterable[int],
+    user_id: int | None,
+) -> PresenceBulkResult:
+    """
+    Registra la presencia de varios propietarios en una asamblea.
+
+    Parámetros:
+        db: Sesión de base de datos.
+        meeting_id: Asamblea en la que se registra la asistencia.
+        condominium_id: Conjunto de la asamblea (los propietarios deben pertenecer a él).
+        owner_ids: IDs escaneados en la puerta (se ignoran duplicados).
+        user_id: Usuario que ejecuta el check-in (para auditoría).
+
+    Retorna:
+        PresenceBulkResult con registrados, ya presentes, rechazados y el quórum.
+    """
+    requested = list(dict.fromkeys(owner_ids))
+
+    coeficientes = dict(
+        db.execute(
+            select(Owner.id, Owner.coeficiente).where(
+                Owner.id.in_(requested),
+                Owner.condominium_id == condominium_id,
+            )
+        ).all()
+    )
+    rejected = [owner_id for owner_id in requested if owner_id not in coeficientes]
+
+    registered: set[int] = set()
+    if coeficientes:
+        now = datetime.now(timezone.utc)
+        stmt = _insert_presences_ignoring_duplicates(
+            db,
+            [
+                {
+                    "meeting_id": meeting_id,
+                    "owner_id": owner_id,
+                    "coeficiente": coeficiente,
+                    "created_at": now,
+                }
+                for owner_id, coeficiente in coeficientes.items()
+            ],
+        )
+        registered = set(db.execute(stmt).scalars())
+
+    registered_ids = [owner_id for owner_id in requested if owner_id in registered]
+    already_present = [
+        owner_id
+        for owner_id in requested
+        if owner_id in coeficientes and owner_id not in registered
+    ]
+    represented = [
+        owner_id
+        for owner_id, _ in delegation_service.register_represented_presences(
+            db, meeting_id=meeting_id, owner_ids=coeficientes.keys()
+        )
+    ]
+
+    if registered_ids or represented:
+        outbox_service.emit_many(
+            db,
+            (
+                {
+                    "event_type": events.PRESENCE_REGISTERED,
+                    "meeting_id": meeting_id,
+                    "entity_type": "Owner",
+                    "entity_id": owner_id,
+                    "payload": {"coeficiente": coeficientes[owner_id]},
+                }
+                for owner_id in registered_ids
+            ),
+        )
+        log_action(
+            db,
+            user_id=user_id,
+            action="REGISTER_PRESENCE_BULK",
+            entity_type="Meeting",
+            entity_id=meeting_id,
+            description=(
+                f"Check-in masivo: {len(registered_ids)} presencias registradas, "
+                f"owner_ids={registered_ids}, representados={represented}"
+            ),
+            commit=False,
+        )
+    db.commit()
+
+    return PresenceBulkResult(
+        registered=registered_ids,
+        already_present=already_present,
+        rejected=rejected,
+        represented=represented,
+        quorum=calculate_quorum_status(db, meeting_id),
+    )
+
+
+def issue_checkin_tokens(db: Session, *, meeting_id: int) -> List[CheckinTokenRead]:
+    """
+    Emite en un solo lote los tokens de check-in de todos los propietarios
+    del conjunto de una asamblea.
+
+    Usa una consulta para la asamblea y otra para los propietarios; la firma
+    se calcula en memoria.
+
+    Excepciones:
+        - ValueError si la asamblea no existe.
+    """
+    condominium_id = db.execute(
+        select(Meeting.condominium_id).where(Meeting.id == meeting_id)
+    ).scalar_one_or_none()
+    if condominium_id is None:
+        raise ValueError(f"Asamblea con id {meeting_id} no encontrada.")
+
+    expires = datetime.now(timezone.utc) + timedelta(hours=settings.CHECKIN_TOKEN_TTL_HOURS)
+    expires_ts = int(expires.timestamp())
+    owners = db.execute(
+        select(Owner.id, Owner.name, Owner.coeficiente)
+        .where(Owner.condominium_id == condominium_id)
+        .order_by(Owner.id)
+    )
+    return [
+        CheckinTokenRead(
+            owner_id=owner_id,
+            owner_name=name,
+            token=issue_checkin_token(
+                meeting_id=meeting_id,
+                owner_id=owner_id,
+                coeficiente=coeficiente,
+                expires_at=expires_ts,
+            ),
+            expires_at=expires,
+        )
+        for owner_id, name, coeficiente in owners
+    ]
+
+
+def register_presence_from_token(
+    db: Session,
+    *,
+    claims: CheckinClaims,
+    user_id: int | None,
+) -> PresenceScanResult:
+    """
+    Registra la presencia descrita por un token de check-in ya verificado.
+
+    No consulta Owner: el coeficiente y los IDs vienen firmados. Sí
+    comprueba que la asamblea exista y no esté cerrada, porque un token
+    sigue siendo válido hasta su expiración.
+    Un escaneo repetido no falla; devuelve registered=False.
+    """
+    ensure_meeting_accepts_presence(db, claims.meeting_id)
+    stmt = _insert_presences_ignoring_duplicates(
+        db,
+        [
+            {
+                "meeting_id": claims.meeting_id,
+                "owner_id": claims.owner_id,
+                "coeficiente": claims.coeficiente,
+                "created_at": datetime.now(timezone.utc),
+            }
+        ],
+    )
+    registered = db.execute(stmt).first() is not None
+    represented = [
+        owner_id
+        for owner_id, _ in delegation_service.register_represented_presences(
+            db, meeting_id=claims.meeting_id, owner_ids=[claims.owner_id]
+        )
+    ]
+
+    if registered:
+        outbox_service.emit(
+            db,
+            events.PRESENCE_REGISTERED,
+            meeting_id=claims.meeting_id,
+            entity_type="Owner",
+            entity_id=claims.owner_id,
+            payload={"coeficiente": claims.coeficiente},
+        )
+        log_action(
+            db,
+            user_id=user_id,
+            action="REGISTER_PRESENCE",
+            entity_type="Meeting",
+            entity_id=claims.meeting_id,
+            description=(
+                f"Presencia registrada por token para owner_id={claims.owner_id}, "
+                f"coeficiente={claims.coeficiente}"
+            ),
+            commit=False,
+        )
+    db.commit()
+
+    return PresenceScanResult(
+        owner_id=claims.owner_id,
+        coeficiente=claims.coeficiente,
+        registered=registered,
+        represented=represented,
+    )
@@ -17,15 +17,72 @@ Reglas de negocio relacionadas:
 from typing import List, Dict, Any
 
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import func
+from sqlalchemy import func, select
 
 from app.core.config import get_settings
+from app.core.tracing import traced
 from app.models import Meeting, Condominium, Presence, Owner
 from app.schemas.quorum_schema import QuorumStatus, QuorumDetail
 
 settings = get_settings()
 
 
+def build_quorum_status(
+    meeting_id: int,
+    presentes_coeficiente: float,
+    coeficiente_total: float,
+) -> QuorumStatus:
+    """
+    Construye el resumen de quórum a partir de los coeficientes ya sumados.
+
+    Compara el porcentaje contra QUORUM_MIN (RD-04).
+    """
+    coeficiente_total = coeficiente_total or 0.0
+    if coeficiente_total <= 0:
+        porcentaje_quorum = 0.0
+    else:
+        porcentaje_quorum = (presentes_coeficiente / coeficiente_total) * 100.0
+
+    return QuorumStatus(
+        meeting_id=meeting_id,
+        presentes_coeficiente=float(presentes_coeficiente),
+        coeficiente_total=float(coeficiente_total),
+        porcentaje_quorum=float(round(porcentaje_quorum, 2)),
+        cumple_quorum=bool(porcentaje_quorum >= settings.QUORUM_MIN),
+    )
+
+
+@traced("quorum.calculate_status")
+def calculate_quorum_status(db: Session, meeting_id: int) -> QuorumStatus:
+    """
+    Calcula solo el resumen de quórum, sin cargar el detalle de presentes.
+
+    Usa una única consulta agregada (conjunto + suma de coeficientes), por lo
+    que es adecuada para recalcular el quórum después de cada check-in.
+
+    Excepciones:
+        - ValueError si la asamblea no existe.
+    """
+    presentes = (
+        select(func.coalesce(func.sum(Presence.coeficiente), 0.0))
+        .where(Presence.meeting_id == meeting_id)
+        .scalar_subquery()
+    )
+    row = db.execute(
+        select(Condominium.coeficiente_total, presentes)
+        .select_from(Meeting)
+        .join(Condominium, Condominium.id == Meeting.condominium_id)
+        .where(Meeting.id == meeting_id)
+    ).first()
+
+    if row is None:
+        raise ValueError(f"Asamblea con id {meeting_id} no encontrada.")
+
+    coeficiente_total, presentes_coeficiente = row
+    return build_quorum_status(meeting_id, presentes_coeficiente, coeficiente_total)
+
+
+@traced("quorum.calculate")
 def calculate_quorum(db: Session, meeting_id: int) -> QuorumDetail:
     """
     Calcula el estado de quórum para una asamblea dada.
@@ -77,20 +134,7 @@ def calculate_quorum(db: Session, meeting_id: int) -> QuorumDetail:
         .scalar()
     )
 
-    if coeficiente_total <= 0:
-        porcentaje_quorum = 0.0
-    else:
-        porcentaje_quorum = (presentes_coeficiente / coeficiente_total) * 100.0
-
-    cumple_quorum = porcentaje_quorum >= settings.QUORUM_MIN
-
-    status = QuorumStatus(
-        meeting_id=meeting_id,
-        presentes_coeficiente=float(presentes_coeficiente),
-        coeficiente_total=float(coeficiente_total),
-        porcentaje_quorum=float(round(porcentaje_quorum, 2)),
-        cumple_quorum=bool(cumple_quorum),
-    )
+    status = build_quorum_status(meeting_id, presentes_coeficiente, coeficiente_total)
 
     # Detalle de presentes (para UI / reportes)
     presentes_list: List[Dict[str, Any]] = []
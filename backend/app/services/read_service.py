@@ -0,0 +1,179 @@
+"""
+backend/app/services/read_service.py
+
+Ruta de lectura liviana para los endpoints de consulta de AgoraX.
+
+En lugar de cargar instancias ORM completas (con sus cascadas selectin hacia
+condominium, owners, presences, votes...) para luego copiarlas a modelos
+Pydantic, aquí se seleccionan solo las columnas necesarias y se construyen
+DTOs con slots. Cada DTO tiene un TypeAdapter precompilado para serializar
+directamente a JSON (ver core/serialization.py).
+
+get_meeting_validators da la versión de una asamblea para las respuestas
+condicionales (ETag / 304) de todas sus rutas GET.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import TypeAdapter
+from sqlalchemy import func, select, union_all
+from sqlalchemy.orm import Session
+
+from app.core.http_cache import Validators
+from app.models import AgendaItem, Meeting, MeetingArchive, OutboxEvent, Vote
+
+
+# ================== DTOs ==================
+
+
+@dataclass(slots=True)
+class VoteRow:
+    """Voto sin valor cifrado (misma forma que VoteResponse)."""
+
+    id: int
+    agenda_item_id: int
+    owner_id: int
+    created_at: datetime
+
+
+@dataclass(slots=True)
+class MeetingRow:
+    """Resumen de asamblea (misma forma que MeetingSummary)."""
+
+    id: int
+    title: str
+    date: datetime
+    status: str
+
+
+@dataclass(slots=True)
+class AgendaItemRow:
+    """Punto de agenda (misma forma que AgendaItemDetail)."""
+
+    title: str
+    id: int
+    status: str
+
+
+@dataclass(slots=True)
+class MeetingDetailRow:
+    """Detalle de asamblea (misma forma que MeetingDetail)."""
+
+    id: int
+    title: str
+    date: datetime
+    status: str
+    condominium_id: int
+    total_propietarios: int
+    agenda_items: List[AgendaItemRow] = field(default_factory=list)
+
+
+# TypeAdapters precompilados (se construyen una sola vez al importar)
+VOTE_ROWS_ADAPTER = TypeAdapter(List[VoteRow])
+MEETING_ROWS_ADAPTER = TypeAdapter(List[MeetingRow])
+MEETING_DETAIL_ADAPTER = TypeAdapter(MeetingDetailRow)
+
+
+# ================== CONSULTAS ==================
+
+
+def agenda_item_exists(db: Session, *, meeting_id: int, agenda_item_id: int) -> bool:
+    """
+    Indica si el punto de agenda existe y pertenece a la asamblea.
+    """
+    return (
+        db.execute(
+            select(AgendaItem.id).where(
+                AgendaItem.id == agenda_item_id,
+                AgendaItem.meeting_id == meeting_id,
+            )
+        ).first()
+        is not None
+    )
+
+
+def list_vote_rows(db: Session, *, agenda_item_id: int) -> List[VoteRow]:
+    """
+    Lista los votos de un punto de agenda seleccionando solo las columnas públicas.
+    """
+    result = db.execute(
+        select(Vote.id, Vote.agenda_item_id, Vote.owner_id, Vote.created_at)
+        .where(Vote.agenda_item_id == agenda_item_id)
+        .order_by(Vote.created_at.asc())
+    )
+    return [VoteRow(*row) for row in result]
+
+
+def list_meeting_rows(db: Session) -> List[MeetingRow]:
+    """
+    Lista las asambleas (más recientes primero) sin cargar relaciones.
+
+    Incluye las archivadas (archive_service) desde meeting_archives.
+    """
+    rows = union_all(
+        select(Meeting.id, Meeting.title, Meeting.date, Meeting.status),
+        select(
+            MeetingArchive.meeting_id,
+            MeetingArchive.title,
+            MeetingArchive.date,
+            MeetingArchive.status,
+        ),
+    ).subquery()
+    result = db.execute(select(rows).order_by(rows.c.date.desc()))
+    return [MeetingRow(*row) for row in result]
+
+
+def get_meeting_detail_row(db: Session, *, meeting_id: int) -> Optional[MeetingDetailRow]:
+    """
+    Obtiene el detalle de una asamblea y sus puntos de agenda en dos consultas de columnas.
+    """
+    row = db.execute(
+        select(
+            Meeting.id,
+            Meeting.title,
+            Meeting.date,
+            Meeting.status,
+            Meeting.condominium_id,
+            Meeting.total_propietarios,
+        ).where(Meeting.id == meeting_id)
+    ).first()
+    if row is None:
+        return None
+
+    items = db.execute(
+        select(AgendaItem.title, AgendaItem.id, AgendaItem.status)
+        .where(AgendaItem.meeting_id == meeting_id)
+        .order_by(AgendaItem.id)
+    )
+    return MeetingDetailRow(*row, agenda_items=[AgendaItemRow(*item) for item in items])
+
+
+def get_meeting_validators(db: Session, *, meeting_id: int) -> Optional[Validators]:
+    """
+    Versión actual de una asamblea como validadores HTTP.
+
+    Todo cambio de agenda, presencias, estados o votos emite un evento
+    del outbox en la misma transacción, así que la versión se deriva de
+    esos eventos: último id y cantidad. La cantidad cubre el caso de
+    PostgreSQL en que un id menor se confirma después que uno mayor (el
+    máximo no cambiaría). Se resuelve sobre el índice (meeting_id, id),
+    sin cargar la asamblea ni bloquear a los escritores.
+
+    Retorna None si la asamblea no tiene eventos (p. ej. datos anteriores
+    al outbox): la ruta responde sin validadores.
+    """
+    row = db.execute(
+        select(
+            func.max(OutboxEvent.id).label("last_id"),
+            func.count().label("total"),
+            func.max(OutboxEvent.created_at).label("last_at"),
+        ).where(OutboxEvent.meeting_id == meeting_id)
+    ).one()
+    if not row.total:
+        return None
+    return Validators(
+        etag=f'W/"m{meeting_id}-v{row.last_id}.{row.total}"',
+        last_modified=row.last_at,
+    )
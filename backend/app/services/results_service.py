@@ -0,0 +1,187 @@
+"""
+backend/app/services/results_service.py
+
+Escrutinio materializado de los puntos de agenda.
+
+Cuando un punto pasa a CLOSED se descifran sus votos una sola vez (en
+lote), se cuentan por opción (número de votos y coeficiente), se evalúa
+el umbral de mayoría del punto y se guarda el resultado en
+agenda_item_results junto con la respuesta JSON ya serializada.
+
+Reglas de negocio relacionadas:
+- RD-05: Los resultados no pueden modificarse tras el cierre.
+- RB-09: Resultados visibles solo al cierre de todas las votaciones.
+- RD-04 / RD-10: La mayoría se mide sobre coeficientes (presentes o totales).
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.core.db import dialect_insert
+from app.core.vote_crypto import decrypt_vote_values, vote_aad
+from app.models import AgendaItem, AgendaItemResult, Condominium, Meeting, Owner, Presence, Vote
+from app.schemas.vote_schema import AgendaItemResultRead, OptionResult
+from app.services.rule_registry import RULES_VERSION
+
+# Opción que cuenta como voto a favor al evaluar la mayoría
+APPROVAL_OPTION = "SI"
+
+# Mayoría absoluta: siempre se exige más de la mitad, además del umbral del punto
+_ABSOLUTE_MAJORITY_PCT = 50.0
+
+
+@dataclass(slots=True)
+class StoredResult:
+    """
+    Resultado leído de agenda_item_results.
+
+    pending_items indica si la asamblea aún tiene puntos sin cerrar (RB-09).
+    """
+
+    payload_json: str
+    computed_at: datetime
+    pending_items: bool
+
+
+def normalize_option(value: str) -> str:
+    """
+    Normaliza una opción de voto para el conteo ('sí ' -> 'SI').
+    """
+    return value.strip().upper().replace("Í", "I")
+
+
+def _basis_weight(db: Session, agenda_item: AgendaItem) -> float:
+    if agenda_item.threshold_basis == "TOTAL":
+        total = db.execute(
+            select(Condominium.coeficiente_total)
+            .join(Meeting, Meeting.condominium_id == Condominium.id)
+            .where(Meeting.id == agenda_item.meeting_id)
+        ).scalar_one_or_none()
+    else:
+        total = db.execute(
+            select(func.coalesce(func.sum(Presence.coeficiente), 0.0)).where(
+                Presence.meeting_id == agenda_item.meeting_id
+            )
+        ).scalar_one()
+    return float(total or 0.0)
+
+
+def compute_agenda_item_result(db: Session, agenda_item: AgendaItem) -> AgendaItemResultRead:
+    """
+    Calcula y guarda el resultado de un punto que se está cerrando.
+
+    No hace commit: se confirma en la misma transacción que el cambio de
+    estado. Si ya existía un resultado (cierre concurrente) no se reescribe.
+
+    Excepciones:
+        - VoteDecryptionError si algún voto no se puede descifrar.
+    """
+    rows = db.execute(
+        select(Vote.owner_id, Vote.value_encrypted, Owner.coeficiente)
+        .join(Owner, Owner.id == Vote.owner_id)
+        .where(Vote.agenda_item_id == agenda_item.id)
+    ).all()
+
+    values = decrypt_vote_values(
+        [row.value_encrypted for row in rows],
+        associated_data=[vote_aad(agenda_item.id, row.owner_id) for row in rows],
+    )
+
+    tally: Dict[str, List[float]] = {}
+    total_weight = 0.0
+    for row, value in zip(rows, values):
+        entry = tally.setdefault(normalize_option(value), [0, 0.0])
+        entry[0] += 1
+        entry[1] += row.coeficiente
+        total_weight += row.coeficiente
+
+    total_votes = len(rows)
+    basis_weight = _basis_weight(db, agenda_item)
+    approving_weight = tally.get(APPROVAL_OPTION, [0, 0.0])[1]
+    approval_pct = (approving_weight / basis_weight) * 100.0 if basis_weight > 0 else 0.0
+    approved = (
+        approval_pct > _ABSOLUTE_MAJORITY_PCT
+        and approval_pct >= agenda_item.approval_threshold
+    )
+
+    options = [
+        OptionResult(
+            option=option,
+            total_votos=int(votes),
+            coeficiente=weight,
+            porcentaje_votos=(votes / total_votes) * 100.0 if total_votes else 0.0,
+            porcentaje_coeficiente=(weight / total_weight) * 100.0 if total_weight else 0.0,
+        )
+        for option, (votes, weight) in sorted(tally.items(), key=lambda item: -item[1][1])
+    ]
+    computed_at = datetime.now(timezone.utc)
+    result = AgendaItemResultRead(
+        agenda_item_id=agenda_item.id,
+        meeting_id=agenda_item.meeting_id,
+        total_votos=total_votes,
+        coeficiente_votante=total_weight,
+        coeficiente_base=basis_weight,
+        threshold_basis=agenda_item.threshold_basis,
+        approval_threshold=agenda_item.approval_threshold,
+        porcentaje_aprobacion=approval_pct,
+        aprobado=approved,
+        opciones=options,
+        rules_version=RULES_VERSION,
+        computed_at=computed_at,
+    )
+
+    stmt = (
+        dialect_insert(db, AgendaItemResult.__table__)
+        .values(
+            agenda_item_id=agenda_item.id,
+            meeting_id=agenda_item.meeting_id,
+            total_votes=total_votes,
+            total_weight=total_weight,
+            basis_weight=basis_weight,
+            approval_threshold=agenda_item.approval_threshold,
+            threshold_basis=agenda_item.threshold_basis,
+            approval_pct=approval_pct,
+            approved=approved,
+            rules_version=RULES_VERSION,
+            payload_json=result.model_dump_json(),
+            computed_at=computed_at,
+        )
+        .on_conflict_do_nothing(index_elements=["agenda_item_id"])
+    )
+    db.execute(stmt)
+    return result
+
+
+def get_stored_result(
+    db: Session,
+    *,
+    meeting_id: int,
+    agenda_item_id: int,
+) -> Optional[StoredResult]:
+    """
+    Lee el resultado materializado de un punto en una sola consulta.
+
+    Retorna None si el punto no existe o aún no se ha cerrado.
+    """
+    pending = (
+        select(AgendaItem.id)
+        .where(AgendaItem.meeting_id == meeting_id, AgendaItem.status != "CLOSED")
+        .exists()
+    )
+    row = db.execute(
+        select(
+            AgendaItemResult.payload_json,
+            AgendaItemResult.computed_at,
+            pending.label("pending_items"),
+        ).where(
+            AgendaItemResult.agenda_item_id == agenda_item_id,
+            AgendaItemResult.meeting_id == meeting_id,
+        )
+    ).first()
+    if row is None:
+        return None
+    return StoredResult(row.payload_json, row.computed_at, bool(row.pending_items))
@@ -8,6 +8,8 @@ operaciones críticas, como emisión de votos y manejo de agenda.
 
 Reglas principales implementadas aquí:
 - RD-01: Un propietario solo puede votar una vez por cada punto.
+- RD-02: Un apoderado representa máximo a un propietario (el propietario
+  por el que se vota se resuelve en voting_rights, ver delegation_service).
 - RD-03: Solo usuarios autenticados pueden votar (complementa security).
 - RD-04: El quórum se basa en coeficientes de presencias.
 - RD-05: Los resultados no pueden modificarse tras el cierre.
@@ -15,16 +17,37 @@ Reglas principales implementadas aquí:
 - RB-02: Debe cerrarse un punto antes de abrir otro.
 - RB-03: El usuario debe confirmar asistencia antes de votar.
 - RB-07: No se puede abrir votación sin quórum mínimo.
+
+Las reglas se declaran en services/rule_registry.py (RI-01). Aquí se
+implementan sus verificaciones y se compilan en pipelines (RulePipeline):
+cada pipeline obtiene la unión de hechos que necesitan sus reglas en una
+sola consulta y luego las evalúa en orden, sin consultas adicionales.
+
+Con una traza activa (core/tracing.py), cada verificación ensure_* y cada
+regla de un pipeline registra su propio span ("rules.<id>").
 """
 
-from typing import Optional
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Sequence, Tuple
 
 from fastapi import HTTPException, status
+from sqlalchemy import Integer, and_, bindparam, exists, or_, select
 from sqlalchemy.orm import Session
 
 from app.core.config import get_settings
-from app.models import Meeting, AgendaItem, Owner, Presence, Vote
+from app.core.tracing import span, traced
+from app.models import Meeting, AgendaItem, Owner, Presence, Vote, VotingRight
 from app.services.quorum_service import calculate_quorum
+from app.services.rule_registry import (
+    FACT_AGENDA_ITEM_STATUS,
+    FACT_MEETING_STATUS,
+    FACT_OWNER_IN_DEBT,
+    FACT_PRESENCE_EXISTS,
+    FACT_VOTE_EXISTS,
+    FACT_VOTING_RIGHT,
+    RULES_VERSION,
+    get_rule,
+)
 
 settings = get_settings()
 
@@ -36,6 +59,7 @@ def _http_error(detail: str, status_code: int = status.HTTP_400_BAD_REQUEST) ->
     return HTTPException(status_code=status_code, detail=detail)
 
 
+@traced("rules.ensure_meeting_allows_voting")
 def ensure_meeting_allows_voting(meeting: Meeting) -> None:
     """
     Verifica que la asamblea permita operaciones de voto.
@@ -47,13 +71,18 @@ def ensure_meeting_allows_voting(meeting: Meeting) -> None:
     Excepción:
         Lanza HTTPException si no se cumple.
     """
-    if meeting.status != "IN_PROGRESS":
+    _require_meeting_in_progress(meeting.id, meeting.status)
+
+
+def _require_meeting_in_progress(meeting_id: Optional[int], meeting_status: Optional[str]) -> None:
+    if meeting_status != "IN_PROGRESS":
         raise _http_error(
-            f"La asamblea (id={meeting.id}) no está en estado IN_PROGRESS. "
-            f"Estado actual: {meeting.status}"
+            f"La asamblea (id={meeting_id}) no está en estado IN_PROGRESS. "
+            f"Estado actual: {meeting_status}"
         )
 
 
+@traced("rules.ensure_agenda_item_is_open")
 def ensure_agenda_item_is_open(agenda_item: AgendaItem) -> None:
     """
     Verifica que el punto de agenda esté en estado OPEN.
@@ -62,13 +91,18 @@ def ensure_agenda_item_is_open(agenda_item: AgendaItem) -> None:
         - El punto debe estar OPEN para admitir nuevos votos.
         - Si está CLOSED, no se admite más votación (RD-05).
     """
-    if agenda_item.status != "OPEN":
+    _require_agenda_item_open(agenda_item.id, agenda_item.status)
+
+
+def _require_agenda_item_open(agenda_item_id: Optional[int], item_status: Optional[str]) -> None:
+    if item_status != "OPEN":
         raise _http_error(
-            f"El punto de agenda (id={agenda_item.id}) no está abierto para votación. "
-            f"Estado actual: {agenda_item.status}"
+            f"El punto de agenda (id={agenda_item_id}) no está abierto para votación. "
+            f"Estado actual: {item_status}"
         )
 
 
+@traced("rules.ensure_owner_not_in_debt")
 def ensure_owner_not_in_debt(owner: Owner) -> None:
     """
     Verifica que el propietario no tenga deuda pendiente.
@@ -76,12 +110,17 @@ def ensure_owner_not_in_debt(owner: Owner) -> None:
     Regla:
         - RD-08: Propietarios con deuda no pueden votar.
     """
-    if owner.is_in_debt:
+    _require_owner_not_in_debt(owner.id, owner.is_in_debt)
+
+
+def _require_owner_not_in_debt(owner_id: Optional[int], is_in_debt: Optional[bool]) -> None:
+    if is_in_debt:
         raise _http_error(
-            f"El propietario (id={owner.id}) tiene deuda pendiente y no puede votar."
+            f"El propietario (id={owner_id}) tiene deuda pendiente y no puede votar."
         )
 
 
+@traced("rules.ensure_owner_has_presence")
 def ensure_owner_has_presence(db: Session, meeting_id: int, owner_id: int) -> Presence:
     """
     Verifica que el propietario tenga presencia registrada en la asamblea.
@@ -104,15 +143,19 @@ def ensure_owner_has_presence(db: Session, meeting_id: int, owner_id: int) -> Pr
         .first()
     )
 
-    if presence is None:
+    _require_presence(presence is not None)
+    return presence
+
+
+def _require_presence(has_presence: Optional[bool]) -> None:
+    if not has_presence:
         raise _http_error(
             "El propietario no tiene registrada su asistencia en la asamblea, "
             "no puede votar hasta confirmar presencia."
         )
 
-    return presence
-
 
+@traced("rules.ensure_owner_has_not_voted")
 def ensure_owner_has_not_voted(
     db: Session,
     agenda_item_id: int,
@@ -136,12 +179,17 @@ def ensure_owner_has_not_voted(
         .first()
     )
 
-    if existing_vote is not None:
+    _require_not_voted(existing_vote is not None)
+
+
+def _require_not_voted(has_voted: Optional[bool]) -> None:
+    if has_voted:
         raise _http_error(
             "El propietario ya registró un voto para este punto de agenda."
         )
 
 
+@traced("rules.ensure_quorum_before_opening_vote")
 def ensure_quorum_before_opening_vote(db: Session, meeting: Meeting) -> None:
     """
     Verifica que la asamblea cumpla el quórum mínimo antes de abrir votaciones.
@@ -160,6 +208,199 @@ def ensure_quorum_before_opening_vote(db: Session, meeting: Meeting) -> None:
         )
 
 
+# ================== PIPELINE COMPILADO ==================
+
+
+@dataclass(slots=True)
+class VoteFacts:
+    """
+    Hechos necesarios para validar un voto, obtenidos en una sola consulta.
+
+    Los campos de entidades no encontradas quedan en None (por ejemplo,
+    agenda_item_id es None si el punto no pertenece a la asamblea).
+    """
+
+    meeting_id: Optional[int] = None
+    meeting_status: Optional[str] = None
+    agenda_item_id: Optional[int] = None
+    agenda_item_status: Optional[str] = None
+    owner_id: Optional[int] = None
+    owner_is_in_debt: Optional[bool] = None
+    has_presence: Optional[bool] = None
+    has_voted: Optional[bool] = None
+
+
+# Verificaciones ejecutables por regla, en el orden en que se evalúan
+_RULE_CHECKS: Dict[str, Tuple[Callable[[VoteFacts], None], ...]] = {
+    "RD-05": (
+        lambda f: _require_meeting_in_progress(f.meeting_id, f.meeting_status),
+        lambda f: _require_agenda_item_open(f.agenda_item_id, f.agenda_item_status),
+    ),
+    "RD-08": (lambda f: _require_owner_not_in_debt(f.owner_id, f.owner_is_in_debt),),
+    "RB-03": (lambda f: _require_presence(f.has_presence),),
+    "RD-01": (lambda f: _require_not_voted(f.has_voted),),
+}
+
+
+class RulePipeline:
+    """
+    Pipeline de validación compilado a partir del registro de reglas.
+
+    Al construirse:
+        - Resuelve las reglas en el registro (falla si alguna no existe).
+        - Calcula la unión de hechos que declaran.
+        - Fija el orden de evaluación de sus verificaciones.
+
+    La sentencia SELECT que obtiene los hechos se construye una sola vez
+    por forma de identificar al propietario (por usuario o por propietario).
+
+    Por usuario, si el pipeline declara FACT_VOTING_RIGHT (RD-02), el
+    propietario se resuelve en voting_rights: el propio o el representado
+    (represented_owner_id), con una búsqueda por índice en la misma
+    consulta. Las asambleas sin derechos calculados (sin poderes) usan las
+    unidades propias del usuario.
+    """
+
+    def __init__(self, rule_ids: Sequence[str]) -> None:
+        rules = [get_rule(rule_id) for rule_id in rule_ids]
+        self.rule_ids: Tuple[str, ...] = tuple(rule.id for rule in rules)
+        self.facts = frozenset().union(*(rule.facts for rule in rules))
+        self.version = RULES_VERSION
+        self._steps = tuple(
+            (rule_id, check) for rule_id in self.rule_ids for check in _RULE_CHECKS.get(rule_id, ())
+        )
+        self._span_names = {rule_id: f"rules.{rule_id}" for rule_id in self.rule_ids}
+        self._statements: Dict[str, object] = {}
+
+    def _statement(self, owner_key: str):
+        stmt = self._statements.get(owner_key)
+        if stmt is not None:
+            return stmt
+
+        meetings = Meeting.__table__
+        items = AgendaItem.__table__
+        owners = Owner.__table__
+        presences = Presence.__table__
+        votes = Vote.__table__
+
+        columns = [
+            meetings.c.id.label("meeting_id"),
+            items.c.id.label("agenda_item_id"),
+            owners.c.id.label("owner_id"),
+        ]
+        if FACT_MEETING_STATUS in self.facts:
+            columns.append(meetings.c.status.label("meeting_status"))
+        if FACT_AGENDA_ITEM_STATUS in self.facts:
+            columns.append(items.c.status.label("agenda_item_status"))
+        if FACT_OWNER_IN_DEBT in self.facts:
+            columns.append(owners.c.is_in_debt.label("owner_is_in_debt"))
+        if FACT_PRESENCE_EXISTS in self.facts:
+            columns.append(
+                exists()
+                .where(presences.c.meeting_id == meetings.c.id)
+                .where(presences.c.owner_id == owners.c.id)
+                .label("has_presence")
+            )
+        if FACT_VOTE_EXISTS in self.facts:
+            columns.append(
+                exists()
+                .where(votes.c.agenda_item_id == items.c.id)
+                .where(votes.c.owner_id == owners.c.id)
+                .label("has_voted")
+            )
+
+        source = meetings.outerjoin(
+            items,
+            and_(
+                items.c.id == bindparam("agenda_item_id"),
+                items.c.meeting_id == meetings.c.id,
+            ),
+        )
+        order_by = [owners.c.id]
+        if owner_key == "user_id" and FACT_VOTING_RIGHT in self.facts:
+            rights = VotingRight.__table__
+            any_right = rights.alias("any_right")
+            represented = bindparam("represented_owner_id", type_=Integer)
+            source = source.outerjoin(
+                rights,
+                and_(
+                    rights.c.meeting_id == meetings.c.id,
+                    rights.c.user_id == bindparam("owner_key"),
+                    or_(represented.is_(None), rights.c.owner_id == represented),
+                ),
+            ).outerjoin(
+                owners,
+                or_(
+                    owners.c.id == rights.c.owner_id,
+                    and_(
+                        rights.c.owner_id.is_(None),
+                        ~exists().where(any_right.c.meeting_id == meetings.c.id),
+                        owners.c.user_id == bindparam("owner_key"),
+                        or_(represented.is_(None), owners.c.id == represented),
+                    ),
+                ),
+            )
+            # Sin propietario indicado, primero las unidades propias
+            order_by = [rights.c.delegated, owners.c.id]
+        else:
+            owner_column = owners.c.user_id if owner_key == "user_id" else owners.c.id
+            source = source.outerjoin(owners, owner_column == bindparam("owner_key"))
+        stmt = (
+            select(*columns)
+            .select_from(source)
+            .where(meetings.c.id == bindparam("meeting_id"))
+            .order_by(*order_by)
+            .limit(1)
+        )
+        self._statements[owner_key] = stmt
+        return stmt
+
+    def load_facts(
+        self,
+        db: Session,
+        *,
+        meeting_id: int,
+        agenda_item_id: int,
+        user_id: Optional[int] = None,
+        owner_id: Optional[int] = None,
+        represented_owner_id: Optional[int] = None,
+    ) -> VoteFacts:
+        """
+        Obtiene en una sola consulta todos los hechos que necesita el pipeline.
+
+        El propietario se identifica por user_id (usuario autenticado) o,
+        si se indica, directamente por owner_id. Con user_id,
+        represented_owner_id elige por cuál de sus propietarios vota el
+        usuario (el suyo o el que representa como apoderado).
+        """
+        owner_key = "owner_id" if owner_id is not None else "user_id"
+        with span("rules.load_facts", **{"rules.owner_key": owner_key}):
+            row = db.execute(
+                self._statement(owner_key),
+                {
+                    "meeting_id": meeting_id,
+                    "agenda_item_id": agenda_item_id,
+                    "owner_key": owner_id if owner_id is not None else user_id,
+                    "represented_owner_id": represented_owner_id,
+                },
+            ).mappings().first()
+        if row is None:
+            return VoteFacts()
+        return VoteFacts(**row)
+
+    def evaluate(self, facts: VoteFacts) -> None:
+        """
+        Evalúa las reglas en orden; lanza HTTPException en la primera violación.
+        """
+        for rule_id, step in self._steps:
+            with span(self._span_names[rule_id]):
+                step(facts)
+
+
+# Pipeline de emisión de votos: mismo orden que validate_vote_eligibility
+VOTE_PIPELINE = RulePipeline(("RD-03", "RD-02", "RD-05", "RD-08", "RB-03", "RD-01"))
+
+
 def validate_vote_eligibility(
     db: Session,
     *,
@@ -179,9 +420,13 @@ def validate_vote_eligibility(
         - RD-01: No debe haber un voto previo sobre el mismo punto (ensure_owner_has_not_voted).
 
     Si alguna regla no se cumple, se lanza HTTPException con mensaje descriptivo.
+
+    Usa VOTE_PIPELINE: presencia y voto previo se resuelven en una sola consulta.
     """
-    ensure_meeting_allows_voting(meeting)
-    ensure_agenda_item_is_open(agenda_item)
-    ensure_owner_not_in_debt(owner)
-    ensure_owner_has_presence(db, meeting_id=meeting.id, owner_id=owner.id)
-    ensure_owner_has_not_voted(db, agenda_item_id=agenda_item.id, owner_id=owner.id)
+    facts = VOTE_PIPELINE.load_facts(
+        db,
+        meeting_id=meeting.id,
+        agenda_item_id=agenda_item.id,
+        owner_id=owner.id,
+    )
+    VOTE_PIPELINE.evaluate(facts)
@@ -0,0 +1,244 @@
+"""
+backend/app/services/rule_registry.py
+
+Repositorio central y versionado de reglas de negocio de AgoraX (RI-01).
+
+Cada regla RD / RB / RI se declara una sola vez aquí, con:
+- Su descripción y propósito (catálogo público servido por /rules).
+- Los hechos (facts) que necesita para evaluarse, por ejemplo
+  "agenda_item.status" o "presence.exists".
+
+El motor de reglas (rule_engine) compila pipelines de validación a partir
+de estas declaraciones: obtiene la unión de hechos en una sola consulta y
+evalúa las reglas en orden. El catálogo se pre-serializa a bytes al importar
+el módulo, con un ETag derivado de la versión del registro.
+
+Cualquier cambio en este archivo debe acompañarse de un incremento de
+RULES_VERSION (RI-02: los cambios a reglas requieren aprobación formal).
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Optional, Tuple
+
+RULES_VERSION = "2025.11.3"
+
+
+# ================== HECHOS ==================
+
+FACT_MEETING_STATUS = "meeting.status"
+FACT_AGENDA_ITEM_STATUS = "agenda_item.status"
+FACT_OWNER_IN_DEBT = "owner.is_in_debt"
+FACT_PRESENCE_EXISTS = "presence.exists"
+FACT_VOTE_EXISTS = "vote.exists"
+FACT_VOTING_RIGHT = "voting_right.holder"
+
+
+@dataclass(frozen=True)
+class BusinessRule:
+    """
+    Declaración de una regla de negocio.
+
+    Atributos:
+        id: Código de la regla (ej. 'RD-01').
+        categoria: 'definicionales', 'comportamiento' o 'implicitas'.
+        descripcion: Texto de la regla.
+        proposito: Propósito (RD / RB).
+        tipo: Tipo de regla implícita (RI).
+        facts: Hechos que necesita el motor para evaluarla.
+    """
+
+    id: str
+    categoria: str
+    descripcion: str
+    proposito: Optional[str] = None
+    tipo: Optional[str] = None
+    facts: FrozenSet[str] = frozenset()
+
+    def as_catalog_entry(self) -> dict:
+        entry = {"id": self.id, "descripcion": self.descripcion}
+        if self.tipo is not None:
+            entry["tipo"] = self.tipo
+        else:
+            entry["proposito"] = self.proposito
+        return entry
+
+
+def _rd(rule_id: str, descripcion: str, proposito: str, *facts: str) -> BusinessRule:
+    return BusinessRule(rule_id, "definicionales", descripcion, proposito, facts=frozenset(facts))
+
+
+def _rb(rule_id: str, descripcion: str, proposito: str, *facts: str) -> BusinessRule:
+    return BusinessRule(rule_id, "comportamiento", descripcion, proposito, facts=frozenset(facts))
+
+
+def _ri(rule_id: str, descripcion: str, tipo: str) -> BusinessRule:
+    return BusinessRule(rule_id, "implicitas", descripcion, tipo=tipo)
+
+
+RULES: Tuple[BusinessRule, ...] = (
+    # Reglas Definicionales (RD)
+    _rd(
+        "RD-01",
+        "Un propietario solo puede votar una vez por cada punto.",
+        "Evitar duplicidad y asegurar integridad.",
+        FACT_VOTE_EXISTS,
+    ),
+    _rd(
+        "RD-02",
+        "Un apoderado representa máximo a un propietario.",
+        "Evitar concentración de poder.",
+        FACT_VOTING_RIGHT,
+    ),
+    _rd(
+        "RD-03",
+        "Solo los usuarios autenticados pueden votar.",
+        "Validar identidad y legitimidad.",
+    ),
+    _rd(
+        "RD-04",
+        "El quórum mínimo es del 51% del coeficiente total.",
+        "Cumplimiento de la Ley 675/2001.",
+    ),
+    _rd(
+        "RD-05",
+        "Los resultados no pueden modificarse tras el cierre.",
+        "Garantizar transparencia y trazabilidad.",
+        FACT_MEETING_STATUS,
+        FACT_AGENDA_ITEM_STATUS,
+    ),
+    _rd(
+        "RD-06",
+        "Los votos se almacenan cifrados (AES-256-GCM).",
+        "Proteger confidencialidad.",
+    ),
+    _rd(
+        "RD-07",
+        "Cada asamblea tiene un identificador único.",
+        "Facilitar auditoría y trazabilidad.",
+    ),
+    _rd(
+        "RD-08",
+        "Propietarios con deuda no pueden votar.",
+        "Cumplimiento normativo interno.",
+        FACT_OWNER_IN_DEBT,
+    ),
+    _rd(
+        "RD-09",
+        "El acta debe incluir quórum, votos y firma digital.",
+        "Evidencia legal de decisiones.",
+    ),
+    _rd(
+        "RD-10",
+        "Cada conjunto debe registrar su coeficiente total.",
+        "Calcular quórum ponderado.",
+    ),
+    # Reglas de Comportamiento (RB)
+    _rb(
+        "RB-01",
+        "Solo el administrador puede abrir o cerrar votaciones.",
+        "Control jerárquico del proceso.",
+    ),
+    _rb(
+        "RB-02",
+        "Debe cerrarse un punto antes de abrir otro.",
+        "Evitar solapamiento de decisiones.",
+    ),
+    _rb(
+        "RB-03",
+        "El usuario debe confirmar asistencia antes de votar.",
+        "Validar participación real en el quórum.",
+        FACT_PRESENCE_EXISTS,
+    ),
+    _rb(
+        "RB-04",
+        "El sistema notifica apertura/cierre a todos los usuarios.",
+        "Transparencia y comunicación.",
+    ),
+    _rb(
+        "RB-05",
+        "Los votos no pueden modificarse una vez emitidos.",
+        "Evitar fraude.",
+    ),
+    _rb(
+        "RB-06",
+        "Registrar IP, fecha y hora de cada voto.",
+        "Auditoría y trazabilidad.",
+    ),
+    _rb(
+        "RB-07",
+        "No se puede abrir votación sin quórum mínimo.",
+        "Cumplimiento legal.",
+    ),
+    _rb(
+        "RB-08",
+        "Reconexión segura ante fallos, sin duplicar voto.",
+        "Continuidad operativa.",
+    ),
+    _rb(
+        "RB-09",
+        "Resultados visibles solo al cierre de todas las votaciones.",
+        "Evitar sesgo.",
+    ),
+    _rb(
+        "RB-10",
+        "El administrador debe firmar electrónicamente el acta.",
+        "Validación final del proceso.",
+    ),
+    # Reglas Implícitas (RI)
+    _ri(
+        "RI-01",
+        "Todas las reglas deben almacenarse en un repositorio central versionado.",
+        "Definicional",
+    ),
+    _ri(
+        "RI-02",
+        "Los cambios a reglas requieren aprobación formal.",
+        "Comportamiento",
+    ),
+    _ri(
+        "RI-03",
+        "Se debe mantener un glosario de términos del sistema.",
+        "Definicional",
+    ),
+)
+
+RULES_BY_ID: Dict[str, BusinessRule] = {rule.id: rule for rule in RULES}
+
+
+def get_rule(rule_id: str) -> BusinessRule:
+    """
+    Devuelve la declaración de una regla por su código.
+
+    Excepciones:
+        - KeyError si la regla no está registrada.
+    """
+    return RULES_BY_ID[rule_id]
+
+
+def build_catalog() -> dict:
+    """
+    Construye el catálogo público de reglas agrupado por categoría.
+    """
+    catalog: dict = {
+        "version": RULES_VERSION,
+        "definicionales": [],
+        "comportamiento": [],
+        "implicitas": [],
+    }
+    for rule in RULES:
+        catalog[rule.categoria].append(rule.as_catalog_entry())
+    return catalog
+
+
+# Catálogo pre-serializado: el endpoint /rules solo devuelve estos bytes
+CATALOG_BYTES: bytes = json.dumps(
+    build_catalog(),
+    ensure_ascii=False,
+    separators=(",", ":"),
+).encode("utf-8")
+
+CATALOG_ETAG: str = (
+    f'"rules-{RULES_VERSION}-{hashlib.sha256(CATALOG_BYTES).hexdigest()[:12]}"'
+)
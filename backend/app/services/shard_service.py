@@ -0,0 +1,281 @@
+"""
+backend/app/services/shard_service.py
+
+Operaciones de mantenimiento del sharding por conjunto.
+
+Incluye:
+- provision_shard: crea el esquema en un shard y reserva su rango de IDs.
+- tenant_row_filters: qué filas pertenecen a un conjunto, en orden de FK.
+- rebalance_tenant: mueve un conjunto completo de un shard a otro.
+
+Rangos de IDs:
+    Los IDs deben ser únicos entre shards (meeting_routes se indexa por
+    meeting_id y los datos se copian con su ID original). Cada shard recibe
+    un desplazamiento (id_offset) a partir del cual asigna sus IDs:
+    setval() en PostgreSQL, sqlite_sequence en SQLite.
+"""
+
+import logging
+import time
+from typing import Dict, List, Sequence, Tuple
+
+from sqlalchemy import delete, func, or_, select, text
+from sqlalchemy.sql.elements import ColumnElement
+from sqlalchemy.sql.schema import Table
+
+from app.core.config import get_settings
+from app.core.db import dialect_insert
+from app.core.schema import ensure_schema
+from app.core.sharding import DEFAULT_SHARD, STATUS_ACTIVE, STATUS_MOVING, shard_router
+from app.models import (
+    AgendaItem,
+    AgendaItemResult,
+    AuditLog,
+    Condominium,
+    Delegation,
+    Meeting,
+    MeetingArchive,
+    OutboxEvent,
+    Owner,
+    Presence,
+    User,
+    Vote,
+    VotingRight,
+)
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Tamaño de lote para copiar filas entre shards
+_COPY_BATCH = 1000
+
+
+def provision_shard(shard: str, *, id_offset: int) -> None:
+    """
+    Prepara un shard: crea el esquema y mueve sus contadores de ID a id_offset.
+
+    Es idempotente: un contador que ya supera el desplazamiento no se toca.
+    Debe volver a ejecutarse tras añadir tablas al esquema.
+    """
+    from app.core.db import Base
+
+    shard_engine = shard_router.engine(shard)
+    ensure_schema(shard_engine)
+
+    with shard_engine.begin() as conn:
+        _raise_id_counters(conn, Base.metadata.sorted_tables, floor=id_offset)
+    logger.info("Shard %s aprovisionado (IDs desde %s).", shard, id_offset)
+
+
+def _raise_id_counters(conn, tables: Sequence[Table], *, floor: int = 0) -> None:
+    """
+    Sube el contador de ID de cada tabla a max(floor, MAX(id)); nunca lo baja.
+
+    En SQLite un INSERT con id explícito ya mueve sqlite_sequence, así que
+    solo hace falta aplicar floor.
+    """
+    for table in tables:
+        pk = list(table.primary_key.columns)
+        if len(pk) != 1 or pk[0].autoincrement is False or pk[0].foreign_keys:
+            continue
+        if conn.dialect.name == "postgresql":
+            conn.execute(
+                text(
+                    "SELECT setval(pg_get_serial_sequence(:table, :column), GREATEST("
+                    ":floor, "
+                    f'(SELECT COALESCE(MAX("{pk[0].name}"), 0) FROM "{table.name}"), '
+                    "COALESCE(pg_sequence_last_value(pg_get_serial_sequence(:table, :column)::regclass), 0)))"
+                ),
+                {"table": table.name, "column": pk[0].name, "floor": floor},
+            )
+        elif conn.dialect.name == "sqlite" and floor > 0:
+            current = conn.execute(
+                text("SELECT seq FROM sqlite_sequence WHERE name = :table"),
+                {"table": table.name},
+            ).scalar_one_or_none()
+            if current is None:
+                conn.execute(
+                    text("INSERT INTO sqlite_sequence (name, seq) VALUES (:table, :offset)"),
+                    {"table": table.name, "offset": floor},
+                )
+            elif current < floor:
+                conn.execute(
+                    text("UPDATE sqlite_sequence SET seq = :offset WHERE name = :table"),
+                    {"table": table.name, "offset": floor},
+                )
+
+
+def tenant_row_filters(condominium_id: int) -> List[Tuple[Table, ColumnElement]]:
+    """
+    Devuelve (tabla, filtro) con las filas de un conjunto, en orden de claves foráneas.
+
+    Los usuarios se incluyen porque propietarios y auditoría los referencian;
+    se copian al destino pero nunca se borran del origen. Los eventos del
+    outbox viajan con su asamblea (también las archivadas): de ellos salen
+    las versiones y ETags de lectura.
+    """
+    meeting_ids = select(Meeting.id).where(Meeting.condominium_id == condominium_id)
+    agenda_ids = select(AgendaItem.id).where(AgendaItem.meeting_id.in_(meeting_ids))
+    presence_ids = select(Presence.id).where(Presence.meeting_id.in_(meeting_ids))
+    vote_ids = select(Vote.id).where(Vote.agenda_item_id.in_(agenda_ids))
+
+    audit_filter = or_(
+        (AuditLog.entity_type == "Meeting") & AuditLog.entity_id.in_(meeting_ids),
+        (AuditLog.entity_type == "AgendaItem") & AuditLog.entity_id.in_(agenda_ids),
+        (AuditLog.entity_type == "Presence") & AuditLog.entity_id.in_(presence_ids),
+        (AuditLog.entity_type == "Vote") & AuditLog.entity_id.in_(vote_ids),
+    )
+    outbox_filter = or_(
+        OutboxEvent.meeting_id.in_(meeting_ids),
+        OutboxEvent.meeting_id.in_(
+            select(MeetingArchive.meeting_id).where(MeetingArchive.condominium_id == condominium_id)
+        ),
+    )
+    user_filter = or_(
+        User.id.in_(select(Owner.user_id).where(Owner.condominium_id == condominium_id)),
+        User.id.in_(select(AuditLog.user_id).where(audit_filter)),
+        User.id.in_(select(Delegation.proxy_user_id).where(Delegation.meeting_id.in_(meeting_ids))),
+    )
+
+    return [
+        (Condominium.__table__, Condominium.id == condominium_id),
+        (User.__table__, user_filter),
+        (Owner.__table__, Owner.condominium_id == condominium_id),
+        (Meeting.__table__, Meeting.condominium_id == condominium_id),
+        (MeetingArchive.__table__, MeetingArchive.condominium_id == condominium_id),
+        (AgendaItem.__table__, AgendaItem.meeting_id.in_(meeting_ids)),
+        (Presence.__table__, Presence.meeting_id.in_(meeting_ids)),
+        (Delegation.__table__, Delegation.meeting_id.in_(meeting_ids)),
+        (VotingRight.__table__, VotingRight.meeting_id.in_(meeting_ids)),
+        (Vote.__table__, Vote.agenda_item_id.in_(agenda_ids)),
+        (AgendaItemResult.__table__, AgendaItemResult.meeting_id.in_(meeting_ids)),
+        (AuditLog.__table__, audit_filter),
+        (OutboxEvent.__table__, outbox_filter),
+    ]
+
+
+# Tablas compartidas: se copian si faltan, pero no se borran del origen
+_SHARED_TABLES = frozenset({"users"})
+
+# Tablas que reciben IDs nuevos del destino al copiarse (en orden de id): el
+# relay del outbox avanza por id, y un id del origen por encima del contador
+# del destino dejaría sin publicar los eventos nuevos del destino
+_RENUMBERED_TABLES = frozenset({"outbox_events"})
+
+
+def rebalance_tenant(
+    condominium_id: int,
+    target_shard: str,
+    *,
+    drain_seconds: float | None = None,
+) -> Dict[str, int]:
+    """
+    Mueve un conjunto completo al shard destino.
+
+    Pasos:
+        1. Marca el conjunto como MOVING (sus peticiones reciben 503).
+        2. Espera drain_seconds (por defecto el TTL de la caché de rutas)
+           para que todos los workers vean el cambio.
+        3. Copia las filas en una sola transacción del destino y sube sus
+           contadores de ID por encima de los IDs copiados. Los eventos del
+           outbox se reinsertan con IDs nuevos del destino (su relay los
+           publica una vez más; la entrega ya es al-menos-una-vez).
+        4. Registra las asambleas en meeting_routes y apunta el conjunto
+           al destino (ACTIVE).
+        5. Borra las filas del origen.
+
+    Si la copia falla, el conjunto vuelve a quedar ACTIVE en el origen.
+
+    Retorna:
+        Número de filas copiadas por tabla.
+    """
+    if drain_seconds is None:
+        drain_seconds = settings.SHARD_ROUTE_CACHE_SECONDS
+
+    with shard_router.session(DEFAULT_SHARD) as directory_db:
+        shard_router.invalidate(condominium_id)
+        source_shard, _ = shard_router.tenant_route(directory_db, condominium_id)
+        if source_shard == target_shard:
+            return {}
+        shard_router.assign_tenant(directory_db, condominium_id, source_shard, status=STATUS_MOVING)
+        directory_db.commit()
+
+    if drain_seconds > 0:
+        time.sleep(drain_seconds)
+
+    source_engine = shard_router.engine(source_shard)
+    target_engine = shard_router.engine(target_shard)
+    filters = tenant_row_filters(condominium_id)
+    copied: Dict[str, int] = {}
+
+    try:
+        with source_engine.connect() as source, target_engine.begin() as target:
+            for table, where in filters:
+                query = select(table).where(where)
+                if table.name in _RENUMBERED_TABLES:
+                    query = query.order_by(table.c.id)
+                rows = [dict(row) for row in source.execute(query).mappings()]
+                if table.name in _RENUMBERED_TABLES:
+                    for row in rows:
+                        del row["id"]
+                stmt = dialect_insert(target, table)
+                if table.name in _SHARED_TABLES:
+                    stmt = stmt.on_conflict_do_nothing(index_elements=["id"])
+                for start in range(0, len(rows), _COPY_BATCH):
+                    target.execute(stmt, rows[start:start + _COPY_BATCH])
+                copied[table.name] = len(rows)
+            _raise_id_counters(
+                target,
+                [table for table, _ in filters if copied[table.name] and table.name not in _RENUMBERED_TABLES],
+            )
+
+            # Las asambleas archivadas también se leen por meeting_id
+            meeting_ids = list(
+                source.execute(
+                    select(Meeting.id)
+                    .where(Meeting.condominium_id == condominium_id)
+                    .union_all(
+                        select(MeetingArchive.meeting_id).where(
+                            MeetingArchive.condominium_id == condominium_id
+                        )
+                    )
+                ).scalars()
+            )
+    except Exception:
+        with shard_router.session(DEFAULT_SHARD) as directory_db:
+            shard_router.assign_tenant(directory_db, condominium_id, source_shard, status=STATUS_ACTIVE)
+            directory_db.commit()
+        raise
+
+    with shard_router.session(DEFAULT_SHARD) as directory_db:
+        for meeting_id in meeting_ids:
+            shard_router.register_meeting(directory_db, meeting_id, condominium_id)
+        shard_router.assign_tenant(directory_db, condominium_id, target_shard, status=STATUS_ACTIVE)
+        directory_db.commit()
+
+    with source_engine.begin() as source:
+        for table, where in reversed(filters):
+            if table.name not in _SHARED_TABLES:
+                source.execute(delete(table).where(where))
+
+    logger.info(
+        "Conjunto %s movido de %s a %s: %s",
+        condominium_id,
+        source_shard,
+        target_shard,
+        copied,
+    )
+    return copied
+
+
+def tenant_row_counts(shard: str, condominium_id: int) -> Dict[str, int]:
+    """
+    Cuenta las filas del conjunto en un shard (verificación tras un rebalanceo).
+    """
+    with shard_router.engine(shard).connect() as conn:
+        return {
+            table.name: conn.execute(
+                select(func.count()).select_from(table).where(where)
+            ).scalar_one()
+            for table, where in tenant_row_filters(condominium_id)
+        }
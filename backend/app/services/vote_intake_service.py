@@ -0,0 +1,177 @@
+"""
+backend/app/services/vote_intake_service.py
+
+Aplicador del diario local de votos (VOTE_INTAKE_MODE=journal).
+
+Recibe lotes de app.core.vote_journal y, por cada shard, en una sola
+transacción:
+    1. Lee el checkpoint del diario y omite lo ya aplicado (reproducción
+       idempotente tras un fallo).
+    2. Comprueba qué puntos siguen OPEN (FOR SHARE en PostgreSQL, como
+       cast_vote en modo directo).
+    3. Inserta los votos en un único INSERT ... ON CONFLICT DO NOTHING.
+    4. Inserta la auditoría de todo el lote (CAST_VOTE o REJECT_VOTE) y
+       los eventos VOTE_CAST (outbox).
+    5. Avanza el checkpoint.
+
+Un voto aceptado por el diario solo se descarta si su punto ya no está
+abierto o si el propietario ya tenía voto (RD-01); queda registrado como
+REJECT_VOTE en la auditoría. Como el modo diario corre en un único
+proceso (vote_journal.claim_intake), el cierre de un punto aplica antes
+todos sus votos aceptados y ninguno se descarta por llegar tarde.
+
+Reglas de negocio relacionadas:
+- RD-01: Un propietario solo puede votar una vez por cada punto.
+- RD-05: No se puede votar cuando el punto está cerrado.
+- RB-06: Registrar IP, fecha y hora del voto (created_at = aceptación en el diario).
+"""
+
+import logging
+from datetime import datetime, timezone
+from typing import Dict, List, Sequence, Tuple
+
+from sqlalchemy import insert, select
+
+from app.core import events
+from app.core.db import dialect_insert
+from app.core.sharding import shard_router
+from app.core.vote_journal import JournalRecord
+from app.models import AgendaItem, AuditLog, Vote, VoteJournalCheckpoint
+from app.services import outbox_service
+
+logger = logging.getLogger(__name__)
+
+
+def apply_journal_records(journal_id: str, records: Sequence[JournalRecord]) -> None:
+    """
+    Aplica un lote del diario, agrupado por shard.
+
+    Cada shard se confirma por separado junto con su checkpoint; si uno
+    falla, el lote completo se reintenta y los shards ya confirmados
+    omiten sus registros por checkpoint.
+    """
+    by_shard: Dict[str, List[JournalRecord]] = {}
+    for record in records:
+        by_shard.setdefault(record.shard, []).append(record)
+    for shard, shard_records in by_shard.items():
+        _apply_shard(journal_id, shard, shard_records)
+
+
+def _apply_shard(journal_id: str, shard: str, records: List[JournalRecord]) -> None:
+    db = shard_router.session(shard)
+    try:
+        applied_seq = db.execute(
+            select(VoteJournalCheckpoint.applied_seq).where(
+                VoteJournalCheckpoint.journal_id == journal_id
+            )
+        ).scalar_one_or_none() or 0
+        fresh = [record for record in records if record.seq > applied_seq]
+        if not fresh:
+            db.rollback()
+            return
+
+        open_stmt = select(AgendaItem.id).where(
+            AgendaItem.id.in_({record.agenda_item_id for record in fresh}),
+            AgendaItem.status == "OPEN",
+        )
+        if db.get_bind().dialect.name == "postgresql":
+            open_stmt = open_stmt.with_for_update(read=True)
+        open_items = set(db.execute(open_stmt).scalars())
+
+        inserted: Dict[Tuple[int, int], int] = {}
+        accepted = [record for record in fresh if record.agenda_item_id in open_items]
+        if accepted:
+            votes = Vote.__table__
+            rows = db.execute(
+                dialect_insert(db, votes)
+                .values(
+                    [
+                        {
+                            "agenda_item_id": record.agenda_item_id,
+                            "owner_id": record.owner_id,
+                            "value_encrypted": record.value_encrypted,
+                            "created_at": record.created_at,
+                            "ip_address": record.ip_address,
+                        }
+                        for record in accepted
+                    ]
+                )
+                .on_conflict_do_nothing(index_elements=["agenda_item_id", "owner_id"])
+                .returning(votes.c.id, votes.c.agenda_item_id, votes.c.owner_id)
+            ).all()
+            inserted = {(row.agenda_item_id, row.owner_id): row.id for row in rows}
+
+        audit_rows = []
+        for record in fresh:
+            vote_id = inserted.get((record.agenda_item_id, record.owner_id))
+            if vote_id is not None:
+                audit_rows.append(
+                    {
+                        "user_id": record.user_id,
+                        "action": "CAST_VOTE",
+                        "entity_type": "Vote",
+                        "entity_id": vote_id,
+                        "description": (
+                            f"Voto emitido para agenda_item_id={record.agenda_item_id}, "
+                            f"owner_id={record.owner_id}"
+                        ),
+                        "created_at": record.created_at,
+                    }
+                )
+                continue
+            reason = (
+                "RD-01: voto duplicado"
+                if record.agenda_item_id in open_items
+                else "RD-05: el punto ya no está abierto"
+            )
+            logger.warning(
+                "Voto del diario descartado (%s): agenda_item_id=%s, owner_id=%s",
+                reason,
+                record.agenda_item_id,
+                record.owner_id,
+            )
+            audit_rows.append(
+                {
+                    "user_id": record.user_id,
+                    "action": "REJECT_VOTE",
+                    "entity_type": "AgendaItem",
+                    "entity_id": record.agenda_item_id,
+                    "description": f"Voto del diario descartado ({reason}), owner_id={record.owner_id}",
+                    "created_at": record.created_at,
+                }
+            )
+
+        shard_router.replicate_users(db, {record.user_id for record in fresh})
+        db.execute(insert(AuditLog), audit_rows)
+        outbox_service.emit_many(
+            db,
+            (
+                {
+                    "event_type": events.VOTE_CAST,
+                    "meeting_id": record.meeting_id,
+                    "entity_type": "Vote",
+                    "entity_id": inserted[(record.agenda_item_id, record.owner_id)],
+                    "payload": {"agenda_item_id": record.agenda_item_id, "owner_id": record.owner_id},
+                    "created_at": record.created_at,
+                }
+                for record in fresh
+                if (record.agenda_item_id, record.owner_id) in inserted
+            ),
+        )
+
+        now = datetime.now(timezone.utc)
+        last_seq = fresh[-1].seq
+        db.execute(
+            dialect_insert(db, VoteJournalCheckpoint.__table__)
+            .values(journal_id=journal_id, applied_seq=last_seq, updated_at=now)
+            .on_conflict_do_update(
+                index_elements=["journal_id"],
+                set_={"applied_seq": last_seq, "updated_at": now},
+            )
+        )
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
@@ -0,0 +1,265 @@
+"""
+backend/app/services/vote_rekey_service.py
+
+Rotación en línea de la clave de cifrado de votos.
+
+Procedimiento:
+    1. Configurar la nueva clave en VOTE_ENCRYPTION_KEY y mover la anterior
+       a VOTE_ENCRYPTION_OLD_KEYS; reiniciar los workers (todos descifran
+       con ambas y cifran con la nueva).
+    2. Ejecutar rekey_votes (python -m scripts.rekey_votes) hasta terminar.
+    3. Retirar la clave anterior de VOTE_ENCRYPTION_OLD_KEYS, salvo que
+       old_keys_in_archives la indique: las asambleas archivadas en frío
+       (archive_service) conservan sus votos cifrados con la clave vigente
+       al archivarlas, y sin ella dejan de poder descifrarse. Una clave
+       debe seguir en VOTE_ENCRYPTION_OLD_KEYS mientras algún archivo la use.
+
+rekey_votes recorre la tabla votes por keyset (id > último procesado) en
+bloques. Cada bloque se descifra y recifra en un pool de hilos y se
+confirma en una transacción corta junto con su checkpoint, de modo que:
+    - Un fallo solo pierde el bloque en curso; al relanzar se continúa.
+    - La votación en vivo no queda bloqueada (en SQLite cada bloque toma
+      un turno de la cola de escritura como cualquier otro escritor).
+    - max_rows_per_second limita el ritmo para no competir con la votación.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import bindparam, select, update
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.core.vote_crypto import (
+    VoteDecryptionError,
+    ciphertext_key_id,
+    decrypt_vote_values,
+    derive_vote_key,
+    encrypt_vote_values,
+    get_vote_key,
+    vote_aad,
+)
+from app.models import Vote, VoteRekeyCheckpoint
+from app.services.archive_service import archived_vote_key_usage
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+@dataclass(slots=True)
+class RekeyReport:
+    """
+    Resultado de una ejecución de rekey_votes.
+    """
+
+    target_key_id: str
+    scanned: int = 0
+    reencrypted: int = 0
+    failed: int = 0
+    chunks: int = 0
+    finished: bool = False
+    elapsed_s: float = 0.0
+
+
+# (id, agenda_item_id, owner_id, value_encrypted)
+_Row = Tuple[int, int, int, str]
+
+
+def _reencrypt_rows(rows: Sequence[_Row]) -> Tuple[List[dict], int]:
+    """
+    Descifra y recifra un sub-bloque. Devuelve (actualizaciones, fallidos).
+
+    Si el lote completo falla se reintenta voto a voto para aislar los
+    registros ilegibles sin perder el resto.
+    """
+    aads = [vote_aad(agenda_item_id, owner_id) for _, agenda_item_id, owner_id, _ in rows]
+    tokens = [token for *_, token in rows]
+    try:
+        clear = decrypt_vote_values(tokens, associated_data=aads)
+        good = list(range(len(rows)))
+    except VoteDecryptionError:
+        clear, good = [], []
+        for index, (token, aad) in enumerate(zip(tokens, aads)):
+            try:
+                clear.extend(decrypt_vote_values([token], associated_data=[aad]))
+                good.append(index)
+            except VoteDecryptionError:
+                logger.warning("Voto %s no se pudo descifrar; se deja intacto.", rows[index][0])
+
+    sealed = encrypt_vote_values(clear, associated_data=[aads[i] for i in good])
+    updates = [
+        {"vote_id": rows[i][0], "old_value": rows[i][3], "new_value": new}
+        for i, new in zip(good, sealed)
+    ]
+    return updates, len(rows) - len(good)
+
+
+def rekey_votes(
+    bind: Engine,
+    *,
+    chunk_size: int = 500,
+    workers: int = 4,
+    max_rows_per_second: Optional[float] = None,
+    stop_event: Optional[threading.Event] = None,
+) -> RekeyReport:
+    """
+    Recifra con la clave actual todos los votos cifrados con otra clave.
+
+    Parámetros:
+        bind: Motor de la base (un shard) a recorrer.
+        chunk_size: Votos por bloque/transacción.
+        workers: Hilos para descifrar/recifrar cada bloque.
+        max_rows_per_second: Ritmo máximo (None = sin límite).
+        stop_event: Permite detener el trabajo entre bloques.
+    """
+    target = get_vote_key().key_id
+    report = RekeyReport(target_key_id=target.hex())
+    started = time.perf_counter()
+
+    votes = Vote.__table__
+    apply_update = (
+        update(votes)
+        .where(votes.c.id == bindparam("vote_id"))
+        .where(votes.c.value_encrypted == bindparam("old_value"))
+        .values(value_encrypted=bindparam("new_value"))
+    )
+
+    with bind.begin() as conn:
+        checkpoint = conn.execute(
+            select(VoteRekeyCheckpoint.last_vote_id, VoteRekeyCheckpoint.finished_at).where(
+                VoteRekeyCheckpoint.target_key_id == report.target_key_id
+            )
+        ).first()
+        if checkpoint is None:
+            conn.execute(
+                VoteRekeyCheckpoint.__table__.insert().values(
+                    target_key_id=report.target_key_id,
+                    last_vote_id=0,
+                    reencrypted=0,
+                    failed=0,
+                    updated_at=datetime.now(timezone.utc),
+                )
+            )
+            last_id = 0
+        elif checkpoint.finished_at is not None:
+            # Recorrido previo terminado: una nueva ejecución vuelve a empezar
+            conn.execute(
+                update(VoteRekeyCheckpoint.__table__)
+                .where(VoteRekeyCheckpoint.target_key_id == report.target_key_id)
+                .values(last_vote_id=0, finished_at=None, updated_at=datetime.now(timezone.utc))
+            )
+            last_id = 0
+        else:
+            last_id = checkpoint.last_vote_id
+
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="vote-rekey") as pool:
+        while True:
+            if stop_event is not None and stop_event.is_set():
+                report.elapsed_s = time.perf_counter() - started
+                return report
+
+            chunk_started = time.perf_counter()
+            with bind.connect() as conn:
+                rows: List[_Row] = [
+                    tuple(row)
+                    for row in conn.execute(
+                        select(votes.c.id, votes.c.agenda_item_id, votes.c.owner_id, votes.c.value_encrypted)
+                        .where(votes.c.id > last_id)
+                        .order_by(votes.c.id)
+                        .limit(chunk_size)
+                    )
+                ]
+            if not rows:
+                break
+
+            pending: List[_Row] = []
+            failed = 0
+            for row in rows:
+                try:
+                    if ciphertext_key_id(row[3]) != target:
+                        pending.append(row)
+                except VoteDecryptionError:
+                    failed += 1
+
+            updates: List[dict] = []
+            if pending:
+                step = max(1, -(-len(pending) // max(1, workers)))
+                parts = [pending[i:i + step] for i in range(0, len(pending), step)]
+                for part_updates, part_failed in pool.map(_reencrypt_rows, parts):
+                    updates.extend(part_updates)
+                    failed += part_failed
+
+            last_id = rows[-1][0]
+            with bind.begin() as conn:
+                if updates:
+                    conn.execute(apply_update, updates)
+                conn.execute(
+                    update(VoteRekeyCheckpoint.__table__)
+                    .where(VoteRekeyCheckpoint.target_key_id == report.target_key_id)
+                    .values(
+                        last_vote_id=last_id,
+                        reencrypted=VoteRekeyCheckpoint.reencrypted + len(updates),
+                        failed=VoteRekeyCheckpoint.failed + failed,
+                        updated_at=datetime.now(timezone.utc),
+                    )
+                )
+
+            report.scanned += len(rows)
+            report.reencrypted += len(updates)
+            report.failed += failed
+            report.chunks += 1
+
+            if max_rows_per_second:
+                min_duration = len(rows) / max_rows_per_second
+                remaining = min_duration - (time.perf_counter() - chunk_started)
+                if remaining > 0:
+                    time.sleep(remaining)
+
+    with bind.begin() as conn:
+        conn.execute(
+            update(VoteRekeyCheckpoint.__table__)
+            .where(VoteRekeyCheckpoint.target_key_id == report.target_key_id)
+            .values(finished_at=datetime.now(timezone.utc))
+        )
+    report.finished = True
+    report.elapsed_s = time.perf_counter() - started
+    logger.info(
+        "Recifrado terminado hacia %s: %s votos recifrados, %s fallidos.",
+        report.target_key_id,
+        report.reencrypted,
+        report.failed,
+    )
+    return report
+
+
+def old_keys_in_archives(db: Session) -> Dict[str, List[int]]:
+    """
+    Claves distintas de la actual que aún usan asambleas archivadas.
+
+    Retorna:
+        {etiqueta: meeting_ids}, donde la etiqueta es
+        "VOTE_ENCRYPTION_OLD_KEYS[i]" o, si ninguna clave configurada
+        coincide, "key_id <hex> (no configurada)": esos votos archivados ya
+        no pueden descifrarse.
+    """
+    current = get_vote_key().key_id.hex()
+    positions = {
+        derive_vote_key(secret).key_id.hex(): index
+        for index, secret in enumerate(settings.VOTE_ENCRYPTION_OLD_KEYS)
+    }
+    retained: Dict[str, List[int]] = {}
+    for key_id, meeting_ids in archived_vote_key_usage(db).items():
+        if key_id == current:
+            continue
+        if key_id in positions:
+            label = f"VOTE_ENCRYPTION_OLD_KEYS[{positions[key_id]}]"
+        else:
+            label = f"key_id {key_id} (no configurada)"
+        retained[label] = meeting_ids
+    return retained
@@ -0,0 +1,9 @@
+"""
+backend/benchmarks/__init__.py
+
+Scripts de medición de desempeño de AgoraX.
+
+No forman parte de la aplicación desplegada; se ejecutan desde la carpeta
+backend/, por ejemplo:
+    python -m benchmarks.load_simulator --backend sqlite
+"""
@@ -0,0 +1,234 @@
+"""
+backend/benchmarks/query_plans.py
+
+Verifica que las consultas de las rutas calientes usen índices.
+
+Crea el esquema con las migraciones (core/schema.py), siembra un
+conjunto de datos grande y obtiene el plan de cada consulta:
+
+    - SQLite: EXPLAIN QUERY PLAN; falla si alguna tabla se recorre con SCAN.
+    - PostgreSQL: EXPLAIN tras ANALYZE; falla si aparece un Seq Scan.
+
+Termina con código 1 si alguna consulta no usa índice, de modo que sirve
+como verificación en CI.
+
+Uso (desde backend/):
+    python -m benchmarks.query_plans --owners 20000 --meetings 50
+    DB_BACKEND=postgresql python -m benchmarks.query_plans   # base desechable
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+from datetime import datetime, timezone
+
+_BATCH = 5000
+
+
+def _insert(conn, table, rows) -> None:
+    for start in range(0, len(rows), _BATCH):
+        conn.execute(table.insert(), rows[start:start + _BATCH])
+
+
+def _seed(engine, owners: int, meetings: int, items_per_meeting: int) -> dict:
+    """
+    Siembra usuarios, propietarios, asambleas, puntos, presencias, votos y auditoría.
+
+    Devuelve identificadores representativos para parametrizar las consultas.
+    """
+    from app.models import AgendaItem, AuditLog, Condominium, Meeting, Owner, Presence, User, Vote
+
+    rng = random.Random(7)
+    now = datetime.now(timezone.utc)
+    condominiums = max(1, owners // 1000)
+    with engine.begin() as conn:
+        _insert(conn, Condominium.__table__, [
+            {"id": c + 1, "name": f"Conjunto {c}", "coeficiente_total": 100.0} for c in range(condominiums)
+        ])
+        _insert(conn, User.__table__, [
+            {"id": u + 1, "email": f"plan{u}@agorax.local", "hashed_password": "x", "role": "OWNER"}
+            for u in range(owners)
+        ])
+        _insert(conn, Owner.__table__, [
+            {
+                "id": o + 1,
+                "user_id": o + 1,
+                "condominium_id": o % condominiums + 1,
+                "name": f"Propietario {o}",
+                "coeficiente": 1.0,
+                "is_in_debt": False,
+            }
+            for o in range(owners)
+        ])
+        _insert(conn, Meeting.__table__, [
+            {
+                "id": m + 1,
+                "condominium_id": m % condominiums + 1,
+                "title": f"Asamblea {m}",
+                "date": now,
+                "status": "IN_PROGRESS",
+                "total_propietarios": owners // condominiums,
+                "version": 1,
+            }
+            for m in range(meetings)
+        ])
+        _insert(conn, AgendaItem.__table__, [
+            {
+                "id": m * items_per_meeting + i + 1,
+                "meeting_id": m + 1,
+                "title": f"Punto {i}",
+                "status": "OPEN",
+                "approval_threshold": 50.0,
+                "threshold_basis": "PRESENT",
+                "version": 1,
+            }
+            for m in range(meetings)
+            for i in range(items_per_meeting)
+        ])
+
+        presences, votes = [], []
+        for m in range(meetings):
+            members = [o for o in range(owners) if o % condominiums == m % condominiums]
+            attending = rng.sample(members, k=len(members) // 2)
+            presences.extend(
+                {"meeting_id": m + 1, "owner_id": o + 1, "coeficiente": 1.0, "created_at": now}
+                for o in attending
+            )
+            for i in range(items_per_meeting):
+                votes.extend(
+                    {
+                        "agenda_item_id": m * items_per_meeting + i + 1,
+                        "owner_id": o + 1,
+                        "value_encrypted": "x",
+                        "created_at": now,
+                    }
+                    for o in attending[: len(attending) // 2]
+                )
+        _insert(conn, Presence.__table__, presences)
+        _insert(conn, Vote.__table__, votes)
+        _insert(conn, AuditLog.__table__, [
+            {
+                "user_id": rng.randint(1, owners),
+                "action": "VOTE_CAST",
+                "entity_type": rng.choice(("Vote", "Meeting", "AgendaItem", "Presence")),
+                "entity_id": rng.randint(1, len(votes)),
+                "created_at": now,
+            }
+            for _ in range(len(votes))
+        ])
+        # Estadísticas para el planificador (PostgreSQL y SQLite)
+        conn.exec_driver_sql("ANALYZE")
+    return {
+        "user_id": owners // 2,
+        "owner_id": owners // 2,
+        "condominium_id": 1,
+        "meeting_id": 1,
+        "agenda_item_id": 1,
+        "presences": len(presences),
+        "votes": len(votes),
+    }
+
+
+def _hot_queries(ids: dict) -> list:
+    from sqlalchemy import select
+
+    from app.models import AgendaItem, AuditLog, Meeting, Owner, Presence, Vote
+    from app.services import dashboard_service
+    from app.services.rule_engine import VOTE_PIPELINE
+
+    facts = VOTE_PIPELINE._statement("user_id")
+    page_ids = list(range(1, 21))
+    return [
+        ("owners.user_id", select(Owner).where(Owner.user_id == ids["user_id"]), {}),
+        ("owners.condominium_id", select(Owner).where(Owner.condominium_id == ids["condominium_id"]), {}),
+        ("presences.meeting_id", select(Presence).where(Presence.meeting_id == ids["meeting_id"]), {}),
+        ("presences.owner_id", select(Presence).where(Presence.owner_id == ids["owner_id"]), {}),
+        ("votes.agenda_item_id", select(Vote).where(Vote.agenda_item_id == ids["agenda_item_id"]), {}),
+        ("votes.owner_id", select(Vote).where(Vote.owner_id == ids["owner_id"]), {}),
+        ("agenda_items.meeting_id", select(AgendaItem).where(AgendaItem.meeting_id == ids["meeting_id"]), {}),
+        ("meetings.condominium_id", select(Meeting).where(Meeting.condominium_id == ids["condominium_id"]), {}),
+        (
+            "audit_logs(entity)",
+            select(AuditLog)
+            .where(AuditLog.entity_type == "Vote", AuditLog.entity_id == ids["agenda_item_id"])
+            .order_by(AuditLog.created_at.asc()),
+            {},
+        ),
+        (
+            "dashboard.versions",
+            dashboard_service._versions_statement(page_ids),
+            {},
+        ),
+        ("dashboard.presences", dashboard_service._presences_statement(page_ids), {}),
+        ("dashboard.agenda_votes", dashboard_service._agenda_votes_statement(page_ids), {}),
+        (
+            "vote_pipeline.facts",
+            facts,
+            {
+                "meeting_id": ids["meeting_id"],
+                "agenda_item_id": ids["agenda_item_id"],
+                "owner_key": ids["user_id"],
+                "represented_owner_id": None,
+            },
+        ),
+    ]
+
+
+def _explain(conn, stmt, values: dict) -> list[str]:
+    # render_postcompile: expande los IN (...) en parámetros individuales
+    compiled = stmt.compile(dialect=conn.dialect, compile_kwargs={"render_postcompile": True})
+    params = compiled.construct_params(values)
+    if compiled.positional:
+        params = tuple(params[name] for name in compiled.positiontup)
+    if conn.dialect.name == "postgresql":
+        return [row[0] for row in conn.exec_driver_sql("EXPLAIN " + str(compiled), params)]
+    # (id, parent, notused, detail)
+    return [row[-1] for row in conn.exec_driver_sql("EXPLAIN QUERY PLAN " + str(compiled), params)]
+
+
+def _full_scans(dialect: str, plan: list[str]) -> list[str]:
+    if dialect == "postgresql":
+        return [line.strip() for line in plan if "Seq Scan" in line]
+    return [line for line in plan if line.startswith("SCAN ")]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Verificación de planes de las rutas calientes")
+    parser.add_argument("--owners", type=int, default=20000)
+    parser.add_argument("--meetings", type=int, default=50)
+    parser.add_argument("--items", type=int, default=5, help="puntos de agenda por asamblea")
+    args = parser.parse_args()
+
+    os.environ.setdefault("DB_BACKEND", "sqlite")
+    os.environ.setdefault("SQLITE_PATH", os.path.join(tempfile.mkdtemp(prefix="agorax-"), "plans.db"))
+
+    from app.core.db import engine
+    from app.core.schema import ensure_schema
+
+    ensure_schema(engine)
+    ids = _seed(engine, args.owners, args.meetings, args.items)
+    print(
+        f"Datos: {args.owners} propietarios, {args.meetings} asambleas, "
+        f"{ids['presences']} presencias, {ids['votes']} votos ({engine.dialect.name})\n"
+    )
+
+    failures = 0
+    with engine.connect() as conn:
+        for label, stmt, values in _hot_queries(ids):
+            plan = _explain(conn, stmt, values)
+            scans = _full_scans(engine.dialect.name, plan)
+            failures += bool(scans)
+            print(f"{'FALLA' if scans else 'ok':<6} {label}")
+            for line in scans or plan[:1]:
+                print(f"       {line.strip()}")
+
+    if failures:
+        print(f"\n{failures} consulta(s) recorren una tabla completa.")
+        sys.exit(1)
+    print("\nTodas las consultas calientes usan índices.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""
+backend/benchmarks/read_path.py
+
+Compara la ruta de lectura anterior con la ruta liviana (read_service).
+
+Antes:
+    ORM completo (con cascadas selectin) -> modelos Pydantic -> validación
+    del response_model -> jsonable_encoder -> json.dumps.
+Después:
+    SELECT de columnas -> DTOs con slots -> TypeAdapter.dump_json.
+
+Reporta CPU por fila (time.process_time) y memoria pico (tracemalloc) para
+el listado de votos de un punto de agenda y el listado de asambleas.
+
+Uso (desde backend/):
+    python -m benchmarks.read_path --votes 5000 --meetings 500
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+
+
+def _measure(fn, repeats: int) -> tuple[float, float]:
+    """Devuelve (CPU segundos por repetición, memoria pico en KiB)."""
+    fn()  # calentamiento (compila sentencias y adapters)
+    cpu_start = time.process_time()
+    for _ in range(repeats):
+        fn()
+    cpu = (time.process_time() - cpu_start) / repeats
+
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return cpu, peak / 1024.0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark de la ruta de lectura")
+    parser.add_argument("--votes", type=int, default=3000)
+    parser.add_argument("--meetings", type=int, default=300)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    os.environ.setdefault("DB_BACKEND", "sqlite")
+    os.environ.setdefault("SQLITE_PATH", os.path.join(tempfile.mkdtemp(prefix="agorax-"), "read.db"))
+
+    from typing import List
+
+    from fastapi.encoders import jsonable_encoder
+    from pydantic import TypeAdapter
+
+    from app.core.db import Base, SessionLocal, engine
+    from app.models import AgendaItem, Condominium, Meeting, Owner, User, Vote
+    from app.schemas.meeting_schema import MeetingSummary
+    from app.schemas.vote_schema import VoteResponse
+    from app.services import read_service
+
+    Base.metadata.create_all(bind=engine)
+    with SessionLocal() as db:
+        condominium = Condominium(name="Bench", coeficiente_total=float(args.votes))
+        db.add(condominium)
+        db.flush()
+        users = [User(email=f"bench{i}@agorax.local", hashed_password="x") for i in range(args.votes)]
+        db.add_all(users)
+        db.flush()
+        owners = [
+            Owner(user_id=u.id, condominium_id=condominium.id, name=f"P{i}", coeficiente=1.0)
+            for i, u in enumerate(users)
+        ]
+        db.add_all(owners)
+        meetings = [
+            Meeting(condominium_id=condominium.id, title=f"Asamblea {i}", total_propietarios=1)
+            for i in range(args.meetings)
+        ]
+        db.add_all(meetings)
+        db.flush()
+        item = AgendaItem(meeting_id=meetings[0].id, title="Punto", status="OPEN")
+        db.add(item)
+        db.flush()
+        db.add_all(
+            Vote(agenda_item_id=item.id, owner_id=o.id, value_encrypted="x") for o in owners
+        )
+        db.commit()
+        item_id = item.id
+
+    votes_model_adapter = TypeAdapter(List[VoteResponse])
+    meetings_model_adapter = TypeAdapter(List[MeetingSummary])
+
+    def votes_before():
+        with SessionLocal() as db:
+            votes = (
+                db.query(Vote)
+                .filter(Vote.agenda_item_id == item_id)
+                .order_by(Vote.created_at.asc())
+                .all()
+            )
+            models = [
+                VoteResponse(
+                    id=v.id,
+                    agenda_item_id=v.agenda_item_id,
+                    owner_id=v.owner_id,
+                    created_at=v.created_at,
+                )
+                for v in votes
+            ]
+            validated = votes_model_adapter.validate_python(models, from_attributes=True)
+            return json.dumps(jsonable_encoder(validated)).encode("utf-8")
+
+    def votes_after():
+        with SessionLocal() as db:
+            rows = read_service.list_vote_rows(db, agenda_item_id=item_id)
+            return read_service.VOTE_ROWS_ADAPTER.dump_json(rows)
+
+    def meetings_before():
+        with SessionLocal() as db:
+            meetings = db.query(Meeting).order_by(Meeting.date.desc()).all()
+            validated = meetings_model_adapter.validate_python(meetings, from_attributes=True)
+            return json.dumps(jsonable_encoder(validated)).encode("utf-8")
+
+    def meetings_after():
+        with SessionLocal() as db:
+            rows = read_service.list_meeting_rows(db)
+            return read_service.MEETING_ROWS_ADAPTER.dump_json(rows)
+
+    assert json.loads(votes_before()) == json.loads(votes_after())
+    assert json.loads(meetings_before()) == json.loads(meetings_after())
+
+    print(f"{'ruta':<22} {'filas':>6} {'µs CPU/fila':>12} {'KiB pico':>10} {'bytes/fila':>11}")
+    for label, rows, fn in (
+        ("votos (antes)", args.votes, votes_before),
+        ("votos (después)", args.votes, votes_after),
+        ("asambleas (antes)", args.meetings, meetings_before),
+        ("asambleas (después)", args.meetings, meetings_after),
+    ):
+        cpu, peak_kib = _measure(fn, args.repeats)
+        print(
+            f"{label:<22} {rows:>6} {cpu / rows * 1e6:>12.2f} "
+            f"{peak_kib:>10.0f} {peak_kib * 1024 / rows:>11.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
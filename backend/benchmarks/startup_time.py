@@ -0,0 +1,85 @@
+"""
+backend/benchmarks/startup_time.py
+
+Mide el arranque en frío de un worker de AgoraX.
+
+Cada iteración lanza un intérprete nuevo (como haría uvicorn/gunicorn al
+crear un worker) y mide por separado:
+- import_ms: tiempo de `import app.main` (no debe tocar la base de datos).
+- startup_ms: tiempo del hook lifespan (verificación de huella del esquema).
+- pesados: módulos criptográficos cargados tras el arranque (deberían
+  ser ninguno: passlib, bcrypt y jose se cargan en el primer uso).
+
+La primera iteración crea el esquema; las siguientes solo validan la huella.
+
+Uso (desde backend/):
+    python -m benchmarks.startup_time --runs 10
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+_PROBE = r"""
+import asyncio, json, sys, time
+t0 = time.perf_counter()
+import app.main as main
+t1 = time.perf_counter()
+
+async def _startup():
+    async with main.app.router.lifespan_context(main.app):
+        pass
+
+asyncio.run(_startup())
+t2 = time.perf_counter()
+heavy = [m for m in ("passlib", "bcrypt", "jose", "cryptography") if m in sys.modules]
+print(json.dumps({
+    "import_ms": (t1 - t0) * 1000.0,
+    "startup_ms": (t2 - t1) * 1000.0,
+    "heavy": heavy,
+}))
+"""
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Tiempo de arranque por worker")
+    parser.add_argument("--runs", type=int, default=8)
+    parser.add_argument("--backend", choices=["sqlite", "postgresql"], default="sqlite")
+    args = parser.parse_args()
+
+    env = dict(os.environ)
+    env["DB_BACKEND"] = args.backend
+    if args.backend == "sqlite":
+        env["SQLITE_PATH"] = os.path.join(tempfile.mkdtemp(prefix="agorax-"), "startup.db")
+
+    results = []
+    for run in range(args.runs):
+        proc = subprocess.run(
+            [sys.executable, "-c", _PROBE],
+            capture_output=True,
+            text=True,
+            env=env,
+            check=True,
+        )
+        sample = json.loads(proc.stdout.strip().splitlines()[-1])
+        results.append(sample)
+        label = "frío (crea esquema)" if run == 0 else "huella cacheada"
+        print(
+            f"run {run:>2}  import {sample['import_ms']:7.1f} ms  "
+            f"startup {sample['startup_ms']:7.1f} ms  pesados={sample['heavy'] or '-'}  [{label}]"
+        )
+
+    warm = results[1:] or results
+    print(
+        "mediana (huella cacheada): "
+        f"import {statistics.median(r['import_ms'] for r in warm):.1f} ms, "
+        f"startup {statistics.median(r['startup_ms'] for r in warm):.1f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+backend/benchmarks/vote_crypto.py
+
+Mide el rendimiento del cifrado de votos (app.core.vote_crypto).
+
+Compara:
+- sin caché: derivar la clave y crear el cifrador en cada voto.
+- individual: encrypt/decrypt_vote_value con el cifrador cacheado.
+- lote: encrypt/decrypt_vote_values (nonces en una sola lectura, cifrador resuelto por lote).
+
+Y los dos caminos que descifran en bloque:
+- escrutinio: descifrar todos los votos de un punto y contarlos.
+- exportación: descifrar y escribir un CSV (agenda_item_id, owner_id, valor).
+
+Uso (desde backend/):
+    python -m benchmarks.vote_crypto --votes 20000
+"""
+
+import argparse
+import csv
+import io
+import os
+import time
+from collections import Counter
+
+
+def _rate(label: str, count: int, fn) -> None:
+    fn()  # calentamiento
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {count / elapsed:>12,.0f} votos/s  {elapsed / count * 1e6:>8.2f} µs/voto")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark de cifrado de votos")
+    parser.add_argument("--votes", type=int, default=20000)
+    args = parser.parse_args()
+
+    os.environ.setdefault("VOTE_ENCRYPTION_KEY", "benchmark-key-" + "x" * 32)
+
+    from app.core import vote_crypto
+
+    options = ("SI", "NO", "ABSTENCION")
+    values = [options[i % 3] for i in range(args.votes)]
+    aads = [vote_crypto.vote_aad(1, owner_id) for owner_id in range(args.votes)]
+    secret = os.environ["VOTE_ENCRYPTION_KEY"]
+
+    def encrypt_uncached():
+        out = []
+        for value, aad in zip(values, aads):
+            key = vote_crypto.derive_vote_key(secret)
+            nonce = os.urandom(12)
+            out.append(key.aead.encrypt(nonce, value.encode("utf-8"), aad))
+        return out
+
+    def encrypt_single():
+        return [
+            vote_crypto.encrypt_vote_value(value, associated_data=aad)
+            for value, aad in zip(values, aads)
+        ]
+
+    def encrypt_batch():
+        return vote_crypto.encrypt_vote_values(values, associated_data=aads)
+
+    tokens = encrypt_batch()
+    assert vote_crypto.decrypt_vote_values(tokens, associated_data=aads) == values
+
+    def decrypt_single():
+        return [
+            vote_crypto.decrypt_vote_value(token, associated_data=aad)
+            for token, aad in zip(tokens, aads)
+        ]
+
+    def decrypt_batch():
+        return vote_crypto.decrypt_vote_values(tokens, associated_data=aads)
+
+    def tally():
+        return Counter(vote_crypto.decrypt_vote_values(tokens, associated_data=aads))
+
+    def export():
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        clear = vote_crypto.decrypt_vote_values(tokens, associated_data=aads)
+        writer.writerows((1, owner_id, value) for owner_id, value in enumerate(clear))
+        return buffer.getvalue()
+
+    print(f"votos: {args.votes}")
+    _rate("cifrar sin caché", args.votes, encrypt_uncached)
+    _rate("cifrar individual", args.votes, encrypt_single)
+    _rate("cifrar lote", args.votes, encrypt_batch)
+    _rate("descifrar individual", args.votes, decrypt_single)
+    _rate("descifrar lote", args.votes, decrypt_batch)
+    _rate("escrutinio (lote)", args.votes, tally)
+    _rate("exportación CSV (lote)", args.votes, export)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+backend/migrations/env.py
+
+Entorno de Alembic para AgoraX.
+
+- Los metadatos objetivo son los de los modelos (app.models).
+- La conexión llega de dos formas:
+    - Desde la aplicación (core/schema.py): config.attributes["connection"],
+      dentro de la transacción que ya tomó el bloqueo de arranque.
+    - Desde la línea de comandos: la URL de la configuración
+      (build_database_url), o la de `-x url=...` para migrar un shard.
+- En SQLite las alteraciones de tablas usan el modo batch (copiar y
+  renombrar), porque SQLite no soporta la mayoría de ALTER TABLE.
+"""
+
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import create_engine, pool
+
+import app.models  # noqa: F401  (registra todos los modelos)
+from app.core.config import get_settings
+from app.core.db import Base, build_database_url
+
+config = context.config
+
+if config.config_file_name is not None and config.attributes.get("connection") is None:
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
+
+target_metadata = Base.metadata
+
+# Tablas que no gestionan las migraciones (huella de arranque de core/schema.py)
+_UNMANAGED_TABLES = {"agorax_schema_state"}
+
+
+def _include_object(obj, name, type_, reflected, compare_to):
+    return not (type_ == "table" and name in _UNMANAGED_TABLES)
+
+
+def _database_url() -> str:
+    return context.get_x_argument(as_dictionary=True).get("url") or build_database_url(get_settings())
+
+
+def _configure(**kwargs) -> None:
+    context.configure(
+        target_metadata=target_metadata,
+        include_object=_include_object,
+        compare_type=True,
+        **kwargs,
+    )
+
+
+def run_migrations_offline() -> None:
+    """
+    Genera el SQL sin conectarse (alembic upgrade head --sql).
+    """
+    url = _database_url()
+    _configure(url=url, literal_binds=True, render_as_batch=url.startswith("sqlite"))
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        _configure(connection=connection, render_as_batch=connection.dialect.name == "sqlite")
+        with context.begin_transaction():
+            context.run_migrations()
+        return
+
+    connectable = create_engine(_database_url(), poolclass=pool.NullPool)
+    with connectable.connect() as connection:
+        _configure(connection=connection, render_as_batch=connection.dialect.name == "sqlite")
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,255 @@
+"""
+Esquema base de AgoraX.
+
+Reproduce las tablas que hasta ahora creaba create_all a partir de los
+modelos. En SQLite las PK enteras llevan AUTOINCREMENT, como en
+core/db.py, para que cada shard tenga su contador en sqlite_sequence. Las bases ya existentes creadas así no ejecutan esta revisión:
+core/schema.py las marca (stamp) como 0001 al adoptarlas.
+
+Revisión: 0001
+Anterior: ninguna
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0001"
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('condominiums',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=255), nullable=False),
+    sa.Column('coeficiente_total', sa.Float(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sqlite_autoincrement=True,
+    )
+    op.create_index('ix_condominiums_id', 'condominiums', ['id'], unique=False)
+
+    op.create_table('meeting_routes',
+    sa.Column('meeting_id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('condominium_id', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('meeting_id'),
+    sqlite_autoincrement=True,
+    )
+    op.create_index('ix_meeting_routes_condominium_id', 'meeting_routes', ['condominium_id'], unique=False)
+
+    op.create_table('outbox_consumer_offsets',
+    sa.Column('consumer', sa.String(length=100), nullable=False),
+    sa.Column('last_event_id', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('consumer'),
+    sqlite_autoincrement=True,
+    )
+    op.create_table('outbox_events',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('event_type', sa.String(length=50), nullable=False),
+    sa.Column('meeting_id', sa.Integer(), nullable=True),
+    sa.Column('entity_type', sa.String(length=50), nullable=False),
+    sa.Column('entity_id', sa.Integer(), nullable=True),
+    sa.Column('payload_json', sa.Text(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sqlite_autoincrement=True,
+    )
+    op.create_index('ix_outbox_events_meeting_id_id', 'outbox_events', ['meeting_id', 'id'], unique=False)
+
+    op.create_table('tenant_shards',
+    sa.Column('condominium_id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('shard', sa.String(length=64), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('condominium_id'),
+    sqlite_autoincrement=True,
+    )
+    op.create_table('users',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('email', sa.String(length=255), nullable=False),
+    sa.Column('hashed_password', sa.String(length=255), nullable=False),
+    sa.Column('full_name', sa.String(length=255), nullable=True),
+    sa.Column('role', sa.String(length=50), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sqlite_autoincrement=True,
+    )
+    op.create_index('ix_users_email', 'users', ['email'], unique=True)
+    op.create_index('ix_users_id', 'users', ['id'], unique=False)
+
+    op.create_table('vote_journal_checkpoints',
+    sa.Column('journal_id', sa.String(length=36), nullable=False),
+    sa.Column('applied_seq', sa.BigInteger(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('journal_id'),
+    sqlite_autoincrement=True,
+    )
+    op.create_table('vote_rekey_checkpoints',
+    sa.Column('target_key_id', sa.String(length=16), nullable=False),
+    sa.Column('last_vote_id', sa.Integer(), nullable=False),
+    sa.Column('reencrypted', sa.Integer(), nullable=False),
+    sa.Column('failed', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('target_key_id'),
+    sqlite_autoincrement=True,
+    )
+    op.create_table('audit_logs',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=True),
+    sa.Column('action', sa.String(length=100), nullable=False),
+    sa.Column('entity_type', sa.String(length=100), nullable=False),
+    sa.Column('entity_id', sa.Integer(), nullable=True),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sqlite_autoincrement=True,
+    )
+    op.create_index('ix_audit_logs_id', 'audit_logs', ['id'], unique=False)
+
+    op.create_table('meetings',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('condominium_id', sa.Integer(), nullable=False),
+    sa.Column('title', sa.String(length=255), nullable=False),
+    sa.Column('date', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('status', sa.String(length=50), nullable=False),
+    sa.Column('total_propietarios', sa.Integer(), nullable=False),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['condominium_id'], ['condominiums.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sqlite_autoincrement=True,
+    )
+    op.create_index('ix_meetings_id', 'meetings', ['id'], unique=False)
+
+    op.create_table('owners',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('condominium_id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=255), nullable=False),
+    sa.Column('unit', sa.String(length=50), nullable=True),
+    sa.Column('coeficiente', sa.Float(), nullable=False),
+    sa.Column('is_in_debt', sa.Boolean(), nullable=False),
+    sa.ForeignKeyConstraint(['condominium_id'], ['condominiums.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sqlite_autoincrement=True,
+    )
+    op.create_index('ix_owners_id', 'owners', ['id'], unique=False)
+
+    op.create_table('agenda_items',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('meeting_id', sa.Integer(), nullable=False),
+    sa.Column('title', sa.String(length=255), nullable=False),
+    sa.Column('status', sa.String(length=50), nullable=False),
+    sa.Column('approval_threshold', sa.Float(), nullable=False),
+    sa.Column('threshold_basis', sa.String(length=20), nullable=False),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['meeting_id'], ['meetings.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sqlite_autoincrement=True,
+    )
+    op.create_index('ix_agenda_items_id', 'agenda_items', ['id'], unique=False)
+
+    op.create_table('delegations',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('meeting_id', sa.Integer(), nullable=False),
+    sa.Column('principal_owner_id', sa.Integer(), nullable=False),
+    sa.Column('proxy_user_id', sa.Integer(), nullable=False),
+    sa.Column('created_by_user_id', sa.Integer(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.ForeignKeyConstraint(['created_by_user_id'], ['users.id'], ),
+    sa.ForeignKeyConstraint(['meeting_id'], ['meetings.id'], ),
+    sa.ForeignKeyConstraint(['principal_owner_id'], ['owners.id'], ),
+    sa.ForeignKeyConstraint(['proxy_user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('meeting_id', 'principal_owner_id', name='uq_delegation_meeting_principal'),
+    sa.UniqueConstraint('meeting_id', 'proxy_user_id', name='uq_delegation_meeting_proxy'),
+    sqlite_autoincrement=True,
+    )
+    op.create_index('ix_delegations_id', 'delegations', ['id'], unique=False)
+
+    op.create_table('presences',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('meeting_id', sa.Integer(), nullable=False),
+    sa.Column('owner_id', sa.Integer(), nullable=False),
+    sa.Column('coeficiente', sa.Float(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.ForeignKeyConstraint(['meeting_id'], ['meetings.id'], ),
+    sa.ForeignKeyConstraint(['owner_id'], ['owners.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('meeting_id', 'owner_id', name='uq_presence_meeting_owner'),
+    sqlite_autoincrement=True,
+    )
+    op.create_index('ix_presences_id', 'presences', ['id'], unique=False)
+
+    op.create_table('voting_rights',
+    sa.Column('meeting_id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('owner_id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('coeficiente', sa.Float(), nullable=False),
+    sa.Column('delegated', sa.Boolean(), nullable=False),
+    sa.ForeignKeyConstraint(['meeting_id'], ['meetings.id'], ),
+    sa.ForeignKeyConstraint(['owner_id'], ['owners.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('meeting_id', 'owner_id'),
+    sqlite_autoincrement=True,
+    )
+    op.create_index('ix_voting_rights_meeting_user', 'voting_rights', ['meeting_id', 'user_id'], unique=False)
+
+    op.create_table('agenda_item_results',
+    sa.Column('agenda_item_id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('meeting_id', sa.Integer(), nullable=False),
+    sa.Column('total_votes', sa.Integer(), nullable=False),
+    sa.Column('total_weight', sa.Float(), nullable=False),
+    sa.Column('basis_weight', sa.Float(), nullable=False),
+    sa.Column('approval_threshold', sa.Float(), nullable=False),
+    sa.Column('threshold_basis', sa.String(length=20), nullable=False),
+    sa.Column('approval_pct', sa.Float(), nullable=False),
+    sa.Column('approved', sa.Boolean(), nullable=False),
+    sa.Column('rules_version', sa.String(length=32), nullable=False),
+    sa.Column('payload_json', sa.Text(), nullable=False),
+    sa.Column('computed_at', sa.DateTime(timezone=True), nullable=False),
+    sa.ForeignKeyConstraint(['agenda_item_id'], ['agenda_items.id'], ),
+    sa.ForeignKeyConstraint(['meeting_id'], ['meetings.id'], ),
+    sa.PrimaryKeyConstraint('agenda_item_id'),
+    sqlite_autoincrement=True,
+    )
+    op.create_index('ix_agenda_item_results_meeting_id', 'agenda_item_results', ['meeting_id'], unique=False)
+
+    op.create_table('votes',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('agenda_item_id', sa.Integer(), nullable=False),
+    sa.Column('owner_id', sa.Integer(), nullable=False),
+    sa.Column('value_encrypted', sa.String(length=512), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('ip_address', sa.String(length=64), nullable=True),
+    sa.ForeignKeyConstraint(['agenda_item_id'], ['agenda_items.id'], ),
+    sa.ForeignKeyConstraint(['owner_id'], ['owners.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('agenda_item_id', 'owner_id', name='uq_vote_agenda_owner'),
+    sqlite_autoincrement=True,
+    )
+    op.create_index('ix_votes_id', 'votes', ['id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_table('votes')
+    op.drop_table('agenda_item_results')
+    op.drop_table('voting_rights')
+    op.drop_table('presences')
+    op.drop_table('delegations')
+    op.drop_table('agenda_items')
+    op.drop_table('owners')
+    op.drop_table('meetings')
+    op.drop_table('audit_logs')
+    op.drop_table('vote_rekey_checkpoints')
+    op.drop_table('vote_journal_checkpoints')
+    op.drop_table('users')
+    op.drop_table('tenant_shards')
+    op.drop_table('outbox_events')
+    op.drop_table('outbox_consumer_offsets')
+    op.drop_table('meeting_routes')
+    op.drop_table('condominiums')
@@ -0,0 +1,51 @@
+"""
+Índices de las rutas calientes.
+
+Búsquedas que recorrían la tabla completa:
+
+    - owners.user_id: get_current_user, hechos del pipeline de votación.
+    - owners.condominium_id: quórum, búsqueda de propietarios, listados.
+    - presences.owner_id / votes.owner_id: cargas selectin desde Owner.
+    - agenda_items.meeting_id: agenda de una asamblea.
+    - meetings.condominium_id: asambleas de un conjunto.
+    - audit_logs(entity_type, entity_id): historial de una entidad.
+
+presences.meeting_id y votes.agenda_item_id no necesitan índice propio:
+son la primera columna de uq_presence_meeting_owner y uq_vote_agenda_owner.
+
+Los índices se crean con IF NOT EXISTS porque las bases adoptadas pueden
+haber recibido tablas nuevas por create_all (ver core/schema.py).
+
+Revisión: 0002
+Anterior: 0001
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0002"
+down_revision: Union[str, Sequence[str], None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (nombre, tabla, columnas)
+HOT_PATH_INDEXES = (
+    ("ix_owners_user_id", "owners", ["user_id"]),
+    ("ix_owners_condominium_id", "owners", ["condominium_id"]),
+    ("ix_presences_owner_id", "presences", ["owner_id"]),
+    ("ix_votes_owner_id", "votes", ["owner_id"]),
+    ("ix_agenda_items_meeting_id", "agenda_items", ["meeting_id"]),
+    ("ix_meetings_condominium_id", "meetings", ["condominium_id"]),
+    ("ix_audit_logs_entity", "audit_logs", ["entity_type", "entity_id"]),
+)
+
+
+def upgrade() -> None:
+    for name, table, columns in HOT_PATH_INDEXES:
+        op.create_index(name, table, columns, unique=False, if_not_exists=True)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(HOT_PATH_INDEXES):
+        op.drop_index(name, table_name=table, if_exists=True)
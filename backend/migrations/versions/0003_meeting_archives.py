@@ -0,0 +1,46 @@
+"""
+Índice de asambleas archivadas (meeting_archives).
+
+Ver services/archive_service.py. Como en 0002, IF NOT EXISTS cubre las
+bases adoptadas, en las que create_all ya pudo crear la tabla.
+
+Revisión: 0003
+Anterior: 0002
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0003"
+down_revision: Union[str, Sequence[str], None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('meeting_archives',
+    sa.Column('meeting_id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('condominium_id', sa.Integer(), nullable=False),
+    sa.Column('title', sa.String(length=255), nullable=False),
+    sa.Column('date', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('status', sa.String(length=50), nullable=False),
+    sa.Column('total_propietarios', sa.Integer(), nullable=False),
+    sa.Column('path', sa.String(length=500), nullable=False),
+    sa.Column('sha256', sa.String(length=64), nullable=False),
+    sa.Column('size_bytes', sa.Integer(), nullable=False),
+    sa.Column('row_count', sa.Integer(), nullable=False),
+    sa.Column('format_version', sa.Integer(), nullable=False),
+    sa.Column('archived_at', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('meeting_id'),
+    if_not_exists=True,
+    )
+    op.create_index(
+        'ix_meeting_archives_condominium_id', 'meeting_archives', ['condominium_id'],
+        unique=False, if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('meeting_archives')
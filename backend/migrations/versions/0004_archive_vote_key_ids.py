@@ -0,0 +1,33 @@
+"""
+Claves de voto usadas por cada asamblea archivada (meeting_archives.vote_key_ids).
+
+Los archivos en frío no se recifran al rotar VOTE_ENCRYPTION_KEY: la
+columna permite saber qué claves deben seguir en VOTE_ENCRYPTION_OLD_KEYS.
+Los archivos existentes quedan en NULL y se rellenan leyendo el archivo
+(services/archive_service.py). Se comprueba la columna antes de crearla
+porque las bases adoptadas pueden haber recibido la tabla por create_all.
+
+Revisión: 0004
+Anterior: 0003
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0004"
+down_revision: Union[str, Sequence[str], None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    columns = {column["name"] for column in sa.inspect(op.get_bind()).get_columns("meeting_archives")}
+    if "vote_key_ids" not in columns:
+        op.add_column("meeting_archives", sa.Column("vote_key_ids", sa.String(length=255), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("meeting_archives") as batch_op:
+        batch_op.drop_column("vote_key_ids")
@@ -0,0 +1,6 @@
+"""
+backend/scripts
+
+Herramientas operativas de AgoraX (se ejecutan con `python -m scripts.<nombre>`
+desde backend/).
+"""
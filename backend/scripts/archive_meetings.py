@@ -0,0 +1,56 @@
+"""
+backend/scripts/archive_meetings.py
+
+Archiva en frío las asambleas cerradas (ver services/archive_service.py).
+
+Toma las asambleas cerradas con más de ARCHIVE_AFTER_DAYS días y archiva
+cada una en su propia transacción: un fallo no afecta a las demás y el
+job puede relanzarse. Con sharding habilitado recorre cada shard.
+
+Uso (desde backend/):
+    python -m scripts.archive_meetings --older-than-days 30 --limit 100
+    python -m scripts.archive_meetings --meeting-id 42
+"""
+
+import argparse
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Archivado en frío de asambleas cerradas")
+    parser.add_argument("--older-than-days", type=int, default=None, help="por defecto ARCHIVE_AFTER_DAYS")
+    parser.add_argument("--limit", type=int, default=100, help="asambleas máximas por shard")
+    parser.add_argument("--meeting-id", type=int, default=None, help="solo esta asamblea")
+    parser.add_argument("--shard", default=None, help="solo este shard (por defecto todos)")
+    args = parser.parse_args()
+
+    from fastapi import HTTPException
+
+    from app.core.sharding import shard_router
+    from app.services.archive_service import archivable_meeting_ids, archive_meeting
+
+    shards = [args.shard] if args.shard else shard_router.shard_names()
+    for shard in shards:
+        with shard_router.session(shard) as db:
+            if args.meeting_id is not None:
+                meeting_ids = [args.meeting_id]
+            else:
+                meeting_ids = archivable_meeting_ids(db, older_than_days=args.older_than_days, limit=args.limit)
+            archived = failed = 0
+            for meeting_id in meeting_ids:
+                try:
+                    report = archive_meeting(db, meeting_id)
+                except HTTPException as exc:
+                    if args.meeting_id is None or exc.status_code != 404:
+                        print(f"[{shard}] asamblea {meeting_id}: {exc.detail}")
+                        failed += 1
+                    continue
+                archived += 1
+                print(
+                    f"[{shard}] asamblea {meeting_id}: {sum(report.row_counts.values())} filas, "
+                    f"{report.size_bytes} bytes -> {report.path}"
+                )
+            print(f"[{shard}] {archived} archivadas, {failed} fallidas")
+
+
+if __name__ == "__main__":
+    main()
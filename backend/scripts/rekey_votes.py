@@ -0,0 +1,53 @@
+"""
+backend/scripts/rekey_votes.py
+
+Recifra los votos con la clave actual tras rotar VOTE_ENCRYPTION_KEY.
+
+Es reanudable: si se interrumpe, al relanzarlo continúa desde el último
+bloque confirmado. Con sharding habilitado recorre cada shard.
+
+Los archivos en frío no se recifran: al terminar indica qué claves de
+VOTE_ENCRYPTION_OLD_KEYS siguen usando asambleas archivadas y no pueden
+retirarse.
+
+Uso (desde backend/):
+    python -m scripts.rekey_votes --chunk-size 500 --workers 4 --max-rate 2000
+"""
+
+import argparse
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Recifrado de votos tras rotar la clave")
+    parser.add_argument("--chunk-size", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--max-rate", type=float, default=None, help="votos/s máximos")
+    parser.add_argument("--shard", default=None, help="solo este shard (por defecto todos)")
+    args = parser.parse_args()
+
+    from app.core.sharding import shard_router
+    from app.services.vote_rekey_service import old_keys_in_archives, rekey_votes
+
+    shards = [args.shard] if args.shard else shard_router.shard_names()
+    for shard in shards:
+        report = rekey_votes(
+            shard_router.engine(shard),
+            chunk_size=args.chunk_size,
+            workers=args.workers,
+            max_rows_per_second=args.max_rate,
+        )
+        print(
+            f"[{shard}] clave {report.target_key_id}: {report.scanned} revisados, "
+            f"{report.reencrypted} recifrados, {report.failed} fallidos, "
+            f"{report.chunks} bloques, {report.elapsed_s:.1f} s"
+        )
+        with shard_router.session(shard) as db:
+            for label, meeting_ids in old_keys_in_archives(db).items():
+                print(
+                    f"[{shard}] {label} sigue en uso en {len(meeting_ids)} asambleas "
+                    f"archivadas ({meeting_ids[:10]}): no retirarla"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""
+backend/scripts/shards.py
+
+Herramienta de línea de comandos para el sharding por conjunto.
+
+Subcomandos:
+    provision  Crea el esquema de un shard y reserva su rango de IDs.
+    assign     Asigna un conjunto (aún sin datos) a un shard.
+    rebalance  Mueve un conjunto completo a otro shard.
+    demo       Prueba local con dos bases SQLite: siembra un conjunto en
+               'default', lo mueve a 's2' y de vuelta, verificando conteos.
+
+Uso (desde backend/, con SHARD_DATABASE_URLS configurado):
+    python -m scripts.shards provision s2 --id-offset 1000000000
+    python -m scripts.shards rebalance 7 s2
+    python -m scripts.shards demo
+"""
+
+import argparse
+import json
+import os
+import tempfile
+
+
+def _demo() -> None:
+    workdir = tempfile.mkdtemp(prefix="agorax-shards-")
+    os.environ["DB_BACKEND"] = "sqlite"
+    os.environ["SQLITE_PATH"] = os.path.join(workdir, "default.db")
+    os.environ["SHARD_DATABASE_URLS"] = json.dumps(
+        {"s2": f"sqlite+pysqlite:///{os.path.join(workdir, 's2.db')}"}
+    )
+
+    from sqlalchemy import select
+
+    from app.core.db import SessionLocal, engine
+    from app.core.schema import ensure_schema
+    from app.core.sharding import shard_router
+    from app.models import AgendaItem, AuditLog, Condominium, Meeting, OutboxEvent, Owner, Presence, User, Vote
+    from app.services import shard_service
+
+    ensure_schema(engine)
+    shard_service.provision_shard("s2", id_offset=1_000_000_000)
+
+    with SessionLocal() as db:
+        condominium = Condominium(name="Demo", coeficiente_total=10.0)
+        db.add(condominium)
+        db.flush()
+        users = [User(email=f"demo{i}@agorax.local", hashed_password="x") for i in range(10)]
+        db.add_all(users)
+        db.flush()
+        owners = [
+            Owner(user_id=u.id, condominium_id=condominium.id, name=f"P{i}", coeficiente=1.0)
+            for i, u in enumerate(users)
+        ]
+        db.add_all(owners)
+        meeting = Meeting(condominium_id=condominium.id, title="Asamblea demo", total_propietarios=10)
+        db.add(meeting)
+        db.flush()
+        item = AgendaItem(meeting_id=meeting.id, title="Punto", status="OPEN")
+        db.add(item)
+        db.flush()
+        db.add_all(Presence(meeting_id=meeting.id, owner_id=o.id, coeficiente=1.0) for o in owners)
+        db.add_all(Vote(agenda_item_id=item.id, owner_id=o.id, value_encrypted="x") for o in owners[:6])
+        db.add(AuditLog(user_id=users[0].id, action="CREATE_MEETING", entity_type="Meeting", entity_id=meeting.id))
+        db.add(OutboxEvent(event_type="MEETING_CREATED", meeting_id=meeting.id, entity_type="Meeting", entity_id=meeting.id))
+        db.commit()
+        condominium_id, meeting_id = condominium.id, meeting.id
+
+    before = shard_service.tenant_row_counts("default", condominium_id)
+    print("default antes     :", before)
+
+    copied = shard_service.rebalance_tenant(condominium_id, "s2", drain_seconds=0)
+    print("copiadas a s2     :", copied)
+    on_target = shard_service.tenant_row_counts("s2", condominium_id)
+    left = shard_service.tenant_row_counts("default", condominium_id)
+    print("s2 después        :", on_target)
+    print("default después   :", left)
+    assert on_target == before
+    with shard_router.session("s2") as s2_db:
+        # Los eventos reciben IDs del rango de s2: su relay los sigue viendo
+        assert min(s2_db.scalars(select(OutboxEvent.id))) >= 1_000_000_000
+    assert all(count == 0 for name, count in left.items() if name != "users")
+
+    with SessionLocal() as directory_db:
+        shard = shard_router.shard_for_path_params(directory_db, {"meeting_id": str(meeting_id)})
+        print(f"meeting {meeting_id} -> {shard}")
+        assert shard == "s2"
+        with shard_router.tenant_session(directory_db, condominium_id) as tenant_db:
+            new_meeting = Meeting(condominium_id=condominium_id, title="Nueva", total_propietarios=10)
+            tenant_db.add(new_meeting)
+            tenant_db.commit()
+            print(f"nueva asamblea en s2 con id {new_meeting.id} (rango del shard)")
+            assert new_meeting.id >= 1_000_000_000
+
+    shard_service.rebalance_tenant(condominium_id, "default", drain_seconds=0)
+    back = shard_service.tenant_row_counts("default", condominium_id)
+    print("default de vuelta :", back)
+    assert back["meetings"] == before["meetings"] + 1
+    print("OK")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Sharding por conjunto")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    provision = sub.add_parser("provision")
+    provision.add_argument("shard")
+    provision.add_argument("--id-offset", type=int, required=True)
+
+    assign = sub.add_parser("assign")
+    assign.add_argument("condominium_id", type=int)
+    assign.add_argument("shard")
+
+    rebalance = sub.add_parser("rebalance")
+    rebalance.add_argument("condominium_id", type=int)
+    rebalance.add_argument("shard")
+    rebalance.add_argument("--drain-seconds", type=float, default=None)
+
+    sub.add_parser("demo")
+    args = parser.parse_args()
+
+    if args.command == "demo":
+        _demo()
+        return
+
+    from app.core.db import SessionLocal
+    from app.core.sharding import shard_router
+    from app.services import shard_service
+
+    if args.command == "provision":
+        shard_service.provision_shard(args.shard, id_offset=args.id_offset)
+    elif args.command == "assign":
+        with SessionLocal() as db:
+            shard_router.assign_tenant(db, args.condominium_id, args.shard)
+            db.commit()
+    elif args.command == "rebalance":
+        copied = shard_service.rebalance_tenant(
+            args.condominium_id,
+            args.shard,
+            drain_seconds=args.drain_seconds,
+        )
+        print(json.dumps(copied, indent=2))
+
+
+if __name__ == "__main__":
+    main()